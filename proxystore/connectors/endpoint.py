@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
 import uuid
 from collections.abc import Sequence
@@ -85,6 +86,10 @@ class EndpointConnector:
         # Maintain single session for connection pooling persistence to
         # speed up repeat requests to same endpoint.
         self._session = requests.Session()
+        self._session.mount(
+            f'{client.UNIX_SOCKET_SCHEME}://',
+            client.UnixSocketAdapter(),
+        )
 
         # Find the first locally accessible endpoint to use as our
         # home endpoint
@@ -92,6 +97,7 @@ class EndpointConnector:
             home_dir() if self.proxystore_dir is None else self.proxystore_dir,
         )
         found_endpoint: EndpointConfig | None = None
+        address: str | None = None
         for endpoint in available_endpoints:
             endpoint_uuid = UUID(endpoint.uuid)
             if endpoint_uuid not in self.endpoints:
@@ -103,10 +109,48 @@ class EndpointConnector:
                     'has not been started',
                 )
                 continue
-            logger.debug(f'Attempting connection to {endpoint_uuid}')
-            response = self._session.get(
-                f'http://{endpoint.host}:{endpoint.port}/endpoint',
+            address = self._connect(endpoint)
+            if address is not None:
+                found_endpoint = endpoint
+                break
+
+        if found_endpoint is None or address is None:
+            self._session.close()
+            raise EndpointConnectorError(
+                'Failed to find an endpoint configuration matching one of the '
+                'provided endpoint UUIDs, or an endpoint configuration was '
+                'found but the endpoint could not be connected to. '
+                'Enable debug level logging for more more details.',
+            )
+        self.endpoint_uuid: uuid.UUID = uuid.UUID(found_endpoint.uuid)
+        self.endpoint_host: str | None = found_endpoint.host
+        self.endpoint_port: int = found_endpoint.port
+
+        self.address = address
+
+    def _connect(self, endpoint: EndpointConfig) -> str | None:
+        # Returns the address of the endpoint if the endpoint is reachable
+        # and has the expected UUID. The Unix socket of the endpoint is
+        # preferred if the endpoint is listening on one.
+        endpoint_uuid = UUID(endpoint.uuid)
+        addresses: list[str] = []
+        if endpoint.socket_path is not None and os.path.exists(
+            endpoint.socket_path,
+        ):
+            addresses.append(client.unix_socket_address(endpoint.socket_path))
+        addresses.append(f'http://{endpoint.host}:{endpoint.port}')
+
+        for address in addresses:
+            logger.debug(
+                f'Attempting connection to {endpoint_uuid} at {address}',
             )
+            try:
+                response = self._session.get(f'{address}/endpoint')
+            except requests.exceptions.ConnectionError:
+                if address == addresses[-1]:
+                    raise
+                logger.debug(f'Connection to {endpoint_uuid} failed')
+                continue
             if response.status_code == 200:
                 uuid_ = response.json()['uuid']
                 if endpoint_uuid == UUID(uuid_):
@@ -114,8 +158,7 @@ class EndpointConnector:
                         f'Connection to {endpoint_uuid} successful, using '
                         'as local endpoint',
                     )
-                    found_endpoint = endpoint
-                    break
+                    return address
                 else:
                     logger.debug(
                         f'Connection to {endpoint_uuid} returned '
@@ -123,20 +166,7 @@ class EndpointConnector:
                     )
             else:
                 logger.debug(f'Connection to {endpoint_uuid} failed')
-
-        if found_endpoint is None:
-            self._session.close()
-            raise EndpointConnectorError(
-                'Failed to find an endpoint configuration matching one of the '
-                'provided endpoint UUIDs, or an endpoint configuration was '
-                'found but the endpoint could not be connected to. '
-                'Enable debug level logging for more more details.',
-            )
-        self.endpoint_uuid: uuid.UUID = uuid.UUID(found_endpoint.uuid)
-        self.endpoint_host: str | None = found_endpoint.host
-        self.endpoint_port: int = found_endpoint.port
-
-        self.address = f'http://{self.endpoint_host}:{self.endpoint_port}'
+        return None
 
     def __enter__(self) -> Self:
         return self
@@ -252,7 +282,20 @@ class EndpointConnector:
             List with same order as `keys` with the serialized objects or \
             `None` if the corresponding key does not have an associated object.
         """
-        return [self.get(key) for key in keys]
+        try:
+            return list(
+                client.get_batch(
+                    self.address,
+                    [key.object_id for key in keys],
+                    [key.endpoint_id for key in keys],
+                    session=self._session,
+                ),
+            )
+        except requests.exceptions.RequestException as e:
+            assert e.response is not None
+            raise EndpointConnectorError(
+                f'Get batch failed with error code {e.response.status_code}.',
+            ) from e
 
     def new_key(self, obj: BytesLike | None = None) -> EndpointKey:
         """Create a new key.
@@ -278,11 +321,13 @@ class EndpointConnector:
             endpoint_id=str(self.endpoint_uuid),
         )
 
-    def put(self, obj: BytesLike) -> EndpointKey:
+    def put(self, obj: BytesLike, ttl: float | None = None) -> EndpointKey:
         """Put a serialized object in the store.
 
         Args:
             obj: Serialized object to put in the store.
+            ttl: Optional time-to-live in seconds after which the endpoint
+                will expire the object.
 
         Returns:
             Key which can be used to retrieve the object.
@@ -291,22 +336,48 @@ class EndpointConnector:
             object_id=str(uuid.uuid4()),
             endpoint_id=str(self.endpoint_uuid),
         )
-        self.set(key, obj)
+        self.set(key, obj, ttl=ttl)
         return key
 
-    def put_batch(self, objs: Sequence[BytesLike]) -> list[EndpointKey]:
+    def put_batch(
+        self,
+        objs: Sequence[BytesLike],
+        ttl: float | None = None,
+    ) -> list[EndpointKey]:
         """Put a batch of serialized objects in the store.
 
         Args:
             objs: Sequence of serialized objects to put in the store.
+            ttl: Optional time-to-live in seconds applied to each object.
 
         Returns:
             List of keys with the same order as `objs` which can be used to \
             retrieve the objects.
         """
-        return [self.put(obj) for obj in objs]
+        keys = [self.new_key() for _ in objs]
+        # Byte views are streamed by the client without copying the objects.
+        try:
+            client.put_batch(
+                self.address,
+                [key.object_id for key in keys],
+                [memoryview(obj).cast('B') for obj in objs],
+                [key.endpoint_id for key in keys],
+                session=self._session,
+                ttl=ttl,
+            )
+        except requests.exceptions.RequestException as e:
+            assert e.response is not None
+            raise EndpointConnectorError(
+                f'Put batch failed with error code {e.response.status_code}.',
+            ) from e
+        return keys
 
-    def set(self, key: EndpointKey, obj: BytesLike) -> None:
+    def set(
+        self,
+        key: EndpointKey,
+        obj: BytesLike,
+        ttl: float | None = None,
+    ) -> None:
         """Set the object associated with a key.
 
         Note:
@@ -319,6 +390,8 @@ class EndpointConnector:
         Args:
             key: Key that the object will be associated with.
             obj: Object to associate with the key.
+            ttl: Optional time-to-live in seconds after which the endpoint
+                will expire the object.
         """
         try:
             client.put(
@@ -327,6 +400,7 @@ class EndpointConnector:
                 bytes(obj),
                 key.endpoint_id,
                 session=self._session,
+                ttl=ttl,
             )
         except requests.exceptions.RequestException as e:
             assert e.response is not None
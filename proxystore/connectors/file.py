@@ -6,6 +6,8 @@ import logging
 import os
 import shutil
 import sys
+import threading
+import time
 import uuid
 from collections.abc import Sequence
 from types import TracebackType
@@ -39,6 +41,11 @@ class FileConnector:
     files are used to indicate that an object is finished being written
     to avoid race conditions.
 
+    Objects put with a `ttl` have an additional marker file whose
+    modification time is set to the expiration time of the object. Expired
+    objects are treated as missing and are removed lazily when accessed or
+    by [`sweep()`][proxystore.connectors.file.FileConnector.sweep].
+
     Args:
         store_dir: Path to directory to store data in. Note this
             directory will be deleted upon closing the store.
@@ -46,6 +53,13 @@ class FileConnector:
             [`close()`][proxystore.connectors.file.FileConnector] by removing
             `store_dir`.
         buffering: Buffering policy used with [`open()`][open].
+        sweep_interval: Optional interval in seconds between calls to
+            [`sweep()`][proxystore.connectors.file.FileConnector.sweep]
+            in a background thread. If `None`, expired objects are only
+            removed when accessed.
+
+    Raises:
+        ValueError: If `sweep_interval` is not greater than zero.
     """
 
     def __init__(
@@ -54,14 +68,33 @@ class FileConnector:
         *,
         clear: bool = True,
         buffering: int = -1,
+        sweep_interval: float | None = None,
     ) -> None:
+        if sweep_interval is not None and sweep_interval <= 0:
+            raise ValueError(
+                'Sweep interval must be greater than zero. '
+                f'Got {sweep_interval}.',
+            )
+
         self.store_dir = os.path.abspath(store_dir)
         self.clear = clear
         self.buffering = buffering
+        self.sweep_interval = sweep_interval
 
         if not os.path.exists(self.store_dir):
             os.makedirs(self.store_dir, exist_ok=True)
 
+        self._sweeper_stop = threading.Event()
+        self._sweeper: threading.Thread | None = None
+        if self.sweep_interval is not None:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                args=(self.sweep_interval,),
+                daemon=True,
+                name='file-connector-sweeper',
+            )
+            self._sweeper.start()
+
     def __enter__(self) -> Self:
         return self
 
@@ -93,6 +126,11 @@ class FileConnector:
                 [`FileConnector`][proxystore.connectors.file.FileConnector]
                 was instantiated.
         """
+        self._sweeper_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
         clear = self.clear if clear is None else clear
         if clear and os.path.isdir(self.store_dir):
             shutil.rmtree(self.store_dir, ignore_errors=True)
@@ -107,6 +145,7 @@ class FileConnector:
             'store_dir': self.store_dir,
             'clear': self.clear,
             'buffering': self.buffering,
+            'sweep_interval': self.sweep_interval,
         }
 
     @classmethod
@@ -125,11 +164,13 @@ class FileConnector:
             key: Key associated with object to evict.
         """
         path = os.path.join(self.store_dir, key.filename)
-        if os.path.exists(path):
-            os.remove(path)
-        marker = path + '.ready'
-        if os.path.exists(marker):
-            os.remove(marker)
+        # Remove the ready marker first so concurrent readers never see
+        # a ready object with missing data.
+        for filepath in (path + '.ready', path, path + '.expires'):
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
 
     def exists(self, key: FileKey) -> bool:
         """Check if an object associated with the key exists.
@@ -141,7 +182,7 @@ class FileConnector:
             If an object associated with the key exists.
         """
         path = os.path.join(self.store_dir, key.filename + '.ready')
-        return os.path.exists(path)
+        return os.path.exists(path) and not self._evict_if_expired(key)
 
     def get(self, key: FileKey) -> BytesLike | None:
         """Get the serialized object associated with the key.
@@ -154,9 +195,13 @@ class FileConnector:
         """
         path = os.path.join(self.store_dir, key.filename)
         marker = path + '.ready'
-        if os.path.exists(marker):
-            with open(path, 'rb', buffering=self.buffering) as f:
-                return f.read()
+        if os.path.exists(marker) and not self._evict_if_expired(key):
+            try:
+                with open(path, 'rb', buffering=self.buffering) as f:
+                    return f.read()
+            except FileNotFoundError:
+                # Object was evicted between checking the marker and reading.
+                return None
         return None
 
     def get_batch(self, keys: Sequence[FileKey]) -> list[BytesLike | None]:
@@ -185,32 +230,44 @@ class FileConnector:
         """
         return FileKey(filename=str(uuid.uuid4()))
 
-    def put(self, obj: BytesLike) -> FileKey:
+    def put(self, obj: BytesLike, ttl: float | None = None) -> FileKey:
         """Put a serialized object in the store.
 
         Args:
             obj: Serialized object to put in the store.
+            ttl: Optional time-to-live in seconds after which the object
+                expires.
 
         Returns:
             Key which can be used to retrieve the object.
         """
         key = FileKey(filename=str(uuid.uuid4()))
-        self.set(key, obj)
+        self.set(key, obj, ttl=ttl)
         return key
 
-    def put_batch(self, objs: Sequence[BytesLike]) -> list[FileKey]:
+    def put_batch(
+        self,
+        objs: Sequence[BytesLike],
+        ttl: float | None = None,
+    ) -> list[FileKey]:
         """Put a batch of serialized objects in the store.
 
         Args:
             objs: Sequence of serialized objects to put in the store.
+            ttl: Optional time-to-live in seconds applied to each object.
 
         Returns:
             List of keys with the same order as `objs` which can be used to
             retrieve the objects.
         """
-        return [self.put(obj) for obj in objs]
+        return [self.put(obj, ttl=ttl) for obj in objs]
 
-    def set(self, key: FileKey, obj: BytesLike) -> None:
+    def set(
+        self,
+        key: FileKey,
+        obj: BytesLike,
+        ttl: float | None = None,
+    ) -> None:
         """Set the object associated with a key.
 
         Note:
@@ -223,9 +280,62 @@ class FileConnector:
         Args:
             key: Key that the object will be associated with.
             obj: Object to associate with the key.
+            ttl: Optional time-to-live in seconds after which the object
+                expires.
         """
         path = os.path.join(self.store_dir, key.filename)
         with open(path, 'wb', buffering=self.buffering) as f:
             f.write(obj)
+        expires = path + '.expires'
+        if ttl is not None:
+            open(expires, 'wb').close()
+            expires_at = time.time() + ttl
+            os.utime(expires, (expires_at, expires_at))
+        else:
+            # Overwriting a key without a ttl clears any previous deadline.
+            try:
+                os.remove(expires)
+            except FileNotFoundError:
+                pass
         marker = path + '.ready'
         open(marker, 'wb').close()
+
+    def sweep(self) -> int:
+        """Evict all objects whose time-to-live has expired.
+
+        Returns:
+            Number of objects evicted.
+        """
+        now = time.time()
+        evicted = 0
+        with os.scandir(self.store_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.expires'):
+                    continue
+                try:
+                    expired = entry.stat().st_mtime <= now
+                except FileNotFoundError:  # pragma: no cover
+                    # Evicted by another process while scanning.
+                    continue
+                if expired:
+                    filename = entry.name[: -len('.expires')]
+                    self.evict(FileKey(filename=filename))
+                    evicted += 1
+        return evicted
+
+    def _evict_if_expired(self, key: FileKey) -> bool:
+        path = os.path.join(self.store_dir, key.filename + '.expires')
+        try:
+            expired = os.stat(path).st_mtime <= time.time()
+        except FileNotFoundError:
+            return False
+        if expired:
+            self.evict(key)
+        return expired
+
+    def _sweep_loop(self, interval: float) -> None:
+        while not self._sweeper_stop.wait(interval):
+            try:
+                self.sweep()
+            except Exception:  # pragma: no cover
+                logger.exception('Failed to sweep expired objects')
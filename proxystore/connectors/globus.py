@@ -7,7 +7,9 @@ import logging
 import os
 import re
 import sys
+import threading
 import uuid
+from collections import OrderedDict
 from collections.abc import Collection
 from collections.abc import Generator
 from collections.abc import Iterator
@@ -289,6 +291,170 @@ class GlobusKey(NamedTuple):
         return not self == other
 
 
+# Pseudo-status for task IDs which the Transfer API reports as invalid.
+_INVALID_TASK_STATUS = 'INVALID'
+_TERMINAL_TASK_STATUSES = frozenset(
+    {'SUCCEEDED', 'FAILED', _INVALID_TASK_STATUS},
+)
+# Max number of terminal task statuses cached by a _TaskPoller.
+_TASK_STATUS_CACHE_SIZE = 1024
+
+
+class _TaskWaiter:
+    # Result of polling a task shared by all threads waiting on the task.
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.status: str | None = None
+        self.error: Exception | None = None
+        self.waiting = 0
+
+
+class _TaskPoller:
+    # Shared cache of Globus task statuses with a single background thread
+    # polling outstanding tasks. The most recent terminal statuses are cached
+    # so repeated checks of a task do not call the Transfer API, and all
+    # threads waiting on the same task are woken at once when the task
+    # completes. Errors are only delivered to the threads waiting when the
+    # error occurred so the next wait on the task polls it again.
+
+    def __init__(
+        self,
+        client: globus_sdk.TransferClient,
+        polling_interval: float,
+        cache_size: int = _TASK_STATUS_CACHE_SIZE,
+    ) -> None:
+        self._client = client
+        self._polling_interval = polling_interval
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._statuses: OrderedDict[str, str] = OrderedDict()
+        self._waiters: dict[str, _TaskWaiter] = {}
+        self._closed = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._stop.set()
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            # Wake any threads still waiting rather than leaving them
+            # blocked until their timeout.
+            for waiter in self._waiters.values():
+                waiter.error = RuntimeError('Task poller has been closed.')
+                waiter.done.set()
+            self._waiters.clear()
+
+    def wait(self, task_id: str, timeout: float) -> str:
+        """Wait on a task and return its terminal status.
+
+        Raises:
+            RuntimeError: If the poller has been closed or the task does not
+                complete within the timeout.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Task poller has been closed.')
+            status = self._statuses.get(task_id, None)
+            if status is not None:
+                self._statuses.move_to_end(task_id)
+                return status
+            waiter = self._waiters.get(task_id, None)
+            if waiter is None:
+                waiter = _TaskWaiter()
+                self._waiters[task_id] = waiter
+            waiter.waiting += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._poll_loop,
+                    daemon=True,
+                    name='globus-task-poller',
+                )
+                self._thread.start()
+
+        if not waiter.done.wait(timeout):
+            with self._lock:
+                # The task may have completed before the lock was acquired.
+                if not waiter.done.is_set():  # pragma: no branch
+                    waiter.waiting -= 1
+                    if waiter.waiting == 0:
+                        # Stop polling the task once no thread is waiting.
+                        self._waiters.pop(task_id, None)
+                    raise RuntimeError(
+                        f'Task {task_id} did not complete within the timeout',
+                    )
+        if waiter.error is not None:
+            raise waiter.error
+        assert waiter.status is not None
+        return waiter.status
+
+    def _poll(self, task_id: str) -> None:
+        status: str | None = None
+        error: Exception | None = None
+        try:
+            status = self._client.get_task(task_id)['status']
+        except globus_sdk.TransferAPIError as e:
+            if e.http_status == 400:
+                status = _INVALID_TASK_STATUS
+            else:
+                error = e
+        except Exception as e:
+            error = e
+
+        if error is None and status not in _TERMINAL_TASK_STATUSES:
+            # Task is still active so check again next interval.
+            return
+
+        with self._lock:
+            waiter = self._waiters.pop(task_id, None)
+            if waiter is None:  # pragma: no cover
+                # Woken by close() while polling.
+                return
+            if error is not None:
+                waiter.error = error
+            else:
+                assert status is not None
+                waiter.status = status
+                self._statuses[task_id] = status
+                if len(self._statuses) > self._cache_size:
+                    self._statuses.popitem(last=False)
+            waiter.done.set()
+
+    def _poll_loop(self) -> None:
+        while not self._stop.is_set():
+            with self._lock:
+                task_ids = list(self._waiters)
+            for task_id in task_ids:
+                self._poll(task_id)
+
+            with self._lock:
+                if len(self._waiters) == 0:
+                    # Exit while holding the lock so a concurrent wait()
+                    # sees there is no thread and starts a new one.
+                    self._thread = None
+                    return
+            self._stop.wait(self._polling_interval)
+
+        with self._lock:
+            self._thread = None
+
+
+class _CoalescedTransfer:
+    # Files from independent put() calls which will be transferred together
+    # in a single Globus task.
+
+    def __init__(self) -> None:
+        self.filenames: list[str] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.task_ids: tuple[str, ...] = ()
+        self.error: Exception | None = None
+
+
 class GlobusConnector:
     """Globus transfer connector.
 
@@ -337,11 +503,24 @@ class GlobusConnector:
             tasks have finished.
         sync_level: Globus Transfer sync level.
         timeout: Timeout in seconds for waiting on Globus Transfer tasks.
+        coalesce_window: Opt-in window in seconds for coalescing transfers.
+            If set, the files written by
+            [`put()`][proxystore.connectors.globus.GlobusConnector.put] calls
+            (e.g., from different threads) within the window are transferred
+            in a single Globus task, and all of the returned keys share the
+            task ID. The first put in a window waits up to `coalesce_window`
+            seconds for other puts so this trades put latency for fewer task
+            submissions. If `None`, each put submits its own task.
+        coalesce_max_size: Maximum number of files in a coalesced transfer.
+            The transfer is submitted as soon as this many files are waiting,
+            even if the window has not elapsed.
 
     Raises:
         GlobusAuthFileError: If the Globus authentication file cannot be found.
         ValueError: If `endpoints` is of an incorrect type.
         ValueError: If fewer than two endpoints are provided.
+        ValueError: If `coalesce_window` or `coalesce_max_size` are not
+            greater than zero.
     """
 
     def __init__(
@@ -352,10 +531,12 @@ class GlobusConnector:
         *,
         clear: bool = True,
         buffering: int = -1,
-        polling_interval: int = 1,
+        polling_interval: float = 1,
         sync_level: int
         | Literal['exists', 'size', 'mtime', 'checksum'] = 'mtime',
-        timeout: int = 60,
+        timeout: float = 60,
+        coalesce_window: float | None = None,
+        coalesce_max_size: int = 100,
     ) -> None:
         if isinstance(endpoints, GlobusEndpoints):
             self.endpoints = endpoints
@@ -370,15 +551,34 @@ class GlobusConnector:
             )
         if len(endpoints) < 2:
             raise ValueError('At least two Globus endpoints are required.')
+        if coalesce_window is not None and coalesce_window <= 0:
+            raise ValueError(
+                'Coalesce window must be greater than zero. '
+                f'Got {coalesce_window}.',
+            )
+        if coalesce_max_size <= 0:
+            raise ValueError(
+                'Coalesce max size must be greater than zero. '
+                f'Got {coalesce_max_size}.',
+            )
         self.buffering = buffering
         self.clear = clear
         self.polling_interval = polling_interval
         self.sync_level = sync_level
         self.timeout = timeout
+        self.coalesce_window = coalesce_window
+        self.coalesce_max_size = coalesce_max_size
+
+        self._coalesce_lock = threading.Lock()
+        self._coalesce_pending: _CoalescedTransfer | None = None
 
         self._transfer_client = get_transfer_client(
             collections=[ep.uuid for ep in self.endpoints],
         )
+        self._task_poller = _TaskPoller(
+            self._transfer_client,
+            self.polling_interval,
+        )
 
     def __enter__(self) -> Self:
         return self
@@ -419,31 +619,26 @@ class GlobusConnector:
         """Get endpoint local to current host."""
         return self.endpoints.get_by_host(hostname())
 
-    def _validate_task_id(self, task_ids: str | tuple[str, ...]) -> bool:
-        """Validate key contains a real Globus task id."""
-        task_ids = task_ids if isinstance(task_ids, tuple) else (task_ids,)
-        for tid in task_ids:
-            try:
-                self._transfer_client.get_task(tid)
-            except globus_sdk.TransferAPIError as e:
-                if e.http_status == 400:
-                    return False
-                raise e
-        return True
+    def _wait_on_tasks(self, task_ids: str | tuple[str, ...]) -> bool:
+        """Wait on list of Globus tasks.
+
+        Task statuses are shared across all callers via a cache updated by a
+        single background poller so waiting on many keys with the same task
+        ID only polls the Transfer API once per interval.
 
-    def _wait_on_tasks(self, task_ids: str | tuple[str, ...]) -> None:
-        """Wait on list of Globus tasks."""
+        Returns:
+            `False` if any task ID is not a valid Globus task ID and `True` \
+            once all of the tasks have completed.
+
+        Raises:
+            RuntimeError: If a task does not complete within the timeout.
+        """
         task_ids = task_ids if isinstance(task_ids, tuple) else (task_ids,)
         for tid in task_ids:
-            done = self._transfer_client.task_wait(
-                tid,
-                timeout=self.timeout,
-                polling_interval=self.polling_interval,
-            )
-            if not done:
-                raise RuntimeError(
-                    f'Task {tid} did not complete within the timeout',
-                )
+            status = self._task_poller.wait(tid, timeout=self.timeout)
+            if status == _INVALID_TASK_STATUS:
+                return False
+        return True
 
     def _transfer_files(
         self,
@@ -507,6 +702,57 @@ class GlobusConnector:
 
         return tuple(tids)
 
+    def _transfer_files_coalesced(self, filename: str) -> tuple[str, ...]:
+        """Add a file to the current coalesced transfer.
+
+        The first caller to add a file to a new coalesced transfer waits for
+        the window to elapse (or the transfer to fill) and then submits the
+        transfer on behalf of all callers. Other callers wait on the
+        submission.
+
+        Args:
+            filename: Name of file to transfer.
+
+        Returns:
+            Tuple of Globus Task UUIDs of the coalesced transfer.
+        """
+        assert self.coalesce_window is not None
+        with self._coalesce_lock:
+            transfer = self._coalesce_pending
+            leader = transfer is None
+            if transfer is None:
+                transfer = _CoalescedTransfer()
+                self._coalesce_pending = transfer
+            transfer.filenames.append(filename)
+            if len(transfer.filenames) >= self.coalesce_max_size:
+                # Close the transfer so later puts start a new one.
+                self._coalesce_pending = None
+                transfer.full.set()
+
+        if not leader:
+            transfer.done.wait()
+            if transfer.error is not None:
+                raise transfer.error
+            return transfer.task_ids
+
+        transfer.full.wait(self.coalesce_window)
+        with self._coalesce_lock:
+            if self._coalesce_pending is transfer:
+                self._coalesce_pending = None
+
+        try:
+            transfer.task_ids = self._transfer_files(transfer.filenames)
+        except Exception as e:
+            transfer.error = e
+            raise
+        finally:
+            transfer.done.set()
+        logger.debug(
+            f'Coalesced {len(transfer.filenames)} file(s) into Globus '
+            f'task(s) {", ".join(transfer.task_ids)}',
+        )
+        return transfer.task_ids
+
     def close(self, clear: bool | None = None) -> None:
         """Close the connector and clean up.
 
@@ -542,6 +788,7 @@ class GlobusConnector:
                     delete_task,
                 )
                 self._wait_on_tasks(tdata['task_id'])
+        self._task_poller.close()
 
     def config(self) -> dict[str, Any]:
         """Get the connector configuration.
@@ -556,6 +803,8 @@ class GlobusConnector:
             'polling_interval': self.polling_interval,
             'sync_level': self.sync_level,
             'timeout': self.timeout,
+            'coalesce_window': self.coalesce_window,
+            'coalesce_max_size': self.coalesce_max_size,
         }
 
     @classmethod
@@ -593,9 +842,8 @@ class GlobusConnector:
         Returns:
             If an object associated with the key exists.
         """
-        if not self._validate_task_id(key.task_id):
+        if not self._wait_on_tasks(key.task_id):
             return False
-        self._wait_on_tasks(key.task_id)
         return os.path.exists(self._get_filepath(key.filename))
 
     def get(self, key: GlobusKey) -> BytesLike | None:
@@ -629,6 +877,10 @@ class GlobusConnector:
     def put(self, obj: BytesLike) -> GlobusKey:
         """Put a serialized object in the store.
 
+        Note:
+            If `coalesce_window` is set, this method blocks until the
+            coalesced transfer containing the object has been submitted.
+
         Args:
             obj: Serialized object to put in the store.
 
@@ -643,7 +895,10 @@ class GlobusConnector:
         with open(path, 'wb', buffering=self.buffering) as f:
             f.write(obj)
 
-        tids = self._transfer_files(filename)
+        if self.coalesce_window is None:
+            tids = self._transfer_files(filename)
+        else:
+            tids = self._transfer_files_coalesced(filename)
 
         return GlobusKey(filename=filename, task_id=tids)
 
@@ -6,10 +6,13 @@ import dataclasses
 import logging
 import re
 import sys
+import threading
+import time
 from collections.abc import Iterable
 from collections.abc import Sequence
 from types import TracebackType
 from typing import Any
+from typing import cast
 from typing import NamedTuple
 from typing import TypedDict
 from typing import TypeVar
@@ -29,6 +32,15 @@ from proxystore.utils.imports import import_from_path
 logger = logging.getLogger(__name__)
 KeyT = TypeVar('KeyT', bound=NamedTuple)
 
+ADAPTIVE_SMOOTHING = 0.2
+"""Weight of the newest observation in adaptive performance estimates."""
+ADAPTIVE_MIN_SAMPLES = 3
+"""Observations needed before an adaptive estimate is trusted."""
+ADAPTIVE_REFRESH_INTERVAL = 60.0
+"""Seconds after which an unused adaptive estimate is re-measured."""
+ADAPTIVE_FAILURE_BACKOFF = 30.0
+"""Seconds a failed adaptive connector is avoided for."""
+
 
 class PolicyDict(TypedDict):
     """JSON compatible representation of a [`Policy`][proxystore.connectors.multi.Policy]."""  # noqa: E501
@@ -39,6 +51,7 @@ class PolicyDict(TypedDict):
     max_size_bytes: int
     subset_tags: list[str]
     superset_tags: list[str]
+    adaptive: bool
 
 
 @dataclasses.dataclass
@@ -61,6 +74,14 @@ class Policy:
         superset_tags: Superset tags. See
             [`is_valid()`][proxystore.connectors.multi.Policy.is_valid] for
             more details.
+        adaptive: Rank this connector by observed performance rather than
+            by `priority`. See
+            [`MultiConnector`][proxystore.connectors.multi.MultiConnector]
+            for more details.
+
+    Note:
+        The host patterns and tags are compiled when the policy is created
+        so the policy should not be modified after creation.
     """
 
     priority: int = 0
@@ -69,6 +90,36 @@ class Policy:
     max_size_bytes: int = sys.maxsize
     subset_tags: list[str] = dataclasses.field(default_factory=list)
     superset_tags: list[str] = dataclasses.field(default_factory=list)
+    adaptive: bool = False
+
+    _patterns: tuple[re.Pattern[str], ...] | None = dataclasses.field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _subset_tags: frozenset[str] = dataclasses.field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _superset_tags: frozenset[str] = dataclasses.field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.host_pattern is None:
+            self._patterns = None
+        elif isinstance(self.host_pattern, str):
+            self._patterns = (re.compile(self.host_pattern),)
+        else:
+            # Store as a list so a single-use iterable is not consumed by
+            # compiling the patterns.
+            self.host_pattern = list(self.host_pattern)
+            self._patterns = tuple(re.compile(p) for p in self.host_pattern)
+        self._subset_tags = frozenset(self.subset_tags)
+        self._superset_tags = frozenset(self.superset_tags)
 
     def is_valid(
         self,
@@ -94,33 +145,39 @@ class Policy:
         Returns:
             If the provided constraints are valid for the policy.
         """
+        return (
+            self._is_valid_constraints(
+                size_bytes,
+                None if subset_tags is None else frozenset(subset_tags),
+                None if superset_tags is None else frozenset(superset_tags),
+            )
+            and self.is_valid_on_host()
+        )
+
+    def _is_valid_constraints(
+        self,
+        size_bytes: int | None,
+        subset_tags: frozenset[str] | None,
+        superset_tags: frozenset[str] | None,
+    ) -> bool:
+        # Same as is_valid() but without the host check and with the tags
+        # already converted to sets so they can be reused across policies.
         if size_bytes is not None and (
             size_bytes < self.min_size_bytes
             or size_bytes > self.max_size_bytes
         ):
             return False
-        if subset_tags is not None and not set(subset_tags).issubset(
-            self.subset_tags,
-        ):
+        if subset_tags is not None and not subset_tags <= self._subset_tags:
             return False
-        if superset_tags is not None and not set(superset_tags).issuperset(
-            self.superset_tags,
-        ):
-            return False
-        return self.is_valid_on_host()
+        return superset_tags is None or superset_tags >= self._superset_tags
 
     def is_valid_on_host(self) -> bool:
         """Check if this policy is valid on the current host."""
-        if self.host_pattern is None:
+        if self._patterns is None:
             return True
 
-        patterns: Iterable[str]
-        if isinstance(self.host_pattern, str):
-            patterns = [self.host_pattern]
-        else:
-            patterns = self.host_pattern
         hostname = utils.hostname()
-        return any(re.fullmatch(p, hostname) for p in patterns)
+        return any(p.fullmatch(hostname) for p in self._patterns)
 
     def as_dict(self) -> PolicyDict:
         """Convert the Policy to a JSON compatible dict.
@@ -147,8 +204,101 @@ class Policy:
             max_size_bytes=self.max_size_bytes,
             subset_tags=self.subset_tags,
             superset_tags=self.superset_tags,
+            adaptive=self.adaptive,
+        )
+
+
+class _OperationEstimate:
+    # Exponentially weighted least-squares fit of operation duration as a
+    # linear function of object size. The intercept approximates the fixed
+    # per-operation latency and the slope the inverse of the bandwidth.
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self._w = 0.0
+        self._x = 0.0
+        self._y = 0.0
+        self._xx = 0.0
+        self._xy = 0.0
+
+    def record(self, size_bytes: float, duration: float) -> None:
+        decay = 1 - ADAPTIVE_SMOOTHING
+        self.samples += 1
+        self._w = decay * self._w + 1
+        self._x = decay * self._x + size_bytes
+        self._y = decay * self._y + duration
+        self._xx = decay * self._xx + size_bytes * size_bytes
+        self._xy = decay * self._xy + size_bytes * duration
+
+    def latency(self) -> float:
+        mean_x = self._x / self._w
+        mean_y = self._y / self._w
+        return max(mean_y - self.inverse_bandwidth() * mean_x, 0.0)
+
+    def inverse_bandwidth(self) -> float:
+        variance = self._w * self._xx - self._x * self._x
+        # Variance of the sizes is zero (or numerically close to it) when all
+        # observed objects have the same size so no slope can be fit.
+        if variance <= 1e-9 * self._w * self._xx:
+            return 0.0
+        slope = (self._w * self._xy - self._x * self._y) / variance
+        return max(slope, 0.0)
+
+    def predict(self, size_bytes: int) -> float:
+        return self.latency() + self.inverse_bandwidth() * size_bytes
+
+
+class _ConnectorEstimate:
+    # Running performance estimate of the put and get operations of a single
+    # connector used by adaptive policies.
+
+    def __init__(self) -> None:
+        self.put = _OperationEstimate()
+        self.get = _OperationEstimate()
+        self.last_observed = 0.0
+        self.last_failure: float | None = None
+        self._lock = threading.Lock()
+
+    def record_put(self, size_bytes: float, duration: float) -> None:
+        with self._lock:
+            self.put.record(size_bytes, duration)
+            self.last_observed = time.monotonic()
+            self.last_failure = None
+
+    def record_get(self, size_bytes: float, duration: float) -> None:
+        with self._lock:
+            self.get.record(size_bytes, duration)
+            self.last_observed = time.monotonic()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.last_failure = time.monotonic()
+
+    def failing(self, now: float) -> bool:
+        return (
+            self.last_failure is not None
+            and now - self.last_failure < ADAPTIVE_FAILURE_BACKOFF
         )
 
+    def needs_measurement(self, now: float) -> bool:
+        return (
+            self.put.samples < ADAPTIVE_MIN_SAMPLES
+            or now - self.last_observed > ADAPTIVE_REFRESH_INTERVAL
+        )
+
+    def predict(self, size_bytes: int) -> float:
+        with self._lock:
+            put = self.put.predict(size_bytes)
+            # Objects are typically read at least once after being put, but
+            # estimates for gets may not exist yet if nothing has been read
+            # so assume gets are as costly as puts until observed.
+            get = (
+                self.get.predict(size_bytes)
+                if self.get.samples >= ADAPTIVE_MIN_SAMPLES
+                else put
+            )
+        return put + get
+
 
 class _ConnectorPolicy(NamedTuple):
     connector: Connector[Any]
@@ -205,6 +355,19 @@ class MultiConnector:
         connector = MultiConnector(connector)
         ```
 
+    Note:
+        Connectors are chosen by the highest `priority` policy whose
+        constraints are satisfied. If that policy is
+        [`adaptive`][proxystore.connectors.multi.Policy], all satisfied
+        adaptive policies are instead ranked by the expected time to put and
+        get the object. Expected times are based on running estimates of the
+        latency and bandwidth of each adaptive connector which are updated
+        from observed operations, so the routing adjusts as load changes
+        without hand-tuning `min_size_bytes` and `max_size_bytes`. Adaptive
+        connectors that have not been measured recently are tried first, and
+        an adaptive connector that raises an error is avoided for a period
+        while the put falls back to the next best adaptive connector.
+
     Note:
         Methods of this class will raise
         [`MultiConnectorError`][proxystore.connectors.multi.MultiConnectorError]
@@ -244,6 +407,19 @@ class MultiConnector:
             key=lambda name: self.connectors[name].policy.priority,
             reverse=True,
         )
+        # The hostname does not change during the lifetime of the process so
+        # connectors whose policies are not valid on this host are filtered
+        # out once here rather than on every put.
+        self._host_valid_connectors = [
+            name
+            for name in self.connectors_by_priority
+            if self.connectors[name].policy.is_valid_on_host()
+        ]
+        self._estimates = {
+            name: _ConnectorEstimate()
+            for name, (_, policy) in self.connectors.items()
+            if policy.adaptive
+        }
 
     def __enter__(self) -> Self:
         return self
@@ -274,6 +450,103 @@ class MultiConnector:
                 f'The connector which created {key} does not exist.',
             )
 
+    def _select_connectors(
+        self,
+        size_bytes: int,
+        subset_tags: frozenset[str],
+        superset_tags: frozenset[str],
+    ) -> tuple[str, ...]:
+        # Returns the names of the connectors to try, in order, for an
+        # object. This is a single connector unless the best static match
+        # is adaptive in which case all matching adaptive connectors are
+        # returned ranked by estimated performance.
+        valid = [
+            name
+            for name in self._host_valid_connectors
+            if self.connectors[name].policy._is_valid_constraints(
+                size_bytes,
+                subset_tags,
+                superset_tags,
+            )
+        ]
+        if len(valid) == 0:
+            raise MultiConnectorError(
+                'No connector policy was suitable for the constraints: '
+                f'subset_tags={set(subset_tags)}, '
+                f'superset_tags={set(superset_tags)}.',
+            )
+        if not self.connectors[valid[0]].policy.adaptive:
+            return (valid[0],)
+
+        now = time.monotonic()
+        adaptive = [name for name in valid if name in self._estimates]
+
+        def _rank(name: str) -> tuple[bool, bool, float]:
+            estimate = self._estimates[name]
+            failing = estimate.failing(now)
+            measure = estimate.needs_measurement(now)
+            # Sort keys: healthy before failing, then connectors needing
+            # measurement before measured ones, then by predicted time.
+            # sorted() is stable so ties keep priority order.
+            return (
+                failing,
+                not measure,
+                0.0 if measure else estimate.predict(size_bytes),
+            )
+
+        return tuple(sorted(adaptive, key=_rank))
+
+    def _put_with_fallback(
+        self,
+        candidates: tuple[str, ...],
+        objs: Sequence[BytesLike],
+        *,
+        batch: bool,
+    ) -> tuple[str, list[Any]]:
+        for name, fallback in zip(
+            candidates,
+            (*candidates[1:], None),
+            strict=True,
+        ):
+            connector = self.connectors[name].connector
+            estimate = self._estimates.get(name, None)
+            start = time.perf_counter()
+            try:
+                keys = (
+                    connector.put_batch(objs)
+                    if batch
+                    else [connector.put(objs[0])]
+                )
+            except Exception:
+                if estimate is not None:
+                    estimate.record_failure()
+                if fallback is None:
+                    raise
+                logger.exception(
+                    f'Put to adaptive connector {name} failed, falling back '
+                    f'to connector {fallback}',
+                )
+                continue
+
+            if estimate is not None:
+                duration = time.perf_counter() - start
+                total = sum(len(obj) for obj in objs)
+                estimate.record_put(total / len(objs), duration / len(objs))
+            break
+        return name, keys
+
+    def _record_get(
+        self,
+        name: str,
+        objs: Sequence[BytesLike | None],
+        duration: float,
+    ) -> None:
+        estimate = self._estimates.get(name, None)
+        found = [obj for obj in objs if obj is not None]
+        if estimate is not None and len(found) > 0:
+            total = sum(len(obj) for obj in found)
+            estimate.record_get(total / len(found), duration / len(objs))
+
     def close(self) -> None:
         """Close the connector and clean up.
 
@@ -362,11 +635,20 @@ class MultiConnector:
             Serialized object or `None` if the object does not exist.
         """
         connector = self._connector_from_key(key)
-        return connector.get(key.connector_key)
+        start = time.perf_counter()
+        obj = connector.get(key.connector_key)
+        duration = time.perf_counter() - start
+        self._record_get(key.connector_name, [obj], duration)
+        return obj
 
     def get_batch(self, keys: Sequence[MultiKey]) -> list[BytesLike | None]:
         """Get a batch of serialized objects associated with the keys.
 
+        Keys are grouped by the connector that created them so each
+        connector receives a single
+        [`get_batch()`][proxystore.connectors.protocols.Connector.get_batch]
+        call.
+
         Args:
             keys: Sequence of keys associated with objects to retrieve.
 
@@ -374,7 +656,21 @@ class MultiConnector:
             List with same order as `keys` with the serialized objects or \
             `None` if the corresponding key does not have an associated object.
         """
-        return [self.get(key) for key in keys]
+        groups: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            groups.setdefault(key.connector_name, []).append(i)
+
+        objs: list[BytesLike | None] = [None] * len(keys)
+        for name, indices in groups.items():
+            connector = self._connector_from_key(keys[indices[0]])
+            start = time.perf_counter()
+            results = connector.get_batch(
+                [keys[i].connector_key for i in indices],
+            )
+            self._record_get(name, results, time.perf_counter() - start)
+            for i, obj in zip(indices, results, strict=True):
+                objs[i] = obj
+        return objs
 
     def put(
         self,
@@ -397,22 +693,13 @@ class MultiConnector:
         Raises:
             MultiConnectorError: If no connector policy matches the arguments.
         """
-        for connector_name in self.connectors_by_priority:
-            connector, policy = self.connectors[connector_name]
-            if policy.is_valid(
-                size_bytes=len(obj),
-                subset_tags=subset_tags,
-                superset_tags=superset_tags,
-            ):
-                key = connector.put(obj)
-                return MultiKey(
-                    connector_name=connector_name,
-                    connector_key=key,
-                )
-        raise MultiConnectorError(
-            'No connector policy was suitable for the constraints: '
-            f'subset_tags={subset_tags}, superset_tags={superset_tags}.',
+        candidates = self._select_connectors(
+            len(obj),
+            frozenset(subset_tags),
+            frozenset(superset_tags),
         )
+        name, keys = self._put_with_fallback(candidates, [obj], batch=False)
+        return MultiKey(connector_name=name, connector_key=keys[0])
 
     def put_batch(
         self,
@@ -422,11 +709,13 @@ class MultiConnector:
     ) -> list[MultiKey]:
         """Put a batch of serialized objects in the store.
 
-        Warning:
-            This method calls
-            [`put()`][proxystore.connectors.multi.MultiConnector] individually
-            for each item in the batch so items in the batch can potentially
-            be placed in different connectors.
+        Note:
+            Each object is matched to a connector individually so items in
+            the batch can potentially be placed in different connectors.
+            Objects are then grouped by connector and each connector receives
+            a single
+            [`put_batch()`][proxystore.connectors.protocols.Connector.put_batch]
+            call.
 
         Args:
             objs: Sequence of serialized objects to put in the store.
@@ -442,7 +731,27 @@ class MultiConnector:
         Raises:
             MultiConnectorError: If no connector policy matches the arguments.
         """
-        return [
-            self.put(obj, subset_tags=subset_tags, superset_tags=superset_tags)
-            for obj in objs
-        ]
+        subset_tags = frozenset(subset_tags)
+        superset_tags = frozenset(superset_tags)
+
+        # Select all connectors first so no objects are stored if any object
+        # does not match a policy.
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for i, obj in enumerate(objs):
+            candidates = self._select_connectors(
+                len(obj),
+                subset_tags,
+                superset_tags,
+            )
+            groups.setdefault(candidates, []).append(i)
+
+        keys: list[MultiKey | None] = [None] * len(objs)
+        for candidates, indices in groups.items():
+            name, connector_keys = self._put_with_fallback(
+                candidates,
+                [objs[i] for i in indices],
+                batch=True,
+            )
+            for i, key in zip(indices, connector_keys, strict=True):
+                keys[i] = MultiKey(connector_name=name, connector_key=key)
+        return cast(list[MultiKey], keys)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 import sys
 import uuid
 from collections.abc import Sequence
@@ -19,6 +20,11 @@ else:  # pragma: <3.11 cover
 import redis
 
 
+def _ttl_to_ms(ttl: float) -> int:
+    # Redis requires a positive integer expiry so round up to at least 1 ms.
+    return max(1, math.ceil(ttl * 1000))
+
+
 class RedisKey(NamedTuple):
     """Key to objects store in a Redis server.
 
@@ -159,39 +165,59 @@ class RedisConnector:
         """
         return RedisKey(redis_key=str(uuid.uuid4()))
 
-    def put(self, obj: BytesLike) -> RedisKey:
+    def put(self, obj: BytesLike, ttl: float | None = None) -> RedisKey:
         """Put a serialized object in the store.
 
         Args:
             obj: Serialized object to put in the store.
+            ttl: Optional time-to-live in seconds. Redis will expire the
+                object after `ttl` seconds.
 
         Returns:
             Key which can be used to retrieve the object.
         """
         key = RedisKey(redis_key=str(uuid.uuid4()))
-        self._redis_client.set(key.redis_key, bytes(obj))
+        self.set(key, obj, ttl=ttl)
         return key
 
-    def put_batch(self, objs: Sequence[BytesLike]) -> list[RedisKey]:
+    def put_batch(
+        self,
+        objs: Sequence[BytesLike],
+        ttl: float | None = None,
+    ) -> list[RedisKey]:
         """Put a batch of serialized objects in the store.
 
         Args:
             objs: Sequence of serialized objects to put in the store.
+            ttl: Optional time-to-live in seconds applied to each object.
 
         Returns:
             List of keys with the same order as `objs` which can be used to \
             retrieve the objects.
         """
         keys = [RedisKey(redis_key=str(uuid.uuid4())) for _ in objs]
-        self._redis_client.mset(
-            {
-                key.redis_key: bytes(obj)
-                for key, obj in zip(keys, objs, strict=True)
-            },
-        )
+        if ttl is None:
+            self._redis_client.mset(
+                {
+                    key.redis_key: bytes(obj)
+                    for key, obj in zip(keys, objs, strict=True)
+                },
+            )
+        else:
+            # MSET does not support expiry so each SET ... PX is pipelined
+            # into a single round trip instead.
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for key, obj in zip(keys, objs, strict=True):
+                pipeline.set(key.redis_key, bytes(obj), px=_ttl_to_ms(ttl))
+            pipeline.execute()
         return keys
 
-    def set(self, key: RedisKey, obj: BytesLike) -> None:
+    def set(
+        self,
+        key: RedisKey,
+        obj: BytesLike,
+        ttl: float | None = None,
+    ) -> None:
         """Set the object associated with a key.
 
         Note:
@@ -204,5 +230,8 @@ class RedisConnector:
         Args:
             key: Key that the object will be associated with.
             obj: Object to associate with the key.
+            ttl: Optional time-to-live in seconds. Redis will expire the
+                object after `ttl` seconds.
         """
-        self._redis_client.set(key.redis_key, bytes(obj))
+        px = None if ttl is None else _ttl_to_ms(ttl)
+        self._redis_client.set(key.redis_key, bytes(obj), px=px)
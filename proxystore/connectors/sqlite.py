@@ -0,0 +1,448 @@
+"""SQLite connector implementation."""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Generator
+from collections.abc import Sequence
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any
+from typing import NamedTuple
+
+from proxystore.serialize import BytesLike
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+BLOB_CHUNK_SIZE_DEFAULT = 16 * 1024 * 1024
+"""Default chunk size (bytes) used for incremental BLOB reads and writes."""
+
+# Connection.blobopen() was added in Python 3.11.
+_INCREMENTAL_BLOB_IO = sys.version_info >= (3, 11)
+
+
+class SQLiteKey(NamedTuple):
+    """Key to objects in a SQLite database.
+
+    Attributes:
+        sqlite_key: Unique object ID.
+    """
+
+    sqlite_key: str
+
+
+class SQLiteConnector:
+    """Connector to a SQLite database on the local file system.
+
+    This connector stores objects as BLOBs in a single SQLite database file
+    which is suitable for persistent single-node deployments. Compared to the
+    [`FileConnector`][proxystore.connectors.file.FileConnector], there
+    is only one file (plus the WAL files) rather than two per object, batch
+    operations are performed atomically within a single transaction, and
+    key lookups use the primary key index.
+
+    The database is opened in
+    [write-ahead logging](https://www.sqlite.org/wal.html) mode so readers
+    in any number of processes do not block, and are not blocked by, a
+    writer. Each process lazily opens its own connection so instances of
+    this connector can be safely shared with child processes, e.g., by
+    reconstructing the connector from its config.
+
+    Objects larger than `blob_chunk_size` are written and read using
+    incremental BLOB I/O so SQLite never needs a second full copy of the
+    object in memory. Incremental BLOB I/O requires Python 3.11 or later;
+    older versions fall back to reading and writing the BLOB in one
+    statement.
+
+    Args:
+        database_path: Path to the database file. The file and parent
+            directories will be created if they do not exist.
+        clear: Delete the database file when
+            [`close()`][proxystore.connectors.sqlite.SQLiteConnector.close]
+            is called.
+        timeout: Seconds to wait for a lock held by another connection
+            before raising an error.
+        blob_chunk_size: Size in bytes of chunks used for incremental BLOB
+            I/O. Objects larger than this will be read and written in chunks.
+
+    Raises:
+        ValueError: If `blob_chunk_size` is not greater than zero.
+    """
+
+    def __init__(
+        self,
+        database_path: str | pathlib.Path,
+        *,
+        clear: bool = False,
+        timeout: float = 30,
+        blob_chunk_size: int = BLOB_CHUNK_SIZE_DEFAULT,
+    ) -> None:
+        if blob_chunk_size <= 0:
+            raise ValueError(
+                'BLOB chunk size must be greater than zero. '
+                f'Got {blob_chunk_size}.',
+            )
+
+        path = pathlib.Path(database_path).expanduser().resolve()
+        self.database_path = str(path)
+        self.clear = clear
+        self.timeout = timeout
+        self.blob_chunk_size = blob_chunk_size
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        # Initialize eagerly so configuration errors are raised here.
+        self._connection()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(database_path={self.database_path})'
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared across a fork so a new connection
+        # is opened if this instance is used in a different process.
+        pid = os.getpid()
+        if self._conn is None or self._conn_pid != pid:
+            conn = sqlite3.connect(
+                self.database_path,
+                timeout=self.timeout,
+                # Access is serialized by self._lock.
+                check_same_thread=False,
+                # Transactions are managed explicitly.
+                isolation_level=None,
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            # NORMAL is durable against application crashes in WAL mode
+            # and avoids an fsync on every commit.
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS blobs '
+                '(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)',
+            )
+            self._conn = conn
+            self._conn_pid = pid
+        return self._conn
+
+    @contextmanager
+    def _transaction(
+        self,
+        immediate: bool = False,
+    ) -> Generator[sqlite3.Connection, None, None]:
+        with self._lock:
+            conn = self._connection()
+            # Write transactions acquire the write lock immediately to avoid
+            # lock upgrade deadlocks between processes.
+            conn.execute('BEGIN IMMEDIATE' if immediate else 'BEGIN')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            else:
+                conn.execute('COMMIT')
+
+    def _read(self, conn: sqlite3.Connection, key: str) -> BytesLike | None:
+        cursor = conn.execute(
+            'SELECT rowid, length(value) FROM blobs WHERE key=? '
+            'AND (expires IS NULL OR expires>?)',
+            (key, time.time()),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        rowid, size = row
+
+        if size > self.blob_chunk_size and _INCREMENTAL_BLOB_IO:
+            return self._read_incremental(conn, rowid, size)
+
+        (value,) = conn.execute(
+            'SELECT value FROM blobs WHERE rowid=?',
+            (rowid,),
+        ).fetchone()
+        return value
+
+    def _read_incremental(  # pragma: >=3.11 cover
+        self,
+        conn: sqlite3.Connection,
+        rowid: int,
+        size: int,
+    ) -> BytesLike:
+        # Read into a preallocated buffer so peak memory is the size of the
+        # object plus one chunk rather than two copies of the object.
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        with conn.blobopen('blobs', 'value', rowid, readonly=True) as blob:
+            for offset in range(0, size, self.blob_chunk_size):
+                chunk = blob.read(self.blob_chunk_size)
+                view[offset : offset + len(chunk)] = chunk
+        return buffer
+
+    def _write(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        obj: BytesLike,
+        expires: float | None,
+    ) -> None:
+        size = len(obj)
+        if size > self.blob_chunk_size and _INCREMENTAL_BLOB_IO:
+            self._write_incremental(conn, key, obj, expires)
+            return
+
+        conn.execute(
+            'INSERT OR REPLACE INTO blobs (key, value, expires) '
+            'VALUES (?, ?, ?)',
+            (key, obj, expires),
+        )
+
+    def _write_incremental(  # pragma: >=3.11 cover
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        obj: BytesLike,
+        expires: float | None,
+    ) -> None:
+        # Reserve space with zeroblob() and then write the object in chunks
+        # directly from the buffer so SQLite does not copy the whole object
+        # when binding the parameter.
+        size = len(obj)
+        cursor = conn.execute(
+            'INSERT OR REPLACE INTO blobs (key, value, expires) '
+            'VALUES (?, zeroblob(?), ?)',
+            (key, size, expires),
+        )
+        rowid = cursor.lastrowid
+        assert rowid is not None
+        view = memoryview(obj).cast('B')
+        with conn.blobopen('blobs', 'value', rowid) as blob:
+            for offset in range(0, size, self.blob_chunk_size):
+                blob.write(view[offset : offset + self.blob_chunk_size])
+
+    def close(self, clear: bool | None = None) -> None:
+        """Close the connector and clean up.
+
+        Warning:
+            Passing `clear=True` will delete the database file which will
+            remove all objects, including those added by other connector
+            instances using the same database file.
+
+        Args:
+            clear: Delete the database file. Overrides the default value of
+                `clear` provided when the
+                [`SQLiteConnector`][proxystore.connectors.sqlite.SQLiteConnector]
+                was instantiated.
+        """
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+            if self.clear if clear is None else clear:
+                for suffix in ('', '-wal', '-shm'):
+                    try:
+                        os.remove(self.database_path + suffix)
+                    except FileNotFoundError:
+                        pass
+
+    def config(self) -> dict[str, Any]:
+        """Get the connector configuration.
+
+        The configuration contains all the information needed to reconstruct
+        the connector object.
+        """
+        return {
+            'database_path': self.database_path,
+            'clear': self.clear,
+            'timeout': self.timeout,
+            'blob_chunk_size': self.blob_chunk_size,
+        }
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> SQLiteConnector:
+        """Create a new connector instance from a configuration.
+
+        Args:
+            config: Configuration returned by `#!python .config()`.
+        """
+        return cls(**config)
+
+    def evict(self, key: SQLiteKey) -> None:
+        """Evict the object associated with the key.
+
+        Args:
+            key: Key associated with object to evict.
+        """
+        with self._transaction(immediate=True) as conn:
+            conn.execute('DELETE FROM blobs WHERE key=?', (key.sqlite_key,))
+
+    def evict_batch(self, keys: Sequence[SQLiteKey]) -> None:
+        """Evict a batch of objects in a single transaction.
+
+        Args:
+            keys: Sequence of keys associated with objects to evict.
+        """
+        with self._transaction(immediate=True) as conn:
+            conn.executemany(
+                'DELETE FROM blobs WHERE key=?',
+                [(key.sqlite_key,) for key in keys],
+            )
+
+    def exists(self, key: SQLiteKey) -> bool:
+        """Check if an object associated with the key exists.
+
+        Args:
+            key: Key potentially associated with stored object.
+
+        Returns:
+            If an object associated with the key exists.
+        """
+        with self._lock:
+            cursor = self._connection().execute(
+                'SELECT 1 FROM blobs WHERE key=? '
+                'AND (expires IS NULL OR expires>?) LIMIT 1',
+                (key.sqlite_key, time.time()),
+            )
+            return cursor.fetchone() is not None
+
+    def get(self, key: SQLiteKey) -> BytesLike | None:
+        """Get the serialized object associated with the key.
+
+        Args:
+            key: Key associated with the object to retrieve.
+
+        Returns:
+            Serialized object or `None` if the object does not exist.
+        """
+        with self._transaction() as conn:
+            return self._read(conn, key.sqlite_key)
+
+    def get_batch(self, keys: Sequence[SQLiteKey]) -> list[BytesLike | None]:
+        """Get a batch of serialized objects associated with the keys.
+
+        Objects are read within a single transaction so the batch is a
+        consistent snapshot of the database.
+
+        Args:
+            keys: Sequence of keys associated with objects to retrieve.
+
+        Returns:
+            List with same order as `keys` with the serialized objects or \
+            `None` if the corresponding key does not have an associated object.
+        """
+        with self._transaction() as conn:
+            return [self._read(conn, key.sqlite_key) for key in keys]
+
+    def new_key(self, obj: BytesLike | None = None) -> SQLiteKey:
+        """Create a new key.
+
+        Args:
+            obj: Optional object which the key will be associated with.
+                Ignored in this implementation.
+
+        Returns:
+            Key which can be used to retrieve an object once \
+            [`set()`][proxystore.connectors.sqlite.SQLiteConnector.set] \
+            has been called on the key.
+        """
+        return SQLiteKey(sqlite_key=str(uuid.uuid4()))
+
+    def put(self, obj: BytesLike, ttl: float | None = None) -> SQLiteKey:
+        """Put a serialized object in the store.
+
+        Args:
+            obj: Serialized object to put in the store.
+            ttl: Optional time-to-live in seconds after which the object
+                expires.
+
+        Returns:
+            Key which can be used to retrieve the object.
+        """
+        key = self.new_key()
+        self.set(key, obj, ttl=ttl)
+        return key
+
+    def put_batch(
+        self,
+        objs: Sequence[BytesLike],
+        ttl: float | None = None,
+    ) -> list[SQLiteKey]:
+        """Put a batch of serialized objects in a single transaction.
+
+        Args:
+            objs: Sequence of serialized objects to put in the store.
+            ttl: Optional time-to-live in seconds applied to each object.
+
+        Returns:
+            List of keys with the same order as `objs` which can be used to \
+            retrieve the objects.
+        """
+        keys = [self.new_key() for _ in objs]
+        expires = None if ttl is None else time.time() + ttl
+        with self._transaction(immediate=True) as conn:
+            for key, obj in zip(keys, objs, strict=True):
+                self._write(conn, key.sqlite_key, obj, expires)
+        return keys
+
+    def set(
+        self,
+        key: SQLiteKey,
+        obj: BytesLike,
+        ttl: float | None = None,
+    ) -> None:
+        """Set the object associated with a key.
+
+        Note:
+            The [`Connector`][proxystore.connectors.protocols.Connector]
+            provides write-once, read-many semantics. Thus,
+            [`set()`][proxystore.connectors.sqlite.SQLiteConnector.set]
+            should only be called once per key, otherwise unexpected behavior
+            can occur.
+
+        Args:
+            key: Key that the object will be associated with.
+            obj: Object to associate with the key.
+            ttl: Optional time-to-live in seconds after which the object
+                expires.
+        """
+        expires = None if ttl is None else time.time() + ttl
+        with self._transaction(immediate=True) as conn:
+            self._write(conn, key.sqlite_key, obj, expires)
+
+    def sweep(self) -> int:
+        """Delete all objects whose time-to-live has expired.
+
+        Returns:
+            Number of objects deleted.
+        """
+        with self._transaction(immediate=True) as conn:
+            cursor = conn.execute(
+                'DELETE FROM blobs WHERE expires<=?',
+                (time.time(),),
+            )
+            return cursor.rowcount
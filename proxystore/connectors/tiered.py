@@ -0,0 +1,464 @@
+"""Tiered connector implementation."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import logging
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any
+from typing import cast
+from typing import NamedTuple
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from proxystore.connectors.protocols import Connector
+from proxystore.connectors.protocols import DeferrableConnector
+from proxystore.serialize import BytesLike
+from proxystore.utils.imports import get_object_path
+from proxystore.utils.imports import import_from_path
+
+logger = logging.getLogger(__name__)
+
+
+class TieredKey(NamedTuple):
+    """Key to objects stored in a [`TieredConnector`][proxystore.connectors.tiered.TieredConnector].
+
+    Both keys are created when the object is first stored so the key
+    remains valid as the object migrates between tiers.
+
+    Attributes:
+        hot_key: Key of the object in the hot tier.
+        cold_key: Key of the object in the cold tier.
+    """  # noqa: E501
+
+    # Typed as Any for the same reason as MultiKey.connector_key.
+    hot_key: Any
+    cold_key: Any
+
+
+@dataclasses.dataclass
+class _HotEntry:
+    timestamp: float
+    size: int
+    in_cold: bool
+
+
+class TieredConnector:
+    """Connector composed of a fast hot tier and a large cold tier.
+
+    Objects are put in the hot tier, and a background thread demotes objects
+    to the cold tier once they are older than `demote_after` seconds or
+    when the total size of objects in the hot tier exceeds `max_hot_bytes`
+    (oldest objects are demoted first). Reads check the hot tier first and
+    then the cold tier, optionally promoting objects found in the cold tier
+    back to the hot tier.
+
+    Example:
+        ```python
+        from proxystore.connectors.file import FileConnector
+        from proxystore.connectors.redis import RedisConnector
+        from proxystore.connectors.tiered import TieredConnector
+
+        connector = TieredConnector(
+            RedisConnector(...),
+            FileConnector(...),
+            demote_after=30,
+            max_hot_bytes=1_000_000_000,
+        )
+        ```
+
+    Note:
+        Both tiers must implement the
+        [`DeferrableConnector`][proxystore.connectors.protocols.DeferrableConnector]
+        protocol because objects are written to a tier using a key created
+        ahead of time.
+
+    Note:
+        Only objects put (or promoted) by this connector instance are tracked
+        for demotion. Objects put by a connector in another process, for
+        example one created with
+        [`from_config()`][proxystore.connectors.tiered.TieredConnector.from_config],
+        are demoted by that connector.
+
+    Warning:
+        Objects which are still in the hot tier remain there when the
+        connector is closed. Call
+        [`flush()`][proxystore.connectors.tiered.TieredConnector.flush]
+        before closing to move all objects to the cold tier.
+
+    Args:
+        hot: Connector to put objects in.
+        cold: Connector objects are demoted to.
+        demote_after: Demote objects which have been in the hot tier for
+            this many seconds. If `None`, objects are not demoted by age.
+        max_hot_bytes: Demote the oldest objects when the total bytes in the
+            hot tier exceeds this value. If `None`, objects are not demoted
+            by size.
+        promote_on_get: Copy objects read from the cold tier back into the
+            hot tier.
+        interval: Seconds between checks for objects to demote.
+
+    Raises:
+        TypeError: If either connector does not implement the
+            [`DeferrableConnector`][proxystore.connectors.protocols.DeferrableConnector]
+            protocol.
+        ValueError: If `interval` is not greater than zero.
+    """
+
+    def __init__(
+        self,
+        hot: Connector[Any],
+        cold: Connector[Any],
+        *,
+        demote_after: float | None = 60,
+        max_hot_bytes: int | None = None,
+        promote_on_get: bool = False,
+        interval: float = 1,
+    ) -> None:
+        for connector in (hot, cold):
+            if not isinstance(connector, DeferrableConnector):
+                name = type(connector).__name__
+                raise TypeError(
+                    f'The provided connector is type {name} which does not '
+                    'implement the '
+                    f'{DeferrableConnector.__name__} protocol.',
+                )
+        if interval <= 0:
+            raise ValueError(
+                f'Interval must be greater than zero. Got {interval}.',
+            )
+
+        self.hot = hot
+        self.cold = cold
+        # Same connectors as above but typed with the deferrable methods.
+        self._hot_deferrable = cast(DeferrableConnector[Any], hot)
+        self._cold_deferrable = cast(DeferrableConnector[Any], cold)
+        self.demote_after = demote_after
+        self.max_hot_bytes = max_hot_bytes
+        self.promote_on_get = promote_on_get
+        self.interval = interval
+
+        # Objects currently in the hot tier ordered from oldest to newest.
+        self._hot_entries: collections.OrderedDict[TieredKey, _HotEntry] = (
+            collections.OrderedDict()
+        )
+        self._hot_bytes = 0
+        self._lock = threading.Lock()
+
+        self._demoter_stop = threading.Event()
+        self._demoter_wake = threading.Event()
+        self._demoter: threading.Thread | None = None
+        if self.demote_after is not None or self.max_hot_bytes is not None:
+            self._demoter = threading.Thread(
+                target=self._demote_loop,
+                daemon=True,
+                name='tiered-connector-demoter',
+            )
+            self._demoter.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(hot={self.hot}, cold={self.cold})'
+
+    @property
+    def hot_bytes(self) -> int:
+        """Total bytes of tracked objects in the hot tier."""
+        return self._hot_bytes
+
+    def close(self) -> None:
+        """Close the connector and clean up.
+
+        Warning:
+            This will call `close()` on both tiers.
+        """
+        self._demoter_stop.set()
+        self._demoter_wake.set()
+        if self._demoter is not None:
+            self._demoter.join()
+            self._demoter = None
+
+        self.hot.close()
+        self.cold.close()
+
+    def config(self) -> dict[str, Any]:
+        """Get the connector configuration.
+
+        The configuration contains all the information needed to reconstruct
+        the connector object.
+        """
+        return {
+            'hot': (get_object_path(type(self.hot)), self.hot.config()),
+            'cold': (get_object_path(type(self.cold)), self.cold.config()),
+            'demote_after': self.demote_after,
+            'max_hot_bytes': self.max_hot_bytes,
+            'promote_on_get': self.promote_on_get,
+            'interval': self.interval,
+        }
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> TieredConnector:
+        """Create a new connector instance from a configuration.
+
+        Args:
+            config: Configuration returned by `#!python .config()`.
+        """
+        config = config.copy()
+        tiers = {}
+        for tier in ('hot', 'cold'):
+            path, tier_config = config.pop(tier)
+            tiers[tier] = import_from_path(path).from_config(tier_config)
+        return cls(**tiers, **config)
+
+    def evict(self, key: TieredKey) -> None:
+        """Evict the object associated with the key.
+
+        Args:
+            key: Key associated with object to evict.
+        """
+        self._untrack(key)
+        self.hot.evict(key.hot_key)
+        self.cold.evict(key.cold_key)
+
+    def exists(self, key: TieredKey) -> bool:
+        """Check if an object associated with the key exists.
+
+        Args:
+            key: Key potentially associated with stored object.
+
+        Returns:
+            If an object associated with the key exists.
+        """
+        return self.hot.exists(key.hot_key) or self.cold.exists(key.cold_key)
+
+    def get(self, key: TieredKey) -> BytesLike | None:
+        """Get the serialized object associated with the key.
+
+        Args:
+            key: Key associated with the object to retrieve.
+
+        Returns:
+            Serialized object or `None` if the object does not exist.
+        """
+        obj = self.hot.get(key.hot_key)
+        if obj is not None:
+            return obj
+
+        obj = self.cold.get(key.cold_key)
+        if obj is not None and self.promote_on_get:
+            self._promote(key, obj)
+        return obj
+
+    def get_batch(self, keys: Sequence[TieredKey]) -> list[BytesLike | None]:
+        """Get a batch of serialized objects associated with the keys.
+
+        Args:
+            keys: Sequence of keys associated with objects to retrieve.
+
+        Returns:
+            List with same order as `keys` with the serialized objects or \
+            `None` if the corresponding key does not have an associated object.
+        """
+        objs = self.hot.get_batch([key.hot_key for key in keys])
+        missing = [i for i, obj in enumerate(objs) if obj is None]
+        if len(missing) == 0:
+            return objs
+
+        cold_objs = self.cold.get_batch([keys[i].cold_key for i in missing])
+        for i, obj in zip(missing, cold_objs, strict=True):
+            objs[i] = obj
+            if obj is not None and self.promote_on_get:
+                self._promote(keys[i], obj)
+        return objs
+
+    def new_key(self, obj: BytesLike | None = None) -> TieredKey:
+        """Create a new key.
+
+        Args:
+            obj: Optional object which the key will be associated with.
+                Ignored by this implementation.
+
+        Returns:
+            Key which can be used to retrieve an object once \
+            [`set()`][proxystore.connectors.tiered.TieredConnector.set] \
+            has been called on the key.
+        """
+        return TieredKey(
+            hot_key=self._hot_deferrable.new_key(),
+            cold_key=self._cold_deferrable.new_key(),
+        )
+
+    def put(self, obj: BytesLike) -> TieredKey:
+        """Put a serialized object in the hot tier.
+
+        Args:
+            obj: Serialized object to put in the store.
+
+        Returns:
+            Key which can be used to retrieve the object.
+        """
+        key = TieredKey(
+            hot_key=self.hot.put(obj),
+            cold_key=self._cold_deferrable.new_key(),
+        )
+        self._track(key, len(obj), in_cold=False)
+        return key
+
+    def put_batch(self, objs: Sequence[BytesLike]) -> list[TieredKey]:
+        """Put a batch of serialized objects in the hot tier.
+
+        Args:
+            objs: Sequence of serialized objects to put in the store.
+
+        Returns:
+            List of keys with the same order as `objs` which can be used to \
+            retrieve the objects.
+        """
+        hot_keys = self.hot.put_batch(objs)
+        keys = [
+            TieredKey(
+                hot_key=hot_key,
+                cold_key=self._cold_deferrable.new_key(),
+            )
+            for hot_key in hot_keys
+        ]
+        for key, obj in zip(keys, objs, strict=True):
+            self._track(key, len(obj), in_cold=False)
+        return keys
+
+    def set(self, key: TieredKey, obj: BytesLike) -> None:
+        """Set the object associated with a key in the hot tier.
+
+        Note:
+            The [`Connector`][proxystore.connectors.protocols.Connector]
+            provides write-once, read-many semantics. Thus,
+            [`set()`][proxystore.connectors.tiered.TieredConnector.set]
+            should only be called once per key, otherwise unexpected behavior
+            can occur.
+
+        Args:
+            key: Key that the object will be associated with.
+            obj: Object to associate with the key.
+        """
+        self._hot_deferrable.set(key.hot_key, obj)
+        self._track(key, len(obj), in_cold=False)
+
+    def demote(self, key: TieredKey) -> bool:
+        """Move an object from the hot tier to the cold tier.
+
+        Args:
+            key: Key associated with the object to demote.
+
+        Returns:
+            If the object was demoted. `False` if the object is not tracked \
+            in the hot tier by this connector.
+        """
+        with self._lock:
+            entry = self._hot_entries.get(key, None)
+        if entry is None:
+            return False
+
+        if not entry.in_cold:
+            obj = self.hot.get(key.hot_key)
+            if obj is None:
+                # Object was evicted from the hot tier by someone else.
+                self._untrack(key)
+                return False
+            self._cold_deferrable.set(key.cold_key, obj)
+
+        if not self._untrack(key):
+            # Object was evicted while being copied to the cold tier so
+            # remove the copy that was just written.
+            self.cold.evict(key.cold_key)
+            return False
+        self.hot.evict(key.hot_key)
+        return True
+
+    def flush(self) -> int:
+        """Demote all objects tracked in the hot tier.
+
+        Returns:
+            Number of objects demoted.
+        """
+        with self._lock:
+            keys = list(self._hot_entries)
+        return sum(self.demote(key) for key in keys)
+
+    def _demote_ready(self) -> int:
+        now = time.monotonic()
+        keys: list[TieredKey] = []
+        with self._lock:
+            excess = (
+                self._hot_bytes - self.max_hot_bytes
+                if self.max_hot_bytes is not None
+                else 0
+            )
+            for key, entry in self._hot_entries.items():
+                expired = (
+                    self.demote_after is not None
+                    and now - entry.timestamp >= self.demote_after
+                )
+                if not expired and excess <= 0:
+                    # Entries are ordered oldest first so no later entries
+                    # can be expired either.
+                    break
+                keys.append(key)
+                excess -= entry.size
+        return sum(self.demote(key) for key in keys)
+
+    def _demote_loop(self) -> None:
+        while not self._demoter_stop.is_set():
+            self._demoter_wake.wait(self.interval)
+            self._demoter_wake.clear()
+            if self._demoter_stop.is_set():
+                break
+            try:
+                self._demote_ready()
+            except Exception:  # pragma: no cover
+                logger.exception('Failed to demote objects to the cold tier')
+
+    def _promote(self, key: TieredKey, obj: BytesLike) -> None:
+        self._hot_deferrable.set(key.hot_key, obj)
+        self._track(key, len(obj), in_cold=True)
+
+    def _track(self, key: TieredKey, size: int, *, in_cold: bool) -> None:
+        with self._lock:
+            previous = self._hot_entries.pop(key, None)
+            if previous is not None:
+                self._hot_bytes -= previous.size
+            self._hot_entries[key] = _HotEntry(
+                timestamp=time.monotonic(),
+                size=size,
+                in_cold=in_cold,
+            )
+            self._hot_bytes += size
+            pressure = (
+                self.max_hot_bytes is not None
+                and self._hot_bytes > self.max_hot_bytes
+            )
+        if pressure:
+            self._demoter_wake.set()
+
+    def _untrack(self, key: TieredKey) -> bool:
+        with self._lock:
+            entry = self._hot_entries.pop(key, None)
+            if entry is not None:
+                self._hot_bytes -= entry.size
+        return entry is not None
@@ -6,6 +6,7 @@ See the CLI Reference for the
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
@@ -23,6 +24,7 @@ from proxystore.endpoint.commands import remove_endpoint
 from proxystore.endpoint.commands import start_endpoint
 from proxystore.endpoint.commands import stop_endpoint
 from proxystore.endpoint.config import read_config
+from proxystore.endpoint.metrics import format_prometheus
 from proxystore.p2p.nat import check_nat_and_log
 from proxystore.serialize import deserialize
 from proxystore.serialize import serialize
@@ -159,6 +161,12 @@ def check_nat_command(host: str, port: int) -> None:
     metavar='BOOL',
     help='Optionally persist data to a database.',
 )
+@click.option(
+    '--unix-socket/--no-unix-socket',
+    default=False,
+    metavar='BOOL',
+    help='Optionally listen on a Unix socket for local clients.',
+)
 def configure(
     name: str,
     host: str,
@@ -168,6 +176,7 @@ def configure(
     relay_server: bool,
     peer_channels: int,
     persist: bool,
+    unix_socket: bool,
 ) -> None:
     """Configure a new endpoint."""
     raise SystemExit(
@@ -179,6 +188,7 @@ def configure(
             port=port,
             relay_auth=relay_auth,
             relay_server=relay_address if relay_server else None,
+            unix_socket=unix_socket,
         ),
     )
 
@@ -207,6 +217,42 @@ def start(ctx: click.Context, name: str, detach: bool) -> None:
     )
 
 
+@cli.command()
+@click.argument('name', metavar='NAME', required=True)
+@click.option(
+    '--format',
+    'format_',
+    default='json',
+    type=click.Choice(['json', 'prometheus']),
+    help='Output format.',
+)
+def stats(name: str, format_: str) -> None:
+    """Print statistics of a running endpoint."""
+    endpoint_dir = os.path.join(home_dir(), name)
+    if not os.path.isdir(endpoint_dir):
+        logger.error(f'An endpoint named {name} does not exist.')
+        sys.exit(1)
+    cfg = read_config(endpoint_dir)
+
+    address = f'http://{cfg.host}:{cfg.port}'
+    if cfg.socket_path is not None and os.path.exists(cfg.socket_path):
+        address = client.unix_socket_address(cfg.socket_path)
+    try:
+        stats_ = client.metrics(address)
+    except requests.exceptions.ConnectionError as e:
+        logger.error(f'Unable to connect to endpoint at {address}.')
+        logger.debug(e)
+        sys.exit(1)
+    except requests.exceptions.RequestException as e:
+        logger.error(e)
+        sys.exit(1)
+
+    if format_ == 'json':
+        click.echo(json.dumps(stats_, indent=2))
+    else:
+        click.echo(format_prometheus(stats_), nl=False)
+
+
 @cli.command()
 @click.argument('name', metavar='NAME', required=True)
 def stop(name: str) -> None:
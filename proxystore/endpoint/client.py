@@ -8,17 +8,193 @@ Note:
 
 Note:
     These client functions ignore all HTTP proxies.
+
+Note:
+    An endpoint configured with a
+    [`socket_path`][proxystore.endpoint.config.EndpointConfig] can also be
+    reached by clients on the same host through a Unix domain socket. Use
+    [`unix_socket_address()`][proxystore.endpoint.client.unix_socket_address]
+    to get the address of the socket to pass to these client functions. A
+    session passed to these functions with such an address must have a
+    [`UnixSocketAdapter`][proxystore.endpoint.client.UnixSocketAdapter]
+    mounted.
 """
 
 from __future__ import annotations
 
+import functools
+import json
+import socket
+import threading
+import urllib.parse
 import uuid
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+from typing import Literal
 
 import requests
+import requests.adapters
+import urllib3
 from requests.exceptions import RequestException  # noqa: F401
 
 from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
-from proxystore.utils.data import chunk_bytes
+from proxystore.endpoint.multipart import decode_multipart
+from proxystore.endpoint.multipart import encode_multipart
+from proxystore.endpoint.multipart import encoded_length
+
+UNIX_SOCKET_SCHEME = 'http+unix'
+"""URL scheme of endpoint addresses that refer to a Unix domain socket."""
+
+
+def unix_socket_address(path: str) -> str:
+    """Get the address of an endpoint listening on a Unix domain socket.
+
+    Args:
+        path: Path to the Unix domain socket.
+
+    Returns:
+        Address to pass to the client functions in this module.
+    """
+    return f'{UNIX_SOCKET_SCHEME}://{urllib.parse.quote(path, safe="")}'
+
+
+class _UnixSocketConnection(urllib3.connection.HTTPConnection):
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        super().__init__('localhost', **kwargs)
+        self._socket_path = path
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class _UnixSocketConnectionPool(urllib3.HTTPConnectionPool):
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        super().__init__('localhost', **kwargs)
+        self._socket_path = path
+
+    def _new_conn(self) -> _UnixSocketConnection:
+        self.num_connections += 1
+        return _UnixSocketConnection(
+            self._socket_path,
+            timeout=self.timeout.connect_timeout,
+        )
+
+
+class UnixSocketAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter for endpoints listening on a Unix domain socket.
+
+    The adapter handles URLs with the scheme
+    [`UNIX_SOCKET_SCHEME`][proxystore.endpoint.client.UNIX_SOCKET_SCHEME]
+    where the host is the percent-encoded path to the socket.
+
+    Example:
+        ```python
+        session = requests.Session()
+        session.mount(f'{UNIX_SOCKET_SCHEME}://', UnixSocketAdapter())
+        ```
+
+    Args:
+        pool_maxsize: Maximum number of connections to keep in the pool
+            of each socket.
+        kwargs: Additional keyword arguments to pass to
+            [`HTTPAdapter`][requests.adapters.HTTPAdapter].
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(pool_maxsize=pool_maxsize, **kwargs)
+        self._maxsize = pool_maxsize
+        self._pools: dict[str, _UnixSocketConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+
+    def _get_pool(self, url: str) -> _UnixSocketConnectionPool:
+        path = urllib.parse.unquote(urllib.parse.urlparse(url).netloc)
+        with self._pools_lock:
+            pool = self._pools.get(path, None)
+            if pool is None:
+                pool = _UnixSocketConnectionPool(
+                    path,
+                    maxsize=self._maxsize,
+                )
+                self._pools[path] = pool
+            return pool
+
+    def get_connection_with_tls_context(
+        self,
+        request: requests.PreparedRequest,
+        verify: bool | str | None,
+        proxies: Mapping[str, str] | None = None,
+        cert: tuple[str, str] | str | None = None,
+    ) -> urllib3.HTTPConnectionPool:
+        """Get the connection pool for the socket of the request URL."""
+        assert request.url is not None
+        return self._get_pool(request.url)
+
+    def get_connection(  # type: ignore[override]
+        self,
+        url: str,
+        proxies: Mapping[str, str] | None = None,
+    ) -> urllib3.HTTPConnectionPool:  # pragma: no cover
+        """Get the connection pool for the socket of the URL.
+
+        Used by versions of `requests` prior to 2.32.2.
+        """
+        return self._get_pool(url)
+
+    def request_url(
+        self,
+        request: requests.PreparedRequest,
+        proxies: Mapping[str, str] | None,
+    ) -> str:
+        """Get the URL to use in the request line."""
+        return request.path_url
+
+    def close(self) -> None:
+        """Close all connection pools."""
+        super().close()
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+
+
+def _unix_socket_request(
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> requests.Response:
+    # Mirrors requests.request() which uses a temporary session.
+    with requests.Session() as session:
+        session.mount(f'{UNIX_SOCKET_SCHEME}://', UnixSocketAdapter())
+        return session.request(method, url, **kwargs)
+
+
+def _sender(
+    method: Literal['get', 'post'],
+    address: str,
+    session: requests.Session | None,
+) -> Callable[..., requests.Response]:
+    if session is not None:
+        return getattr(session, method)
+    elif address.startswith(f'{UNIX_SOCKET_SCHEME}://'):
+        return functools.partial(_unix_socket_request, method)
+    else:
+        return getattr(requests, method)
 
 
 def evict(
@@ -44,7 +220,7 @@ def evict(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    post = requests.post if session is None else session.post
+    post = _sender('post', address, session)
     response = post(
         f'{address}/evict',
         params={'key': key, 'endpoint': endpoint_str},
@@ -84,7 +260,7 @@ def exists(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    get_ = requests.get if session is None else session.get
+    get_ = _sender('get', address, session)
     response = get_(
         f'{address}/exists',
         params={'key': key, 'endpoint': endpoint_str},
@@ -104,7 +280,7 @@ def get(
     key: str,
     endpoint: uuid.UUID | str | None = None,
     session: requests.Session | None = None,
-) -> bytes | None:
+) -> bytearray | None:
     """Get the serialized object associated with the key.
 
     Args:
@@ -125,7 +301,7 @@ def get(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    get_ = requests.get if session is None else session.get
+    get_ = _sender('get', address, session)
     response = get_(
         f'{address}/get',
         params={'key': key, 'endpoint': endpoint_str},
@@ -145,10 +321,7 @@ def get(
             response=response,
         )
 
-    data = bytearray()
-    for chunk in response.iter_content(chunk_size=None):
-        data += chunk
-    return bytes(data)
+    return _read_response(response)
 
 
 def put(
@@ -157,9 +330,13 @@ def put(
     data: bytes,
     endpoint: uuid.UUID | str | None = None,
     session: requests.Session | None = None,
+    ttl: float | None = None,
 ) -> None:
     """Put a serialized object in the store.
 
+    The data is sent as-is with its `Content-Length` so the endpoint can
+    read it into a preallocated buffer.
+
     Args:
         address: Address of endpoint.
         key: Key associated with object to retrieve.
@@ -168,6 +345,8 @@ def put(
         session: Session instance to use for making the request. Reusing the
             same session across multiple requests to the same host can improve
             performance.
+        ttl: Optional time-to-live in seconds after which the endpoint
+            will expire the object.
 
     Raises:
         RequestException: If the endpoint request results in an unexpected
@@ -176,13 +355,292 @@ def put(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    post = requests.post if session is None else session.post
+    post = _sender('post', address, session)
     response = post(
         f'{address}/set',
         headers={'Content-Type': 'application/octet-stream'},
-        params={'key': key, 'endpoint': endpoint_str},
+        params={'key': key, 'endpoint': endpoint_str, 'ttl': ttl},
+        proxies={'http': ''},
+        data=data,
+    )
+    if not response.ok:
+        raise requests.exceptions.RequestException(
+            f'Endpoint returned HTTP error code {response.status_code}. '
+            f'{response.text}',
+            response=response,
+        )
+
+
+def metrics(
+    address: str,
+    session: requests.Session | None = None,
+) -> dict[str, Any]:
+    """Get the statistics of an endpoint.
+
+    Args:
+        address: Address of endpoint.
+        session: Session instance to use for making the request. Reusing the
+            same session across multiple requests to the same host can improve
+            performance.
+
+    Returns:
+        Statistics returned by
+        [`Endpoint.stats()`][proxystore.endpoint.endpoint.Endpoint.stats].
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+    """
+    get_ = _sender('get', address, session)
+    response = get_(
+        f'{address}/metrics',
+        params={'format': 'json'},
+        proxies={'http': ''},
+    )
+    if not response.ok:
+        raise requests.exceptions.RequestException(
+            f'Endpoint returned HTTP error code {response.status_code}. '
+            f'{response.text}',
+            response=response,
+        )
+    return response.json()
+
+
+def _read_response(response: requests.Response) -> bytearray:
+    """Read the body of a streamed response.
+
+    If the endpoint provided the `Content-Length`, the body is read
+    directly into a preallocated buffer in bounded chunks. Otherwise, the
+    buffer is grown as chunks are received.
+    """
+    length = response.headers.get('Content-Length', None)
+    if length is None or 'Content-Encoding' in response.headers:
+        data = bytearray()
+        for chunk in response.iter_content(chunk_size=None):
+            data += chunk
+        return data
+
+    data = bytearray(int(length))
+    offset = 0
+    with memoryview(data) as view:
+        while offset < len(data):
+            end = min(offset + MAX_CHUNK_LENGTH, len(data))
+            received = response.raw.readinto(view[offset:end])
+            if received == 0:
+                raise requests.exceptions.RequestException(
+                    f'Endpoint response ended after {offset} of '
+                    f'{len(data)} bytes.',
+                    response=response,
+                )
+            offset += received
+    return data
+
+
+class _SizedBody:
+    """Iterable request body with a known length.
+
+    requests sends an iterable body with chunked transfer encoding unless
+    the length of the body is known, in which case the `Content-Length`
+    header is set instead.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], length: int) -> None:
+        self._chunks = chunks
+        self._length = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._chunks)
+
+    def __len__(self) -> int:
+        return self._length
+
+
+def _batch_header(
+    keys: Sequence[str],
+    endpoints: Sequence[uuid.UUID | str | None] | None,
+) -> dict[str, Any]:
+    if endpoints is not None and len(endpoints) != len(keys):
+        raise ValueError(
+            f'Got {len(keys)} keys but {len(endpoints)} endpoints.',
+        )
+    return {
+        'keys': list(keys),
+        'endpoints': None
+        if endpoints is None
+        else [
+            str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
+            for endpoint in endpoints
+        ],
+    }
+
+
+def evict_batch(
+    address: str,
+    keys: Sequence[str],
+    endpoints: Sequence[uuid.UUID | str | None] | None = None,
+    session: requests.Session | None = None,
+) -> None:
+    """Evict the objects associated with a batch of keys.
+
+    Args:
+        address: Address of endpoint.
+        keys: Keys associated with objects to evict.
+        endpoints: Optional UUID of the remote endpoint to forward each
+            operation to. Must be the same length as `keys` if provided.
+        session: Session instance to use for making the request. Reusing the
+            same session across multiple requests to the same host can improve
+            performance.
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+        ValueError: If `keys` and `endpoints` have different lengths.
+    """
+    post = _sender('post', address, session)
+    response = post(
+        f'{address}/evict_batch',
+        json=_batch_header(keys, endpoints),
+        proxies={'http': ''},
+    )
+    if not response.ok:
+        raise requests.exceptions.RequestException(
+            f'Endpoint returned HTTP error code {response.status_code}. '
+            f'{response.text}',
+            response=response,
+        )
+
+
+def exists_batch(
+    address: str,
+    keys: Sequence[str],
+    endpoints: Sequence[uuid.UUID | str | None] | None = None,
+    session: requests.Session | None = None,
+) -> list[bool]:
+    """Check if objects associated with a batch of keys exist.
+
+    Args:
+        address: Address of endpoint.
+        keys: Keys potentially associated with stored objects.
+        endpoints: Optional UUID of the remote endpoint to forward each
+            operation to. Must be the same length as `keys` if provided.
+        session: Session instance to use for making the request. Reusing the
+            same session across multiple requests to the same host can improve
+            performance.
+
+    Returns:
+        List with the same order as `keys` indicating if an object \
+        associated with the key exists.
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+        ValueError: If `keys` and `endpoints` have different lengths.
+    """
+    post = _sender('post', address, session)
+    response = post(
+        f'{address}/exists_batch',
+        json=_batch_header(keys, endpoints),
+        proxies={'http': ''},
+    )
+    if not response.ok:
+        raise requests.exceptions.RequestException(
+            f'Endpoint returned HTTP error code {response.status_code}. '
+            f'{response.text}',
+            response=response,
+        )
+    return response.json()['exists']
+
+
+def get_batch(
+    address: str,
+    keys: Sequence[str],
+    endpoints: Sequence[uuid.UUID | str | None] | None = None,
+    session: requests.Session | None = None,
+) -> list[memoryview | None]:
+    """Get the serialized objects associated with a batch of keys.
+
+    Args:
+        address: Address of endpoint.
+        keys: Keys associated with objects to retrieve.
+        endpoints: Optional UUID of the remote endpoint to forward each
+            operation to. Must be the same length as `keys` if provided.
+        session: Session instance to use for making the request. Reusing the
+            same session across multiple requests to the same host can improve
+            performance.
+
+    Returns:
+        List with the same order as `keys` of views of the serialized \
+        objects in the response body or `None` if the corresponding object \
+        does not exist.
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+        ValueError: If `keys` and `endpoints` have different lengths.
+    """
+    post = _sender('post', address, session)
+    response = post(
+        f'{address}/get_batch',
+        json=_batch_header(keys, endpoints),
+        proxies={'http': ''},
+        stream=True,
+    )
+    if not response.ok:
+        raise requests.exceptions.RequestException(
+            f'Endpoint returned HTTP error code {response.status_code}. '
+            f'{response.text}',
+            response=response,
+        )
+
+    return decode_multipart(_read_response(response))
+
+
+def put_batch(
+    address: str,
+    keys: Sequence[str],
+    data: Sequence[bytes | bytearray | memoryview],
+    endpoints: Sequence[uuid.UUID | str | None] | None = None,
+    session: requests.Session | None = None,
+    ttl: float | None = None,
+) -> None:
+    """Put a batch of serialized objects in the store.
+
+    The objects are streamed in the request body without being copied into
+    a single buffer and the `Content-Length` of the body is provided.
+
+    Args:
+        address: Address of endpoint.
+        keys: Keys to associate with each object.
+        data: Serialized data to put in the store.
+        endpoints: Optional UUID of the remote endpoint to forward each
+            operation to. Must be the same length as `keys` if provided.
+        session: Session instance to use for making the request. Reusing the
+            same session across multiple requests to the same host can improve
+            performance.
+        ttl: Optional time-to-live in seconds after which the endpoint
+            will expire the objects.
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+        ValueError: If `keys`, `data`, and `endpoints` have different lengths.
+    """
+    if len(data) != len(keys):
+        raise ValueError(f'Got {len(keys)} keys but {len(data)} values.')
+    header = json.dumps(_batch_header(keys, endpoints)).encode()
+    parts = [header, *data]
+    body = _SizedBody(
+        encode_multipart(parts, MAX_CHUNK_LENGTH),
+        encoded_length(parts),
+    )
+
+    post = _sender('post', address, session)
+    response = post(
+        f'{address}/set_batch',
+        headers={'Content-Type': 'application/octet-stream'},
+        params={'ttl': ttl},
         proxies={'http': ''},
-        data=chunk_bytes(data, MAX_CHUNK_LENGTH),
+        data=body,
         stream=True,
     )
     if not response.ok:
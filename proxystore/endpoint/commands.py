@@ -26,6 +26,7 @@ import psutil
 from proxystore import utils
 from proxystore.endpoint.config import ENDPOINT_CONFIG_FILE
 from proxystore.endpoint.config import ENDPOINT_DATABASE_FILE
+from proxystore.endpoint.config import ENDPOINT_SOCKET_FILE
 from proxystore.endpoint.config import EndpointConfig
 from proxystore.endpoint.config import EndpointRelayAuthConfig
 from proxystore.endpoint.config import EndpointRelayConfig
@@ -114,6 +115,7 @@ def configure_endpoint(
     proxystore_dir: str | None = None,
     relay_auth: bool = True,
     relay_server: str | None,
+    unix_socket: bool = False,
 ) -> int:
     """Configure a new endpoint.
 
@@ -131,6 +133,8 @@ def configure_endpoint(
         relay_server: Optional relay server address for P2P endpoint
             connections.
         relay_auth: Relay server used Globus Auth.
+        unix_socket: Also listen on a Unix domain socket in the endpoint
+            directory which local clients will prefer.
 
     Returns:
         Exit code where 0 is success and 1 is failure. Failure messages \
@@ -146,6 +150,12 @@ def configure_endpoint(
         else None
     )
 
+    socket_path = (
+        os.path.join(endpoint_dir, ENDPOINT_SOCKET_FILE)
+        if unix_socket
+        else None
+    )
+
     host_addr: str | None = None
     host_type: Literal['fqdn', 'ip', 'static']
     if host.lower().strip() == 'fqdn':
@@ -165,6 +175,7 @@ def configure_endpoint(
             host=host_addr,
             port=port,
             host_type=host_type,
+            socket_path=socket_path,
             relay=EndpointRelayConfig(
                 address=relay_server,
                 auth=EndpointRelayAuthConfig(
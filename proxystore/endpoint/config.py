@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import re
+import sys
 import uuid
 from typing import Any
 from typing import Literal
@@ -11,6 +12,7 @@ from typing import Literal
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import model_validator
 
 try:
     from pydantic import field_validator
@@ -18,12 +20,19 @@ except ImportError:  # pragma: no cover
     # Pydantic v1 compatibility
     from pydantic import validator as field_validator  # type: ignore[no-redef]
 
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
 from proxystore.endpoint.constants import MAX_OBJECT_SIZE_DEFAULT
+from proxystore.endpoint.constants import MAX_REQUEST_SIZE_DEFAULT
 from proxystore.utils.config import dump
 from proxystore.utils.config import load
 
 ENDPOINT_CONFIG_FILE = 'config.toml'
 ENDPOINT_DATABASE_FILE = 'blobs.db'
+ENDPOINT_SOCKET_FILE = 'endpoint.sock'
 ENDPOINT_LOG_FILE = 'log.txt'
 ENDPOINT_PID_FILE = 'daemon.pid'
 
@@ -49,6 +58,12 @@ class EndpointRelayConfig(BaseModel):
         address: Address of the relay server to register with.
         auth: Relay server authentication configuration.
         peer_channels: Number of peer channels to multiplex communication over.
+        max_peer_requests: Maximum number of requests from peer endpoints to
+            process concurrently.
+        peer_idle_timeout: Optional seconds after which a peer connection
+            that has not been used is closed.
+        warm_peers: UUIDs of peer endpoints to open connections with when
+            the endpoint starts.
         verify_certificates: Validate the relay server's SSL certificate. This
             should only be disabled when testing endpoint with local relay
             servers using self-signed certificates.
@@ -59,6 +74,9 @@ class EndpointRelayConfig(BaseModel):
         default_factory=EndpointRelayAuthConfig,
     )
     peer_channels: int = 1
+    max_peer_requests: int = 16
+    peer_idle_timeout: float | None = None
+    warm_peers: list[str] = Field(default_factory=list)
     verify_certificate: bool = True
 
     @field_validator('address')
@@ -79,6 +97,32 @@ class EndpointRelayConfig(BaseModel):
             raise ValueError('Peer channels must be >= 1.')
         return v
 
+    @field_validator('max_peer_requests')
+    @classmethod
+    def _max_peer_requests_validator(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Max peer requests must be >= 1.')
+        return v
+
+    @field_validator('peer_idle_timeout')
+    @classmethod
+    def _peer_idle_timeout_validator(cls, v: float | None) -> float | None:
+        if v is not None and v <= 0:
+            raise ValueError('Peer idle timeout must be None or > 0.')
+        return v
+
+    @field_validator('warm_peers')
+    @classmethod
+    def _warm_peers_validator(cls, v: list[str]) -> list[str]:
+        for peer in v:
+            try:
+                uuid.UUID(peer)
+            except ValueError:
+                raise ValueError(
+                    f'Warm peer "{peer}" is not a valid UUID string.',
+                ) from None
+        return v
+
 
 class EndpointStorageConfig(BaseModel):
     """Endpoint data storage configuration.
@@ -88,10 +132,28 @@ class EndpointStorageConfig(BaseModel):
             for storing endpoint data. If `None`, data will only be stored
             in-memory.
         max_object_size: Optional maximum object size.
+        max_memory_size: Optional byte budget for keeping objects in-memory.
+            If set, a
+            [`TieredStorage`][proxystore.endpoint.storage.TieredStorage] is
+            used which spills the least recently used objects to the SQLite
+            database at `database_path` when the budget is exceeded. Requires
+            `database_path` to be set.
+        commit_window: Optional seconds to batch writes to the SQLite
+            database into a single commit. If `None`, each write is committed
+            immediately.
+        replica_cache_size: Optional byte budget for caching objects fetched
+            from peer endpoints. If `None`, fetched objects are not cached.
+        max_request_size: Optional maximum size in bytes of a request body,
+            such as the objects in a batch set request. Larger requests
+            are rejected before the body is read.
     """
 
     database_path: str | None = None
     max_object_size: int = MAX_OBJECT_SIZE_DEFAULT
+    max_memory_size: int | None = None
+    commit_window: float | None = None
+    replica_cache_size: int | None = None
+    max_request_size: int | None = MAX_REQUEST_SIZE_DEFAULT
 
     @field_validator('max_object_size')
     @classmethod
@@ -102,6 +164,50 @@ class EndpointStorageConfig(BaseModel):
             )
         return v
 
+    @field_validator('max_request_size')
+    @classmethod
+    def _max_request_size_validator(cls, v: int | None) -> int | None:
+        if v is not None and v < 1:
+            raise ValueError(
+                'Max request size must be None or greater than zero.',
+            )
+        return v
+
+    @field_validator('max_memory_size')
+    @classmethod
+    def _max_memory_size_validator(cls, v: int | None) -> int | None:
+        if v is not None and v < 0:
+            raise ValueError(
+                'Max memory size must be None or greater than or equal to '
+                'zero.',
+            )
+        return v
+
+    @field_validator('commit_window')
+    @classmethod
+    def _commit_window_validator(cls, v: float | None) -> float | None:
+        if v is not None and v < 0:
+            raise ValueError('Commit window must be None or non-negative.')
+        return v
+
+    @field_validator('replica_cache_size')
+    @classmethod
+    def _replica_cache_size_validator(cls, v: int | None) -> int | None:
+        if v is not None and v < 0:
+            raise ValueError(
+                'Replica cache size must be None or greater than or equal '
+                'to zero.',
+            )
+        return v
+
+    @model_validator(mode='after')
+    def _database_path_required(self) -> Self:
+        if self.max_memory_size is not None and self.database_path is None:
+            raise ValueError(
+                'A database path is required when max memory size is set.',
+            )
+        return self
+
 
 class EndpointConfig(BaseModel):
     """Endpoint configuration.
@@ -112,6 +218,9 @@ class EndpointConfig(BaseModel):
         host: Host endpoint is running on.
         host_type: Type of host address to use (FQDN or IP).
         port: Port endpoint is running on.
+        socket_path: Optional path to a Unix domain socket the endpoint
+            will also listen on. Clients on the same host will prefer the
+            socket over the host and port.
         peering: Peering configuration.
         storage: Storage configuration.
 
@@ -126,6 +235,7 @@ class EndpointConfig(BaseModel):
     port: int
     host: str | None = None
     host_type: Literal['fqdn', 'ip', 'static'] = 'ip'
+    socket_path: str | None = None
     relay: EndpointRelayConfig = Field(
         default_factory=EndpointRelayConfig,
     )
@@ -161,6 +271,11 @@ class EndpointConfig(BaseModel):
             raise ValueError('Port must be in range [1, 65535].')
         return v
 
+    @field_validator('socket_path')
+    @classmethod
+    def _socket_path_validator(cls, v: str | None) -> str | None:
+        return None if v is None else os.path.expanduser(v)
+
 
 def get_configs(proxystore_dir: str) -> list[EndpointConfig]:
     """Get all valid endpoint configurations in parent directory.
@@ -7,3 +7,9 @@ MAX_CHUNK_LENGTH = 1000_000
 
 MAX_OBJECT_SIZE_DEFAULT = 100_000_000
 """Default maximum endpoint object size in bytes."""
+
+MAX_REQUEST_SIZE_DEFAULT = 1_000_000_000
+"""Default maximum size in bytes of a request body sent to an endpoint."""
+
+SQLITE_CHUNK_SIZE_DEFAULT = 16_000_000
+"""Default maximum size in bytes of a single BLOB row in SQLite storage."""
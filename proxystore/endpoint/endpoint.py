@@ -4,27 +4,39 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
 import logging
+import time
+from collections import deque
+from collections import OrderedDict
 from collections.abc import Generator
+from collections.abc import Sequence
 from types import TracebackType
 from typing import Any
+from typing import Literal
 from uuid import UUID
 from uuid import uuid4
 
 from proxystore.endpoint.exceptions import PeeringNotAvailableError
 from proxystore.endpoint.exceptions import PeerRequestError
+from proxystore.endpoint.messages import decode_message
+from proxystore.endpoint.messages import encode_message
+from proxystore.endpoint.messages import EndpointBatchRequest
 from proxystore.endpoint.messages import EndpointRequest
+from proxystore.endpoint.metrics import EndpointMetrics
 from proxystore.endpoint.storage import DictStorage
 from proxystore.endpoint.storage import Storage
 from proxystore.p2p.connection import log_name
 from proxystore.p2p.manager import PeerManager
-from proxystore.serialize import deserialize
 from proxystore.serialize import SerializationError
-from proxystore.serialize import serialize
 from proxystore.utils.tasks import spawn_guarded_background_task
 
 logger = logging.getLogger(__name__)
 
+_PeerMessage = EndpointRequest | EndpointBatchRequest
+# Maximum number of keys for which peers holding replicas are tracked.
+_MAX_REPLICA_HOLDERS = 2**16
+
 
 class EndpointMode(enum.Enum):
     """Endpoint mode."""
@@ -35,6 +47,68 @@ class EndpointMode(enum.Enum):
     """Endpoint is operating in isolation and will ignore peer requests."""
 
 
+class _ReplicaCache:
+    """Byte-budgeted LRU cache of blobs fetched from peer endpoints."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._blobs: OrderedDict[
+            tuple[UUID, str],
+            bytes | bytearray | memoryview,
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def get(
+        self,
+        endpoint: UUID,
+        key: str,
+    ) -> bytes | bytearray | memoryview | None:
+        blob = self._blobs.get((endpoint, key), None)
+        if blob is not None:
+            self._blobs.move_to_end((endpoint, key))
+        return blob
+
+    def put(
+        self,
+        endpoint: UUID,
+        key: str,
+        blob: bytes | bytearray | memoryview,
+    ) -> None:
+        self.evict(endpoint, key)
+        if len(blob) > self.max_bytes:
+            return
+        self._blobs[(endpoint, key)] = _owned(blob)
+        self.size += len(blob)
+        while self.size > self.max_bytes:
+            _, evicted = self._blobs.popitem(last=False)
+            self.size -= len(evicted)
+
+    def evict(self, endpoint: UUID, key: str) -> None:
+        blob = self._blobs.pop((endpoint, key), None)
+        if blob is not None:
+            self.size -= len(blob)
+
+    def clear(self) -> None:
+        self._blobs.clear()
+        self.size = 0
+
+
+class _PeerBatchRead:
+    """Keys of an in-flight batch get request to a peer endpoint.
+
+    Keys written while the request is in-flight are marked stale so the
+    results for those keys are not cached as replicas.
+    """
+
+    def __init__(self, endpoint: UUID, keys: Sequence[str]) -> None:
+        self.endpoint = endpoint
+        self.keys = frozenset(keys)
+        self.stale: set[str] = set()
+
+
 class Endpoint:
     """ProxyStore Endpoint.
 
@@ -58,7 +132,19 @@ class Endpoint:
     Warning:
         Requests made to remote endpoints will only invoke the request on
         the remote and return the result. I.e., invoking GET on a remote
-        will return the value but will not store it on the local endpoint.
+        will return the value but will not store it on the local endpoint
+        unless a `replica_cache_size` is configured.
+
+    Note:
+        When a `replica_cache_size` is set, objects fetched from peer
+        endpoints are cached locally in a least-recently-used cache with
+        that byte budget so repeated requests for the same object do not
+        transfer the object again. Endpoints remember which peers have
+        fetched each of their objects and notify those peers when the object
+        is evicted or overwritten so stale replicas are dropped. Objects
+        which expire because of a time-to-live are not propagated so replicas
+        of those objects can outlive the original until evicted from the
+        cache.
 
     Example:
         Solo Mode Usage
@@ -126,9 +212,16 @@ class Endpoint:
             endpoints connected to the same relay server.
         storage: Storage interface to use. If `None`,
             [`DictStorage`][proxystore.endpoint.storage.DictStorage] is used.
+        replica_cache_size: Optional byte budget for caching objects
+            fetched from peer endpoints. If `None`, fetched objects are not
+            cached.
+        max_peer_requests: Maximum number of requests from peer endpoints
+            to process concurrently. Pending requests are dispatched
+            round-robin across peers so one busy peer cannot starve others.
 
     Raises:
         ValueError: if neither `name`/`uuid` or `peer_manager` are set.
+        ValueError: if `max_peer_requests` is less than one.
     """
 
     def __init__(
@@ -138,26 +231,57 @@ class Endpoint:
         *,
         peer_manager: PeerManager | None = None,
         storage: Storage | None = None,
+        replica_cache_size: int | None = None,
+        max_peer_requests: int = 16,
     ) -> None:
         if peer_manager is None and (name is None or uuid is None):
             raise ValueError(
                 'The name and uuid parameters must be provided if '
                 'a PeerManager is not provided.',
             )
+        if max_peer_requests < 1:
+            raise ValueError(
+                'The max_peer_requests parameter must be at least one.',
+            )
 
         self._default_name = name
         self._default_uuid = uuid
         self._peer_manager = peer_manager
         self._storage = DictStorage() if storage is None else storage
+        self._replicas = (
+            None
+            if replica_cache_size is None
+            else _ReplicaCache(replica_cache_size)
+        )
+        # Peers which have fetched each key from this endpoint and may
+        # hold a replica that needs to be invalidated, in LRU order.
+        self._replica_holders: OrderedDict[str, set[UUID]] = OrderedDict()
+        self._invalidation_tasks: set[asyncio.Task[None]] = set()
+        self.metrics = EndpointMetrics()
+        # In-flight get/exists requests to peers keyed on (op, key, peer)
+        # so concurrent identical requests share a single transfer.
+        self._inflight: dict[
+            tuple[Literal['exists', 'get'], str, UUID],
+            asyncio.Task[Any],
+        ] = {}
+        self._batch_reads: set[_PeerBatchRead] = set()
 
         self._mode = (
             EndpointMode.SOLO if peer_manager is None else EndpointMode.PEERING
         )
         self._pending_requests: dict[
             str,
-            asyncio.Future[EndpointRequest],
+            asyncio.Future[_PeerMessage],
         ] = {}
         self._peer_handler_task: asyncio.Task[None] | None = None
+        # Requests from peers waiting to be processed. Peers with pending
+        # requests are kept in round-robin order.
+        self._max_peer_requests = max_peer_requests
+        self._peer_request_queues: OrderedDict[
+            UUID,
+            deque[_PeerMessage],
+        ] = OrderedDict()
+        self._peer_request_tasks: set[asyncio.Task[None]] = set()
 
         if self._mode is EndpointMode.SOLO:
             # Initialization is not complete for endpoints in peering mode
@@ -252,17 +376,17 @@ class Endpoint:
                 f'in {self._mode.name} mode',
             )
 
-    async def _handle_peer_requests(self) -> None:  # noqa: C901
+    async def _handle_peer_requests(self) -> None:
         """Coroutine to listen for request from peer endpoints."""
         assert self.peer_manager is not None
         logger.info(f'{self._log_prefix}: listening for peer requests')
 
         while True:
             source_endpoint, message_ = await self.peer_manager.recv()
-            assert isinstance(message_, bytes)
+            assert isinstance(message_, bytearray)
             try:
-                message: EndpointRequest = deserialize(message_)
-            except SerializationError as e:
+                message = decode_message(message_)
+            except (SerializationError, ValueError) as e:
                 logger.error(
                     f'{self._log_prefix}: unable to decode message from peer '
                     f'endpoint {source_endpoint}: {e}',
@@ -286,41 +410,185 @@ class Endpoint:
 
             logger.debug(
                 f'{self._log_prefix}: received {type(message).__name__}'
-                f'(id={message.uuid}, key={message.key}) from '
+                f'(id={message.uuid}, {_describe_keys(message)}) from '
                 f'{source_endpoint}',
             )
+            queue = self._peer_request_queues.setdefault(
+                source_endpoint,
+                deque(),
+            )
+            queue.append(message)
+            self._dispatch_peer_requests()
 
+    def _dispatch_peer_requests(self) -> None:
+        """Start processing pending peer requests up to the concurrency limit.
+
+        The peer at the front of the queue is served next and then moved to
+        the back if it has more pending requests.
+        """
+        while (
+            len(self._peer_request_tasks) < self._max_peer_requests
+            and len(self._peer_request_queues) > 0
+        ):
+            source, queue = next(iter(self._peer_request_queues.items()))
+            message = queue.popleft()
+            if len(queue) == 0:
+                del self._peer_request_queues[source]
+            else:
+                self._peer_request_queues.move_to_end(source)
+
+            task = asyncio.create_task(
+                self._respond_to_peer(source, message),
+                name=f'endpoint-{self.uuid}-peer-request-{message.uuid}',
+            )
+            self._peer_request_tasks.add(task)
+            task.add_done_callback(self._peer_request_done)
+
+    def _peer_request_done(self, task: asyncio.Task[None]) -> None:
+        self._peer_request_tasks.discard(task)
+        self._dispatch_peer_requests()
+
+    async def _respond_to_peer(
+        self,
+        source: UUID,
+        message: _PeerMessage,
+    ) -> None:
+        try:
+            if isinstance(message, EndpointBatchRequest):
+                await self._process_peer_batch_request(source, message)
+            else:
+                await self._process_peer_request(source, message)
+        except Exception as e:
+            message.error = e
+
+        message.kind = 'response'
+        logger.debug(
+            f'{self._log_prefix}: sending {message.op} response with '
+            f'id={message.uuid} and {_describe_keys(message)} to {source}',
+        )
+        assert self._peer_manager is not None
+        try:
+            await self._peer_manager.send(source, encode_message(message))
+        except Exception as e:
+            logger.error(
+                f'{self._log_prefix}: failed to send {message.op} response '
+                f'with id={message.uuid} to {source}: {e}',
+            )
+
+    async def _process_peer_request(
+        self,
+        source: UUID,
+        message: EndpointRequest,
+    ) -> None:
+        if message.op == 'evict':
+            await self.evict(message.key)
+        elif message.op == 'exists':
+            message.exists = await self.exists(message.key)
+        elif message.op == 'get':
+            message.data = await self.get(message.key)
+            self._record_replica(source, message.key, message.data)
+        elif message.op == 'invalidate':
+            self._forget_inflight(message.key, source)
+            if self._replicas is not None:
+                self._replicas.evict(source, message.key)
+        elif message.op == 'set':
+            assert message.data is not None
+            await self.set(message.key, message.data, ttl=message.ttl)
+            message.data = None
+        else:
+            raise AssertionError(
+                f'unsupported request type {type(message).__name__}',
+            )
+
+    async def _process_peer_batch_request(
+        self,
+        source: UUID,
+        message: EndpointBatchRequest,
+    ) -> None:
+        results = await self._local_batch(
+            message.op,
+            message.keys,
+            message.data,
+            message.ttl,
+        )
+        if message.op == 'get':
+            for key, result in zip(message.keys, results, strict=True):
+                self._record_replica(source, key, result)
+        message.data = results if message.op == 'get' else None
+        message.exists = results if message.op == 'exists' else None
+
+    def _record_replica(
+        self,
+        peer: UUID,
+        key: str,
+        data: bytes | bytearray | memoryview | None,
+    ) -> None:
+        if data is None:
+            # The key was evicted or expired so any replicas are stale.
+            self._invalidate_replicas(key)
+            return
+        if peer == self.uuid:
+            return
+        holders = self._replica_holders.get(key, None)
+        if holders is None:
+            holders = self._replica_holders[key] = set()
+            while len(self._replica_holders) > _MAX_REPLICA_HOLDERS:
+                # Holders of the least recently fetched key are told to drop
+                # their replicas since they will no longer be tracked.
+                self._invalidate_replicas(next(iter(self._replica_holders)))
+        else:
+            self._replica_holders.move_to_end(key)
+        holders.add(peer)
+
+    def _invalidate_replicas(self, key: str) -> None:
+        """Notify peers holding a replica of the key in the background."""
+        holders = self._replica_holders.pop(key, None)
+        if holders is None:
+            return
+        task = asyncio.create_task(
+            self._send_invalidations(key, holders),
+            name=f'endpoint-{self.uuid}-invalidate-{key}',
+        )
+        self._invalidation_tasks.add(task)
+        task.add_done_callback(self._invalidation_tasks.discard)
+
+    async def _send_invalidations(self, key: str, peers: set[UUID]) -> None:
+        async def _invalidate(peer: UUID) -> None:
+            request = EndpointRequest(
+                kind='request',
+                op='invalidate',
+                uuid=str(uuid4()),
+                key=key,
+            )
             try:
-                if message.op == 'evict':
-                    await self.evict(message.key)
-                elif message.op == 'exists':
-                    message.exists = await self.exists(message.key)
-                elif message.op == 'get':
-                    message.data = await self.get(message.key)
-                elif message.op == 'set':
-                    assert message.data is not None
-                    await self.set(message.key, message.data)
-                    message.data = None
-                else:
-                    raise AssertionError(
-                        f'unsupported request type {type(message).__name__}',
-                    )
+                future = await self._request_from_peer(peer, request)
+                await future
             except Exception as e:
-                message.error = e
+                logger.warning(
+                    f'{self._log_prefix}: failed to invalidate replica of '
+                    f'key={key} on {peer}: {e}',
+                )
 
-            message.kind = 'response'
-            logger.debug(
-                f'{self._log_prefix}: sending {message.op} response with '
-                f'id={message.uuid} and key={message.key} to '
-                f'{source_endpoint}',
-            )
-            await self.peer_manager.send(source_endpoint, serialize(message))
+        await asyncio.gather(*(_invalidate(peer) for peer in peers))
+
+    async def _evict_local(self, key: str) -> None:
+        await self._storage.evict(key)
+        self._invalidate_replicas(key)
+
+    async def _set_local(
+        self,
+        key: str,
+        data: bytes | bytearray | memoryview,
+        ttl: float | None,
+    ) -> None:
+        await self._storage.set(key, _owned(data), ttl=ttl)
+        self._invalidate_replicas(key)
 
     async def _request_from_peer(
         self,
         endpoint: UUID,
-        request: EndpointRequest,
-    ) -> asyncio.Future[EndpointRequest]:
+        request: _PeerMessage,
+    ) -> asyncio.Future[_PeerMessage]:
         """Send request to peer endpoint.
 
         Any exceptions will be set on the returned future.
@@ -329,22 +597,119 @@ class Endpoint:
         #   - should some ops be sent to all endpoints that may have
         #     a copy of the data (mostly for evict)?
         assert self.peer_manager is not None
-        self._pending_requests[request.uuid] = (
+        future: asyncio.Future[_PeerMessage] = (
             asyncio.get_running_loop().create_future()
         )
+        future.add_done_callback(
+            functools.partial(
+                self._record_peer_request,
+                request,
+                time.perf_counter(),
+            ),
+        )
+        self._pending_requests[request.uuid] = future
         logger.debug(
             f'{self._log_prefix}: sending {request.op} request with '
-            f'id={request.uuid} and key={request.key}) to {endpoint}',
+            f'id={request.uuid} and {_describe_keys(request)}) to {endpoint}',
         )
         try:
-            await self.peer_manager.send(endpoint, serialize(request))
+            await self.peer_manager.send(endpoint, encode_message(request))
         except Exception as e:
-            self._pending_requests[request.uuid].set_exception(
+            self._pending_requests.pop(request.uuid, None)
+            future.set_exception(
                 PeerRequestError(
                     f'Request to peer {endpoint} failed: {e!s}',
                 ),
             )
-        return self._pending_requests[request.uuid]
+        return future
+
+    def _record_peer_request(
+        self,
+        request: _PeerMessage,
+        start: float,
+        future: asyncio.Future[_PeerMessage],
+    ) -> None:
+        failed = future.cancelled() or future.exception() is not None
+        op = (
+            f'{request.op}_batch'
+            if isinstance(request, EndpointBatchRequest)
+            else request.op
+        )
+        self.metrics.record_peer_request(
+            op,
+            time.perf_counter() - start,
+            error=failed,
+            bytes_received=0 if failed else _data_size(future.result()),
+            bytes_sent=_data_size(request),
+        )
+
+    def _coalesce(
+        self,
+        op: Literal['exists', 'get'],
+        key: str,
+        endpoint: UUID,
+    ) -> asyncio.Future[Any]:
+        # Joins an identical in-flight request to the peer or starts a new
+        # one. The request runs in its own task and each caller awaits it
+        # through a shield so one cancelled caller does not cancel the
+        # transfer for the others.
+        ident = (op, key, endpoint)
+        task = self._inflight.get(ident, None)
+        if task is None:
+            task = asyncio.create_task(
+                self._request_key_from_peer(op, key, endpoint),
+                name=f'endpoint-{op}-{key}-{endpoint}',
+            )
+            self._inflight[ident] = task
+
+            def _done(task: asyncio.Task[Any]) -> None:
+                if self._inflight.get(ident, None) is task:
+                    del self._inflight[ident]
+                # Mark the exception as retrieved in case every caller
+                # was cancelled before the request finished.
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(_done)
+        return asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, endpoint: UUID) -> None:
+        # Requests started after a write to the key must not join reads
+        # which were already in-flight before the write.
+        self._inflight.pop(('exists', key, endpoint), None)
+        self._inflight.pop(('get', key, endpoint), None)
+        for read in self._batch_reads:
+            if read.endpoint == endpoint and key in read.keys:
+                read.stale.add(key)
+
+    async def _request_key_from_peer(
+        self,
+        op: Literal['exists', 'get'],
+        key: str,
+        endpoint: UUID,
+    ) -> Any:
+        request = EndpointRequest(
+            kind='request',
+            op=op,
+            uuid=str(uuid4()),
+            key=key,
+        )
+        request_future = await self._request_from_peer(endpoint, request)
+        response = await request_future
+        assert isinstance(response, EndpointRequest)
+        if op == 'exists':
+            assert isinstance(response.exists, bool)
+            return response.exists
+        if (
+            self._replicas is not None
+            and response.data is not None
+            and self._inflight.get((op, key, endpoint), None)
+            is asyncio.current_task()
+        ):
+            # Only cache the result if no write to the key was issued while
+            # this request was in-flight.
+            self._replicas.put(endpoint, key, response.data)
+        return response.data
 
     def _is_peer_request(self, endpoint: UUID | None) -> bool:
         """Check if this request should be forwarded to peer endpoint."""
@@ -371,6 +736,9 @@ class Endpoint:
         )
         if self._is_peer_request(endpoint):
             assert endpoint is not None
+            self._forget_inflight(key, endpoint)
+            if self._replicas is not None:
+                self._replicas.evict(endpoint, key)
             request = EndpointRequest(
                 kind='request',
                 op='evict',
@@ -380,7 +748,7 @@ class Endpoint:
             request_future = await self._request_from_peer(endpoint, request)
             await request_future
         else:
-            await self._storage.evict(key)
+            await self._evict_local(key)
 
     async def exists(self, key: str, endpoint: UUID | None = None) -> bool:
         """Check if key exists on endpoint.
@@ -402,16 +770,12 @@ class Endpoint:
         )
         if self._is_peer_request(endpoint):
             assert endpoint is not None
-            request = EndpointRequest(
-                kind='request',
-                op='exists',
-                uuid=str(uuid4()),
-                key=key,
-            )
-            request_future = await self._request_from_peer(endpoint, request)
-            response = await request_future
-            assert isinstance(response.exists, bool)
-            return response.exists
+            if (
+                self._replicas is not None
+                and self._replicas.get(endpoint, key) is not None
+            ):
+                return True
+            return await self._coalesce('exists', key, endpoint)
         else:
             return await self._storage.exists(key)
 
@@ -419,7 +783,7 @@ class Endpoint:
         self,
         key: str,
         endpoint: UUID | None = None,
-    ) -> bytes | None:
+    ) -> bytes | bytearray | memoryview | None:
         """Get value associated with key on endpoint.
 
         Args:
@@ -439,23 +803,20 @@ class Endpoint:
         )
         if self._is_peer_request(endpoint):
             assert endpoint is not None
-            request = EndpointRequest(
-                kind='request',
-                op='get',
-                uuid=str(uuid4()),
-                key=key,
-            )
-            request_future = await self._request_from_peer(endpoint, request)
-            response = await request_future
-            return response.data
+            if self._replicas is not None:
+                replica = self._replicas.get(endpoint, key)
+                if replica is not None:
+                    return replica
+            return await self._coalesce('get', key, endpoint)
         else:
             return await self._storage.get(key, None)
 
     async def set(
         self,
         key: str,
-        data: bytes,
+        data: bytes | bytearray | memoryview,
         endpoint: UUID | None = None,
+        ttl: float | None = None,
     ) -> None:
         """Set key with data on endpoint.
 
@@ -465,6 +826,8 @@ class Endpoint:
             endpoint: Endpoint to perform operation on. If
                 unspecified or if the endpoint is on solo mode, the operation
                 will be performed on the local endpoint.
+            ttl: Optional time-to-live in seconds after which the data
+                expires.
 
         Raises:
             ObjectSizeExceededError: If the max object size is configured and
@@ -483,11 +846,314 @@ class Endpoint:
                 uuid=str(uuid4()),
                 key=key,
                 data=data,
+                ttl=ttl,
             )
+            self._forget_inflight(key, endpoint)
+            if self._replicas is not None:
+                self._replicas.evict(endpoint, key)
             request_future = await self._request_from_peer(endpoint, request)
             await request_future
         else:
-            await self._storage.set(key, data)
+            await self._set_local(key, data, ttl)
+
+    async def _local_batch(
+        self,
+        op: Literal['evict', 'exists', 'get', 'set'],
+        keys: Sequence[str],
+        data: Sequence[bytes | bytearray | memoryview | None] | None = None,
+        ttl: float | None = None,
+    ) -> list[Any]:
+        # Returns the result of the operation for each key which is the
+        # data for get, a bool for exists, and None otherwise.
+        if op == 'evict':
+            for key in keys:
+                await self._evict_local(key)
+            return [None] * len(keys)
+        elif op == 'exists':
+            return [await self._storage.exists(key) for key in keys]
+        elif op == 'get':
+            return [await self._storage.get(key, None) for key in keys]
+        elif op == 'set':
+            assert data is not None
+            for key, blob in zip(keys, data, strict=True):
+                assert blob is not None
+                await self._set_local(key, blob, ttl)
+            return [None] * len(keys)
+        else:
+            raise AssertionError(f'Unsupported batch operation {op}.')
+
+    def _replica_batch(
+        self,
+        op: Literal['evict', 'exists', 'get', 'set'],
+        endpoint: UUID,
+        keys: Sequence[str],
+    ) -> tuple[list[Any], list[int]]:
+        # Returns the results which could be determined from the replica
+        # cache and the indices of keys which still need to be sent to the
+        # peer. Replicas of keys being evicted or set are dropped.
+        results: list[Any] = [None] * len(keys)
+        if op in ('evict', 'set'):
+            for key in keys:
+                self._forget_inflight(key, endpoint)
+                if self._replicas is not None:
+                    self._replicas.evict(endpoint, key)
+            return results, list(range(len(keys)))
+        if self._replicas is None:
+            return results, list(range(len(keys)))
+
+        indices = []
+        for i, key in enumerate(keys):
+            replica = self._replicas.get(endpoint, key)
+            if replica is None:
+                indices.append(i)
+            else:
+                results[i] = replica if op == 'get' else True
+        return results, indices
+
+    async def _peer_batch(
+        self,
+        op: Literal['evict', 'exists', 'get', 'set'],
+        endpoint: UUID,
+        keys: Sequence[str],
+        data: Sequence[bytes | bytearray | memoryview] | None,
+        ttl: float | None,
+    ) -> list[Any]:
+        results, indices = self._replica_batch(op, endpoint, keys)
+        if len(indices) == 0:
+            return results
+
+        request = EndpointBatchRequest(
+            kind='request',
+            op=op,
+            uuid=str(uuid4()),
+            keys=[keys[i] for i in indices],
+            data=None if data is None else [data[i] for i in indices],
+            ttl=ttl,
+        )
+        # Track the keys of get requests so results for keys written while
+        # the request is in-flight are not cached, the same as for
+        # requests for a single key.
+        read = _PeerBatchRead(endpoint, request.keys)
+        if op == 'get':
+            self._batch_reads.add(read)
+        try:
+            future = await self._request_from_peer(endpoint, request)
+            response = await future
+        finally:
+            self._batch_reads.discard(read)
+        assert isinstance(response, EndpointBatchRequest)
+        if op == 'get':
+            assert response.data is not None
+            for i, blob in zip(indices, response.data, strict=True):
+                results[i] = blob
+                if (
+                    self._replicas is not None
+                    and blob is not None
+                    and keys[i] not in read.stale
+                ):
+                    self._replicas.put(endpoint, keys[i], blob)
+        elif op == 'exists':
+            assert response.exists is not None
+            for i, exists in zip(indices, response.exists, strict=True):
+                results[i] = exists
+        return results
+
+    async def _batch(
+        self,
+        op: Literal['evict', 'exists', 'get', 'set'],
+        keys: Sequence[str],
+        endpoints: Sequence[UUID | None] | None,
+        data: Sequence[bytes | bytearray | memoryview] | None = None,
+        ttl: float | None = None,
+    ) -> list[Any]:
+        if endpoints is not None and len(endpoints) != len(keys):
+            raise ValueError(
+                f'Got {len(keys)} keys but {len(endpoints)} endpoints.',
+            )
+
+        # Group keys by the endpoint the operation will be performed on so
+        # only one request is sent to each peer endpoint. None is used
+        # for operations performed on this endpoint.
+        groups: dict[UUID | None, list[int]] = {}
+        for i in range(len(keys)):
+            endpoint = None if endpoints is None else endpoints[i]
+            target = endpoint if self._is_peer_request(endpoint) else None
+            groups.setdefault(target, []).append(i)
+
+        results: list[Any] = [None] * len(keys)
+
+        async def _run(endpoint: UUID | None, indices: list[int]) -> None:
+            group_keys = [keys[i] for i in indices]
+            group_data = None if data is None else [data[i] for i in indices]
+            if endpoint is None:
+                group_results = await self._local_batch(
+                    op,
+                    group_keys,
+                    group_data,
+                    ttl,
+                )
+            else:
+                group_results = await self._peer_batch(
+                    op,
+                    endpoint,
+                    group_keys,
+                    group_data,
+                    ttl,
+                )
+            for i, result in zip(indices, group_results, strict=True):
+                results[i] = result
+
+        await asyncio.gather(
+            *(_run(endpoint, indices) for endpoint, indices in groups.items()),
+        )
+        return results
+
+    async def evict_batch(
+        self,
+        keys: Sequence[str],
+        endpoints: Sequence[UUID | None] | None = None,
+    ) -> None:
+        """Evict a batch of keys.
+
+        Keys are grouped by endpoint so a single request is sent to each
+        peer endpoint.
+
+        Args:
+            keys: Keys to evict.
+            endpoints: Endpoint to perform the operation on for each key.
+                See [`evict()`][proxystore.endpoint.endpoint.Endpoint.evict].
+
+        Raises:
+            PeerRequestError: If request to a peer endpoint fails.
+            ValueError: If `keys` and `endpoints` have different lengths.
+        """
+        logger.debug(f'{self._log_prefix}: EVICT_BATCH {len(keys)} keys')
+        await self._batch('evict', keys, endpoints)
+
+    async def exists_batch(
+        self,
+        keys: Sequence[str],
+        endpoints: Sequence[UUID | None] | None = None,
+    ) -> list[bool]:
+        """Check if a batch of keys exist.
+
+        Keys are grouped by endpoint so a single request is sent to each
+        peer endpoint.
+
+        Args:
+            keys: Keys to check.
+            endpoints: Endpoint to perform the operation on for each key.
+                See [`exists()`][proxystore.endpoint.endpoint.Endpoint.exists].
+
+        Returns:
+            If each key exists.
+
+        Raises:
+            PeerRequestError: If request to a peer endpoint fails.
+            ValueError: If `keys` and `endpoints` have different lengths.
+        """
+        logger.debug(f'{self._log_prefix}: EXISTS_BATCH {len(keys)} keys')
+        return await self._batch('exists', keys, endpoints)
+
+    async def get_batch(
+        self,
+        keys: Sequence[str],
+        endpoints: Sequence[UUID | None] | None = None,
+    ) -> list[bytes | None]:
+        """Get values associated with a batch of keys.
+
+        Keys are grouped by endpoint so a single request is sent to each
+        peer endpoint.
+
+        Args:
+            keys: Keys to get values for.
+            endpoints: Endpoint to perform the operation on for each key.
+                See [`get()`][proxystore.endpoint.endpoint.Endpoint.get].
+
+        Returns:
+            Value associated with each key or `None` for missing keys.
+
+        Raises:
+            PeerRequestError: If request to a peer endpoint fails.
+            ValueError: If `keys` and `endpoints` have different lengths.
+        """
+        logger.debug(f'{self._log_prefix}: GET_BATCH {len(keys)} keys')
+        return await self._batch('get', keys, endpoints)
+
+    async def set_batch(
+        self,
+        keys: Sequence[str],
+        data: Sequence[bytes | bytearray | memoryview],
+        endpoints: Sequence[UUID | None] | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Set a batch of keys with data.
+
+        Keys are grouped by endpoint so a single request is sent to each
+        peer endpoint.
+
+        Args:
+            keys: Keys to associate with values.
+            data: Value to associate with each key.
+            endpoints: Endpoint to perform the operation on for each key.
+                See [`set()`][proxystore.endpoint.endpoint.Endpoint.set].
+            ttl: Optional time-to-live in seconds after which the data
+                expires.
+
+        Raises:
+            ObjectSizeExceededError: If the max object size is configured and
+                the data exceeds that size.
+            PeerRequestError: If request to a peer endpoint fails.
+            ValueError: If `keys`, `data`, and `endpoints` have different
+                lengths.
+        """
+        logger.debug(f'{self._log_prefix}: SET_BATCH {len(keys)} keys')
+        if len(data) != len(keys):
+            raise ValueError(f'Got {len(keys)} keys but {len(data)} values.')
+        await self._batch('set', keys, endpoints, data=data, ttl=ttl)
+
+    async def stats(self) -> dict[str, Any]:
+        """Get statistics of the endpoint.
+
+        Returns:
+            JSON-serializable dictionary with the metrics of routes served \
+            by the endpoint server and requests made to peers, the number \
+            of peer requests awaiting a response, the storage occupancy, \
+            the states of the relay server and peer connections, and \
+            counts of peer connection events.
+        """
+        storage = await self._storage.stats()
+        relay_connected: bool | None = None
+        peer_connections: dict[str, str] = {}
+        peer_connection_events: dict[str, int] = {}
+        if self._peer_manager is not None:
+            relay_connected = self._peer_manager.relay_client.connected
+            states = self._peer_manager.connection_states()
+            peer_connections = {
+                str(peer): state for peer, state in states.items()
+            }
+            peer_connection_events = self._peer_manager.connection_events()
+        return {
+            'uuid': str(self.uuid),
+            'name': self.name,
+            'mode': self._mode.name,
+            'routes': {
+                route: metrics.as_dict()
+                for route, metrics in self.metrics.routes.items()
+            },
+            'peer_requests': {
+                op: metrics.as_dict()
+                for op, metrics in self.metrics.peer_requests.items()
+            },
+            'peer_requests_in_flight': len(self._pending_requests),
+            'storage': {
+                'blobs': storage.blobs,
+                'total_bytes': storage.total_bytes,
+            },
+            'relay_connected': relay_connected,
+            'peer_connections': peer_connections,
+            'peer_connection_events': peer_connection_events,
+        }
 
     async def close(self) -> None:
         """Close the endpoint and any open connections safely."""
@@ -497,7 +1163,43 @@ class Endpoint:
                 await self._peer_handler_task
             except asyncio.CancelledError:
                 pass
+        self._peer_request_queues.clear()
+        for task in (
+            *self._peer_request_tasks,
+            *self._invalidation_tasks,
+            *self._inflight.values(),
+        ):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._replicas is not None:
+            self._replicas.clear()
         if self._peer_manager is not None:
             await self._peer_manager.close()
         await self._storage.close()
         logger.info(f'{self._log_prefix}: endpoint closed')
+
+
+def _data_size(message: _PeerMessage) -> int:
+    if isinstance(message, EndpointBatchRequest):
+        if message.data is None:
+            return 0
+        return sum(len(blob) for blob in message.data if blob is not None)
+    return 0 if message.data is None else len(message.data)
+
+
+def _owned(
+    blob: bytes | bytearray | memoryview,
+) -> bytes | bytearray:
+    # Decoded requests are views into the full request or message buffer
+    # so a view kept after the request would hold the whole buffer in memory
+    # while only the size of the view is counted by storage.
+    return bytes(blob) if isinstance(blob, memoryview) else blob
+
+
+def _describe_keys(message: _PeerMessage) -> str:
+    if isinstance(message, EndpointBatchRequest):
+        return f'keys={len(message.keys)}'
+    return f'key={message.key}'
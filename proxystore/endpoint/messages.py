@@ -1,10 +1,27 @@
-"""Endpoint to endpoint messages."""
+"""Endpoint to endpoint messages.
+
+Messages are sent between peer endpoints in a compact binary format
+created by [`encode_message()`][proxystore.endpoint.messages.encode_message]
+and parsed by
+[`decode_message()`][proxystore.endpoint.messages.decode_message].
+"""
 
 from __future__ import annotations
 
+import enum
+import struct
+import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 from typing import Literal
 
+from proxystore.endpoint.exceptions import PeerRequestError
+from proxystore.endpoint.multipart import MISSING_PART
+from proxystore.serialize import deserialize
+from proxystore.serialize import SerializationError
+from proxystore.serialize import serialize
+
 
 @dataclass
 class EndpointRequest:
@@ -13,18 +30,251 @@ class EndpointRequest:
     Attributes:
         kind: One of `#!python 'request'` or `#!python 'response'`.
         op: One of `#!python 'evict'`, `#!python 'exists'`, `#!python 'get'`,
-            or `#!python 'set'`.
+            `#!python 'invalidate'`, or `#!python 'set'`. An `invalidate`
+            request is sent by the owner of a key to peers which may hold a
+            replica of the key.
         uuid: UUID of sender.
         key: Key to operate on.
         data: Optional data to operate on.
+        ttl: Optional time-to-live in seconds of data in a `set` operation.
         exists: Result of `exists` operation.
         error: Error raised by operation.
     """
 
     kind: Literal['request', 'response']
-    op: Literal['evict', 'exists', 'get', 'set']
+    op: Literal['evict', 'exists', 'get', 'invalidate', 'set']
     uuid: str
     key: str
-    data: bytes | None = None
+    data: bytes | bytearray | memoryview | None = None
+    ttl: float | None = None
     exists: bool | None = None
     error: Exception | None = None
+
+
+@dataclass
+class EndpointBatchRequest:
+    """Message type for batch requests between endpoints.
+
+    Attributes:
+        kind: One of `#!python 'request'` or `#!python 'response'`.
+        op: One of `#!python 'evict'`, `#!python 'exists'`, `#!python 'get'`,
+            or `#!python 'set'`.
+        uuid: UUID of sender.
+        keys: Keys to operate on.
+        data: Data for each key in a `set` operation or the result of a
+            `get` operation.
+        ttl: Optional time-to-live in seconds of data in a `set` operation.
+        exists: Result of `exists` operation for each key.
+        error: Error raised by operation.
+    """
+
+    kind: Literal['request', 'response']
+    op: Literal['evict', 'exists', 'get', 'set']
+    uuid: str
+    keys: list[str]
+    data: list[bytes | bytearray | memoryview | None] | None = None
+    ttl: float | None = None
+    exists: list[bool] | None = None
+    error: Exception | None = None
+
+
+_VERSION = 1
+# Version, kind, op, flags, request UUID, TTL, and number of keys.
+_HEADER = struct.Struct('!BBBB16sdI')
+_LENGTH = struct.Struct('!I')
+_PART = struct.Struct('!Q')
+
+_KINDS: tuple[Literal['request', 'response'], ...] = ('request', 'response')
+_OPS: tuple[Literal['evict', 'exists', 'get', 'invalidate', 'set'], ...] = (
+    'evict',
+    'exists',
+    'get',
+    'invalidate',
+    'set',
+)
+
+
+class _Flag(enum.IntFlag):
+    BATCH = 1
+    DATA = 2
+    TTL = 4
+    EXISTS = 8
+    ERROR = 16
+
+
+def _encode_error(error: Exception) -> bytes:
+    try:
+        return serialize(error)
+    except SerializationError:
+        return serialize(
+            PeerRequestError(f'{type(error).__name__}: {error}'),
+        )
+
+
+def encode_message(
+    message: EndpointRequest | EndpointBatchRequest,
+) -> list[bytes | bytearray | memoryview]:
+    """Encode a message into the binary peer message format.
+
+    A message is a fixed-size header (format version, kind, operation,
+    flags, request UUID, and TTL) followed by sections for the keys, the
+    results of an `exists` operation, the error, and the data. Data blobs
+    are never pickled or copied and are instead referenced by the returned
+    buffers. Only an error raised by the operation is serialized with
+    [`serialize()`][proxystore.serialize.serialize].
+
+    Note:
+        The buffers can be passed directly to
+        [`PeerManager.send()`][proxystore.p2p.manager.PeerManager.send]
+        which sends them as a single message without joining them.
+
+    Args:
+        message: Message to encode. The `uuid` of the message must be a
+            valid UUID string.
+
+    Returns:
+        Buffers which when concatenated form the encoded message.
+    """
+    flags = _Flag(0)
+    keys: list[str]
+    data: Sequence[bytes | bytearray | memoryview | None] | None
+    exists: Sequence[bool] | None
+    if isinstance(message, EndpointBatchRequest):
+        flags |= _Flag.BATCH
+        keys, data, exists = message.keys, message.data, message.exists
+    else:
+        keys = [message.key]
+        data = None if message.data is None else [message.data]
+        exists = None if message.exists is None else [message.exists]
+
+    parts: list[bytes | bytearray | memoryview] = []
+    for key in keys:
+        encoded_key = key.encode()
+        parts.extend((_LENGTH.pack(len(encoded_key)), encoded_key))
+    if exists is not None:
+        flags |= _Flag.EXISTS
+        parts.append(bytes(exists))
+    if message.error is not None:
+        flags |= _Flag.ERROR
+        error = _encode_error(message.error)
+        parts.extend((_LENGTH.pack(len(error)), error))
+    if data is not None:
+        flags |= _Flag.DATA
+        for blob in data:
+            if blob is None:
+                parts.append(_PART.pack(MISSING_PART))
+            else:
+                parts.extend((_PART.pack(len(blob)), blob))
+    if message.ttl is not None:
+        flags |= _Flag.TTL
+
+    header = _HEADER.pack(
+        _VERSION,
+        _KINDS.index(message.kind),
+        _OPS.index(message.op),
+        flags,
+        uuid.UUID(message.uuid).bytes,
+        0 if message.ttl is None else message.ttl,
+        len(keys),
+    )
+    return [header, *parts]
+
+
+class _Reader:
+    def __init__(self, data: bytes | bytearray) -> None:
+        self.view = memoryview(data)
+        self.offset = 0
+
+    def read(self, length: int) -> memoryview:
+        if self.offset + length > len(self.view):
+            raise ValueError(
+                f'Message truncated at offset {self.offset}.',
+            )
+        view = self.view[self.offset : self.offset + length]
+        self.offset += length
+        return view
+
+    def unpack(self, fmt: struct.Struct) -> tuple[Any, ...]:
+        return fmt.unpack(self.read(fmt.size))
+
+
+def decode_message(
+    data: bytes | bytearray,
+) -> EndpointRequest | EndpointBatchRequest:
+    """Decode a message in the binary peer message format.
+
+    Data blobs in the decoded message are views of `data` rather than
+    copies so `data` should not be modified after decoding.
+
+    Args:
+        data: Concatenation of the buffers created by
+            [`encode_message()`][proxystore.endpoint.messages.encode_message].
+
+    Returns:
+        Decoded message.
+
+    Raises:
+        ValueError: If the message is malformed or was encoded with an
+            unsupported format version.
+    """
+    reader = _Reader(data)
+    (version, kind, op, flags_, uuid_, ttl_, count) = reader.unpack(_HEADER)
+    if version != _VERSION:
+        raise ValueError(f'Unsupported message format version {version}.')
+    if kind >= len(_KINDS) or op >= len(_OPS):
+        raise ValueError(f'Unknown message kind {kind} or operation {op}.')
+    flags = _Flag(flags_)
+
+    keys = [
+        str(reader.read(reader.unpack(_LENGTH)[0]), 'utf-8')
+        for _ in range(count)
+    ]
+    exists = (
+        [bool(b) for b in reader.read(count)]
+        if _Flag.EXISTS in flags
+        else None
+    )
+    error = None
+    if _Flag.ERROR in flags:
+        (length,) = reader.unpack(_LENGTH)
+        error = deserialize(reader.read(length))
+    blobs: list[bytes | bytearray | memoryview | None] | None = None
+    if _Flag.DATA in flags:
+        blobs = []
+        for _ in range(count):
+            (length,) = reader.unpack(_PART)
+            blobs.append(
+                None if length == MISSING_PART else reader.read(length),
+            )
+    if reader.offset != len(reader.view):
+        raise ValueError(
+            f'Message has {len(reader.view) - reader.offset} trailing bytes.',
+        )
+
+    ttl = ttl_ if _Flag.TTL in flags else None
+    request_uuid = str(uuid.UUID(bytes=uuid_))
+    if _Flag.BATCH in flags:
+        if _OPS[op] == 'invalidate':
+            raise ValueError('Batch messages do not support invalidate.')
+        return EndpointBatchRequest(
+            kind=_KINDS[kind],
+            op=_OPS[op],
+            uuid=request_uuid,
+            keys=keys,
+            data=blobs,
+            ttl=ttl,
+            exists=exists,
+            error=error,
+        )
+    if count != 1:
+        raise ValueError(f'Expected one key but got {count}.')
+    return EndpointRequest(
+        kind=_KINDS[kind],
+        op=_OPS[op],
+        uuid=request_uuid,
+        key=keys[0],
+        data=None if blobs is None else blobs[0],
+        ttl=ttl,
+        exists=None if exists is None else exists[0],
+        error=error,
+    )
@@ -0,0 +1,341 @@
+"""Endpoint request and peer operation metrics.
+
+Metrics are recorded by an [`Endpoint`][proxystore.endpoint.endpoint.Endpoint]
+and exposed by the `/metrics` route of the endpoint server in either
+the Prometheus text exposition format or as JSON.
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Default upper bounds in seconds of the latency histogram buckets."""
+
+_PREFIX = 'proxystore_endpoint'
+
+
+class LatencyHistogram:
+    """Histogram of latencies in seconds.
+
+    Args:
+        buckets: Upper bounds in seconds of the histogram buckets. An
+            implicit `+Inf` bucket is always included.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.count = 0
+        self.sum = 0.0
+        self._counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, latency: float) -> None:
+        """Record a latency in seconds."""
+        self._counts[bisect.bisect_left(self.buckets, latency)] += 1
+        self.count += 1
+        self.sum += latency
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the histogram as a JSON-serializable dictionary.
+
+        The bucket counts are cumulative and keyed by the string upper bound
+        of the bucket as in the Prometheus format.
+        """
+        cumulative: dict[str, int] = {}
+        total = 0
+        for bound, count in zip(
+            (*(repr(b) for b in self.buckets), '+Inf'),
+            self._counts,
+            strict=True,
+        ):
+            total += count
+            cumulative[bound] = total
+        return {'count': self.count, 'sum': self.sum, 'buckets': cumulative}
+
+
+@dataclasses.dataclass
+class OperationMetrics:
+    """Metrics of a type of request.
+
+    Attributes:
+        count: Number of requests completed.
+        errors: Number of requests which resulted in an error.
+        bytes_received: Total bytes of data received in requests.
+        bytes_sent: Total bytes of data sent in responses.
+        latency: Histogram of request latencies.
+    """
+
+    count: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    latency: LatencyHistogram = dataclasses.field(
+        default_factory=LatencyHistogram,
+    )
+
+    def record(
+        self,
+        latency: float,
+        *,
+        error: bool = False,
+        bytes_received: int = 0,
+        bytes_sent: int = 0,
+    ) -> None:
+        """Record a completed request.
+
+        Args:
+            latency: Latency of the request in seconds.
+            error: If the request resulted in an error.
+            bytes_received: Bytes of data received in the request.
+            bytes_sent: Bytes of data sent in the response.
+        """
+        self.count += 1
+        self.errors += int(error)
+        self.bytes_received += bytes_received
+        self.bytes_sent += bytes_sent
+        self.latency.observe(latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the metrics as a JSON-serializable dictionary."""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'bytes_received': self.bytes_received,
+            'bytes_sent': self.bytes_sent,
+            'latency': self.latency.as_dict(),
+        }
+
+
+class EndpointMetrics:
+    """Metrics of the routes served by and peer requests made by an endpoint.
+
+    Attributes:
+        routes: Mapping of route rule (e.g., `#!python '/get'`) to the
+            metrics of requests to that route.
+        peer_requests: Mapping of operation (e.g., `#!python 'get'` or
+            `#!python 'get_batch'`) to the metrics of requests of that
+            operation made to peer endpoints.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, OperationMetrics] = {}
+        self.peer_requests: dict[str, OperationMetrics] = {}
+
+    def record_route(
+        self,
+        route: str,
+        latency: float,
+        *,
+        error: bool = False,
+        bytes_received: int = 0,
+        bytes_sent: int = 0,
+    ) -> None:
+        """Record a request served by a route.
+
+        Args:
+            route: Rule of the route which served the request.
+            latency: Latency of the request in seconds.
+            error: If the request resulted in an error.
+            bytes_received: Bytes of data received in the request.
+            bytes_sent: Bytes of data sent in the response.
+        """
+        metrics = self.routes.setdefault(route, OperationMetrics())
+        metrics.record(
+            latency,
+            error=error,
+            bytes_received=bytes_received,
+            bytes_sent=bytes_sent,
+        )
+
+    def record_peer_request(
+        self,
+        op: str,
+        latency: float,
+        *,
+        error: bool = False,
+        bytes_received: int = 0,
+        bytes_sent: int = 0,
+    ) -> None:
+        """Record a request made to a peer endpoint.
+
+        Args:
+            op: Operation of the request.
+            latency: Latency in seconds from sending the request to
+                receiving the response.
+            error: If the request resulted in an error.
+            bytes_received: Bytes of data received in the response.
+            bytes_sent: Bytes of data sent in the request.
+        """
+        metrics = self.peer_requests.setdefault(op, OperationMetrics())
+        metrics.record(
+            latency,
+            error=error,
+            bytes_received=bytes_received,
+            bytes_sent=bytes_sent,
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if len(labels) == 0:
+        return ''
+    pairs = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return f'{{{pairs}}}'
+
+
+class _PrometheusWriter:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def header(self, name: str, kind: str, description: str) -> None:
+        self.lines.append(f'# HELP {_PREFIX}_{name} {description}')
+        self.lines.append(f'# TYPE {_PREFIX}_{name} {kind}')
+
+    def sample(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        labels_ = _labels({} if labels is None else labels)
+        self.lines.append(f'{_PREFIX}_{name}{labels_} {value}')
+
+    def operations(
+        self,
+        name: str,
+        label: str,
+        operations: Mapping[str, Mapping[str, Any]],
+        description: str,
+    ) -> None:
+        counters = (
+            ('total', 'count', f'Number of {description}.'),
+            ('errors_total', 'errors', f'Number of failed {description}.'),
+            (
+                'received_bytes_total',
+                'bytes_received',
+                f'Bytes of data received by {description}.',
+            ),
+            (
+                'sent_bytes_total',
+                'bytes_sent',
+                f'Bytes of data sent by {description}.',
+            ),
+        )
+        for suffix, field, help_ in counters:
+            self.header(f'{name}_{suffix}', 'counter', help_)
+            for key, metrics in operations.items():
+                self.sample(f'{name}_{suffix}', metrics[field], {label: key})
+
+        histogram = f'{name}_duration_seconds'
+        self.header(histogram, 'histogram', f'Latency of {description}.')
+        for key, metrics in operations.items():
+            latency = metrics['latency']
+            for bound, count in latency['buckets'].items():
+                self.sample(
+                    f'{histogram}_bucket',
+                    count,
+                    {label: key, 'le': bound},
+                )
+            self.sample(f'{histogram}_sum', latency['sum'], {label: key})
+            self.sample(f'{histogram}_count', latency['count'], {label: key})
+
+
+def format_prometheus(stats: Mapping[str, Any]) -> str:
+    """Format endpoint statistics in the Prometheus text exposition format.
+
+    Args:
+        stats: Statistics returned by
+            [`Endpoint.stats()`][proxystore.endpoint.endpoint.Endpoint.stats].
+
+    Returns:
+        Statistics in the Prometheus text format.
+    """
+    writer = _PrometheusWriter()
+    writer.operations(
+        'requests',
+        'route',
+        stats['routes'],
+        'requests served by the endpoint',
+    )
+    writer.operations(
+        'peer_requests',
+        'op',
+        stats['peer_requests'],
+        'requests made to peer endpoints',
+    )
+
+    writer.header(
+        'peer_requests_in_flight',
+        'gauge',
+        'Number of requests to peer endpoints awaiting a response.',
+    )
+    writer.sample('peer_requests_in_flight', stats['peer_requests_in_flight'])
+
+    writer.header(
+        'storage_blobs',
+        'gauge',
+        'Number of blobs in the endpoint storage.',
+    )
+    writer.sample('storage_blobs', stats['storage']['blobs'])
+    writer.header(
+        'storage_bytes',
+        'gauge',
+        'Total bytes of blobs in the endpoint storage.',
+    )
+    writer.sample('storage_bytes', stats['storage']['total_bytes'])
+
+    if stats['relay_connected'] is not None:
+        writer.header(
+            'relay_connected',
+            'gauge',
+            'If the endpoint is connected to the relay server.',
+        )
+        writer.sample('relay_connected', int(stats['relay_connected']))
+
+    writer.header(
+        'peer_connection_state',
+        'gauge',
+        'Current state of each peer connection.',
+    )
+    for peer, state in stats['peer_connections'].items():
+        writer.sample(
+            'peer_connection_state',
+            1,
+            {'peer': peer, 'state': state},
+        )
+
+    writer.header(
+        'peer_connection_events_total',
+        'counter',
+        'Number of peer connections opened, warmed, and closed when idle.',
+    )
+    for event, count in stats['peer_connection_events'].items():
+        writer.sample(
+            'peer_connection_events_total',
+            count,
+            {'event': event},
+        )
+
+    return '\n'.join(writer.lines) + '\n'
@@ -0,0 +1,102 @@
+"""Length-prefixed multi-part encoding for batch endpoint requests.
+
+A multi-part body is the concatenation of parts where each part is an
+8-byte big-endian length header followed by that many bytes. A part can
+also be missing (e.g., a key with no associated object) in which case the
+header is [`MISSING_PART`][proxystore.endpoint.multipart.MISSING_PART] and
+no bytes follow.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Generator
+from collections.abc import Sequence
+
+from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
+from proxystore.utils.data import chunk_memoryview
+
+_HEADER = struct.Struct('!Q')
+
+MISSING_PART = 2**64 - 1
+"""Length header value used to indicate a missing part."""
+
+
+def encode_multipart(
+    parts: Sequence[bytes | bytearray | memoryview | None],
+    chunk_length: int = MAX_CHUNK_LENGTH,
+) -> Generator[bytes, None, None]:
+    """Encode parts as a multi-part body.
+
+    Args:
+        parts: Sequence of parts to encode where `None` indicates a
+            missing part.
+        chunk_length: Maximum length of yielded chunks of the part data.
+
+    Yields:
+        Chunks of the encoded body suitable for a streamed request or \
+        response.
+    """
+    for part in parts:
+        if part is None:
+            yield _HEADER.pack(MISSING_PART)
+            continue
+        yield _HEADER.pack(len(part))
+        for chunk in chunk_memoryview(part, chunk_length):
+            yield bytes(chunk)
+
+
+def encoded_length(
+    parts: Sequence[bytes | bytearray | memoryview | None],
+) -> int:
+    """Get the length of the multi-part body encoding of parts.
+
+    Args:
+        parts: Sequence of parts where `None` indicates a missing part.
+
+    Returns:
+        Length in bytes of the body yielded by
+        [`encode_multipart()`][proxystore.endpoint.multipart.encode_multipart].
+    """
+    return sum(
+        _HEADER.size + (0 if part is None else len(part)) for part in parts
+    )
+
+
+def decode_multipart(data: bytes | bytearray) -> list[memoryview | None]:
+    """Decode a multi-part body.
+
+    Parts are not copied out of the body so `data` should not be modified
+    while the parts are in use.
+
+    Args:
+        data: Multi-part body created by
+            [`encode_multipart()`][proxystore.endpoint.multipart.encode_multipart].
+
+    Returns:
+        List of [`memoryview`][memoryview] slices of `data` for each part \
+        where `None` indicates a missing part.
+
+    Raises:
+        ValueError: If the body is truncated or otherwise malformed.
+    """
+    view = memoryview(data)
+    parts: list[memoryview | None] = []
+    offset = 0
+    while offset < len(view):
+        if offset + _HEADER.size > len(view):
+            raise ValueError(
+                f'Multi-part body truncated in header at offset {offset}.',
+            )
+        (length,) = _HEADER.unpack_from(view, offset)
+        offset += _HEADER.size
+        if length == MISSING_PART:
+            parts.append(None)
+            continue
+        if offset + length > len(view):
+            raise ValueError(
+                f'Multi-part body truncated in part at offset {offset}.',
+            )
+        parts.append(view[offset : offset + length])
+        offset += length
+    return parts
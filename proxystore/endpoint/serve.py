@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import signal
+import socket
+import stat
+import time
 import uuid
+from collections.abc import Sequence
 from typing import Any
 from typing import Literal
 
@@ -31,15 +36,21 @@ from proxystore.endpoint.config import EndpointConfig
 from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
 from proxystore.endpoint.endpoint import Endpoint
 from proxystore.endpoint.exceptions import PeerRequestError
+from proxystore.endpoint.metrics import format_prometheus
+from proxystore.endpoint.multipart import decode_multipart
+from proxystore.endpoint.multipart import encode_multipart
+from proxystore.endpoint.multipart import encoded_length
 from proxystore.endpoint.storage import DictStorage
 from proxystore.endpoint.storage import SQLiteStorage
 from proxystore.endpoint.storage import Storage
+from proxystore.endpoint.storage import TieredStorage
 from proxystore.globus.app import get_globus_app
 from proxystore.globus.scopes import get_relay_scopes_by_resource_server
 from proxystore.p2p.manager import PeerManager
 from proxystore.p2p.nat import check_nat_and_log
 from proxystore.p2p.relay.client import RelayClient
-from proxystore.utils.data import chunk_bytes
+from proxystore.utils.data import bytes_to_readable
+from proxystore.utils.data import chunk_memoryview
 
 logger = logging.getLogger(__name__)
 
@@ -108,13 +119,30 @@ async def _serve_async(config: EndpointConfig) -> None:
 
     storage: Storage | None
     database_path = config.storage.database_path
-    if database_path is not None:
+    max_memory_size = config.storage.max_memory_size
+    if database_path is not None and max_memory_size is not None:
+        logger.info(
+            'Using in-memory storage with a '
+            f'{bytes_to_readable(max_memory_size)} budget that spills to a '
+            f'SQLite database (path: {database_path})',
+        )
+        storage = TieredStorage(
+            SQLiteStorage(
+                database_path,
+                max_object_size=None,
+                commit_window=config.storage.commit_window,
+            ),
+            max_memory_bytes=max_memory_size,
+            max_object_size=config.storage.max_object_size,
+        )
+    elif database_path is not None:
         logger.info(
             f'Using SQLite database for storage (path: {database_path})',
         )
         storage = SQLiteStorage(
             database_path,
             max_object_size=config.storage.max_object_size,
+            commit_window=config.storage.commit_window,
         )
     else:
         logger.warning(
@@ -138,6 +166,7 @@ async def _serve_async(config: EndpointConfig) -> None:
         peer_manager = PeerManager(
             relay_client,
             peer_channels=config.relay.peer_channels,
+            idle_timeout=config.relay.peer_idle_timeout,
         )
         check_nat_and_log()
 
@@ -146,8 +175,20 @@ async def _serve_async(config: EndpointConfig) -> None:
         uuid=uuid.UUID(config.uuid),
         peer_manager=peer_manager,
         storage=storage,
+        replica_cache_size=config.storage.replica_cache_size,
+        max_peer_requests=config.relay.max_peer_requests,
+    )
+    if peer_manager is not None and len(config.relay.warm_peers) > 0:
+        logger.info(
+            f'Warming connections to {len(config.relay.warm_peers)} peers',
+        )
+        await peer_manager.warm(
+            uuid.UUID(peer) for peer in config.relay.warm_peers
+        )
+    app = create_app(
+        endpoint,
+        max_content_length=config.storage.max_request_size,
     )
-    app = create_app(endpoint)
 
     server_config = uvicorn.Config(
         app,
@@ -165,7 +206,41 @@ async def _serve_async(config: EndpointConfig) -> None:
     )
     logger.info(f'Config: {config}')
 
-    await server.serve()
+    if config.socket_path is None:
+        await server.serve()
+        return
+
+    # Uvicorn binds to either a host/port or a Unix socket so both sockets
+    # are bound here and served by the same server.
+    sockets = [
+        server_config.bind_socket(),
+        _bind_unix_socket(config.socket_path),
+    ]
+    logger.info(f'Serving endpoint on Unix socket {config.socket_path}')
+    try:
+        await server.serve(sockets=sockets)
+    finally:
+        for sock in sockets:
+            sock.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(config.socket_path)
+
+
+def _bind_unix_socket(path: str) -> socket.socket:
+    # A socket file left behind by an endpoint which did not exit cleanly
+    # is removed. The host/port is bound first so a live endpoint using
+    # the socket would have already caused serving to fail.
+    if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+        os.remove(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(path)
+        # Only the owner of the endpoint can connect to the socket.
+        os.chmod(path, 0o600)
+    except OSError:
+        sock.close()
+        raise
+    return sock
 
 
 def serve(
@@ -255,6 +330,28 @@ async def _shutdown() -> None:
     await endpoint.close()
 
 
+@routes_blueprint.before_request
+async def _start_request_timer() -> None:
+    quart.g.request_start = time.perf_counter()
+
+
+@routes_blueprint.after_request
+async def _record_request_metrics(response: Response) -> Response:
+    assert request.url_rule is not None
+    endpoint = quart.current_app.config['endpoint']
+    endpoint.metrics.record_route(
+        request.url_rule.rule,
+        time.perf_counter() - quart.g.request_start,
+        error=response.status_code >= 400,
+        bytes_received=quart.g.get(
+            'body_length',
+            request.content_length or 0,
+        ),
+        bytes_sent=response.content_length or 0,
+    )
+    return response
+
+
 @routes_blueprint.route('/')
 async def _home() -> tuple[str, int]:
     return ('', 200)
@@ -277,6 +374,44 @@ async def endpoint_handler() -> Response:
     )
 
 
+@routes_blueprint.route('/metrics', methods=['GET'])
+async def metrics_handler() -> Response:
+    """Route handler for `GET /metrics`.
+
+    The optional `format` query argument can be `#!python 'prometheus'`
+    (default) or `#!python 'json'`.
+
+    Note:
+        The latency of a route is measured until the response is returned
+        by the route handler so the time to stream a large response body
+        to the client is not included.
+
+    Responses:
+
+    * `Status Code 200`: The statistics returned by
+      [`Endpoint.stats()`][proxystore.endpoint.endpoint.Endpoint.stats] in
+      the Prometheus text exposition format or as JSON.
+    * `Status Code 400`: If the format argument is not supported.
+    """
+    format_ = request.args.get('format', 'prometheus')
+    if format_ not in ('json', 'prometheus'):
+        return Response(f'unsupported format: {format_}', 400)
+
+    endpoint = quart.current_app.config['endpoint']
+    stats = await endpoint.stats()
+    if format_ == 'json':
+        return Response(
+            json.dumps(stats),
+            200,
+            content_type='application/json',
+        )
+    return Response(
+        format_prometheus(stats),
+        200,
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
+
+
 @routes_blueprint.route('/evict', methods=['POST'])
 async def evict_handler() -> Response:
     """Route handler for `POST /evict`.
@@ -386,16 +521,66 @@ async def get_handler() -> Response:
         return Response(str(e), 500)
 
     if data is not None:
-        return Response(
-            response=chunk_bytes(data, MAX_CHUNK_LENGTH),
+        # ASGI requires body chunks be bytes so each bounded chunk is copied
+        # out of a view of the stored blob when it is sent.
+        response = Response(
+            response=(
+                bytes(chunk)
+                for chunk in chunk_memoryview(data, MAX_CHUNK_LENGTH)
+            ),
             content_type='application/octet-stream',
         )
+        response.content_length = len(data)
+        return response
     else:
         return Response('no data associated with request key', 404)
 
 
+async def _read_body() -> bytearray | Response:
+    """Read the streamed request body.
+
+    If the client provided the `Content-Length`, the body is read into a
+    preallocated buffer so the memory used is bounded by the size of the
+    payload. Otherwise, the buffer is grown as chunks are received.
+
+    Returns:
+        The request body or an error response if the body did not match the \
+        `Content-Length` or the `Content-Length` exceeds the max content \
+        length of the app.
+    """
+    length = request.content_length
+    max_length = request.max_content_length
+    if length is not None and max_length is not None and length > max_length:
+        # Checked before the buffer is allocated because the length is
+        # provided by the client.
+        return Response('payload exceeds max request size', 413)
+    if length is None:
+        data = bytearray()
+        # Note: tests/endpoint/serve_test.py::test_empty_chunked_data handles
+        # the branching case for where the code in the for loop is not
+        # executed but coverage is not detecting that hence the pragma here
+        async for chunk in request.body:  # pragma: no branch
+            data += chunk
+        # Recorded in the route metrics in place of the missing length.
+        quart.g.body_length = len(data)
+        return data
+
+    data = bytearray(length)
+    offset = 0
+    with memoryview(data) as view:
+        async for chunk in request.body:
+            end = offset + len(chunk)
+            if end > length:
+                return Response('payload exceeds content length', 400)
+            view[offset:end] = chunk
+            offset = end
+    if offset != length:
+        return Response('payload shorter than content length', 400)
+    return data
+
+
 @routes_blueprint.route('/set', methods=['POST'])
-async def set_handler() -> Response:
+async def set_handler() -> Response:  # noqa: C901
     """Route handler for `POST /set`.
 
     Responses:
@@ -403,8 +588,8 @@ async def set_handler() -> Response:
     * `Status Code 200`: If the operation succeeds. The response message will
       be empty.
     * `Status Code 400`: If the key argument is missing, the endpoint UUID
-      argument is present but not a valid UUID, or the request is missing
-      the data payload.
+      argument is present but not a valid UUID, the ttl argument is present
+      but not a positive number, or the request is missing the data payload.
     * `Status Code 500`: If there was a peer request error. The response
       will contain the string representation of the internal error.
     """
@@ -423,18 +608,226 @@ async def set_handler() -> Response:
         except ValueError:
             return Response(f'{endpoint_uuid} is not a valid UUID4', 400)
 
-    data = bytearray()
-    # Note: tests/endpoint/serve_test.py::test_empty_chunked_data handles
-    # the branching case for where the code in the for loop is not executed
-    # but coverage is not detecting that hence the pragma here
-    async for chunk in request.body:  # pragma: no branch
-        data += chunk
+    ttl: str | float | None = request.args.get('ttl', None)
+    if isinstance(ttl, str):
+        try:
+            ttl = float(ttl)
+        except ValueError:
+            return Response(f'{ttl} is not a valid ttl', 400)
+        if ttl <= 0:
+            return Response('ttl must be greater than zero', 400)
 
+    data = await _read_body()
+    if isinstance(data, Response):
+        return data
     if len(data) == 0:
         return Response('received empty payload', 400)
 
     try:
-        await endpoint.set(key=key, data=bytes(data), endpoint=endpoint_uuid)
+        await endpoint.set(
+            key=key,
+            data=data,
+            endpoint=endpoint_uuid,
+            ttl=ttl,
+        )
+    except PeerRequestError as e:
+        return Response(str(e), 500)
+    else:
+        return Response('', 200)
+
+
+def _parse_batch_header(
+    header: Any,
+) -> tuple[list[str], list[uuid.UUID | None] | None]:
+    """Parse the keys and endpoints of a batch request.
+
+    Raises:
+        ValueError: If the header is malformed.
+    """
+    if not isinstance(header, dict) or not isinstance(
+        header.get('keys', None),
+        list,
+    ):
+        raise ValueError('request missing keys')
+    keys = header['keys']
+    if not all(isinstance(key, str) for key in keys):
+        raise ValueError('keys must be strings')
+
+    endpoints_: Sequence[str | None] | None = header.get('endpoints', None)
+    if endpoints_ is None:
+        return keys, None
+    if not isinstance(endpoints_, list) or len(endpoints_) != len(keys):
+        raise ValueError('endpoints must be a list with one entry per key')
+
+    endpoints: list[uuid.UUID | None] = []
+    for endpoint in endpoints_:
+        if endpoint is None:
+            endpoints.append(None)
+            continue
+        try:
+            endpoints.append(uuid.UUID(endpoint, version=4))
+        except (TypeError, ValueError):
+            raise ValueError(f'{endpoint} is not a valid UUID4') from None
+    return keys, endpoints
+
+
+async def _read_batch_header() -> (
+    tuple[list[str], list[uuid.UUID | None] | None] | Response
+):
+    try:
+        header = json.loads(await request.get_data())
+        return _parse_batch_header(header)
+    except ValueError as e:
+        return Response(str(e), 400)
+
+
+@routes_blueprint.route('/evict_batch', methods=['POST'])
+async def evict_batch_handler() -> Response:
+    """Route handler for `POST /evict_batch`.
+
+    The request body is a JSON object with the list of `keys` and an optional
+    list of `endpoints` UUIDs (or `null`), one per key.
+
+    Responses:
+
+    * `Status Code 200`: If the operation succeeds. The response message will
+      be empty.
+    * `Status Code 400`: If the body is malformed or an endpoint UUID is
+      not a valid UUID.
+    * `Status Code 500`: If there was a peer request error. The response
+      will contain the string representation of the internal error.
+    """
+    parsed = await _read_batch_header()
+    if isinstance(parsed, Response):
+        return parsed
+    keys, endpoints = parsed
+
+    endpoint = quart.current_app.config['endpoint']
+    try:
+        await endpoint.evict_batch(keys, endpoints)
+        return Response('', 200)
+    except PeerRequestError as e:
+        return Response(str(e), 500)
+
+
+@routes_blueprint.route('/exists_batch', methods=['POST'])
+async def exists_batch_handler() -> Response:
+    """Route handler for `POST /exists_batch`.
+
+    The request body is the same as
+    [`evict_batch_handler()`][proxystore.endpoint.serve.evict_batch_handler].
+
+    Responses:
+
+    * `Status Code 200`: If the operation succeeds. The response will be
+      a JSON object with the key `exists` and a list of booleans.
+    * `Status Code 400`: If the body is malformed or an endpoint UUID is
+      not a valid UUID.
+    * `Status Code 500`: If there was a peer request error. The response
+      will contain the string representation of the internal error.
+    """
+    parsed = await _read_batch_header()
+    if isinstance(parsed, Response):
+        return parsed
+    keys, endpoints = parsed
+
+    endpoint = quart.current_app.config['endpoint']
+    try:
+        exists = await endpoint.exists_batch(keys, endpoints)
+        return Response(
+            json.dumps({'exists': exists}),
+            200,
+            content_type='application/json',
+        )
+    except PeerRequestError as e:
+        return Response(str(e), 500)
+
+
+@routes_blueprint.route('/get_batch', methods=['POST'])
+async def get_batch_handler() -> Response:
+    """Route handler for `POST /get_batch`.
+
+    The request body is the same as
+    [`evict_batch_handler()`][proxystore.endpoint.serve.evict_batch_handler].
+
+    Responses:
+
+    * `Status Code 200`: If the operation succeeds. The response will be
+      an octet-stream of the multi-part encoded data for each key (see
+      [`proxystore.endpoint.multipart`][proxystore.endpoint.multipart]) where
+      keys without associated data are missing parts.
+    * `Status Code 400`: If the body is malformed or an endpoint UUID is
+      not a valid UUID.
+    * `Status Code 500`: If there was a peer request error. The response
+      will contain the string representation of the internal error.
+    """
+    parsed = await _read_batch_header()
+    if isinstance(parsed, Response):
+        return parsed
+    keys, endpoints = parsed
+
+    endpoint = quart.current_app.config['endpoint']
+    try:
+        data = await endpoint.get_batch(keys, endpoints)
+    except PeerRequestError as e:
+        return Response(str(e), 500)
+
+    response = Response(
+        response=encode_multipart(data, MAX_CHUNK_LENGTH),
+        content_type='application/octet-stream',
+    )
+    response.content_length = encoded_length(data)
+    return response
+
+
+@routes_blueprint.route('/set_batch', methods=['POST'])
+async def set_batch_handler() -> Response:
+    """Route handler for `POST /set_batch`.
+
+    The request body is multi-part encoded (see
+    [`proxystore.endpoint.multipart`][proxystore.endpoint.multipart]). The
+    first part is a JSON object in the same format as
+    [`evict_batch_handler()`][proxystore.endpoint.serve.evict_batch_handler]
+    and the remaining parts are the data for each key.
+
+    Responses:
+
+    * `Status Code 200`: If the operation succeeds. The response message will
+      be empty.
+    * `Status Code 400`: If the body is malformed, an endpoint UUID is not a
+      valid UUID, the ttl argument is present but not a positive number, or
+      the number of data parts does not match the number of keys.
+    * `Status Code 500`: If there was a peer request error. The response
+      will contain the string representation of the internal error.
+    """
+    ttl: str | float | None = request.args.get('ttl', None)
+    if isinstance(ttl, str):
+        try:
+            ttl = float(ttl)
+        except ValueError:
+            return Response(f'{ttl} is not a valid ttl', 400)
+        if ttl <= 0:
+            return Response('ttl must be greater than zero', 400)
+
+    body = await _read_body()
+    if isinstance(body, Response):
+        return body
+
+    try:
+        parts = decode_multipart(body)
+        if len(parts) == 0 or parts[0] is None:
+            raise ValueError('request missing header part')
+        keys, endpoints = _parse_batch_header(json.loads(bytes(parts[0])))
+    except ValueError as e:
+        return Response(str(e), 400)
+
+    data = parts[1:]
+    if len(data) != len(keys) or any(blob is None for blob in data):
+        return Response('expected one data part per key', 400)
+
+    endpoint = quart.current_app.config['endpoint']
+    try:
+        await endpoint.set_batch(keys, data, endpoints, ttl=ttl)
     except PeerRequestError as e:
         return Response(str(e), 500)
     else:
@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 import pathlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple
 from typing import Protocol
 from typing import runtime_checkable
 
 import aiosqlite
 
 from proxystore.endpoint.constants import MAX_OBJECT_SIZE_DEFAULT
+from proxystore.endpoint.constants import SQLITE_CHUNK_SIZE_DEFAULT
 from proxystore.endpoint.exceptions import ObjectSizeExceededError
 from proxystore.utils.data import bytes_to_readable
+from proxystore.utils.data import chunk_memoryview
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StorageStats:
+    """Occupancy statistics of a storage.
+
+    Attributes:
+        blobs: Number of unexpired blobs in the storage.
+        total_bytes: Total size in bytes of the unexpired blobs.
+    """
+
+    blobs: int
+    total_bytes: int
 
 
 @runtime_checkable
@@ -39,8 +63,8 @@ class Storage(Protocol):
     async def get(
         self,
         key: str,
-        default: bytes | None = None,
-    ) -> bytes | None:
+        default: bytes | bytearray | memoryview | None = None,
+    ) -> bytes | bytearray | memoryview | None:
         """Get a blob from storage.
 
         Args:
@@ -52,12 +76,23 @@ class Storage(Protocol):
         """
         ...
 
-    async def set(self, key: str, blob: bytes) -> None:
+    async def set(
+        self,
+        key: str,
+        blob: bytes | bytearray | memoryview,
+        ttl: float | None = None,
+    ) -> None:
         """Store the blob associated with a key.
 
+        Note:
+            Implementations may keep a reference to `blob` rather than
+            copying it so the blob should not be modified after being set.
+
         Args:
             key: Key that will be used to retrieve the blob.
             blob: Blob to store.
+            ttl: Optional time-to-live in seconds after which the blob
+                expires and is treated as if it does not exist.
 
         Raises:
             ObjectSizeExceededError: If the max object size is configured and
@@ -65,6 +100,10 @@ class Storage(Protocol):
         """
         ...
 
+    async def stats(self) -> StorageStats:
+        """Get occupancy statistics of the storage."""
+        ...
+
     async def close(self) -> None:
         """Close the storage."""
         ...
@@ -83,9 +122,16 @@ class DictStorage:
         *,
         max_object_size: int | None = MAX_OBJECT_SIZE_DEFAULT,
     ) -> None:
-        self._data: dict[str, bytes] = {}
+        self._data: dict[str, bytes | bytearray | memoryview] = {}
+        self._expires: dict[str, float] = {}
         self._max_object_size = max_object_size
 
+    def _evict_if_expired(self, key: str) -> None:
+        expires = self._expires.get(key, None)
+        if expires is not None and expires <= time.time():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+
     async def evict(self, key: str) -> None:
         """Evict a blob from storage.
 
@@ -93,6 +139,7 @@ class DictStorage:
             key: Key associated with blob to evict.
         """
         self._data.pop(key, None)
+        self._expires.pop(key, None)
 
     async def exists(self, key: str) -> bool:
         """Check if a blob exists in the storage.
@@ -103,13 +150,14 @@ class DictStorage:
         Returns:
             If a blob associated with the key exists.
         """
+        self._evict_if_expired(key)
         return key in self._data
 
     async def get(
         self,
         key: str,
-        default: bytes | None = None,
-    ) -> bytes | None:
+        default: bytes | bytearray | memoryview | None = None,
+    ) -> bytes | bytearray | memoryview | None:
         """Get a blob from storage.
 
         Args:
@@ -119,14 +167,22 @@ class DictStorage:
         Returns:
             The blob associated with the key or the value of `default`.
         """
+        self._evict_if_expired(key)
         return self._data.get(key, default)
 
-    async def set(self, key: str, blob: bytes) -> None:
+    async def set(
+        self,
+        key: str,
+        blob: bytes | bytearray | memoryview,
+        ttl: float | None = None,
+    ) -> None:
         """Store the blob associated with a key.
 
         Args:
             key: Key that will be used to retrieve the blob.
             blob: Blob to store.
+            ttl: Optional time-to-live in seconds after which the blob
+                expires and is treated as if it does not exist.
 
         Raises:
             ObjectSizeExceededError: If the max object size is configured and
@@ -142,19 +198,74 @@ class DictStorage:
                 'object limit.',
             )
         self._data[key] = blob
+        if ttl is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = time.time() + ttl
+
+    async def sweep(self) -> int:
+        """Evict all blobs whose time-to-live has expired.
+
+        Returns:
+            Number of blobs evicted.
+        """
+        now = time.time()
+        expired = [k for k, e in self._expires.items() if e <= now]
+        for key in expired:
+            await self.evict(key)
+        return len(expired)
+
+    async def stats(self) -> StorageStats:
+        """Get occupancy statistics of the storage."""
+        now = time.time()
+        blobs = [
+            blob
+            for key, blob in self._data.items()
+            if key not in self._expires or self._expires[key] > now
+        ]
+        return StorageStats(
+            blobs=len(blobs),
+            total_bytes=sum(len(blob) for blob in blobs),
+        )
 
     async def close(self) -> None:
         """Clear all stored blobs."""
         self._data.clear()
+        self._expires.clear()
 
 
 class SQLiteStorage:
     """SQLite storage protocol for blobs.
 
+    Blobs set with a `ttl` store their expiration time in an `expires`
+    column. Expired blobs are ignored by all queries and periodically
+    deleted by a background sweeper task.
+
+    File-backed databases use write-ahead logging (WAL) with
+    `synchronous=NORMAL` so writes do not wait on an fsync of the main
+    database file. Setting `commit_window` additionally enables group
+    commits where writes made within the window are committed together.
+    Each write still waits until its group has been committed.
+
+    Blobs larger than `chunk_size` are split across multiple rows so
+    objects are not limited by the maximum size of a single SQLite BLOB.
+
     Args:
         database_path: Path to database file.
         max_object_size: Optional max size in bytes for any single
             object stored by the endpoint. If exceeded, an error is raised.
+        sweep_interval: Seconds between deleting expired blobs from the
+            database. If `None`, expired blobs are never deleted but are
+            still treated as missing.
+        commit_window: Optional seconds to wait to batch writes into a
+            single commit. If `None`, each write is committed immediately.
+        chunk_size: Maximum size in bytes of a single BLOB row. Larger
+            blobs are stored as multiple chunks. If `None`, blobs are
+            never chunked.
+
+    Raises:
+        ValueError: If `commit_window` is negative or `chunk_size` is not
+            positive.
     """
 
     def __init__(
@@ -162,7 +273,15 @@ class SQLiteStorage:
         database_path: str | pathlib.Path = ':memory:',
         *,
         max_object_size: int | None = MAX_OBJECT_SIZE_DEFAULT,
+        sweep_interval: float | None = 60,
+        commit_window: float | None = None,
+        chunk_size: int | None = SQLITE_CHUNK_SIZE_DEFAULT,
     ) -> None:
+        if commit_window is not None and commit_window < 0:
+            raise ValueError('Commit window must be None or non-negative.')
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Chunk size must be None or greater than zero.')
+
         if database_path == ':memory:':
             self.database_path = database_path
         else:
@@ -170,18 +289,85 @@ class SQLiteStorage:
             self.database_path = str(path)
 
         self._max_object_size = max_object_size
+        self._sweep_interval = sweep_interval
+        self._commit_window = commit_window
+        self._chunk_size = chunk_size
         self._db: aiosqlite.Connection | None = None
+        self._sweeper_task: asyncio.Task[None] | None = None
+        self._commit_future: asyncio.Future[None] | None = None
+        self._commit_task: asyncio.Task[None] | None = None
+        # Writes and reads of chunked blobs span multiple statements so
+        # they are serialized to avoid observing partially written blobs.
+        self._lock = asyncio.Lock()
 
     async def db(self) -> aiosqlite.Connection:
         """Get the database connection object."""
         if self._db is None:
             self._db = await aiosqlite.connect(self.database_path)
+            if self.database_path != ':memory:':
+                await self._db.execute('PRAGMA journal_mode=WAL')
+                await self._db.execute('PRAGMA synchronous=NORMAL')
             await self._db.execute(
                 'CREATE TABLE IF NOT EXISTS blobs'
-                '(key TEXT PRIMARY KEY, value BLOB NOT NULL)',
+                '(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL, '
+                'chunks INTEGER)',
+            )
+            await self._db.execute(
+                'CREATE TABLE IF NOT EXISTS blob_chunks'
+                '(key TEXT NOT NULL, seq INTEGER NOT NULL, '
+                'value BLOB NOT NULL, PRIMARY KEY (key, seq))',
+            )
+            # Databases created by older versions do not have the
+            # expires or chunks columns.
+            async with self._db.execute('PRAGMA table_info(blobs)') as cursor:
+                columns = {row[1] for row in await cursor.fetchall()}
+            if 'expires' not in columns:
+                await self._db.execute(
+                    'ALTER TABLE blobs ADD COLUMN expires REAL',
+                )
+            if 'chunks' not in columns:
+                await self._db.execute(
+                    'ALTER TABLE blobs ADD COLUMN chunks INTEGER',
+                )
+            await self._db.execute(
+                'CREATE INDEX IF NOT EXISTS blobs_expires ON blobs(expires) '
+                'WHERE expires IS NOT NULL',
             )
+            await self._db.commit()
+            if self._sweep_interval is not None:
+                self._sweeper_task = asyncio.create_task(
+                    self._sweep_loop(self._sweep_interval),
+                    name='sqlite-storage-sweeper',
+                )
         return self._db
 
+    async def _commit(self) -> None:
+        if self._commit_window is None:
+            db = await self.db()
+            await db.commit()
+            return
+
+        if self._commit_future is None:
+            self._commit_future = asyncio.get_running_loop().create_future()
+            self._commit_task = asyncio.create_task(
+                self._group_commit(self._commit_future),
+                name='sqlite-storage-group-commit',
+            )
+        await asyncio.shield(self._commit_future)
+
+    async def _group_commit(self, future: asyncio.Future[None]) -> None:
+        assert self._commit_window is not None
+        await asyncio.sleep(self._commit_window)
+        # Writes after this point will wait on the next group commit.
+        self._commit_future = None
+        try:
+            db = await self.db()
+            await db.commit()
+        except Exception as e:  # pragma: no cover
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
     async def evict(self, key: str) -> None:
         """Evict a blob from storage.
 
@@ -189,8 +375,10 @@ class SQLiteStorage:
             key: Key associated with blob to evict.
         """
         db = await self.db()
-        await db.execute('DELETE FROM blobs WHERE key=?', (key,))
-        await db.commit()
+        async with self._lock:
+            await db.execute('DELETE FROM blobs WHERE key=?', (key,))
+            await db.execute('DELETE FROM blob_chunks WHERE key=?', (key,))
+        await self._commit()
 
     async def exists(self, key: str) -> bool:
         """Check if a blob exists in the storage.
@@ -203,20 +391,31 @@ class SQLiteStorage:
         """
         db = await self.db()
         async with db.execute(
-            'SELECT count(*) FROM blobs WHERE key=?',
-            (key,),
+            'SELECT 1 FROM blobs WHERE key=? '
+            'AND (expires IS NULL OR expires>?) LIMIT 1',
+            (key, time.time()),
         ) as cursor:
-            result = await cursor.fetchone()
-            # count() won't ever return 0 rows but mypy doesn't know this
-            assert result is not None
-            (count,) = result
-            return bool(count)
+            return await cursor.fetchone() is not None
+
+    async def _select(
+        self,
+        key: str,
+    ) -> tuple[bytes, int | None] | None:
+        db = await self.db()
+        rows = await db.execute_fetchall(
+            'SELECT value, chunks FROM blobs WHERE key=? '
+            'AND (expires IS NULL OR expires>?)',
+            (key, time.time()),
+        )
+        for value, chunks in rows:
+            return value, chunks
+        return None
 
     async def get(
         self,
         key: str,
-        default: bytes | None = None,
-    ) -> bytes | None:
+        default: bytes | bytearray | memoryview | None = None,
+    ) -> bytes | bytearray | memoryview | None:
         """Get a blob from storage.
 
         Args:
@@ -226,23 +425,45 @@ class SQLiteStorage:
         Returns:
             The blob associated with the key or the value of `default`.
         """
-        db = await self.db()
-        async with db.execute(
-            'SELECT value FROM blobs WHERE key=?',
-            (key,),
-        ) as cursor:
-            result = await cursor.fetchone()
+        result = await self._select(key)
+        if result is None:
+            return default
+        value, chunks = result
+        if chunks is None:
+            return value
+
+        async with self._lock:
+            # The blob may have changed while waiting on the lock.
+            result = await self._select(key)
             if result is None:
                 return default
-            else:
-                return result[0]
-
-    async def set(self, key: str, blob: bytes) -> None:
+            value, chunks = result
+            if chunks is None:
+                return value
+
+            db = await self.db()
+            data = bytearray()
+            async with db.execute(
+                'SELECT value FROM blob_chunks WHERE key=? ORDER BY seq',
+                (key,),
+            ) as cursor:
+                async for (chunk,) in cursor:
+                    data += chunk
+            return data
+
+    async def set(
+        self,
+        key: str,
+        blob: bytes | bytearray | memoryview,
+        ttl: float | None = None,
+    ) -> None:
         """Store the blob associated with a key.
 
         Args:
             key: Key that will be used to retrieve the blob.
             blob: Blob to store.
+            ttl: Optional time-to-live in seconds after which the blob
+                expires and is treated as if it does not exist.
 
         Raises:
             ObjectSizeExceededError: If the max object size is configured and
@@ -257,14 +478,343 @@ class SQLiteStorage:
                 f'exceeds the {bytes_to_readable(self._max_object_size)} '
                 'object limit.',
             )
+        expires = None if ttl is None else time.time() + ttl
+        db = await self.db()
+        async with self._lock:
+            await db.execute('DELETE FROM blob_chunks WHERE key=?', (key,))
+            if self._chunk_size is None or len(blob) <= self._chunk_size:
+                await db.execute(
+                    'INSERT OR REPLACE INTO blobs '
+                    '(key, value, expires, chunks) VALUES (?, ?, ?, NULL)',
+                    (key, blob, expires),
+                )
+            else:
+                chunks = list(chunk_memoryview(blob, self._chunk_size))
+                await db.executemany(
+                    'INSERT INTO blob_chunks (key, seq, value) '
+                    'VALUES (?, ?, ?)',
+                    ((key, i, chunk) for i, chunk in enumerate(chunks)),
+                )
+                await db.execute(
+                    'INSERT OR REPLACE INTO blobs '
+                    '(key, value, expires, chunks) VALUES (?, ?, ?, ?)',
+                    (key, b'', expires, len(chunks)),
+                )
+        await self._commit()
+
+    async def stats(self) -> StorageStats:
+        """Get occupancy statistics of the storage."""
         db = await self.db()
-        await db.execute(
-            'INSERT OR REPLACE INTO blobs (key, value) VALUES (?, ?)',
-            (key, blob),
+        now = time.time()
+        rows = await db.execute_fetchall(
+            'SELECT count(*), total(length(value)) FROM blobs '
+            'WHERE expires IS NULL OR expires>?',
+            (now,),
         )
+        ((blobs, total_bytes),) = rows
+        rows = await db.execute_fetchall(
+            'SELECT total(length(blob_chunks.value)) FROM blob_chunks '
+            'JOIN blobs ON blobs.key=blob_chunks.key '
+            'WHERE blobs.expires IS NULL OR blobs.expires>?',
+            (now,),
+        )
+        ((chunk_bytes,),) = rows
+        return StorageStats(
+            blobs=blobs,
+            total_bytes=int(total_bytes + chunk_bytes),
+        )
+
+    async def sweep(self) -> int:
+        """Delete all blobs whose time-to-live has expired.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        db = await self.db()
+        now = time.time()
+        async with self._lock:
+            await db.execute(
+                'DELETE FROM blob_chunks WHERE key IN '
+                '(SELECT key FROM blobs WHERE expires<=?)',
+                (now,),
+            )
+            cursor = await db.execute(
+                'DELETE FROM blobs WHERE expires<=?',
+                (now,),
+            )
         await db.commit()
+        return cursor.rowcount
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                deleted = await self.sweep()
+            except Exception:  # pragma: no cover
+                logger.exception('Failed to sweep expired blobs')
+            else:
+                if deleted > 0:
+                    logger.debug(f'Swept {deleted} expired blob(s)')
 
     async def close(self) -> None:
-        """Close the storage."""
+        """Close the storage.
+
+        Writes waiting on a group commit are committed before closing.
+        """
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweeper_task
+            self._sweeper_task = None
+        # Wait on in-progress writes and any pending group commit.
+        async with self._lock:
+            if self._commit_task is not None:
+                await self._commit_task
+                self._commit_task = None
         if self._db is not None:
             await self._db.close()
+
+
+class _HotBlob(NamedTuple):
+    blob: bytes | bytearray | memoryview
+    expires: float | None
+
+
+@dataclass(frozen=True)
+class TieredStorageOccupancy:
+    """Occupancy report of a tiered storage.
+
+    Attributes:
+        memory_bytes: Total size in bytes of blobs in the memory tier.
+        memory_blobs: Number of blobs in the memory tier.
+        max_memory_bytes: Byte budget of the memory tier.
+        spilled_blobs: Number of blobs spilled to the cold tier by this
+            instance.
+    """
+
+    memory_bytes: int
+    memory_blobs: int
+    max_memory_bytes: int
+    spilled_blobs: int
+
+
+class TieredStorage:
+    """Memory-bounded storage which spills blobs to a cold storage.
+
+    Blobs are stored in an in-memory least-recently-used (LRU) tier until
+    the total size of the blobs exceeds `max_memory_bytes`. Then, the least
+    recently used blobs are spilled to the `cold` storage (e.g., a
+    [`SQLiteStorage`][proxystore.endpoint.storage.SQLiteStorage]). Reads of
+    spilled blobs are served by the cold storage. Blobs larger than
+    `max_memory_bytes` are written directly to the cold storage.
+
+    Note:
+        When closed, all blobs in the memory tier are written to the cold
+        storage so blobs are not lost if the cold storage is persistent.
+
+    Args:
+        cold: Storage that blobs are spilled to. This storage will be closed
+            when this instance is closed.
+        max_memory_bytes: Byte budget of the in-memory tier.
+        max_object_size: Optional max size in bytes for any single
+            object stored by the endpoint. If exceeded, an error is raised.
+
+    Raises:
+        ValueError: If `max_memory_bytes` is negative.
+    """
+
+    def __init__(
+        self,
+        cold: Storage,
+        *,
+        max_memory_bytes: int,
+        max_object_size: int | None = MAX_OBJECT_SIZE_DEFAULT,
+    ) -> None:
+        if max_memory_bytes < 0:
+            raise ValueError(
+                'Max memory bytes must be greater than or equal to zero.',
+            )
+        self._cold = cold
+        self._max_memory_bytes = max_memory_bytes
+        self._max_object_size = max_object_size
+        self._hot: OrderedDict[str, _HotBlob] = OrderedDict()
+        self._hot_bytes = 0
+        self._spilled = 0
+        self._spill_lock = asyncio.Lock()
+
+    def occupancy(self) -> TieredStorageOccupancy:
+        """Get the current occupancy of the storage."""
+        return TieredStorageOccupancy(
+            memory_bytes=self._hot_bytes,
+            memory_blobs=len(self._hot),
+            max_memory_bytes=self._max_memory_bytes,
+            spilled_blobs=self._spilled,
+        )
+
+    def _pop_hot(self, key: str) -> _HotBlob | None:
+        entry = self._hot.pop(key, None)
+        if entry is not None:
+            self._hot_bytes -= len(entry.blob)
+        return entry
+
+    async def _get_hot(self, key: str) -> _HotBlob | None:
+        entry = self._hot.get(key, None)
+        if entry is None:
+            return None
+        if entry.expires is not None and entry.expires <= time.time():
+            self._pop_hot(key)
+            # The cold storage may have a stale copy from before the
+            # blob was overwritten in the memory tier.
+            await self._cold.evict(key)
+            return None
+        self._hot.move_to_end(key)
+        return entry
+
+    async def _spill(self) -> None:
+        async with self._spill_lock:
+            while self._hot_bytes > self._max_memory_bytes:
+                key, entry = next(iter(self._hot.items()))
+                await self._write_cold(key, entry)
+                # The blob may have been evicted or overwritten while
+                # writing to the cold storage.
+                if self._hot.get(key, None) is entry:
+                    self._pop_hot(key)
+                    self._spilled += 1
+                elif key not in self._hot:
+                    await self._cold.evict(key)
+
+    async def _write_cold(self, key: str, entry: _HotBlob) -> None:
+        if entry.expires is None:
+            await self._cold.set(key, entry.blob)
+            return
+        ttl = entry.expires - time.time()
+        if ttl > 0:
+            await self._cold.set(key, entry.blob, ttl=ttl)
+
+    async def evict(self, key: str) -> None:
+        """Evict a blob from storage.
+
+        Args:
+            key: Key associated with blob to evict.
+        """
+        self._pop_hot(key)
+        await self._cold.evict(key)
+
+    async def exists(self, key: str) -> bool:
+        """Check if a blob exists in the storage.
+
+        Args:
+            key: Key associated with the blob to check.
+
+        Returns:
+            If a blob associated with the key exists.
+        """
+        if await self._get_hot(key) is not None:
+            return True
+        return await self._cold.exists(key)
+
+    async def get(
+        self,
+        key: str,
+        default: bytes | bytearray | memoryview | None = None,
+    ) -> bytes | bytearray | memoryview | None:
+        """Get a blob from storage.
+
+        Args:
+            key: Key associated with the blob to get.
+            default: Default return value if the blob does not exist.
+
+        Returns:
+            The blob associated with the key or the value of `default`.
+        """
+        entry = await self._get_hot(key)
+        if entry is not None:
+            return entry.blob
+        return await self._cold.get(key, default)
+
+    async def set(
+        self,
+        key: str,
+        blob: bytes | bytearray | memoryview,
+        ttl: float | None = None,
+    ) -> None:
+        """Store the blob associated with a key.
+
+        Args:
+            key: Key that will be used to retrieve the blob.
+            blob: Blob to store.
+            ttl: Optional time-to-live in seconds after which the blob
+                expires and is treated as if it does not exist.
+
+        Raises:
+            ObjectSizeExceededError: If the max object size is configured and
+                the data exceeds that size.
+        """
+        if (
+            self._max_object_size is not None
+            and len(blob) > self._max_object_size
+        ):
+            raise ObjectSizeExceededError(
+                f'Bytes value has size {bytes_to_readable(len(blob))} which '
+                f'exceeds the {bytes_to_readable(self._max_object_size)} '
+                'object limit.',
+            )
+
+        self._pop_hot(key)
+        if len(blob) > self._max_memory_bytes:
+            await self._cold.set(key, blob, ttl=ttl)
+            return
+
+        expires = None if ttl is None else time.time() + ttl
+        self._hot[key] = _HotBlob(blob, expires)
+        self._hot_bytes += len(blob)
+        if self._hot_bytes > self._max_memory_bytes:
+            await self._spill()
+
+    async def stats(self) -> StorageStats:
+        """Get occupancy statistics of the storage.
+
+        Note:
+            A blob overwritten in the memory tier after being spilled is
+            counted in both tiers until the stale copy in the cold storage
+            is evicted or expires.
+        """
+        now = time.time()
+        hot = [
+            entry.blob
+            for entry in self._hot.values()
+            if entry.expires is None or entry.expires > now
+        ]
+        cold = await self._cold.stats()
+        return StorageStats(
+            blobs=len(hot) + cold.blobs,
+            total_bytes=sum(len(blob) for blob in hot) + cold.total_bytes,
+        )
+
+    async def sweep(self) -> int:
+        """Evict all blobs in the memory tier whose time-to-live has expired.
+
+        Expired blobs in the cold storage are handled by the cold storage.
+
+        Returns:
+            Number of blobs evicted.
+        """
+        now = time.time()
+        expired = [
+            key
+            for key, entry in self._hot.items()
+            if entry.expires is not None and entry.expires <= now
+        ]
+        for key in expired:
+            self._pop_hot(key)
+            await self._cold.evict(key)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Write blobs in the memory tier to the cold storage and close."""
+        async with self._spill_lock:
+            while len(self._hot) > 0:
+                key, entry = self._hot.popitem(last=False)
+                self._hot_bytes -= len(entry.blob)
+                await self._write_cold(key, entry)
+        await self._cold.close()
@@ -1,16 +1,24 @@
-"""Message chunking utilities."""
+"""Message chunking utilities.
+
+Messages are split into chunks which reference the message data with
+[`memoryview`][memoryview] slices and are reassembled in place by a
+[`ChunkAssembler`][proxystore.p2p.chunks.ChunkAssembler] so the data of a
+message is not copied into intermediate buffers when sending or receiving.
+"""
 
 from __future__ import annotations
 
 import enum
 import math
+import struct
 from collections.abc import Generator
-from struct import pack
-from struct import unpack_from
+from collections.abc import Sequence
 
 CHUNK_HEADER_LENGTH = 2 + (4 * 4)
 CHUNK_HEADER_FORMAT = '!HLLLL'
 
+_CHUNK_HEADER = struct.Struct(CHUNK_HEADER_FORMAT)
+
 
 class ChunkDType(enum.Enum):
     """Data type contained in a Chunk."""
@@ -19,6 +27,8 @@ class ChunkDType(enum.Enum):
     """Data is bytes."""
     STRING = 2
     """Data is a string."""
+    ABORT = 3
+    """Stream was aborted by the sender and its chunks should be discarded."""
 
 
 class Chunk:
@@ -28,8 +38,10 @@ class Chunk:
         stream_id: Unique ID for the stream of chunks.
         seq_id: Sequence number for this chunk in the stream.
         seq_len: Length of the stream.
-        data: Data for this chunk.
-        dtype: Optionally specify data type otherwise inferred from data.
+        data: Data for this chunk. A string is encoded as UTF-8 and other
+            buffers are referenced without copying.
+        dtype: Optionally specify the data type of the message the chunk
+            is part of otherwise inferred from data.
 
     Raises:
         ValueError: if the sequence ID is not less than the sequence length.
@@ -40,7 +52,7 @@ class Chunk:
         stream_id: int,
         seq_id: int,
         seq_len: int,
-        data: bytes | str,
+        data: bytes | bytearray | memoryview | str,
         dtype: ChunkDType | None = None,
     ) -> None:
         if seq_len <= seq_id:
@@ -50,92 +62,225 @@ class Chunk:
         self.stream_id = stream_id
         self.seq_id = seq_id
         self.seq_len = seq_len
-        self.data = data
         if dtype is None:
             self.dtype = (
-                ChunkDType.BYTES
-                if isinstance(data, bytes)
-                else ChunkDType.STRING
+                ChunkDType.STRING
+                if isinstance(data, str)
+                else ChunkDType.BYTES
             )
         else:
             self.dtype = dtype
+        self.data = memoryview(
+            data.encode('utf8') if isinstance(data, str) else data,
+        )
 
     def __bytes__(self) -> bytes:
         """Pack the chunk into bytes."""
-        length = CHUNK_HEADER_LENGTH + len(self.data)
-        header = pack(
-            CHUNK_HEADER_FORMAT,
+        header = _CHUNK_HEADER.pack(
             self.dtype.value,
-            length,
+            CHUNK_HEADER_LENGTH + len(self.data),
             self.stream_id,
             self.seq_id,
             self.seq_len,
         )
-        data = (
-            self.data.encode('utf8')
-            if isinstance(self.data, str)
-            else self.data
-        )
-        chunk = header + data
-
-        data += b'\x00' * (len(chunk) % 4)
-        return chunk
+        return b''.join((header, self.data))
 
     @classmethod
-    def from_bytes(cls, chunk: bytes) -> Chunk:
-        """Decode bytes into a Chunk."""
-        (dtype_value, length, stream_id, seq_id, seq_len) = unpack_from(
-            CHUNK_HEADER_FORMAT,
-            chunk,
+    def from_bytes(cls, chunk: bytes | bytearray | memoryview) -> Chunk:
+        """Decode bytes into a Chunk.
+
+        The data of the returned chunk is a view of `chunk`.
+        """
+        (dtype_value, length, stream_id, seq_id, seq_len) = (
+            _CHUNK_HEADER.unpack_from(chunk)
         )
-        dtype = ChunkDType(dtype_value)
-        chunk_data = chunk[CHUNK_HEADER_LENGTH:length]
-        data: bytes | str
-        if dtype is ChunkDType.STRING:
-            data = chunk_data.decode('utf8')
-        else:
-            data = chunk_data
         return cls(
             stream_id=stream_id,
             seq_id=seq_id,
             seq_len=seq_len,
-            data=data,
-            dtype=dtype,
+            data=memoryview(chunk)[CHUNK_HEADER_LENGTH:length],
+            dtype=ChunkDType(dtype_value),
         )
 
 
+def _split(
+    views: Sequence[memoryview],
+    size: int,
+) -> Generator[bytes | memoryview, None, None]:
+    # Yield the concatenation of the views in pieces of size bytes. Pieces
+    # within a single view are slices of it and only the pieces which span
+    # multiple views are joined.
+    parts: list[memoryview] = []
+    filled = 0
+    empty = True
+    for view in views:
+        offset = 0
+        while offset < len(view):
+            part = view[offset : offset + size - filled]
+            parts.append(part)
+            filled += len(part)
+            offset += len(part)
+            if filled == size:
+                yield parts[0] if len(parts) == 1 else b''.join(parts)
+                parts, filled, empty = [], 0, False
+    if len(parts) > 0 or empty:
+        yield parts[0] if len(parts) == 1 else b''.join(parts)
+
+
 def chunkify(
-    data: bytes | str,
+    data: bytes
+    | bytearray
+    | memoryview
+    | str
+    | Sequence[bytes | bytearray | memoryview],
     size: int,
     stream_id: int,
 ) -> Generator[Chunk, None, None]:
     """Generate chunks from data.
 
+    Every chunk except the last contains exactly `size` bytes. Chunks
+    reference slices of `data` rather than copies so `data` should not be
+    modified until the chunks have been sent.
+
     Args:
-        data: Data to chunk.
-        size: Size of each chunk.
+        data: Data to chunk. Strings are encoded as UTF-8 and chunked by
+            bytes. A sequence of buffers is chunked as if the buffers were
+            concatenated, but only chunks spanning multiple buffers are
+            copied.
+        size: Size in bytes of each chunk.
         stream_id: Unique ID for the stream of chunks.
 
     Yields:
         Chunks of data.
     """
-    seq_len = math.ceil(len(data) / size)
+    dtype = ChunkDType.STRING if isinstance(data, str) else ChunkDType.BYTES
+    if isinstance(data, str):
+        views = [memoryview(data.encode('utf8'))]
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        views = [memoryview(data)]
+    else:
+        views = [memoryview(part) for part in data]
+    # An empty message is still sent as a single empty chunk.
+    seq_len = max(1, math.ceil(sum(len(view) for view in views) / size))
 
-    for i, x in enumerate(range(0, len(data), size)):
-        chunk_data = data[x : min(x + size, len(data))]
+    for i, chunk in enumerate(_split(views, size)):
         yield Chunk(
             stream_id=stream_id,
             seq_id=i,
             seq_len=seq_len,
-            data=chunk_data,
+            data=chunk,
+            dtype=dtype,
         )
 
 
-def reconstruct(chunks: list[Chunk]) -> bytes | str:
+class ChunkAssembler:
+    """Reassemble a message in place from its chunks.
+
+    Chunks can be added in any order and each chunk is copied directly to
+    its position in the buffer for the message. The buffer grows as chunks
+    are added rather than being allocated for the whole message up front so
+    the memory used by a partially received message is proportional to the
+    data received. The last chunk in the sequence is held until the other
+    chunks have been added.
+
+    Args:
+        seq_len: Number of chunks in the message.
+        dtype: Data type of the message.
+    """
+
+    def __init__(self, seq_len: int, dtype: ChunkDType) -> None:
+        self.seq_len = seq_len
+        self.dtype = dtype
+        self._received = 0
+        self._chunk_size: int | None = None
+        self._buffer = bytearray()
+        self._length: int | None = None
+        # Data of the last chunk if it arrives before the other chunks.
+        self._last: bytes | None = None
+
+    @property
+    def complete(self) -> bool:
+        """All chunks of the message have been added."""
+        return self._received == self.seq_len
+
+    def add(self, chunk: Chunk) -> None:
+        """Copy the data of a chunk into the message.
+
+        Raises:
+            ValueError: if the chunk is not part of this message or
+                does not match the size of the previous chunks.
+        """
+        if chunk.seq_len != self.seq_len or chunk.dtype is not self.dtype:
+            raise ValueError('Chunk does not belong to this message.')
+        if self.complete:
+            raise ValueError(f'Got more than {self.seq_len} chunks.')
+
+        last = chunk.seq_id == self.seq_len - 1
+        if self.seq_len == 1:
+            self._buffer = bytearray(chunk.data)
+            self._length = len(chunk.data)
+        elif last and self._received < self.seq_len - 1:
+            self._last = bytes(chunk.data)
+        else:
+            if self._chunk_size is None:
+                self._chunk_size = len(chunk.data)
+            self._place(chunk.seq_id, chunk.data)
+        self._received += 1
+
+        if self.complete and self._last is not None:
+            self._place(self.seq_len - 1, self._last)
+            self._last = None
+
+    def _place(self, seq_id: int, data: bytes | memoryview) -> None:
+        assert self._chunk_size is not None
+        last = seq_id == self.seq_len - 1
+        if len(data) != self._chunk_size and not (
+            last and len(data) < self._chunk_size
+        ):
+            raise ValueError(
+                f'Chunk {seq_id} has length {len(data)} but expected '
+                f'{self._chunk_size}.',
+            )
+        offset = seq_id * self._chunk_size
+        end = offset + len(data)
+        if len(self._buffer) < end:
+            # Grow geometrically so in order chunks are amortized to a
+            # constant number of copies but never beyond the message size.
+            capacity = min(
+                max(end, 2 * len(self._buffer)),
+                self.seq_len * self._chunk_size,
+            )
+            self._buffer.extend(bytes(capacity - len(self._buffer)))
+        self._buffer[offset:end] = data
+        if last:
+            self._length = end
+
+    def message(self) -> bytearray | str:
+        """Get the reassembled message.
+
+        Returns:
+            Reassembled message as a [`bytearray`][bytearray] if the \
+            message was bytes or a string.
+
+        Raises:
+            ValueError: if not all chunks have been added.
+        """
+        if not self.complete:
+            raise ValueError(
+                f'Got {self._received} but expected {self.seq_len}.',
+            )
+        assert self._length is not None
+        del self._buffer[self._length :]
+        if self.dtype is ChunkDType.STRING:
+            return self._buffer.decode('utf8')
+        return self._buffer
+
+
+def reconstruct(chunks: list[Chunk]) -> bytearray | str:
     """Reconstructs data from list of chunks.
 
     Args:
-        chunks: List of chunks to order and join.
+        chunks: List of chunks in any order.
 
     Returns:
         Reconstructed bytes or string.
@@ -145,10 +290,7 @@ def reconstruct(chunks: list[Chunk]) -> bytes | str:
     seq_len = chunks[0].seq_len
     if len(chunks) != seq_len:
         raise ValueError(f'Got {len(chunks)} but expected {seq_len}.')
-    chunks = sorted(chunks, key=lambda c: c.seq_id)
-    if isinstance(chunks[0].data, bytes):
-        return b''.join(c.data for c in chunks)  # type: ignore
-    elif isinstance(chunks[0].data, str):
-        return ''.join(c.data for c in chunks)  # type: ignore
-    else:
-        raise AssertionError('Unreachable.')
+    assembler = ChunkAssembler(seq_len, chunks[0].dtype)
+    for chunk in chunks:
+        assembler.add(chunk)
+    return assembler.message()
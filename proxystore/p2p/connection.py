@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import itertools
 import logging
 import re
 import warnings
-from collections import defaultdict
+from collections import deque
 from collections.abc import Awaitable
 from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from typing import Any
 from uuid import UUID
 
@@ -16,10 +20,12 @@ try:
     from aiortc import RTCDataChannel
     from aiortc import RTCIceCandidate
     from aiortc import RTCPeerConnection
+    from aiortc import RTCSctpTransport
     from aiortc import RTCSessionDescription
     from aiortc.contrib.signaling import BYE
     from aiortc.contrib.signaling import object_from_string
     from aiortc.contrib.signaling import object_to_string
+    from aiortc.sdp import SessionDescription
 except ImportError as e:  # pragma: no cover
     warnings.warn(
         f'{e}. To enable endpoint serving, install proxystore with '
@@ -28,8 +34,10 @@ except ImportError as e:  # pragma: no cover
     )
 
 from proxystore.p2p.chunks import Chunk
+from proxystore.p2p.chunks import CHUNK_HEADER_LENGTH
+from proxystore.p2p.chunks import ChunkAssembler
+from proxystore.p2p.chunks import ChunkDType
 from proxystore.p2p.chunks import chunkify
-from proxystore.p2p.chunks import reconstruct
 from proxystore.p2p.exceptions import PeerConnectionError
 from proxystore.p2p.exceptions import PeerConnectionTimeoutError
 from proxystore.p2p.relay.client import RelayClient
@@ -38,10 +46,27 @@ from proxystore.utils.counter import AtomicCounter
 
 logger = logging.getLogger(__name__)
 
-# These values were manually found using
-# testing/scripts/peer_connection_bandwidth.py
-MAX_CHUNK_SIZE_STRING = 2**15
-MAX_CHUNK_SIZE_BYTES = 2**15
+DEFAULT_MAX_MESSAGE_SIZE = 65536
+"""SCTP max message size assumed if the peer does not specify one.
+
+This is the default defined in RFC 8841 when the max-message-size SDP
+attribute is not present.
+"""
+CHANNEL_SEND_WINDOW = 2**18
+"""Max bytes buffered by a datachannel before sends to it wait.
+
+Sends resume once the buffered amount of a channel drains to half of the
+window. This value can be tuned with
+the testing.scripts.peer_connection_loopback script.
+"""
+
+
+@dataclasses.dataclass
+class _OutgoingMessage:
+    stream_id: int
+    chunks: Iterator[Chunk]
+    sent: asyncio.Future[None]
+    started: bool = False
 
 
 class PeerConnection:
@@ -91,6 +116,11 @@ class PeerConnection:
         await connection2.close()
         ```
 
+    Messages which fit in a single chunk are queued ahead of the remaining
+    chunks of large messages so small messages are not delayed behind bulk
+    transfers. The chunks of large messages are interleaved one chunk at a
+    time so concurrent large messages share the datachannels fairly.
+
     Args:
         relay_client: Client connection to the relay server.
         channels: Number of datachannels to open with peer.
@@ -110,15 +140,24 @@ class PeerConnection:
         )
         self._pc = RTCPeerConnection()
 
-        self._incoming_queue: asyncio.Queue[bytes | str] = asyncio.Queue()
-        self._incoming_chunks: dict[int, list[Chunk]] = defaultdict(list)
+        self._incoming_queue: asyncio.Queue[bytearray | str] = asyncio.Queue()
+        self._incoming_chunks: dict[int, ChunkAssembler] = {}
         # Max size of unsigned long (4 bytes) is 2^32 - 1
         self._message_counter = AtomicCounter(size=2**32 - 1)
 
         # Used by offerer to count how many of the channels it opened are ready
         self._ready = 0
         self._channels: dict[str, RTCDataChannel] = {}
-        self._channel_buffer_low: dict[str, asyncio.Event] = {}
+        # Set when the buffered amount of any channel drains below the
+        # low threshold so a blocked send can pick a channel again.
+        self._buffer_low = asyncio.Event()
+        self._max_message_size = DEFAULT_MAX_MESSAGE_SIZE
+        # Messages with chunks remaining to be sent in round-robin order by
+        # the outgoing task. Small messages are kept in FIFO order at the
+        # front of the queue and counted by _outgoing_small.
+        self._outgoing: deque[_OutgoingMessage] = deque()
+        self._outgoing_small = 0
+        self._outgoing_task: asyncio.Task[None] | None = None
 
         self._peer_uuid: UUID | None = None
         self._peer_name: str | None = None
@@ -142,6 +181,15 @@ class PeerConnection:
         """
         return self._pc.connectionState
 
+    @property
+    def chunk_size(self) -> int:
+        """Size in bytes of the data in each chunk of a message.
+
+        The chunk size is derived from the SCTP max message size negotiated
+        with the peer so each chunk fits in a single datachannel message.
+        """
+        return self._max_message_size - CHUNK_HEADER_LENGTH
+
     async def close(self) -> None:
         """Terminate the peer connection.
 
@@ -150,6 +198,17 @@ class PeerConnection:
             [`RelayClient.close()`][proxystore.p2p.relay.client.RelayClient].
         """
         logger.info(f'{self._log_prefix}: closing connection')
+        if self._outgoing_task is not None:
+            self._outgoing_task.cancel()
+        self._outgoing_small = 0
+        while len(self._outgoing) > 0:
+            outgoing = self._outgoing.popleft()
+            if not outgoing.sent.done():
+                outgoing.sent.set_exception(
+                    PeerConnectionError(
+                        'Connection closed before the message was sent.',
+                    ),
+                )
         # Flush send buffers before close
         # https://github.com/aiortc/aiortc/issues/547
         for channel in self._channels.values():
@@ -183,44 +242,123 @@ class PeerConnection:
 
         self._pc.on('connectionstatechange', _on_close)
 
-    async def send(self, message: bytes | str, timeout: float = 30) -> None:
+    async def send(
+        self,
+        message: bytes
+        | bytearray
+        | str
+        | Sequence[bytes | bytearray | memoryview],
+        timeout: float = 30,
+    ) -> None:
         """Send message to peer.
 
+        Note:
+            Chunks of the message reference the message data rather than
+            copies of it so a [`bytearray`][bytearray] message should not be
+            modified until this method returns.
+
         Args:
-            message: Message to send to peer.
+            message: Message to send to peer. A sequence of buffers is sent
+                as a single message of their concatenation without first
+                joining the buffers.
             timeout: Timeout to wait on peer connection to be ready.
 
         Raises:
             PeerConnectionTimeoutError: If the peer connection is not
                 established within the timeout.
+            PeerConnectionError: If the connection is closed before all
+                chunks of the message are sent.
         """
         await self.ready(timeout)
 
-        chunk_size = (
-            MAX_CHUNK_SIZE_STRING
-            if isinstance(message, str)
-            else MAX_CHUNK_SIZE_BYTES
+        message_id = self._message_counter.increment()
+        chunks = chunkify(message, self.chunk_size, message_id)
+        first = next(chunks)
+        outgoing = _OutgoingMessage(
+            stream_id=message_id,
+            chunks=itertools.chain((first,), chunks),
+            sent=asyncio.get_running_loop().create_future(),
         )
+        if first.seq_len == 1:
+            # Small messages still wait on the send window but are queued
+            # ahead of the chunks of large messages.
+            self._outgoing.insert(self._outgoing_small, outgoing)
+            self._outgoing_small += 1
+        else:
+            self._outgoing.append(outgoing)
+        if self._outgoing_task is None or self._outgoing_task.done():
+            self._outgoing_task = asyncio.create_task(self._send_outgoing())
+        await outgoing.sent
 
-        message_id = self._message_counter.increment()
-        channel_names = list(self._channels.keys())
+        logger.debug(f'{self._log_prefix}: sending message to peer')
 
-        for i, chunk in enumerate(chunkify(message, chunk_size, message_id)):
-            channel_name = channel_names[i % len(channel_names)]
-            channel = self._channels[channel_name]
-            buffer_low = self._channel_buffer_low[channel_name]
-            if channel.bufferedAmount > channel.bufferedAmountLowThreshold:
-                await buffer_low.wait()
-                buffer_low.clear()
-            channel.send(bytes(chunk))
+    async def _send_outgoing(self) -> None:
+        # Send one chunk of each outgoing message in turn until all
+        # outgoing messages have been sent.
+        while len(self._outgoing) > 0:
+            channel = await self._next_channel()
+            outgoing = self._outgoing.popleft()
+            if self._outgoing_small > 0:
+                self._outgoing_small -= 1
+            if outgoing.sent.done():
+                # Sender was cancelled so the rest of the message is dropped.
+                if outgoing.started:
+                    self._send_abort(outgoing.stream_id)
+                continue
+            chunk = next(outgoing.chunks)
+            try:
+                channel.send(bytes(chunk))
+            except Exception as e:
+                outgoing.sent.set_exception(e)
+                continue
+            outgoing.started = True
+            if chunk.seq_id == chunk.seq_len - 1:
+                outgoing.sent.set_result(None)
+            else:
+                self._outgoing.append(outgoing)
+
+    def _send_abort(self, stream_id: int) -> None:
+        # Tell the peer to discard the chunks of the stream it has received.
+        # The abort is sent on every channel so that it is received after
+        # any chunk of the stream sent on the same channel.
+        abort = bytes(Chunk(stream_id, 0, 1, b'', ChunkDType.ABORT))
+        for channel in self._channels.values():
+            try:
+                channel.send(abort)
+            except Exception as e:
+                logger.warning(
+                    f'{self._log_prefix}: failed to abort message with '
+                    f'id={stream_id}: {e}',
+                )
 
-        logger.debug(f'{self._log_prefix}: sending message to peer')
+    def _least_buffered_channel(self) -> RTCDataChannel:
+        return min(self._channels.values(), key=lambda c: c.bufferedAmount)
 
-    async def recv(self) -> bytes | str:
+    async def _next_channel(self) -> RTCDataChannel:
+        """Get the channel with the least buffered data.
+
+        Waits until the buffered amount of at least one channel is below
+        the send window.
+        """
+        while True:
+            self._buffer_low.clear()
+            channel = self._least_buffered_channel()
+            if channel.bufferedAmount < CHANNEL_SEND_WINDOW:
+                return channel
+            await self._buffer_low.wait()
+
+    def _add_channel(self, channel: RTCDataChannel) -> None:
+        channel.bufferedAmountLowThreshold = CHANNEL_SEND_WINDOW // 2
+        channel.on('bufferedamountlow', self._buffer_low.set)
+        channel.on('message', self._on_message)
+        self._channels[channel.label] = channel
+
+    async def recv(self) -> bytearray | str:
         """Receive next message from peer.
 
         Returns:
-            Message received from peer.
+            Message received from peer. Messages sent as bytes are received \
+            as a [`bytearray`][bytearray].
         """
         return await self._incoming_queue.get()
 
@@ -242,13 +380,8 @@ class PeerConnection:
         for i in range(self._max_channels):
             label = f'p2p-{i}-{self._max_channels}'
             channel = self._pc.createDataChannel(label, ordered=False)
-            buffer_low = asyncio.Event()
             channel.on('open', self._on_datachannel_open)
-            channel.on('bufferedamountlow', buffer_low.set)
-            channel.on('message', self._on_message)
-
-            self._channels[label] = channel
-            self._channel_buffer_low[label] = buffer_low
+            self._add_channel(channel)
 
             # We use the underlying RTCDtlsTransport as the channel status.
             channel.transport.transport.on('statechange', _on_close(label))
@@ -282,11 +415,7 @@ class PeerConnection:
                 )
             total = int(match.group(2))
 
-            buffer_low = asyncio.Event()
-            self._channels[channel.label] = channel
-            self._channel_buffer_low[channel.label] = buffer_low
-            channel.on('bufferedamountlow', buffer_low.set)
-            channel.on('message', self._on_message)
+            self._add_channel(channel)
 
             async def _on_close() -> None:
                 if channel.readyState in ('closed', 'failed'):
@@ -313,12 +442,19 @@ class PeerConnection:
 
     async def _on_message(self, data: bytes) -> None:
         chunk = Chunk.from_bytes(data)
-        self._incoming_chunks[chunk.stream_id].append(chunk)
-
-        if len(self._incoming_chunks[chunk.stream_id]) == chunk.seq_len:
-            chunks = self._incoming_chunks.pop(chunk.stream_id)
-            message = reconstruct(chunks)
-            await self._incoming_queue.put(message)
+        if chunk.dtype is ChunkDType.ABORT:
+            # Sender cancelled the message so the chunks are discarded.
+            self._incoming_chunks.pop(chunk.stream_id, None)
+            return
+        assembler = self._incoming_chunks.get(chunk.stream_id, None)
+        if assembler is None:
+            assembler = ChunkAssembler(chunk.seq_len, chunk.dtype)
+            self._incoming_chunks[chunk.stream_id] = assembler
+        assembler.add(chunk)
+
+        if assembler.complete:
+            del self._incoming_chunks[chunk.stream_id]
+            await self._incoming_queue.put(assembler.message())
             logger.debug(f'{self._log_prefix}: received message from peer')
 
     def _on_datachannel_open(self) -> None:
@@ -366,6 +502,7 @@ class PeerConnection:
 
         if isinstance(obj, RTCSessionDescription):
             await self._pc.setRemoteDescription(obj)
+            self._max_message_size = _negotiate_max_message_size(obj)
             self._peer_uuid = message.source_uuid
             self._peer_name = message.source_name
             if obj.type == 'offer':
@@ -403,6 +540,18 @@ class PeerConnection:
             ) from e
 
 
+def _negotiate_max_message_size(remote: RTCSessionDescription) -> int:
+    local_size = RTCSctpTransport.getCapabilities().maxMessageSize
+    remote_size = DEFAULT_MAX_MESSAGE_SIZE
+    for media in SessionDescription.parse(remote.sdp).media:
+        if media.kind == 'application' and media.sctpCapabilities is not None:
+            remote_size = media.sctpCapabilities.maxMessageSize
+    # A max message size of zero indicates the peer has no limit.
+    if remote_size == 0:
+        return local_size
+    return min(local_size, remote_size)
+
+
 def log_name(uuid: UUID, name: str) -> str:
     """Return string formatted as `#!python 'name(uuid-prefix)'`."""
     uuid_ = str(uuid)
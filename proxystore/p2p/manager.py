@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Generator
 from collections.abc import Iterable
+from collections.abc import Sequence
 from types import TracebackType
 from typing import Any
 from uuid import UUID
@@ -77,10 +79,14 @@ class PeerManager:
             established.
         peer_channels: number of datachannels to split message sending over
             between each peer.
+        idle_timeout: Optional timeout in seconds after which a peer
+            connection that has not sent or received a message is closed.
+            If `None`, connections are kept open until closed by the peer.
 
     Raises:
         ValueError: If the relay server address does not start with "ws://"
             or "wss://".
+        ValueError: If `idle_timeout` is not greater than zero.
     """
 
     def __init__(
@@ -89,20 +95,33 @@ class PeerManager:
         *,
         timeout: int = 30,
         peer_channels: int = 1,
+        idle_timeout: float | None = None,
     ) -> None:
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError(
+                f'Idle timeout must be greater than zero. Got {idle_timeout}.',
+            )
         self._relay_client = relay_client
         self._timeout = timeout
         self._peer_channels = peer_channels
+        self._idle_timeout = idle_timeout
 
         self._peers_lock = asyncio.Lock()
         self._peers: dict[frozenset[UUID], PeerConnection] = {}
 
-        self._message_queue: asyncio.Queue[tuple[UUID, bytes | str]] = (
+        self._message_queue: asyncio.Queue[tuple[UUID, bytearray | str]] = (
             asyncio.Queue()
         )
         self._server_task: asyncio.Task[None] | None = None
+        self._reaper_task: asyncio.Task[None] | None = None
         self._tasks: dict[frozenset[UUID], asyncio.Task[None]] = {}
 
+        # Monotonic time of the last message sent or received on each
+        # connection and the number of sends in progress on each connection.
+        self._last_active: dict[frozenset[UUID], float] = {}
+        self._sending: dict[frozenset[UUID], int] = {}
+        self._events = {'opened': 0, 'warmed': 0, 'idle_closed': 0}
+
     @property
     def _log_prefix(self) -> str:
         return f'{self.__class__.__name__}[{log_name(self.uuid, self.name)}]'
@@ -142,6 +161,12 @@ class PeerManager:
                 self._handle_server_messages,
             )
             self._server_task.set_name('peer-manager-server-message-handler')
+        if self._idle_timeout is not None and self._reaper_task is None:
+            self._reaper_task = spawn_guarded_background_task(
+                self._reap_idle_connections,
+                self._idle_timeout,
+            )
+            self._reaper_task.set_name('peer-manager-idle-connection-reaper')
 
     async def __aenter__(self) -> PeerManager:
         await self.async_init()
@@ -189,8 +214,10 @@ class PeerManager:
             f'{self._log_prefix}: listening for messages from peer '
             f'{peer_name}',
         )
+        peers = frozenset({self.uuid, peer_uuid})
         while True:
             message = await connection.recv()
+            self._last_active[peers] = time.monotonic()
             await self._message_queue.put((peer_uuid, message))
             logger.debug(
                 f'{self._log_prefix}: placed message from {peer_name} on '
@@ -233,6 +260,7 @@ class PeerManager:
                     )
                     async with self._peers_lock:
                         self._peers[peers] = connection
+                    self._opened(peers)
                     self._tasks[peers] = spawn_guarded_background_task(
                         self._handle_peer_messages,
                         message.source_uuid,
@@ -257,6 +285,73 @@ class PeerManager:
                     f'{type(message).__name__} from relay server',
                 )
 
+    def _is_idle(self, peers: frozenset[UUID], idle_timeout: float) -> bool:
+        connection = self._peers.get(peers, None)
+        last_active = self._last_active.get(peers, None)
+        return (
+            connection is not None
+            and last_active is not None
+            # Connections still in the handshake are not idle.
+            and connection.state == 'connected'
+            and self._sending.get(peers, 0) == 0
+            and time.monotonic() - last_active >= idle_timeout
+        )
+
+    async def _reap_idle_connections(self, idle_timeout: float) -> None:
+        """Close connections which have been idle for `idle_timeout`."""
+        while True:
+            await asyncio.sleep(idle_timeout / 2)
+            idle = [
+                peers
+                for peers in self._last_active
+                if self._is_idle(peers, idle_timeout)
+            ]
+            for peers in idle:
+                async with self._peers_lock:
+                    # A send may have started on the connection while the
+                    # previous idle connections were being closed.
+                    if not self._is_idle(peers, idle_timeout):
+                        continue
+                    connection = self._peers.pop(peers)
+                    del self._last_active[peers]
+                logger.info(
+                    f'{self._log_prefix}: closing connection idle for more '
+                    f'than {idle_timeout} seconds',
+                )
+                self._events['idle_closed'] += 1
+                await self._close_connection(peers, connection)
+
+    def _opened(self, peers: frozenset[UUID]) -> None:
+        self._last_active[peers] = time.monotonic()
+        self._events['opened'] += 1
+
+    def connection_events(self) -> dict[str, int]:
+        """Get counts of peer connection lifecycle events.
+
+        Returns:
+            Mapping of event to the number of times the event occurred. \
+            Events are `#!python 'opened'` for connections opened by this \
+            manager or a peer, `#!python 'warmed'` for connections opened \
+            by [`warm()`][proxystore.p2p.manager.PeerManager.warm], and \
+            `#!python 'idle_closed'` for connections closed after the \
+            idle timeout.
+        """
+        return dict(self._events)
+
+    def connection_states(self) -> dict[UUID, str]:
+        """Get the state of each peer connection.
+
+        Returns:
+            Mapping of peer UUID to the state of the connection with that \
+            peer (e.g., `#!python 'connecting'` or `#!python 'connected'`).
+        """
+        states: dict[UUID, str] = {}
+        for peers, connection in self._peers.items():
+            # Peers are keyed on the pair of this client and the peer.
+            (peer,) = peers - {self.uuid} or peers
+            states[peer] = connection.state
+        return states
+
     async def close(self) -> None:
         """Close the connection manager.
 
@@ -264,12 +359,13 @@ class PeerManager:
             This will close all create peer connections and close the
             connection to the relay server.
         """
-        if self._server_task is not None:
-            self._server_task.cancel()
-            try:
-                await self._server_task
-            except (asyncio.CancelledError, SafeTaskExitError):
-                pass
+        for background_task in (self._server_task, self._reaper_task):
+            if background_task is not None:
+                background_task.cancel()
+                try:
+                    await background_task
+                except (asyncio.CancelledError, SafeTaskExitError):
+                    pass
 
         for task in self._tasks.values():
             task.cancel()
@@ -302,6 +398,16 @@ class PeerManager:
         peers = frozenset(peers)
         async with self._peers_lock:
             connection = self._peers.pop(peers, None)
+        self._last_active.pop(peers, None)
+        await self._close_connection(peers, connection)
+
+    async def _close_connection(
+        self,
+        peers: frozenset[UUID],
+        connection: PeerConnection | None,
+    ) -> None:
+        # Close a connection already removed from the peers and cancel the
+        # task handling its messages.
         if connection is not None:
             logger.info(
                 f'{self._log_prefix} Closing connection between peers: '
@@ -316,7 +422,7 @@ class PeerManager:
             except (asyncio.CancelledError, SafeTaskExitError):
                 pass
 
-    async def recv(self) -> tuple[UUID, bytes | str]:
+    async def recv(self) -> tuple[UUID, bytearray | str]:
         """Receive next message from a peer.
 
         Returns:
@@ -328,22 +434,36 @@ class PeerManager:
     async def send(
         self,
         peer_uuid: UUID,
-        message: bytes | str,
+        message: bytes
+        | bytearray
+        | str
+        | Sequence[bytes | bytearray | memoryview],
         timeout: float = 30,
     ) -> None:
         """Send message to peer.
 
         Args:
             peer_uuid: UUID of peer to send message to.
-            message: Message to send to peer.
+            message: Message to send to peer. A sequence of buffers is sent
+                as a single message of their concatenation.
             timeout: Timeout to wait on peer connection to be ready.
 
         Raises:
             PeerConnectionTimeoutError: If the peer connection is not
                 established within the timeout.
         """
+        peers = frozenset({self.uuid, peer_uuid})
         connection = await self.get_connection(peer_uuid)
-        await connection.send(message, timeout)
+        self._sending[peers] = self._sending.get(peers, 0) + 1
+        try:
+            await connection.send(message, timeout)
+            # The connection may have been closed during the send.
+            if peers in self._last_active:
+                self._last_active[peers] = time.monotonic()
+        finally:
+            self._sending[peers] -= 1
+            if self._sending[peers] == 0:
+                del self._sending[peers]
 
     async def get_connection(self, peer_uuid: UUID) -> PeerConnection:
         """Get connection to the peer.
@@ -365,6 +485,7 @@ class PeerManager:
                 channels=self._peer_channels,
             )
             self._peers[peers] = connection
+            self._opened(peers)
 
         logger.info(
             f'{self._log_prefix}: opening peer connection with {peer_uuid}',
@@ -382,3 +503,40 @@ class PeerManager:
 
         connection.on_close_callback(self.close_connection, peers)
         return connection
+
+    async def warm(self, peers: Iterable[UUID]) -> None:
+        """Open connections to peers ahead of sending messages.
+
+        Connections to each peer are opened concurrently. This only waits
+        for the connection offers to be sent to the relay server, and the
+        connections are established in the background, so the first
+        message sent to a peer does not wait on the full connection
+        handshake. Peers which already have a connection, and this
+        manager, are skipped. Failures are logged rather than raised.
+
+        Warning:
+            Warmed connections are subject to the idle timeout so
+            connections which are not used within the timeout will be
+            closed.
+
+        Args:
+            peers: UUIDs of peers to open connections with.
+        """
+        to_warm = [
+            peer
+            for peer in dict.fromkeys(peers)
+            if peer != self.uuid
+            and frozenset({self.uuid, peer}) not in self._peers
+        ]
+        results = await asyncio.gather(
+            *(self.get_connection(peer) for peer in to_warm),
+            return_exceptions=True,
+        )
+        for peer, result in zip(to_warm, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f'{self._log_prefix}: failed to warm connection with '
+                    f'{peer}: {result}',
+                )
+            else:
+                self._events['warmed'] += 1
@@ -0,0 +1,570 @@
+"""Relay server load generation benchmark.
+
+Simulates many [`RelayClient`][proxystore.p2p.relay.client.RelayClient]
+instances forwarding peer connection requests through a relay server and
+reports the forwarding throughput and latency of the relay server. By
+default, a relay server is started in a separate process so the CPU and
+memory usage of the relay server can also be reported if
+[psutil](https://github.com/giampaolo/psutil){target=_blank} is installed.
+Optionally, slow clients which never read their messages can be added to
+measure how the relay server behaves when it cannot write to some clients.
+
+Example:
+    ```bash
+    $ python -m proxystore.p2p.relay.bench --clients 16 --duration 3
+    clients: 16
+    sent: 3000
+    forwarded: 3000
+    errors: 0
+    forwarded_per_second: 999.4
+    latency_p50_ms: 2.106
+    latency_p99_ms: 9.075
+    server_cpu_percent: 46.3
+    server_max_rss_mb: 62.1
+    ```
+
+Note:
+    The simulated clients run in a single process so the client process
+    can become the bottleneck at high rates. Compare the throughput with
+    the requested rate to check that the rate was achieved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import dataclasses
+import logging
+import math
+import multiprocessing
+import os
+import socket
+import time
+from collections.abc import Generator
+from collections.abc import Sequence
+
+import click
+
+try:
+    import psutil
+
+    _PSUTIL_AVAILABLE = True
+except ImportError as e:  # pragma: no cover
+    import warnings
+
+    _PSUTIL_AVAILABLE = False
+    warnings.warn(
+        f'{e}. Relay server CPU and memory usage will not be reported by '
+        'the relay benchmark. To enable, install proxystore with '
+        '"pip install proxystore[endpoints]".',
+        stacklevel=2,
+    )
+
+from proxystore.p2p.relay.client import RelayClient
+from proxystore.p2p.relay.config import RelayLoggingConfig
+from proxystore.p2p.relay.config import RelayServingConfig
+from proxystore.p2p.relay.messages import PeerConnectionRequest
+from proxystore.p2p.relay.run import serve
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class ServerUsage:
+    """Resource usage of the relay server process during a benchmark.
+
+    Attributes:
+        cpu_percent: Average CPU utilization where 100 is one core.
+        max_rss_bytes: Largest resident set size sampled.
+    """
+
+    cpu_percent: float
+    max_rss_bytes: int
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """Result of a relay server benchmark.
+
+    Attributes:
+        clients: Number of simulated clients.
+        sent: Number of requests sent by clients.
+        forwarded: Number of requests received by the destination clients.
+        errors: Number of requests returned to the source client with
+            an error.
+        duration: Time in seconds the clients were sending requests.
+        latencies: Sorted latencies in seconds from a client sending a
+            request to the destination client receiving the request.
+        server: Resource usage of the relay server, if known.
+    """
+
+    clients: int
+    sent: int
+    forwarded: int
+    errors: int
+    duration: float
+    latencies: list[float]
+    server: ServerUsage | None = None
+
+    @property
+    def forwarded_per_second(self) -> float:
+        """Forwarded requests per second."""
+        return self.forwarded / self.duration
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Get a latency percentile in seconds.
+
+        Args:
+            percentile: Percentile in the range (0, 100].
+
+        Returns:
+            Latency at the percentile using the nearest-rank method or \
+            NaN if no requests were forwarded.
+        """
+        if len(self.latencies) == 0:
+            return math.nan
+        rank = math.ceil(percentile / 100 * len(self.latencies))
+        return self.latencies[max(rank, 1) - 1]
+
+    def format(self) -> str:
+        """Format the result as `key: value` lines."""
+        lines = [
+            f'clients: {self.clients}',
+            f'sent: {self.sent}',
+            f'forwarded: {self.forwarded}',
+            f'errors: {self.errors}',
+            f'forwarded_per_second: {self.forwarded_per_second:.1f}',
+            f'latency_p50_ms: {self.latency_percentile(50) * 1000:.3f}',
+            f'latency_p99_ms: {self.latency_percentile(99) * 1000:.3f}',
+        ]
+        if self.server is not None:
+            rss_mb = self.server.max_rss_bytes / 1e6
+            lines.extend(
+                [
+                    f'server_cpu_percent: {self.server.cpu_percent:.1f}',
+                    f'server_max_rss_mb: {rss_mb:.1f}',
+                ],
+            )
+        return '\n'.join(lines)
+
+
+@dataclasses.dataclass
+class _Counters:
+    sent: int = 0
+    forwarded: int = 0
+    errors: int = 0
+
+
+def _request(
+    client: RelayClient,
+    peer: RelayClient,
+    padding: str,
+) -> PeerConnectionRequest:
+    # The description starts with the send time so the receiver can
+    # compute the latency. All clients are in this process so share a clock.
+    prefix = f'{time.perf_counter()!r}:'
+    return PeerConnectionRequest(
+        source_uuid=client.uuid,
+        source_name=client.name,
+        peer_uuid=peer.uuid,
+        description_type='offer',
+        description=prefix + padding[: max(0, len(padding) - len(prefix))],
+    )
+
+
+async def _send(
+    client: RelayClient,
+    peer: RelayClient,
+    padding: str,
+    interval: float,
+    offset: float,
+    duration: float,
+    counters: _Counters,
+    slow: Sequence[RelayClient] = (),
+    slow_padding: str = '',
+) -> None:
+    # Requests are sent on a fixed schedule rather than sleeping a fixed
+    # interval between requests so the rate does not drift.
+    start = time.perf_counter() + offset
+    sent = 0
+    while True:
+        next_send = start + sent * interval
+        if next_send - start + offset >= duration:
+            return
+        await asyncio.sleep(max(0, next_send - time.perf_counter()))
+        for slow_client in slow:
+            await client.send(_request(client, slow_client, slow_padding))
+        await client.send(_request(client, peer, padding))
+        sent += 1
+        counters.sent += 1
+
+
+def _padding(size: int) -> str:
+    return base64.b64encode(os.urandom(size)).decode()[:size]
+
+
+async def _recv(
+    client: RelayClient,
+    latencies: list[float],
+    counters: _Counters,
+) -> None:
+    while True:
+        message = await client.recv()
+        received = time.perf_counter()
+        if not isinstance(message, PeerConnectionRequest):
+            continue
+        if message.error is not None:
+            counters.errors += 1
+            continue
+        sent = float(message.description.split(':', 1)[0])
+        latencies.append(received - sent)
+        counters.forwarded += 1
+
+
+async def run_benchmark(
+    address: str,
+    *,
+    clients: int,
+    size: int,
+    rate: float,
+    duration: float,
+    drain_timeout: float = 5,
+    slow_clients: int = 0,
+    slow_size: int = 65536,
+) -> BenchmarkResult:
+    """Run the benchmark against a relay server.
+
+    Each client sends peer connection requests to the next client at
+    an equal share of the total rate. If there are slow clients, each
+    client also sends a request to every slow client before each of its
+    requests. Slow clients never read their messages so the relay server
+    eventually cannot write to them. Only the requests between clients
+    which are reading their messages are included in the result.
+
+    Args:
+        address: Address of the relay server.
+        clients: Number of simulated clients. Must be at least two.
+        size: Size in bytes of the description of each request.
+        rate: Total requests per second sent by all clients.
+        duration: Seconds to send requests for.
+        drain_timeout: Max seconds to wait after sending requests for
+            the remaining requests to be forwarded.
+        slow_clients: Number of slow clients which never read their
+            messages.
+        slow_size: Size in bytes of the description of each request sent
+            to a slow client.
+
+    Returns:
+        Benchmark result without the server usage.
+
+    Raises:
+        ValueError: If `clients` is less than two or `rate` is not positive.
+    """
+    if clients < 2:
+        raise ValueError(f'At least two clients are required. Got {clients}.')
+    if rate <= 0:
+        raise ValueError(f'Rate must be positive. Got {rate}.')
+
+    relay_clients = [
+        RelayClient(address, reconnect_task=False) for _ in range(clients)
+    ]
+    slow = [
+        RelayClient(address, reconnect_task=False) for _ in range(slow_clients)
+    ]
+    await asyncio.gather(
+        *(client.connect() for client in (*relay_clients, *slow)),
+    )
+
+    # Random padding so websocket compression does not shrink the requests.
+    padding = _padding(size)
+    slow_padding = _padding(slow_size) if slow_clients > 0 else ''
+    interval = clients / rate
+    counters = _Counters()
+    latencies: list[float] = []
+
+    receivers = [
+        asyncio.create_task(_recv(client, latencies, counters))
+        for client in relay_clients
+    ]
+    senders = [
+        asyncio.create_task(
+            _send(
+                client,
+                relay_clients[(i + 1) % clients],
+                padding,
+                interval,
+                # Stagger clients across the interval
+                i * interval / clients,
+                duration,
+                counters,
+                slow,
+                slow_padding,
+            ),
+        )
+        for i, client in enumerate(relay_clients)
+    ]
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*senders)
+        elapsed = time.perf_counter() - start
+
+        deadline = time.perf_counter() + drain_timeout
+        while (
+            counters.forwarded + counters.errors < counters.sent
+            and time.perf_counter() < deadline
+        ):
+            await asyncio.sleep(0.01)
+    finally:
+        for task in (*senders, *receivers):
+            task.cancel()
+        await asyncio.gather(*senders, *receivers, return_exceptions=True)
+        await asyncio.gather(
+            *(client.close() for client in (*relay_clients, *slow)),
+        )
+
+    return BenchmarkResult(
+        clients=clients,
+        sent=counters.sent,
+        forwarded=counters.forwarded,
+        errors=counters.errors,
+        duration=elapsed,
+        latencies=sorted(latencies),
+    )
+
+
+class _UsageMonitor:
+    def __init__(self, pid: int, interval: float = 0.1) -> None:
+        self._process = psutil.Process(pid)
+        self._interval = interval
+        self._max_rss = 0
+        self._task: asyncio.Task[None] | None = None
+
+    async def _sample(self) -> None:
+        while True:
+            self._max_rss = max(
+                self._max_rss,
+                self._process.memory_info().rss,
+            )
+            await asyncio.sleep(self._interval)
+
+    def _cpu_time(self) -> float:
+        times = self._process.cpu_times()
+        return times.user + times.system
+
+    def start(self) -> None:
+        self._start_time = time.perf_counter()
+        self._start_cpu = self._cpu_time()
+        self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> ServerUsage:
+        assert self._task is not None
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        wall = time.perf_counter() - self._start_time
+        cpu = self._cpu_time() - self._start_cpu
+        return ServerUsage(
+            cpu_percent=100 * cpu / wall,
+            max_rss_bytes=self._max_rss,
+        )
+
+
+def _serve_relay(config: RelayServingConfig) -> None:  # pragma: no cover
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(serve(config))
+
+
+def _open_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+@contextlib.contextmanager
+def local_relay(
+    max_queued_messages: int = 64,
+    timeout: float = 10,
+) -> Generator[tuple[str, int], None, None]:
+    """Run a relay server in a separate process.
+
+    Args:
+        max_queued_messages: Maximum number of messages waiting to be sent
+            to a single client by the relay server.
+        timeout: Seconds to wait for the relay server to start listening.
+
+    Yields:
+        Tuple of the address and process ID of the relay server.
+
+    Raises:
+        TimeoutError: If the relay server does not start listening within
+            the timeout.
+    """
+    port = _open_port()
+    config = RelayServingConfig(
+        host='localhost',
+        port=port,
+        logging=RelayLoggingConfig(current_client_interval=None),
+        max_queued_messages=max_queued_messages,
+    )
+    process = multiprocessing.get_context('spawn').Process(
+        target=_serve_relay,
+        args=(config,),
+        daemon=True,
+    )
+    process.start()
+    assert process.pid is not None
+
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                socket.create_connection(('localhost', port)).close()
+                break
+            except ConnectionRefusedError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(
+                        'Relay server did not start listening within '
+                        f'{timeout} seconds.',
+                    ) from None
+                time.sleep(0.05)
+        yield f'ws://localhost:{port}', process.pid
+    finally:
+        process.terminate()
+        process.join()
+
+
+async def _run(
+    address: str,
+    pid: int | None,
+    clients: int,
+    size: int,
+    rate: float,
+    duration: float,
+    slow_clients: int = 0,
+    slow_size: int = 65536,
+) -> BenchmarkResult:
+    monitor = (
+        _UsageMonitor(pid) if pid is not None and _PSUTIL_AVAILABLE else None
+    )
+    if monitor is not None:
+        monitor.start()
+    result = await run_benchmark(
+        address,
+        clients=clients,
+        size=size,
+        rate=rate,
+        duration=duration,
+        slow_clients=slow_clients,
+        slow_size=slow_size,
+    )
+    if monitor is not None:
+        result.server = await monitor.stop()
+    return result
+
+
+@click.command()
+@click.option(
+    '--clients',
+    type=click.IntRange(min=2),
+    default=16,
+    show_default=True,
+    help='Number of simulated clients.',
+)
+@click.option(
+    '--size',
+    type=click.IntRange(min=0),
+    default=4096,
+    show_default=True,
+    help='Size in bytes of the description of each request.',
+)
+@click.option(
+    '--rate',
+    type=click.FloatRange(min=0, min_open=True),
+    default=1000,
+    show_default=True,
+    help='Total requests per second sent by all clients.',
+)
+@click.option(
+    '--duration',
+    type=click.FloatRange(min=0, min_open=True),
+    default=10,
+    show_default=True,
+    help='Seconds to send requests for.',
+)
+@click.option(
+    '--slow-clients',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Number of additional clients which never read their messages.',
+)
+@click.option(
+    '--slow-size',
+    type=click.IntRange(min=0),
+    default=65536,
+    show_default=True,
+    help='Size in bytes of the description of requests to slow clients.',
+)
+@click.option(
+    '--relay-address',
+    metavar='ADDR',
+    help=(
+        'Address of an existing relay server to benchmark. If not '
+        'provided, a local relay server is started and its CPU and '
+        'memory usage are reported if psutil is installed.'
+    ),
+)
+@click.option(
+    '--max-queued-messages',
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help='Outbound queue size of the local relay server.',
+)
+def cli(
+    clients: int,
+    size: int,
+    rate: float,
+    duration: float,
+    slow_clients: int,
+    slow_size: int,
+    relay_address: str | None,
+    max_queued_messages: int,
+) -> None:
+    """Benchmark the forwarding throughput and latency of a relay server.
+
+    Simulated clients send peer connection requests of a given size at
+    a given total rate through the relay server. The number of requests
+    forwarded per second and the p50/p99 forwarding latencies are
+    reported. Slow clients which never read their messages can be added to
+    measure forwarding while the relay server is blocked on some clients.
+    """
+    logging.basicConfig(level=logging.WARNING)
+
+    def _benchmark(address: str, pid: int | None) -> BenchmarkResult:
+        return asyncio.run(
+            _run(
+                address,
+                pid,
+                clients,
+                size,
+                rate,
+                duration,
+                slow_clients,
+                slow_size,
+            ),
+        )
+
+    if relay_address is not None:
+        result = _benchmark(relay_address, None)
+    else:
+        with local_relay(max_queued_messages) as (address, pid):
+            result = _benchmark(address, pid)
+
+    click.echo(result.format())
+
+
+if __name__ == '__main__':
+    cli()
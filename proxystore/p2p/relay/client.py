@@ -20,6 +20,7 @@ try:
     import websockets.asyncio
     import websockets.exceptions
     from websockets.asyncio.client import ClientConnection
+    from websockets.typing import Subprotocol
 except ImportError as e:  # pragma: no cover
     import warnings
 
@@ -31,6 +32,7 @@ except ImportError as e:  # pragma: no cover
 
 from proxystore.p2p.relay.exceptions import RelayNotConnectedError
 from proxystore.p2p.relay.exceptions import RelayRegistrationError
+from proxystore.p2p.relay.messages import BINARY_SUBPROTOCOL
 from proxystore.p2p.relay.messages import decode_relay_message
 from proxystore.p2p.relay.messages import encode_relay_message
 from proxystore.p2p.relay.messages import RelayMessage
@@ -49,6 +51,11 @@ class RelayClient:
     This interface abstracts the low-level WebSocket connection to a
     relay server to provide automatic reconnection.
 
+    Messages are sent in the binary message format if the relay server
+    accepts the
+    [`BINARY_SUBPROTOCOL`][proxystore.p2p.relay.messages.BINARY_SUBPROTOCOL]
+    when connecting and as JSON strings otherwise.
+
     Tip:
         This class can be used as an async context manager!
         ```python
@@ -183,20 +190,23 @@ class RelayClient:
             open_timeout=timeout,
             ssl=self._ssl_context,
             additional_headers=self._extra_headers,
+            subprotocols=[Subprotocol(BINARY_SUBPROTOCOL)],
         )
 
         registration_message = RelayRegistrationRequest(self.name, self.uuid)
-        await websocket.send(encode_relay_message(registration_message))
+        await websocket.send(
+            encode_relay_message(
+                registration_message,
+                binary=websocket.subprotocol == BINARY_SUBPROTOCOL,
+            ),
+        )
 
         try:
             message_str = await asyncio.wait_for(
                 websocket.recv(),
                 timeout,
             )
-            if isinstance(message_str, str):
-                message = decode_relay_message(message_str)
-            else:
-                raise AssertionError('Received non-string type on websocket.')
+            message = decode_relay_message(message_str)
         except RelayMessageDecodeError as e:
             raise RelayRegistrationError(
                 'Unable to decode response message from relay server.',
@@ -243,6 +253,14 @@ class RelayClient:
         """UUID of client as registered with relay server."""
         return self._uuid
 
+    @property
+    def connected(self) -> bool:
+        """Check if the websocket connection to the relay server is open."""
+        return (
+            self._websocket is not None
+            and self._websocket.state is websockets.protocol.State.OPEN
+        )
+
     @property
     def websocket(self) -> ClientConnection:
         """Websocket connection to the relay server.
@@ -253,10 +271,8 @@ class RelayClient:
                 [`connect()`][proxystore.p2p.relay.client.RelayClient.connect]
                 needs to be called.
         """
-        if (
-            self._websocket is not None
-            and self._websocket.state is websockets.protocol.State.OPEN
-        ):
+        if self.connected:
+            assert self._websocket is not None
             return self._websocket
         else:
             raise RelayNotConnectedError(
@@ -373,8 +389,6 @@ class RelayClient:
             websocket = self.websocket
 
         message_str = await websocket.recv()
-        if not isinstance(message_str, str):
-            raise AssertionError('Received non-string from websocket.')
         return decode_relay_message(message_str)
 
     async def send(self, message: RelayMessage) -> None:
@@ -383,12 +397,14 @@ class RelayClient:
         Args:
             message: The message to send to the relay server.
         """
-        message_str = encode_relay_message(message)
-
         try:
             websocket = self.websocket
         except RelayNotConnectedError:
             await self.connect()
             websocket = self.websocket
 
+        message_str = encode_relay_message(
+            message,
+            binary=websocket.subprotocol == BINARY_SUBPROTOCOL,
+        )
         await websocket.send(message_str)
@@ -16,6 +16,7 @@ else:  # pragma: <3.11 cover
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import field_validator
 
 from proxystore.utils.config import load
 
@@ -72,6 +73,11 @@ class RelayServingConfig(BaseModel):
         logging: Logging configuration.
         max_message_bytes: Maximum size in bytes of messages received by
             the relay server.
+        max_queued_messages: Maximum number of messages waiting to be sent
+            to a single client.
+        overflow_policy: Action taken when the queue of messages waiting
+            to be sent to a client is full. Either drop the message or
+            close the connection with the client.
     """
 
     host: str | None = None
@@ -81,6 +87,15 @@ class RelayServingConfig(BaseModel):
     auth: RelayAuthConfig = Field(default_factory=RelayAuthConfig)
     logging: RelayLoggingConfig = Field(default_factory=RelayLoggingConfig)
     max_message_bytes: int | None = None
+    max_queued_messages: int = 64
+    overflow_policy: Literal['drop', 'close'] = 'drop'
+
+    @field_validator('max_queued_messages')
+    @classmethod
+    def _max_queued_messages_validator(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError('Max queued messages must be >= 1.')
+        return v
 
     @classmethod
     def from_toml(cls, filepath: str | pathlib.Path) -> Self:
@@ -1,14 +1,28 @@
-"""Message types for relay client and relay server communication."""
+"""Message types for relay client and relay server communication.
+
+Messages are encoded as JSON strings sent in text websocket frames or, if
+both the relay client and relay server support it, in a compact binary
+format sent in binary websocket frames. Support for the binary format is
+negotiated when opening the websocket connection using the
+[`BINARY_SUBPROTOCOL`][proxystore.p2p.relay.messages.BINARY_SUBPROTOCOL]
+websocket subprotocol so clients and servers which only support JSON
+continue to interoperate with newer versions.
+"""
 
 from __future__ import annotations
 
 import dataclasses
 import enum
 import json
+import struct
 import sys
 import uuid
 from typing import Any
 from typing import Literal
+from typing import overload
+
+BINARY_SUBPROTOCOL = 'proxystore-relay.binary'
+"""Websocket subprotocol indicating messages use the binary format."""
 
 
 class RelayMessageType(enum.Enum):
@@ -144,11 +158,11 @@ def str_to_uuid(data: dict[str, Any]) -> dict[str, Any]:
     return data
 
 
-def decode_relay_message(message: str) -> RelayMessage:
-    """Decode JSON string into correct relay message type.
+def decode_relay_message(message: str | bytes) -> RelayMessage:
+    """Decode JSON string or binary message into correct relay message type.
 
     Args:
-        message: JSON string to decode.
+        message: JSON string or bytes in the binary format to decode.
 
     Returns:
         Parsed message.
@@ -156,6 +170,9 @@ def decode_relay_message(message: str) -> RelayMessage:
     Raises:
         RelayMessageDecodeError: If the message cannot be decoded.
     """
+    if isinstance(message, bytes):
+        return _decode_binary(message)
+
     try:
         data = json.loads(message)
     except json.JSONDecodeError as e:
@@ -188,14 +205,47 @@ def decode_relay_message(message: str) -> RelayMessage:
         ) from e
 
 
-def encode_relay_message(message: RelayMessage) -> str:
-    """Encode message as JSON string.
+@overload
+def encode_relay_message(
+    message: RelayMessage,
+    *,
+    binary: Literal[False] = ...,
+) -> str: ...
+
+
+@overload
+def encode_relay_message(
+    message: RelayMessage,
+    *,
+    binary: Literal[True],
+) -> bytes: ...
+
+
+@overload
+def encode_relay_message(
+    message: RelayMessage,
+    *,
+    binary: bool,
+) -> str | bytes: ...
+
+
+def encode_relay_message(
+    message: RelayMessage,
+    *,
+    binary: bool = False,
+) -> str | bytes:
+    """Encode message as JSON string or in the binary format.
+
+    In the binary format, UUIDs are encoded as raw 16-byte values and
+    strings are length-prefixed UTF-8.
 
     Args:
-        message: Message to JSON encode.
+        message: Message to encode.
+        binary: Encode the message in the binary format rather than as
+            a JSON string.
 
     Raises:
-        RelayMessageEncodeError: If the message cannot be JSON encoded.
+        RelayMessageEncodeError: If the message cannot be encoded.
     """
     if not isinstance(message, RelayMessage):
         raise RelayMessageEncodeError(
@@ -203,6 +253,12 @@ def encode_relay_message(message: RelayMessage) -> str:
             f'Got {type(message).__name__}.',
         )
 
+    if binary:
+        try:
+            return _encode_binary(message)
+        except (AttributeError, TypeError, ValueError) as e:
+            raise RelayMessageEncodeError('Error encoding message.') from e
+
     data = dataclasses.asdict(message)
     data = uuid_to_str(data)
 
@@ -210,3 +266,133 @@ def encode_relay_message(message: RelayMessage) -> str:
         return json.dumps(data)
     except TypeError as e:
         raise RelayMessageEncodeError('Error encoding message.') from e
+
+
+_VERSION = 1
+_HEADER = struct.Struct('!BB')
+_LENGTH = struct.Struct('!I')
+_FLAGS = struct.Struct('!B')
+_PEERS = struct.Struct('!16s16sB')
+_KINDS: tuple[type[RelayMessage], ...] = (
+    RelayRegistrationRequest,
+    RelayResponse,
+    PeerConnectionRequest,
+)
+
+
+class _Flag(enum.IntFlag):
+    SUCCESS = 1
+    ERROR = 2
+    MESSAGE = 4
+    ANSWER = 8
+
+
+def _pack_str(value: str) -> bytes:
+    encoded = value.encode('utf-8')
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _encode_binary(message: RelayMessage) -> bytes:
+    parts = [_HEADER.pack(_VERSION, _KINDS.index(type(message)))]
+    if isinstance(message, RelayRegistrationRequest):
+        parts.append(message.uuid.bytes)
+        parts.append(_pack_str(message.name))
+    elif isinstance(message, RelayResponse):
+        flags = _Flag(0)
+        flags |= _Flag.SUCCESS if message.success else 0
+        flags |= _Flag.ERROR if message.error else 0
+        flags |= _Flag.MESSAGE if message.message is not None else 0
+        parts.append(_FLAGS.pack(flags))
+        if message.message is not None:
+            parts.append(_pack_str(message.message))
+    elif isinstance(message, PeerConnectionRequest):
+        if message.description_type not in ('answer', 'offer'):
+            raise ValueError(
+                f'Unknown description type: {message.description_type}.',
+            )
+        flags = _Flag(0)
+        flags |= _Flag.ANSWER if message.description_type == 'answer' else 0
+        flags |= _Flag.ERROR if message.error is not None else 0
+        parts.append(
+            _PEERS.pack(
+                message.source_uuid.bytes,
+                message.peer_uuid.bytes,
+                flags,
+            ),
+        )
+        parts.append(_pack_str(message.source_name))
+        parts.append(_pack_str(message.description))
+        if message.error is not None:
+            parts.append(_pack_str(message.error))
+    else:
+        raise AssertionError('Unreachable.')
+    return b''.join(parts)
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.view = memoryview(data)
+        self.offset = 0
+
+    def read(self, length: int) -> memoryview:
+        if self.offset + length > len(self.view):
+            raise ValueError(f'Message truncated at offset {self.offset}.')
+        view = self.view[self.offset : self.offset + length]
+        self.offset += length
+        return view
+
+    def unpack(self, fmt: struct.Struct) -> tuple[Any, ...]:
+        return fmt.unpack(self.read(fmt.size))
+
+    def read_str(self) -> str:
+        (length,) = self.unpack(_LENGTH)
+        return str(self.read(length), 'utf-8')
+
+
+def _decode_binary(data: bytes) -> RelayMessage:
+    try:
+        reader = _Reader(data)
+        (version, kind) = reader.unpack(_HEADER)
+        if version != _VERSION:
+            raise ValueError(f'Unsupported message format version {version}.')
+        if kind >= len(_KINDS):
+            raise ValueError(f'Unknown message kind {kind}.')
+
+        message: RelayMessage
+        if _KINDS[kind] is RelayRegistrationRequest:
+            uuid_ = uuid.UUID(bytes=bytes(reader.read(16)))
+            message = RelayRegistrationRequest(
+                name=reader.read_str(),
+                uuid=uuid_,
+            )
+        elif _KINDS[kind] is RelayResponse:
+            flags = _Flag(reader.unpack(_FLAGS)[0])
+            message = RelayResponse(
+                success=_Flag.SUCCESS in flags,
+                message=reader.read_str() if _Flag.MESSAGE in flags else None,
+                error=_Flag.ERROR in flags,
+            )
+        else:
+            source, peer, flags_ = reader.unpack(_PEERS)
+            flags = _Flag(flags_)
+            message = PeerConnectionRequest(
+                source_uuid=uuid.UUID(bytes=source),
+                source_name=reader.read_str(),
+                peer_uuid=uuid.UUID(bytes=peer),
+                description_type=(
+                    'answer' if _Flag.ANSWER in flags else 'offer'
+                ),
+                description=reader.read_str(),
+                error=reader.read_str() if _Flag.ERROR in flags else None,
+            )
+
+        if reader.offset != len(reader.view):
+            raise ValueError(
+                f'Message has {len(reader.view) - reader.offset} '
+                'trailing bytes.',
+            )
+    except ValueError as e:
+        raise RelayMessageDecodeError(
+            f'Failed to decode binary message: {e}',
+        ) from e
+    return message
@@ -94,6 +94,8 @@ async def serve(config: RelayServingConfig) -> None:
     server = RelayServer(
         authenticator,
         max_message_bytes=config.max_message_bytes,
+        max_queued_messages=config.max_queued_messages,
+        overflow_policy=config.overflow_policy,
     )
 
     # Set the stop condition when receiving SIGINT (ctrl-C) and SIGTERM.
@@ -130,6 +132,7 @@ async def serve(config: RelayServingConfig) -> None:
         config.port,
         logger=None,
         ssl=ssl_context,
+        select_subprotocol=server.select_subprotocol,
     ):
         logger.info(f'Relay server listening on port {config.port}')
         logger.info('Use ctrl-C to stop')
@@ -7,14 +7,20 @@ of peer WebRTC connections.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
 import logging
 import sys
+from collections.abc import Sequence
 from typing import Generic
+from typing import Literal
 from typing import TypeVar
 
 try:
     import websockets.exceptions
     from websockets.asyncio.server import ServerConnection
+    from websockets.typing import Subprotocol
 except ImportError as e:  # pragma: no cover
     import warnings
 
@@ -30,6 +36,7 @@ from proxystore.p2p.relay.exceptions import RelayServerError
 from proxystore.p2p.relay.exceptions import UnauthorizedError
 from proxystore.p2p.relay.manager import Client
 from proxystore.p2p.relay.manager import ClientManager
+from proxystore.p2p.relay.messages import BINARY_SUBPROTOCOL
 from proxystore.p2p.relay.messages import decode_relay_message
 from proxystore.p2p.relay.messages import encode_relay_message
 from proxystore.p2p.relay.messages import PeerConnectionRequest
@@ -43,6 +50,12 @@ logger = logging.getLogger(__name__)
 UserT = TypeVar('UserT')
 
 
+@dataclasses.dataclass
+class _Outbound:
+    queue: asyncio.Queue[str | bytes]
+    writer: asyncio.Task[None]
+
+
 class RelayServer(Generic[UserT]):
     """WebRTC relay server.
 
@@ -60,6 +73,19 @@ class RelayServer(Generic[UserT]):
     The relay server is built on websockets and designed to be
     served using [`serve()`][proxystore.p2p.relay.run.serve].
 
+    Messages are exchanged with each client in the binary message format
+    if the client negotiated the
+    [`BINARY_SUBPROTOCOL`][proxystore.p2p.relay.messages.BINARY_SUBPROTOCOL]
+    when connecting and as JSON strings otherwise. Negotiating the binary
+    format requires passing
+    [`select_subprotocol()`][proxystore.p2p.relay.server.RelayServer.select_subprotocol]
+    to the websocket server.
+
+    Messages sent to a client are put in a bounded outbound queue for that
+    client which is drained by a writer task for that client. This ensures
+    a slow client does not stall the handling of messages from other
+    clients that are forwarding requests to it.
+
     Args:
         authenticator: Authenticator used to identify users from the opening
             websocket headers.
@@ -68,16 +94,40 @@ class RelayServer(Generic[UserT]):
             closed. Note that message size is computed using
             [`sys.getsizeof()`][sys.getsizeof] so will also include the
             PyObject overhead.
+        max_queued_messages: Maximum number of messages waiting to be sent
+            to a single client.
+        overflow_policy: Action taken when a message is sent to a client
+            whose outbound queue is full. `#!python 'drop'` discards the
+            message and `#!python 'close'` closes the connection with the
+            client (code 4005).
+
+    Raises:
+        ValueError: If `max_queued_messages` is less than one.
     """
 
     def __init__(
         self,
         authenticator: Authenticator[UserT],
         max_message_bytes: int | None = None,
+        *,
+        max_queued_messages: int = 64,
+        overflow_policy: Literal['drop', 'close'] = 'drop',
     ) -> None:
+        if max_queued_messages < 1:
+            raise ValueError(
+                'The max number of queued messages must be at least one. '
+                f'Got {max_queued_messages}.',
+            )
         self._authenticator = authenticator
         self._client_manager: ClientManager[UserT] = ClientManager()
         self._max_message_bytes = max_message_bytes
+        self._max_queued_messages = max_queued_messages
+        self._overflow_policy = overflow_policy
+        self._outbound: dict[Client[UserT], _Outbound] = {}
+        # Tasks closing clients which overflowed or whose writer failed keyed
+        # by client so only one task is started per client and the tasks are
+        # not garbage collected before they are done.
+        self._closing_tasks: dict[Client[UserT], asyncio.Task[None]] = {}
 
     @property
     def authenticator(self) -> Authenticator[UserT]:
@@ -89,12 +139,42 @@ class RelayServer(Generic[UserT]):
         """Manager of user clients."""
         return self._client_manager
 
+    @staticmethod
+    def select_subprotocol(
+        websocket: ServerConnection,
+        subprotocols: Sequence[Subprotocol],
+    ) -> Subprotocol | None:
+        """Select the binary message format if offered by the client.
+
+        This should be passed as the `select_subprotocol` argument of
+        [`websockets.asyncio.server.serve()`][websockets.asyncio.server.serve].
+        Clients which do not offer the
+        [`BINARY_SUBPROTOCOL`][proxystore.p2p.relay.messages.BINARY_SUBPROTOCOL]
+        are still accepted and use JSON messages.
+
+        Args:
+            websocket: Websocket connection being opened.
+            subprotocols: Subprotocols offered by the client.
+
+        Returns:
+            The binary subprotocol if offered by the client otherwise `None`.
+        """
+        if BINARY_SUBPROTOCOL in subprotocols:
+            return Subprotocol(BINARY_SUBPROTOCOL)
+        return None
+
     async def send(self, client: Client[UserT], message: RelayMessage) -> None:
-        """Send message on the socket.
+        """Queue a message to be sent on the socket of a client.
+
+        The message is sent by the writer task of the client so this
+        does not wait on the message being sent. If the outbound queue of
+        the client is full, the message is dropped or the client is closed
+        according to the overflow policy of the server.
 
         Note:
-            Messages are JSON string encoded using
-            [`encode_relay_message()`][proxystore.p2p.relay.messages.encode_relay_message].
+            Messages are encoded using
+            [`encode_relay_message()`][proxystore.p2p.relay.messages.encode_relay_message]
+            in the format negotiated with the client.
 
         Args:
             client: Client to send message to.
@@ -102,15 +182,105 @@ class RelayServer(Generic[UserT]):
                 to the client.
         """
         try:
-            message_str = encode_relay_message(message)
+            message_str = encode_relay_message(
+                message,
+                binary=_uses_binary(client.websocket),
+            )
         except RelayMessageEncodeError as e:
             logger.error(f'Failed to encode message: {e}')
             return
 
+        outbound = self._outbound.get(client, None)
+        if outbound is None:
+            queue: asyncio.Queue[str | bytes] = asyncio.Queue(
+                maxsize=self._max_queued_messages,
+            )
+            writer = asyncio.create_task(
+                self._write_messages(client, queue),
+                name=f'relay-client-writer-{client.uuid}',
+            )
+            writer.add_done_callback(
+                functools.partial(self._writer_done, client),
+            )
+            outbound = _Outbound(queue, writer)
+            self._outbound[client] = outbound
+
         try:
-            await client.websocket.send(message_str)
-        except websockets.exceptions.ConnectionClosed:
-            logger.error('Connection closed while attempting to send message')
+            outbound.queue.put_nowait(message_str)
+        except asyncio.QueueFull:
+            if self._overflow_policy == 'drop':
+                logger.warning(
+                    f'Dropping message to client {client.uuid} '
+                    f'({client.name}) because its outbound queue is full',
+                )
+            elif client not in self._closing_tasks:
+                logger.warning(
+                    f'Closing client {client.uuid} ({client.name}) '
+                    'because its outbound queue is full',
+                )
+                self._unregister_in_background(
+                    client,
+                    code=4005,
+                    reason='Outbound message queue is full.',
+                )
+
+    def _unregister_in_background(
+        self,
+        client: Client[UserT],
+        code: int,
+        reason: str,
+    ) -> None:
+        # Closing waits on the closing handshake with the client, which may
+        # be slow, so it is done in a separate task.
+        task = asyncio.create_task(
+            self.unregister(client, code=code, reason=reason),
+        )
+        self._closing_tasks[client] = task
+        task.add_done_callback(
+            lambda _: self._closing_tasks.pop(client, None),
+        )
+
+    def _writer_done(
+        self,
+        client: Client[UserT],
+        writer: asyncio.Task[None],
+    ) -> None:
+        # An unexpected error in the writer of one client only closes that
+        # client rather than the whole server.
+        if writer.cancelled() or writer.exception() is None:
+            return
+        logger.error(
+            f'Writer for client {client.uuid} ({client.name}) failed',
+            exc_info=writer.exception(),
+        )
+        outbound = self._outbound.get(client, None)
+        if (
+            outbound is not None
+            and outbound.writer is writer
+            and client not in self._closing_tasks
+        ):
+            self._unregister_in_background(
+                client,
+                code=1011,
+                reason='Failed to send message.',
+            )
+
+    async def _write_messages(
+        self,
+        client: Client[UserT],
+        queue: asyncio.Queue[str | bytes],
+    ) -> None:
+        while True:
+            message = await queue.get()
+            try:
+                await client.websocket.send(message)
+            except websockets.exceptions.ConnectionClosed:
+                logger.error(
+                    'Connection closed while attempting to send message',
+                )
+                return
+            finally:
+                queue.task_done()
 
     async def register(
         self,
@@ -202,6 +372,9 @@ class RelayServer(Generic[UserT]):
             f'with code {code}',
         )
         self.client_manager.remove_client(client)
+        outbound = self._outbound.pop(client, None)
+        if outbound is not None:
+            outbound.writer.cancel()
         await client.websocket.close(code=code, reason=reason)
 
     async def forward(
@@ -279,6 +452,20 @@ class RelayServer(Generic[UserT]):
         else:
             raise AssertionError('Unreachable.')
 
+    async def _close(
+        self,
+        websocket: ServerConnection,
+        code: int,
+        reason: str,
+    ) -> None:
+        # Unregister the client of the websocket, if it is registered, so its
+        # outbound queue and writer task are cleaned up with the websocket.
+        client = self.client_manager.get_client_by_websocket(websocket)
+        if client is None:
+            await websocket.close(code, reason=reason)
+        else:
+            await self.unregister(client, code=code, reason=reason)
+
     async def handler(self, websocket: ServerConnection) -> None:  # noqa: C901
         """Websocket server message handler.
 
@@ -289,6 +476,8 @@ class RelayServer(Generic[UserT]):
         - The client attempts to access forbidden resources (code 4002).
         - The client sends a message larger than the allowed size (code 4003).
         - A different client registers with the same ID (code 4004).
+        - The outbound message queue of the client overflows and the
+          overflow policy is `#!python 'close'` (code 4005).
 
         Args:
             websocket: Websocket message was received on.
@@ -311,8 +500,9 @@ class RelayServer(Generic[UserT]):
                 self._max_message_bytes is not None
                 and sys.getsizeof(message_str) > self._max_message_bytes
             ):
-                await websocket.close(
-                    4003,
+                await self._close(
+                    websocket,
+                    code=4003,
                     reason='Message length exceeds limit.',
                 )
                 logger.warning(
@@ -324,10 +514,6 @@ class RelayServer(Generic[UserT]):
                 break
 
             try:
-                if isinstance(message_str, bytes):
-                    raise RelayMessageDecodeError(
-                        'Got message as bytes but expected str.',
-                    )
                 message = decode_relay_message(message_str)
             except RelayMessageDecodeError as e:
                 logger.error(
@@ -335,7 +521,11 @@ class RelayServer(Generic[UserT]):
                     'caught on message received from '
                     f'{websocket.remote_address}. {e}',
                 )
-                await websocket.close(4000, reason='Unknown message type.')
+                await self._close(
+                    websocket,
+                    code=4000,
+                    reason='Unknown message type.',
+                )
                 break
 
             try:
@@ -356,4 +546,13 @@ class RelayServer(Generic[UserT]):
                     message=f'{e.__class__.__name__}: {e}',
                     error=True,
                 )
-                await websocket.send(encode_relay_message(response))
+                await websocket.send(
+                    encode_relay_message(
+                        response,
+                        binary=_uses_binary(websocket),
+                    ),
+                )
+
+
+def _uses_binary(websocket: ServerConnection) -> bool:
+    return websocket.subprotocol == BINARY_SUBPROTOCOL
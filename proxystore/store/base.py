@@ -57,6 +57,15 @@ _NON_PROXIABLE_TYPES = (bool, type(None))
 _MISSING_OBJECT = object()
 
 
+def _add_ttl_to_kwargs(ttl: float | None, kwargs: dict[str, Any]) -> None:
+    # The ttl is only forwarded to the connector when set so connectors
+    # which do not support expiry are unaffected by the default.
+    if ttl is not None:
+        if ttl <= 0:
+            raise ValueError(f'TTL must be greater than zero. Got {ttl}.')
+        kwargs['ttl'] = ttl
+
+
 class Store(Generic[ConnectorT]):
     r"""Key-value store interface for proxies.
 
@@ -592,6 +601,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = ...,
         lifetime: Lifetime | None = ...,
+        ttl: float | None = ...,
         serializer: SerializerT | None = ...,
         deserializer: DeserializerT | None = ...,
         populate_target: bool | None = ...,
@@ -606,6 +616,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = ...,
         lifetime: Lifetime | None = ...,
+        ttl: float | None = ...,
         serializer: SerializerT | None = ...,
         deserializer: DeserializerT | None = ...,
         populate_target: bool | None = ...,
@@ -619,6 +630,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = False,
         lifetime: Lifetime | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         deserializer: DeserializerT | None = None,
         populate_target: bool | None = None,
@@ -634,6 +646,10 @@ class Store(Generic[ConnectorT]):
             lifetime: Attach the proxy to this lifetime. The object associated
                 with the proxy will be evicted when the lifetime ends.
                 Mutually exclusive with the `evict` parameter.
+            ttl: Optional time-to-live in seconds of the object associated
+                with the proxy. The object will be expired by the connector
+                once the ttl has elapsed. See
+                [`put()`][proxystore.store.base.Store.put] for details.
             serializer: Optionally override the default serializer for the
                 store instance.
             deserializer: Optionally override the default deserializer for the
@@ -683,7 +699,7 @@ class Store(Generic[ConnectorT]):
                 )
 
         with Timer() as timer:
-            key = self.put(obj, serializer=serializer, **kwargs)
+            key = self.put(obj, serializer=serializer, ttl=ttl, **kwargs)
             factory: StoreFactory[ConnectorT, T] = StoreFactory(
                 key,
                 store_config=self.config(),
@@ -722,6 +738,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = ...,
         lifetime: Lifetime | None = ...,
+        ttl: float | None = ...,
         serializer: SerializerT | None = ...,
         deserializer: DeserializerT | None = ...,
         populate_target: bool | None = ...,
@@ -736,6 +753,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = ...,
         lifetime: Lifetime | None = ...,
+        ttl: float | None = ...,
         serializer: SerializerT | None = ...,
         deserializer: DeserializerT | None = ...,
         populate_target: bool | None = ...,
@@ -752,6 +770,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = False,
         lifetime: Lifetime | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         deserializer: DeserializerT | None = None,
         populate_target: bool | None = None,
@@ -767,6 +786,10 @@ class Store(Generic[ConnectorT]):
             lifetime: Attach the proxies to this lifetime. The objects
                 associated with each proxy will be evicted when the lifetime
                 ends. Mutually exclusive with the `evict` parameter.
+            ttl: Optional time-to-live in seconds of the objects associated
+                with each proxy. See
+                [`put_batch()`][proxystore.store.base.Store.put_batch] for
+                details.
             serializer: Optionally override the default serializer for the
                 store instance.
             deserializer: Optionally override the default deserializer for the
@@ -824,6 +847,7 @@ class Store(Generic[ConnectorT]):
             keys = self.put_batch(
                 proxiable_objs,
                 serializer=serializer,
+                ttl=ttl,
                 **kwargs,
             )
             factories: list[StoreFactory[ConnectorT, T]] = [
@@ -922,6 +946,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = ...,
         lifetime: Lifetime | None = ...,
+        ttl: float | None = ...,
         serializer: SerializerT | None = ...,
         deserializer: DeserializerT | None = ...,
         populate_target: bool | None = ...,
@@ -936,6 +961,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = ...,
         lifetime: Lifetime | None = ...,
+        ttl: float | None = ...,
         serializer: SerializerT | None = ...,
         deserializer: DeserializerT | None = ...,
         populate_target: bool | None = ...,
@@ -949,6 +975,7 @@ class Store(Generic[ConnectorT]):
         *,
         evict: bool = False,
         lifetime: Lifetime | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         deserializer: DeserializerT | None = None,
         populate_target: bool | None = None,
@@ -964,6 +991,10 @@ class Store(Generic[ConnectorT]):
             lifetime: Attach the proxy to this lifetime. The object associated
                 with the proxy will be evicted when the lifetime ends.
                 Mutually exclusive with the `evict` parameter.
+            ttl: Optional time-to-live in seconds of the object associated
+                with the proxy. The object will be expired by the connector
+                once the ttl has elapsed. See
+                [`put()`][proxystore.store.base.Store.put] for details.
             serializer: Optionally override the default serializer for the
                 store instance.
             deserializer: Optionally override the default deserializer for the
@@ -997,6 +1028,7 @@ class Store(Generic[ConnectorT]):
             obj,
             evict=evict,
             lifetime=lifetime,
+            ttl=ttl,
             serializer=serializer,
             deserializer=deserializer,
             populate_target=populate_target,
@@ -1100,6 +1132,7 @@ class Store(Generic[ConnectorT]):
         obj: Any,
         *,
         lifetime: Lifetime | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         **kwargs: Any,
     ) -> ConnectorKeyT:
@@ -1111,6 +1144,16 @@ class Store(Generic[ConnectorT]):
                 store instance.
             lifetime: Attach the key to this lifetime. The object associated
                 with the key will be evicted when the lifetime ends.
+            ttl: Optional time-to-live in seconds. The object will be expired
+                natively by the connector once `ttl` seconds have elapsed.
+                Requires a connector whose `put()` accepts a `ttl` argument,
+                such as the
+                [`FileConnector`][proxystore.connectors.file.FileConnector],
+                [`RedisConnector`][proxystore.connectors.redis.RedisConnector],
+                or
+                [`EndpointConnector`][proxystore.connectors.endpoint.EndpointConnector].
+                Objects already in the local cache of a store are not
+                invalidated when they expire.
             kwargs: Additional keyword arguments to pass to
                 [`Connector.put()`][proxystore.connectors.protocols.Connector.put].
 
@@ -1119,7 +1162,10 @@ class Store(Generic[ConnectorT]):
 
         Raises:
             TypeError: If the output of `serializer` is not bytes.
+            ValueError: If `ttl` is not greater than zero.
         """
+        _add_ttl_to_kwargs(ttl, kwargs)
+
         timer = Timer().start()
 
         with Timer() as serialize_timer:
@@ -1158,6 +1204,7 @@ class Store(Generic[ConnectorT]):
         objs: Sequence[Any],
         *,
         lifetime: Lifetime | None = None,
+        ttl: float | None = None,
         serializer: SerializerT | None = None,
         **kwargs: Any,
     ) -> list[ConnectorKeyT]:
@@ -1169,6 +1216,8 @@ class Store(Generic[ConnectorT]):
                 store instance.
             lifetime: Attach the keys to this lifetime. The objects associated
                 with each key will be evicted when the lifetime ends.
+            ttl: Optional time-to-live in seconds applied to each object. See
+                [`put()`][proxystore.store.base.Store.put] for details.
             kwargs: Additional keyword arguments to pass to
                 [`Connector.put_batch()`][proxystore.connectors.protocols.Connector.put_batch].
 
@@ -1177,7 +1226,10 @@ class Store(Generic[ConnectorT]):
 
         Raises:
             TypeError: If the output of `serializer` is not bytes.
+            ValueError: If `ttl` is not greater than zero.
         """
+        _add_ttl_to_kwargs(ttl, kwargs)
+
         timer = Timer().start()
 
         def _serialize(obj: Any) -> BytesLike:
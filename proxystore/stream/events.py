@@ -1,4 +1,12 @@
-"""Event types."""
+"""Event types.
+
+Events are encoded to bytes by
+[`event_to_bytes()`][proxystore.stream.events.event_to_bytes] as compact
+tuples. Each distinct [`StoreConfig`][proxystore.store.config.StoreConfig]
+and key type in a message is written once in a table at the start of the
+message, and events reference the table entries by index, rather than each
+event embedding the full store configuration and key type path.
+"""
 
 from __future__ import annotations
 
@@ -130,11 +138,122 @@ def dict_to_event(data: dict[str, Any]) -> Event | EventBatch:
     return event
 
 
+_ENCODING_VERSION = 1
+# Index of an event type in this tuple is the type ID in the encoding.
+_ENCODED_EVENT_TYPES = (EndOfStreamEvent, NewObjectEvent, NewObjectKeyEvent)
+
+
+class _EncodingTables:
+    """Store configs and key types interned while encoding a message."""
+
+    def __init__(self) -> None:
+        self.configs: list[StoreConfig] = []
+        self.key_types: dict[str, int] = {}
+
+    def config_id(self, config: StoreConfig) -> int:
+        for i, known in enumerate(self.configs):
+            if known is config or known == config:
+                return i
+        self.configs.append(config)
+        return len(self.configs) - 1
+
+    def key_type_id(self, key_type: str) -> int:
+        return self.key_types.setdefault(key_type, len(self.key_types))
+
+
+def _encode_event(event: Event, tables: _EncodingTables) -> tuple[Any, ...]:
+    type_id = _ENCODED_EVENT_TYPES.index(type(event))
+    if isinstance(event, EndOfStreamEvent):
+        return (type_id,)
+    elif isinstance(event, NewObjectEvent):
+        return (type_id, event.obj, event.metadata)
+    elif isinstance(event, NewObjectKeyEvent):
+        return (
+            type_id,
+            tables.key_type_id(event.key_type),
+            tuple(event.raw_key),
+            event.evict,
+            event.metadata,
+            tables.config_id(event.store_config),
+        )
+    else:
+        raise AssertionError('Unreachable.')
+
+
+def _decode_event(
+    data: tuple[Any, ...],
+    topic: str,
+    configs: list[StoreConfig],
+    key_types: list[str],
+) -> Event:
+    event_type = _ENCODED_EVENT_TYPES[data[0]]
+    if event_type is EndOfStreamEvent:
+        return EndOfStreamEvent(topic)
+    elif event_type is NewObjectEvent:
+        _, obj, metadata = data
+        return NewObjectEvent(topic=topic, obj=obj, metadata=metadata)
+    elif event_type is NewObjectKeyEvent:
+        _, key_type_id, raw_key, evict, metadata, config_id = data
+        return NewObjectKeyEvent(
+            topic=topic,
+            key_type=key_types[key_type_id],
+            raw_key=list(raw_key),
+            evict=evict,
+            metadata=metadata,
+            store_config=configs[config_id],
+        )
+    else:
+        raise AssertionError('Unreachable.')
+
+
 def event_to_bytes(event: Event | EventBatch) -> bytes:
-    """Convert event to byte-string."""
-    return serialize(event_to_dict(event))
+    """Convert event to byte-string.
+
+    Note:
+        The events in an
+        [`EventBatch`][proxystore.stream.events.EventBatch] are encoded
+        without their topic so are decoded with the topic of the batch.
+    """
+    tables = _EncodingTables()
+    if isinstance(event, EventBatch):
+        batch = True
+        events = [_encode_event(e, tables) for e in event.events]
+    else:
+        batch = False
+        events = [_encode_event(event, tables)]
+    message = (
+        _ENCODING_VERSION,
+        event.topic,
+        batch,
+        # Only non-default fields are sent to further shrink the message.
+        [
+            config.model_dump(exclude_defaults=True)
+            for config in tables.configs
+        ],
+        list(tables.key_types),
+        events,
+    )
+    return serialize(message)
 
 
 def bytes_to_event(s: bytes) -> Event | EventBatch:
-    """Convert byte-string to event."""
-    return dict_to_event(deserialize(s))
+    """Convert byte-string to event.
+
+    Byte-strings of events encoded as dictionaries by older versions of
+    [`event_to_bytes()`][proxystore.stream.events.event_to_bytes] are
+    also supported.
+
+    Raises:
+        ValueError: if the byte-string was encoded with an unsupported
+            version of the encoding.
+    """
+    message = deserialize(s)
+    if isinstance(message, dict):
+        return dict_to_event(message)
+
+    version, topic, batch, config_dicts, key_types, encoded = message
+    if version != _ENCODING_VERSION:
+        raise ValueError(f'Unsupported event encoding version: {version}.')
+    configs = [StoreConfig.model_validate(d) for d in config_dicts]
+    events = [_decode_event(e, topic, configs, key_types) for e in encoded]
+    return EventBatch(topic, events) if batch else events[0]
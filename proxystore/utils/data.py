@@ -25,6 +25,27 @@ def chunk_bytes(
         yield data[index : min(index + chunk_size, length)]
 
 
+def chunk_memoryview(
+    data: bytes | bytearray | memoryview,
+    chunk_size: int,
+) -> Generator[memoryview, None, None]:
+    """Yield zero-copy chunks of binary data.
+
+    Unlike [`chunk_bytes()`][proxystore.utils.data.chunk_bytes], the
+    yielded chunks are views into `data` rather than copies.
+
+    Args:
+        data: Data to be chunked.
+        chunk_size: Chunk size in bytes.
+
+    Returns:
+        Generator that yields memoryviews of the chunks.
+    """
+    view = memoryview(data)
+    for index in range(0, len(view), chunk_size):
+        yield view[index : index + chunk_size]
+
+
 def bytes_to_readable(size: int, precision: int = 3) -> str:
     """Convert bytes to human readable value.
 
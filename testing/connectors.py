@@ -15,6 +15,8 @@ from proxystore.connectors import globus
 from proxystore.connectors import local
 from proxystore.connectors import multi
 from proxystore.connectors import redis
+from proxystore.connectors import sqlite
+from proxystore.connectors import tiered
 from proxystore.connectors.endpoint import EndpointConnector
 from proxystore.connectors.protocols import Connector
 from proxystore.endpoint.config import EndpointConfig
@@ -32,6 +34,8 @@ FIXTURE_LIST = [
     'local_connector',
     'multi_connector',
     'redis_connector',
+    'sqlite_connector',
+    'tiered_connector',
 ]
 MOCK_REDIS_CACHE: dict[str, Any] = {}
 
@@ -141,6 +145,30 @@ def redis_connector() -> Generator[Connector[Any], None, None]:
             yield connector
 
 
+@pytest.fixture(scope='session')
+def sqlite_connector(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Connector[Any], None, None]:
+    """SQLiteConnector fixture."""
+    tmp_path = tmp_path_factory.mktemp('sqlite-connector-fixture')
+    with sqlite.SQLiteConnector(tmp_path / 'blobs.db') as connector:
+        yield connector
+
+
+@pytest.fixture(scope='session')
+def tiered_connector(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Connector[Any], None, None]:
+    """TieredConnector fixture."""
+    tmp_path = tmp_path_factory.mktemp('tiered-connector-fixture')
+    with tiered.TieredConnector(
+        local.LocalConnector(),
+        file.FileConnector(str(tmp_path)),
+        demote_after=None,
+    ) as connector:
+        yield connector
+
+
 @pytest.fixture(scope='session', params=FIXTURE_LIST)
 def connectors(request) -> Generator[Connector[Any], None, None]:
     """Parameterized fixture that returns all Connector implementations."""
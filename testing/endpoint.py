@@ -5,6 +5,9 @@ from __future__ import annotations
 import contextlib
 import logging
 import multiprocessing
+import os
+import shutil
+import tempfile
 import time
 import uuid
 from collections.abc import Generator
@@ -56,11 +59,15 @@ def wait_for_endpoint(host: str, port: int, max_time_s: float = 5) -> None:
 @pytest.fixture(scope='session')
 def endpoint(use_uvloop: bool) -> Generator[EndpointConfig, None, None]:
     """Launch endpoint in subprocess."""
+    # Unix socket paths are limited to ~100 characters so the socket is
+    # not placed in the pytest temporary directory.
+    socket_dir = tempfile.mkdtemp()
     config = EndpointConfig(
         name='endpoint-fixture',
         uuid=str(uuid.uuid4()),
         host='localhost',
         port=open_port(),
+        socket_path=os.path.join(socket_dir, 'endpoint.sock'),
     )
     context = multiprocessing.get_context('spawn')
     server_handle = context.Process(
@@ -77,3 +84,4 @@ def endpoint(use_uvloop: bool) -> Generator[EndpointConfig, None, None]:
 
     server_handle.terminate()
     server_handle.join()
+    shutil.rmtree(socket_dir, ignore_errors=True)
@@ -58,7 +58,7 @@ class MockTransferClient:
     def get_task(self, task_id: str) -> Any:
         """Get task."""
         assert isinstance(task_id, str)
-        return None
+        return {'task_id': task_id, 'status': 'SUCCEEDED'}
 
     def submit_delete(self, delete_data: MockDeleteData) -> dict[str, str]:
         """Submit DeleteData."""
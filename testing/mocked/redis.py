@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import queue
+import time
 from typing import Any
 from typing import TypedDict
 
@@ -30,6 +31,13 @@ class MockStrictRedis:
         self.pubsub_queue = (
             queue.Queue() if pubsub_queue is None else pubsub_queue
         )
+        self.expires: dict[str, float] = {}
+
+    def _expire(self, key: str) -> None:
+        expires = self.expires.get(key, None)
+        if expires is not None and expires <= time.time():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
 
     def blpop(
         self,
@@ -49,11 +57,13 @@ class MockStrictRedis:
 
     def delete(self, key: str) -> None:
         """Delete key."""
+        self.expires.pop(key, None)
         if key in self.data:
             del self.data[key]
 
     def exists(self, key: str) -> bool:
         """Check if key exists."""
+        self._expire(key)
         return key in self.data
 
     def flushdb(self) -> None:
@@ -62,19 +72,29 @@ class MockStrictRedis:
 
     def get(self, key: str) -> bytes | None:
         """Get value with key."""
+        self._expire(key)
         if key in self.data:
             return self.data[key]
         return None
 
     def mget(self, keys: list[str]) -> list[bytes | None]:
         """Get list of values from keys."""
-        return [self.data.get(key, None) for key in keys]
+        return [self.get(key) for key in keys]
 
     def mset(self, values: dict[str, bytes]) -> None:
         """Set list of values."""
         for key, value in values.items():
             self.set(key, value)
 
+    def pexpire(self, key: str, px: int) -> None:
+        """Set the time-to-live of a key in milliseconds."""
+        if key in self.data:
+            self.expires[key] = time.time() + (px / 1000)
+
+    def pipeline(self, transaction: bool = True) -> MockPipeline:
+        """Create a pipeline."""
+        return MockPipeline(self)
+
     def publish(self, topic: str, data: bytes) -> None:
         """Publish a message to a topic."""
         message = Message(
@@ -95,9 +115,33 @@ class MockStrictRedis:
             self.data[key] = []
         self.data[key].extend(values)
 
-    def set(self, key: str, value: bytes) -> None:
+    def set(self, key: str, value: bytes, px: int | None = None) -> None:
         """Set value in MockStrictRedis."""
         self.data[key] = value
+        self.expires.pop(key, None)
+        if px is not None:
+            self.pexpire(key, px)
+
+
+class MockPipeline:
+    """Mock Pipeline which buffers commands until executed."""
+
+    def __init__(self, redis: MockStrictRedis):
+        self.redis = redis
+        self.commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def execute(self) -> list[Any]:
+        """Execute buffered commands."""
+        results = [
+            getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+        self.commands = []
+        return results
+
+    def set(self, key: str, value: bytes, px: int | None = None) -> None:
+        """Buffer a set command."""
+        self.commands.append(('set', (key, value), {'px': px}))
 
 
 class MockPubSub:
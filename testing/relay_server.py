@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
 from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
 from typing import NamedTuple
 
 import pytest_asyncio
@@ -25,13 +27,15 @@ class RelayServerInfo(NamedTuple):
     address: str
 
 
-@pytest_asyncio.fixture()
-async def relay_server() -> AsyncGenerator[RelayServerInfo, None]:
-    """Fixture that runs relay server locally.
+@contextlib.asynccontextmanager
+async def run_relay_server(
+    relay_server: RelayServer[NullUser] | None = None,
+) -> AsyncIterator[RelayServerInfo]:
+    """Run a relay server locally.
 
-    Warning:
-        This fixture has session scope so the relay server will be shared
-        between many tests.
+    Args:
+        relay_server: Relay server to serve. If `None`, a server without
+            authentication is created.
 
     Yields:
         `RelayServerInfo <.RelayServerInfo>`
@@ -40,11 +44,13 @@ async def relay_server() -> AsyncGenerator[RelayServerInfo, None]:
     port = open_port()
     address = f'ws://{host}:{port}'
 
-    relay_server = RelayServer(NullAuthenticator())
+    if relay_server is None:
+        relay_server = RelayServer(NullAuthenticator())
     async with websockets.asyncio.server.serve(
         relay_server.handler,
         host,
         port,
+        select_subprotocol=relay_server.select_subprotocol,
     ) as websocket_server:
         server_info = RelayServerInfo(
             relay_server=relay_server,
@@ -55,3 +61,18 @@ async def relay_server() -> AsyncGenerator[RelayServerInfo, None]:
         )
         assert websocket_server.is_serving()
         yield server_info
+
+
+@pytest_asyncio.fixture()
+async def relay_server() -> AsyncGenerator[RelayServerInfo, None]:
+    """Fixture that runs relay server locally.
+
+    Warning:
+        This fixture has session scope so the relay server will be shared
+        between many tests.
+
+    Yields:
+        `RelayServerInfo <.RelayServerInfo>`
+    """
+    async with run_relay_server() as server_info:
+        yield server_info
@@ -56,7 +56,7 @@ async def amain(
     """Measure transfer speed between producer and consumer."""
     connection = await get_connection(actor, relay, channels)
 
-    data: str | bytes
+    data: str | bytes | bytearray
     if actor == 'producer':
         data = randbytes(size)
         start = time.perf_counter()
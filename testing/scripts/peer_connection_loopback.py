@@ -0,0 +1,176 @@
+"""Peer connection loopback throughput versus channel count.
+
+Runs a relay server and two peers in this process, connects the peers
+over the loopback interface, and measures the throughput of sending
+messages from one peer to the other for each channel count.
+
+Example:
+    ```bash
+    python -m testing.scripts.peer_connection_loopback \
+        --size 100000000 --repeat 3 --channels 1 2 4
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Sequence
+
+import websockets.asyncio.server
+
+from proxystore.p2p.connection import PeerConnection
+from proxystore.p2p.relay.authenticate import NullAuthenticator
+from proxystore.p2p.relay.client import RelayClient
+from proxystore.p2p.relay.messages import PeerConnectionRequest
+from proxystore.p2p.relay.server import RelayServer
+from testing.compat import randbytes
+from testing.utils import open_port
+
+
+async def get_connections(
+    address: str,
+    channels: int,
+) -> tuple[PeerConnection, PeerConnection]:
+    """Return a pair of connected PeerConnections."""
+    client1 = RelayClient(address)
+    await client1.connect()
+    client2 = RelayClient(address)
+    await client2.connect()
+    connection1 = PeerConnection(client1, channels=channels)
+    connection2 = PeerConnection(client2, channels=channels)
+
+    await connection1.send_offer(client2.uuid)
+    offer = await client2.recv()
+    assert isinstance(offer, PeerConnectionRequest)
+    await connection2.handle_server_message(offer)
+    answer = await client1.recv()
+    assert isinstance(answer, PeerConnectionRequest)
+    await connection1.handle_server_message(answer)
+
+    await connection1.ready()
+    await connection2.ready()
+
+    return connection1, connection2
+
+
+async def measure(
+    address: str,
+    channels: int,
+    size: int,
+    repeat: int,
+) -> tuple[int, list[float]]:
+    """Measure the throughput in Mbps of each message sent.
+
+    Returns:
+        Tuple of the negotiated chunk size and the throughputs.
+    """
+    connection1, connection2 = await get_connections(address, channels)
+    data = randbytes(size)
+
+    throughputs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await connection1.send(data)
+        received = await connection2.recv()
+        end = time.perf_counter()
+        assert len(received) == size
+        throughputs.append(size * 8 / (end - start) / 1e6)
+
+    await connection1.close()
+    await connection2.close()
+    await connection1._relay_client.close()
+    await connection2._relay_client.close()
+    return connection1.chunk_size, throughputs
+
+
+async def amain(
+    channels: Sequence[int],
+    size: int,
+    repeat: int,
+) -> None:
+    """Measure loopback throughput for each channel count."""
+    host = 'localhost'
+    port = open_port()
+    address = f'ws://{host}:{port}'
+    relay_server = RelayServer(NullAuthenticator())
+
+    async with websockets.asyncio.server.serve(
+        relay_server.handler,
+        host,
+        port,
+        select_subprotocol=relay_server.select_subprotocol,
+    ):
+        print('channels,chunk_size,mbps_mean,mbps_stdev')
+        for count in channels:
+            chunk_size, throughputs = await measure(
+                address,
+                count,
+                size,
+                repeat,
+            )
+            stdev = statistics.stdev(throughputs) if repeat > 1 else 0.0
+            print(
+                f'{count},{chunk_size},'
+                f'{statistics.mean(throughputs):.3f},{stdev:.3f}',
+            )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Peer loopback bandwidth app."""
+    argv = argv if argv is not None else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description=(
+            'Measure loopback transfer speed between two WebRTC peers '
+            'for varying numbers of datachannels.'
+        ),
+    )
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=10_000_000,
+        help='message length in bytes',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='number of messages to send for each channel count',
+    )
+    parser.add_argument(
+        '--channels',
+        type=int,
+        nargs='+',
+        default=[1, 2, 4],
+        help='numbers of datachannels to test',
+    )
+    parser.add_argument(
+        '--no-uvloop',
+        action='store_true',
+        help='override using uvloop if available',
+    )
+    args = parser.parse_args(argv)
+
+    if not args.no_uvloop:
+        try:
+            import uvloop
+
+            uvloop.install()
+            print('using uvloop')
+        except ImportError:
+            print('uvloop unavailable... using default asyncio event loop')
+
+    logging.basicConfig()
+
+    asyncio.run(amain(args.channels, args.size, args.repeat))
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
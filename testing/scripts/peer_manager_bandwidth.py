@@ -48,7 +48,7 @@ async def amain(
     """Measure transfer speed between producer and consumer."""
     manager, remote_uuid = await get_manager(actor, relay)
 
-    data: str | bytes
+    data: str | bytes | bytearray
     if actor == 'producer':
         data = randbytes(size)
         start = time.perf_counter()
@@ -0,0 +1,173 @@
+"""Relay server forwarding latency under load with slow clients.
+
+Runs a relay server in this process and uses
+[`run_benchmark()`][proxystore.p2p.relay.bench.run_benchmark] to connect
+a number of fast clients and slow clients. Slow clients never read their
+messages so the relay server eventually blocks writing to them. Each fast
+client repeatedly forwards a large message to every slow client and a small
+timestamped message to another fast client. The latency of the small
+messages is reported for each number of fast clients.
+
+Example:
+    ```bash
+    python -m testing.scripts.relay_load --clients 2 8 32 --slow 1
+    ```
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+from collections.abc import Sequence
+from typing import Literal
+
+from proxystore.p2p.relay.authenticate import NullAuthenticator
+from proxystore.p2p.relay.bench import BenchmarkResult
+from proxystore.p2p.relay.bench import run_benchmark
+from proxystore.p2p.relay.server import RelayServer
+from testing.relay_server import run_relay_server
+
+
+async def measure(
+    clients: int,
+    slow: int,
+    duration: float,
+    size: int,
+    payload_size: int,
+    interval: float,
+    max_queued_messages: int,
+    overflow_policy: Literal['drop', 'close'],
+) -> BenchmarkResult:
+    """Measure forwarding latencies between fast clients."""
+    server = RelayServer(
+        NullAuthenticator(),
+        max_queued_messages=max_queued_messages,
+        overflow_policy=overflow_policy,
+    )
+    async with run_relay_server(server) as info:
+        return await run_benchmark(
+            info.address,
+            clients=clients,
+            size=size,
+            rate=clients / interval,
+            duration=duration,
+            slow_clients=slow,
+            slow_size=payload_size,
+        )
+
+
+async def amain(
+    clients: Sequence[int],
+    slow: int,
+    duration: float,
+    size: int,
+    payload_size: int,
+    interval: float,
+    max_queued_messages: int,
+    overflow_policy: Literal['drop', 'close'],
+) -> None:
+    """Measure forwarding latency for each number of fast clients."""
+    print('clients,slow_clients,messages,p50_ms,p99_ms,max_ms')
+    for count in clients:
+        result = await measure(
+            count,
+            slow,
+            duration,
+            size,
+            payload_size,
+            interval,
+            max_queued_messages,
+            overflow_policy,
+        )
+        p50, p99, p100 = (
+            result.latency_percentile(p) * 1000 for p in (50, 99, 100)
+        )
+        print(
+            f'{count},{slow},{result.forwarded},{p50:.3f},{p99:.3f},'
+            f'{p100:.3f}',
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Relay server load test app."""
+    argv = argv if argv is not None else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description=(
+            'Measure relay server forwarding latency between fast clients '
+            'while slow clients are not reading their messages.'
+        ),
+    )
+    parser.add_argument(
+        '--clients',
+        type=int,
+        nargs='+',
+        default=[2, 8, 32],
+        help='numbers of fast clients to test',
+    )
+    parser.add_argument(
+        '--slow',
+        type=int,
+        default=1,
+        help='number of slow clients',
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=5,
+        help='seconds to run each test',
+    )
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=64,
+        help='bytes of data in messages sent between fast clients',
+    )
+    parser.add_argument(
+        '--payload',
+        type=int,
+        default=65536,
+        help='bytes of random data in messages sent to slow clients',
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=0.01,
+        help='seconds between messages sent by each fast client',
+    )
+    parser.add_argument(
+        '--max-queued-messages',
+        type=int,
+        default=64,
+        help='max messages queued by the relay server for each client',
+    )
+    parser.add_argument(
+        '--overflow-policy',
+        choices=['drop', 'close'],
+        default='drop',
+        help='action taken when the queue of a client is full',
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+
+    asyncio.run(
+        amain(
+            args.clients,
+            args.slow,
+            args.duration,
+            args.size,
+            args.payload,
+            args.interval,
+            args.max_queued_messages,
+            args.overflow_policy,
+        ),
+    )
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -23,6 +23,8 @@ from testing.connectors import globus_connector
 from testing.connectors import local_connector
 from testing.connectors import multi_connector
 from testing.connectors import redis_connector
+from testing.connectors import sqlite_connector
+from testing.connectors import tiered_connector
 from testing.endpoint import endpoint
 from testing.relay_server import relay_server
 from testing.ssl import ssl_context
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import array
 import logging
 import pathlib
+import socket
 import uuid
 from unittest import mock
 
@@ -10,10 +12,12 @@ import requests
 
 from proxystore.connectors.endpoint import EndpointConnector
 from proxystore.connectors.endpoint import EndpointConnectorError
+from proxystore.endpoint.client import UNIX_SOCKET_SCHEME
 from proxystore.endpoint.config import EndpointConfig
 from proxystore.endpoint.config import write_config
 from proxystore.endpoint.serve import MAX_CHUNK_LENGTH
 from testing.compat import randbytes
+from testing.utils import open_port
 
 
 def test_no_endpoints_provided() -> None:
@@ -73,6 +77,35 @@ def test_endpoint_uuid_mismatch(endpoint_connector) -> None:
             EndpointConnector.from_config(endpoint_connector.config())
 
 
+def test_unix_socket_preferred(endpoint_connector) -> None:
+    assert endpoint_connector.address.startswith(f'{UNIX_SOCKET_SCHEME}://')
+
+
+def test_unix_socket_fallback(
+    endpoint: EndpointConfig,
+    tmp_path: pathlib.Path,
+) -> None:
+    socket_path = tmp_path / 'endpoint.sock'
+    config = endpoint.model_copy(update={'socket_path': str(socket_path)})
+    write_config(config, str(tmp_path / config.name))
+
+    # Socket does not exist
+    with EndpointConnector([config.uuid], str(tmp_path)) as connector:
+        assert connector.address == f'http://{config.host}:{config.port}'
+
+    # Socket exists but nothing is listening on it
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(socket_path))
+    with EndpointConnector([config.uuid], str(tmp_path)) as connector:
+        assert connector.address == f'http://{config.host}:{config.port}'
+
+    # Neither address can be connected to
+    config = config.model_copy(update={'port': open_port()})
+    write_config(config, str(tmp_path / config.name))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        EndpointConnector([config.uuid], str(tmp_path))
+
+
 def test_bad_responses(endpoint_connector) -> None:
     connector = EndpointConnector.from_config(endpoint_connector.config())
 
@@ -99,6 +132,12 @@ def test_bad_responses(endpoint_connector) -> None:
         with pytest.raises(EndpointConnectorError, match='401'):
             connector.put(b'value')
 
+        with pytest.raises(EndpointConnectorError, match='401'):
+            connector.get_batch([key])
+
+        with pytest.raises(EndpointConnectorError, match='401'):
+            connector.put_batch([b'value'])
+
     connector.close()
 
 
@@ -113,3 +152,38 @@ def test_chunked_requests(endpoint_connector) -> None:
     assert connector.get(key) == data
 
     connector.close()
+
+
+def test_batch_single_request(endpoint_connector) -> None:
+    connector = EndpointConnector.from_config(endpoint_connector.config())
+    objs = [randbytes(100), randbytes(MAX_CHUNK_LENGTH + 1), b'']
+
+    with mock.patch(
+        'requests.Session.post',
+        wraps=connector._session.post,
+    ) as mock_post:
+        keys = connector.put_batch(objs, ttl=60)
+        assert connector.get_batch(
+            [*keys, keys[0]._replace(object_id='x')],
+        ) == [
+            *objs,
+            None,
+        ]
+    assert mock_post.call_count == 2
+
+    connector.close()
+
+
+def test_put_batch_buffers(endpoint_connector) -> None:
+    connector = EndpointConnector.from_config(endpoint_connector.config())
+    items = memoryview(array.array('i', range(10)))
+    objs: list[bytes | bytearray | memoryview] = [
+        bytearray(b'data'),
+        memoryview(b'view'),
+        items,
+    ]
+
+    keys = connector.put_batch(objs)
+    assert connector.get_batch(keys) == [b'data', b'view', items.tobytes()]
+
+    connector.close()
@@ -3,6 +3,9 @@ from __future__ import annotations
 import os
 import pathlib
 import tempfile
+import time
+
+import pytest
 
 from proxystore.connectors.file import FileConnector
 
@@ -51,3 +54,71 @@ def test_paths_work_after_cwd_change(tmp_path: pathlib.Path) -> None:
         connector.close()
 
     os.chdir(current)
+
+
+def test_put_with_ttl(tmp_path: pathlib.Path) -> None:
+    with FileConnector(store_dir=str(tmp_path)) as connector:
+        key = connector.put(b'value', ttl=0.05)
+        other = connector.put(b'value')
+
+        assert connector.get(key) == b'value'
+        time.sleep(0.1)
+        assert not connector.exists(key)
+        assert connector.get(key) is None
+        assert connector.exists(other)
+
+        # Expired objects are removed on access
+        assert not os.path.exists(tmp_path / key.filename)
+
+
+def test_put_batch_with_ttl(tmp_path: pathlib.Path) -> None:
+    with FileConnector(store_dir=str(tmp_path)) as connector:
+        keys = connector.put_batch([b'value1', b'value2'], ttl=0.05)
+
+        assert connector.get_batch(keys) == [b'value1', b'value2']
+        time.sleep(0.1)
+        assert connector.get_batch(keys) == [None, None]
+
+
+def test_set_without_ttl_clears_expiration(tmp_path: pathlib.Path) -> None:
+    with FileConnector(store_dir=str(tmp_path)) as connector:
+        key = connector.put(b'value', ttl=0.05)
+        connector.set(key, b'new-value')
+        time.sleep(0.1)
+
+        assert connector.get(key) == b'new-value'
+        assert connector.sweep() == 0
+        assert connector.exists(key)
+
+
+def test_sweep(tmp_path: pathlib.Path) -> None:
+    with FileConnector(store_dir=str(tmp_path)) as connector:
+        expired = connector.put_batch([b'value1', b'value2'], ttl=0.01)
+        live = connector.put(b'value', ttl=100)
+        other = connector.put(b'value')
+        time.sleep(0.05)
+
+        assert connector.sweep() == len(expired)
+        assert connector.sweep() == 0
+        for key in expired:
+            assert not os.path.exists(tmp_path / key.filename)
+        assert connector.exists(live)
+        assert connector.exists(other)
+
+
+def test_sweep_interval(tmp_path: pathlib.Path) -> None:
+    with FileConnector(
+        store_dir=str(tmp_path),
+        sweep_interval=0.01,
+    ) as connector:
+        key = connector.put(b'value', ttl=0.01)
+        time.sleep(0.1)
+        assert not os.path.exists(tmp_path / key.filename)
+
+        config = connector.config()
+        assert config['sweep_interval'] == 0.01
+
+
+def test_sweep_interval_validation(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match='Sweep interval'):
+        FileConnector(store_dir=str(tmp_path), sweep_interval=0)
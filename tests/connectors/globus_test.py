@@ -3,16 +3,22 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from unittest import mock
 
 import globus_sdk
 import pytest
 
+from proxystore.connectors.globus import _TaskPoller
 from proxystore.connectors.globus import GlobusConnector
 from proxystore.connectors.globus import GlobusEndpoint
 from proxystore.connectors.globus import GlobusEndpoints
 from proxystore.connectors.globus import GlobusKey
+from testing.mocked.globus import MockTransferClient
 
 EP1 = GlobusEndpoint(
     uuid='1',
@@ -182,33 +188,169 @@ def test_globus_connector_init(globus_connector) -> None:
         GlobusConnector(endpoints=[EP1])
 
 
-def test_globus_connector_internals(globus_connector) -> None:
+class _PatchedError(globus_sdk.TransferAPIError):
+    def __init__(self, status: int):
+        self.http_status = status
+
+
+def test_globus_connector_invalid_task(globus_connector) -> None:
+    connector = GlobusConnector.from_config(globus_connector.config())
+
+    with mock.patch.object(
+        connector._transfer_client,
+        'get_task',
+        side_effect=_PatchedError(400),
+    ) as mock_get_task:
+        assert not connector._wait_on_tasks('uuid')
+        assert not connector.exists(GlobusKey('fake', 'fake'))
+        assert not connector.exists(GlobusKey('fake', 'fake'))
+        # Terminal statuses are cached so each task is only checked once.
+        assert mock_get_task.call_count == 2
+
+    connector.close(clear=False)
+
+
+def test_globus_connector_task_error(globus_connector) -> None:
     connector = GlobusConnector.from_config(globus_connector.config())
 
-    class PatchedError(globus_sdk.TransferAPIError):
-        def __init__(self, status: int):
-            self.http_status = status
+    with mock.patch.object(
+        connector._transfer_client,
+        'get_task',
+        side_effect=_PatchedError(401),
+    ):
+        with pytest.raises(globus_sdk.TransferAPIError):
+            connector._wait_on_tasks('uuid')
+
+    # Errors are not cached so the task is checked again.
+    assert connector._wait_on_tasks('uuid')
+
+    connector.close(clear=False)
+
+
+def test_globus_connector_task_timeout(globus_connector) -> None:
+    config = globus_connector.config()
+    config['timeout'] = 0.01
+    connector = GlobusConnector.from_config(config)
+
+    with mock.patch.object(
+        connector._transfer_client,
+        'get_task',
+        return_value={'status': 'ACTIVE'},
+    ):
+        with pytest.raises(RuntimeError, match='timeout'):
+            connector._wait_on_tasks('1234')
+
+    connector.close(clear=False)
+
+
+def test_globus_connector_shared_task_polling(globus_connector) -> None:
+    config = globus_connector.config()
+    config['polling_interval'] = 0.01
+    connector = GlobusConnector.from_config(config)
+    keys = connector.put_batch([b'value'] * 8)
+
+    statuses = iter(['ACTIVE', 'ACTIVE', 'SUCCEEDED'])
+
+    def _get_task(task_id: str) -> dict[str, str]:
+        return {'task_id': task_id, 'status': next(statuses)}
+
+    with mock.patch.object(
+        connector._transfer_client,
+        'get_task',
+        side_effect=_get_task,
+    ) as mock_get_task:
+        with ThreadPoolExecutor(len(keys)) as pool:
+            assert all(pool.map(connector.exists, keys))
+        assert connector.get_batch(keys) == [b'value'] * len(keys)
+
+    # One poller checks the shared task until it completes, regardless of
+    # the number of keys waiting on it.
+    assert mock_get_task.call_count == 3
+
+    connector.close(clear=False)
+
+
+def test_task_poller_cache_size() -> None:
+    client = mock.MagicMock()
+    client.get_task.return_value = {'status': 'SUCCEEDED'}
+    poller = _TaskPoller(client, polling_interval=0.01, cache_size=2)
+
+    for task_id in ('a', 'b', 'a', 'c'):
+        assert poller.wait(task_id, timeout=1) == 'SUCCEEDED'
+
+    # Least recently used status was dropped from the cache
+    assert list(poller._statuses) == ['a', 'c']
+    assert poller._waiters == {}
+    assert client.get_task.call_count == 3
+
+    poller.close()
 
-    def _http_error(status: int):
-        def _error(*args, **kwargs) -> None:
-            raise PatchedError(status)
 
-        return _error
+def test_task_poller_timeout_stops_polling() -> None:
+    client = mock.MagicMock()
+    client.get_task.return_value = {'status': 'ACTIVE'}
+    poller = _TaskPoller(client, polling_interval=0.01)
 
-    connector._transfer_client.get_task = _http_error(400)  # type: ignore
-    assert not connector._validate_task_id('uuid')
-    assert not connector.exists(GlobusKey('fake', 'fake'))
+    errors: list[Exception] = []
 
-    connector._transfer_client.get_task = _http_error(401)  # type: ignore
-    with pytest.raises(globus_sdk.TransferAPIError):
-        connector._validate_task_id('uuid')
+    def _wait(timeout: float) -> None:
+        try:
+            poller.wait('a', timeout=timeout)
+        except RuntimeError as e:
+            errors.append(e)
 
-    def _fail_wait(*args, **kwargs) -> bool:
-        return False
+    # The task is still polled while another thread is waiting on it
+    thread = threading.Thread(target=_wait, args=(0.5,))
+    thread.start()
+    with pytest.raises(RuntimeError, match='timeout'):
+        poller.wait('a', timeout=0.01)
+    assert 'a' in poller._waiters
 
-    connector._transfer_client.task_wait = _fail_wait  # type: ignore
-    with pytest.raises(RuntimeError):
-        connector._wait_on_tasks('1234')
+    thread.join()
+    assert len(errors) == 1
+    assert poller._waiters == {}
+
+    # The polling thread exits once there are no tasks to poll
+    for _ in range(500):  # pragma: no branch
+        if poller._thread is None:
+            break
+        time.sleep(0.01)
+    calls = client.get_task.call_count
+    time.sleep(0.05)
+    assert client.get_task.call_count == calls
+
+    poller.close()
+
+
+def test_task_poller_closed() -> None:
+    client = mock.MagicMock()
+    client.get_task.return_value = {'status': 'ACTIVE'}
+    poller = _TaskPoller(client, polling_interval=0.01)
+
+    errors: list[Exception] = []
+
+    def _wait() -> None:
+        try:
+            poller.wait('a', timeout=10)
+        except RuntimeError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=_wait)
+    thread.start()
+    while client.get_task.call_count == 0:
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    poller.close()
+    thread.join()
+    # Waiters are woken when the poller is closed
+    assert time.perf_counter() - start < 5
+    assert len(errors) == 1
+    assert 'closed' in str(errors[0])
+    assert poller._thread is None
+
+    with pytest.raises(RuntimeError, match='closed'):
+        poller.wait('b', timeout=10)
 
 
 def test_get_filepath(globus_connector) -> None:
@@ -304,6 +446,7 @@ def test_delete_local_paths_on_close(
     with (
         mock.patch(
             'proxystore.connectors.globus.get_transfer_client',
+            MockTransferClient,
         ),
         mock.patch(
             'proxystore.connectors.globus._submit_transfer_action',
@@ -317,3 +460,91 @@ def test_delete_local_paths_on_close(
         assert mocked.call_count == 0
     else:
         assert mocked.call_count == len(endpoints)
+
+
+def test_coalesce_bad_arguments() -> None:
+    with pytest.raises(ValueError, match='window'):
+        GlobusConnector(endpoints=[EP1, EP2], coalesce_window=0)
+    with pytest.raises(ValueError, match='max size'):
+        GlobusConnector(endpoints=[EP1, EP2], coalesce_max_size=0)
+
+
+def _coalescing_connector(
+    globus_connector: GlobusConnector,
+    **kwargs: Any,
+) -> GlobusConnector:
+    config = globus_connector.config()
+    config.update(kwargs)
+    return GlobusConnector.from_config(config)
+
+
+def test_coalesce_puts_across_threads(globus_connector) -> None:
+    connector = _coalescing_connector(
+        globus_connector,
+        coalesce_window=10,
+        coalesce_max_size=4,
+    )
+    client = connector._transfer_client
+    values = [f'value{i}'.encode() for i in range(4)]
+
+    with mock.patch.object(
+        client,
+        'submit_transfer',
+        wraps=client.submit_transfer,
+    ) as mock_submit:
+        # Filling the transfer submits it without waiting for the window.
+        with ThreadPoolExecutor(len(values)) as pool:
+            keys = list(pool.map(connector.put, values))
+
+    mock_submit.assert_called_once()
+    assert len({key.task_id for key in keys}) == 1
+    assert connector.get_batch(keys) == values
+
+
+def test_coalesce_max_size(globus_connector) -> None:
+    connector = _coalescing_connector(
+        globus_connector,
+        coalesce_window=10,
+        coalesce_max_size=2,
+    )
+    client = connector._transfer_client
+
+    with mock.patch.object(
+        client,
+        'submit_transfer',
+        wraps=client.submit_transfer,
+    ) as mock_submit:
+        with ThreadPoolExecutor(4) as pool:
+            keys = list(pool.map(connector.put, [b'value'] * 4))
+
+    assert mock_submit.call_count == 2
+    assert len({key.task_id for key in keys}) == 2
+
+
+def test_coalesce_window_elapsed(globus_connector) -> None:
+    connector = _coalescing_connector(globus_connector, coalesce_window=0.01)
+
+    key1 = connector.put(b'value1')
+    key2 = connector.put(b'value2')
+    assert key1.task_id != key2.task_id
+    assert connector.get(key1) == b'value1'
+    assert connector.get(key2) == b'value2'
+
+
+def test_coalesce_submit_error(globus_connector) -> None:
+    connector = _coalescing_connector(
+        globus_connector,
+        coalesce_window=10,
+        coalesce_max_size=3,
+    )
+
+    with mock.patch.object(
+        connector._transfer_client,
+        'submit_transfer',
+        side_effect=RuntimeError('submit failed'),
+    ):
+        with ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(connector.put, b'value') for _ in range(3)]
+            for future in futures:
+                with pytest.raises(RuntimeError, match='submit failed'):
+                    future.result()
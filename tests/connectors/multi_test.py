@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import json
+import time
 from collections.abc import Generator
 from typing import Any
 from unittest import mock
@@ -9,6 +10,8 @@ from unittest import mock
 import pytest
 
 from proxystore.connectors.local import LocalConnector
+from proxystore.connectors.multi import _OperationEstimate
+from proxystore.connectors.multi import ADAPTIVE_MIN_SAMPLES
 from proxystore.connectors.multi import MultiConnector
 from proxystore.connectors.multi import MultiConnectorError
 from proxystore.connectors.multi import Policy
@@ -90,6 +93,7 @@ def test_policy_superset_tags_validation() -> None:
         Policy(priority=42),
         Policy(min_size_bytes=1, max_size_bytes=2),
         Policy(subset_tags=['a', 'b'], superset_tags=['c']),
+        Policy(adaptive=True),
     ),
 )
 def test_policy_dict_jsonable(policy: Policy) -> None:
@@ -102,6 +106,7 @@ def test_policy_dict_jsonable(policy: Policy) -> None:
         Policy(priority=42),
         Policy(min_size_bytes=1, max_size_bytes=2),
         Policy(subset_tags=['a', 'b'], superset_tags=['c']),
+        Policy(adaptive=True),
     ),
 )
 def test_policy_dict_conversion(policy: Policy) -> None:
@@ -176,20 +181,24 @@ def test_multi_connector_from_config() -> None:
 
 def test_dormant_connectors() -> None:
     with mock.patch('proxystore.utils.hostname') as mock_hostname:
+        # Host validity is computed when the MultiConnector is created so
+        # the hostname must be set first.
+        mock_hostname.return_value = 'otherhost'
         with multi_connector_from_policies(
             Policy(host_pattern='testhost', subset_tags=['a']),
             Policy(host_pattern='otherhost', subset_tags=['b']),
         ) as (multi_connector, _, _):
-            mock_hostname.return_value = 'otherhost'
             key2 = multi_connector.put(b'data', subset_tags=['b'])
-            mock_hostname.return_value = 'testhost'
-            key1 = multi_connector.put(b'data', subset_tags=['a'])
+            with pytest.raises(MultiConnectorError, match='constraints'):
+                multi_connector.put(b'data', subset_tags=['a'])
 
             config = multi_connector.config()
             # Reinitalizing the connector from a config will result in
             # the second connector being dormant because it's host pattern
             # did not match the hostname.
+            mock_hostname.return_value = 'testhost'
             remote_connector = MultiConnector.from_config(config)
+            key1 = remote_connector.put(b'data', subset_tags=['a'])
             assert remote_connector.exists(key1)
 
             assert remote_connector.dormant_connectors is not None
@@ -202,3 +211,195 @@ def test_dormant_connectors() -> None:
                 match='dormant',
             ):
                 remote_connector.get(key2)
+
+
+def test_host_validity_computed_once() -> None:
+    with mock.patch(
+        'proxystore.utils.hostname',
+        return_value='testhost',
+    ) as mock_hostname:
+        with multi_connector_from_policies(
+            Policy(priority=1, host_pattern=['test.*', 'other.*']),
+            Policy(priority=2, host_pattern='other.*'),
+        ) as (multi_connector, connector1, _):
+            calls = mock_hostname.call_count
+            keys = [multi_connector.put(b'data') for _ in range(3)]
+            keys.extend(multi_connector.put_batch([b'data', b'data']))
+            assert mock_hostname.call_count == calls
+
+            assert all(key.connector_name == 'c1' for key in keys)
+            assert all(connector1.exists(key.connector_key) for key in keys)
+
+
+def test_batch_grouped_by_connector() -> None:
+    with multi_connector_from_policies(
+        Policy(max_size_bytes=1),
+        Policy(min_size_bytes=2),
+    ) as (multi_connector, connector1, connector2):
+        values = [b'a', b'value', b'b', b'value', b'c']
+
+        with (
+            mock.patch.object(
+                connector1,
+                'put_batch',
+                wraps=connector1.put_batch,
+            ) as mock_put1,
+            mock.patch.object(
+                connector2,
+                'put_batch',
+                wraps=connector2.put_batch,
+            ) as mock_put2,
+        ):
+            keys = multi_connector.put_batch(values)
+        mock_put1.assert_called_once()
+        mock_put2.assert_called_once()
+
+        names = [key.connector_name for key in keys]
+        assert names == ['c1', 'c2', 'c1', 'c2', 'c1']
+
+        with (
+            mock.patch.object(
+                connector1,
+                'get_batch',
+                wraps=connector1.get_batch,
+            ) as mock_get1,
+            mock.patch.object(
+                connector2,
+                'get_batch',
+                wraps=connector2.get_batch,
+            ) as mock_get2,
+        ):
+            assert multi_connector.get_batch(keys) == values
+        mock_get1.assert_called_once()
+        mock_get2.assert_called_once()
+
+
+def test_put_batch_no_valid_stores_nothing() -> None:
+    with multi_connector_from_policies(
+        Policy(max_size_bytes=1),
+        Policy(max_size_bytes=1),
+    ) as (multi_connector, connector1, connector2):
+        with pytest.raises(MultiConnectorError, match='policy'):
+            multi_connector.put_batch([b'a', b'value'])
+        assert len(connector1._store) == 0
+        assert len(connector2._store) == 0
+
+
+def test_operation_estimate_fit() -> None:
+    estimate = _OperationEstimate()
+    for size in (100, 1000, 10000, 100000):
+        estimate.record(size, 0.001 + size * 1e-6)
+
+    assert estimate.latency() == pytest.approx(0.001)
+    assert estimate.inverse_bandwidth() == pytest.approx(1e-6)
+    assert estimate.predict(500) == pytest.approx(0.0015)
+
+
+def test_operation_estimate_single_size() -> None:
+    estimate = _OperationEstimate()
+    estimate.record(100, 0.002)
+    estimate.record(100, 0.004)
+
+    assert estimate.inverse_bandwidth() == 0
+    assert 0.002 < estimate.predict(1000) < 0.004
+
+
+def test_adaptive_picks_fastest() -> None:
+    with multi_connector_from_policies(
+        Policy(priority=2, adaptive=True),
+        Policy(priority=1, adaptive=True),
+    ) as (multi_connector, connector1, _):
+        put = connector1.put
+
+        def _slow_put(obj: bytes) -> Any:
+            time.sleep(0.01)
+            return put(obj)
+
+        with mock.patch.object(connector1, 'put', side_effect=_slow_put):
+            # Each connector is measured first in priority order.
+            names = [
+                multi_connector.put(b'value').connector_name
+                for _ in range(2 * ADAPTIVE_MIN_SAMPLES)
+            ]
+            assert names == (['c1'] * ADAPTIVE_MIN_SAMPLES) + (
+                ['c2'] * ADAPTIVE_MIN_SAMPLES
+            )
+
+            key = multi_connector.put(b'value')
+            assert key.connector_name == 'c2'
+            keys = multi_connector.put_batch([b'value', b'value'])
+            assert all(key.connector_name == 'c2' for key in keys)
+
+
+def test_adaptive_failure_fallback() -> None:
+    with multi_connector_from_policies(
+        Policy(priority=2, adaptive=True),
+        Policy(priority=1, adaptive=True),
+    ) as (multi_connector, connector1, connector2):
+        with mock.patch.object(
+            connector1,
+            'put',
+            side_effect=RuntimeError,
+        ) as mock_put:
+            key = multi_connector.put(b'value')
+            assert key.connector_name == 'c2'
+            assert connector2.exists(key.connector_key)
+
+            # Failing connector is avoided while in backoff.
+            key = multi_connector.put(b'value')
+            assert key.connector_name == 'c2'
+            mock_put.assert_called_once()
+
+        with mock.patch.object(
+            connector2,
+            'put_batch',
+            side_effect=RuntimeError,
+        ):
+            keys = multi_connector.put_batch([b'value'])
+            assert keys[0].connector_name == 'c1'
+
+
+def test_adaptive_all_fail() -> None:
+    with multi_connector_from_policies(
+        Policy(adaptive=True),
+        Policy(adaptive=True),
+    ) as (multi_connector, connector1, connector2):
+        with (
+            mock.patch.object(connector1, 'put', side_effect=RuntimeError),
+            mock.patch.object(connector2, 'put', side_effect=RuntimeError),
+        ):
+            with pytest.raises(RuntimeError):
+                multi_connector.put(b'value')
+
+
+def test_adaptive_static_priority_precedence() -> None:
+    with multi_connector_from_policies(
+        Policy(priority=2, max_size_bytes=10),
+        Policy(priority=1, adaptive=True),
+    ) as (multi_connector, connector1, _):
+        with mock.patch.object(
+            connector1,
+            'put',
+            side_effect=RuntimeError,
+        ):
+            # Non-adaptive policies do not fall back on error.
+            with pytest.raises(RuntimeError):
+                multi_connector.put(b'value')
+
+        key = multi_connector.put(b'x' * 100)
+        assert key.connector_name == 'c2'
+
+
+def test_adaptive_records_gets() -> None:
+    with multi_connector_from_policies(
+        Policy(adaptive=True),
+        Policy(),
+    ) as (multi_connector, _, _):
+        keys = multi_connector.put_batch([b'value', b'other'])
+        multi_connector.get(keys[0])
+        multi_connector.get_batch(keys)
+
+        estimate = multi_connector._estimates['c1']
+        assert estimate.put.samples == 1
+        assert estimate.get.samples == 2
+        assert 'c2' not in multi_connector._estimates
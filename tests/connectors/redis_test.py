@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 from proxystore.connectors.redis import RedisConnector
 
 
@@ -34,3 +36,28 @@ def test_multiple_closed_connectors(redis_connector) -> None:
     connector1.close(clear=True)
     connector2.close(clear=True)
     assert not connector2.exists(key)
+
+
+def test_put_with_ttl(redis_connector) -> None:
+    connector = RedisConnector('localhost', 0)
+    key = connector.put(b'value', ttl=0.05)
+    other = connector.put(b'value')
+
+    assert connector.get(key) == b'value'
+    time.sleep(0.1)
+    assert not connector.exists(key)
+    assert connector.get(key) is None
+    assert connector.exists(other)
+
+    connector.close()
+
+
+def test_put_batch_with_ttl(redis_connector) -> None:
+    connector = RedisConnector('localhost', 0)
+    keys = connector.put_batch([b'value1', b'value2'], ttl=0.05)
+
+    assert connector.get_batch(keys) == [b'value1', b'value2']
+    time.sleep(0.1)
+    assert connector.get_batch(keys) == [None, None]
+
+    connector.close()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pathlib
+import time
+from unittest import mock
+
+import pytest
+
+from proxystore.connectors.sqlite import SQLiteConnector
+from proxystore.connectors.sqlite import SQLiteKey
+from testing.compat import randbytes
+
+
+def test_close_persists_by_default(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'blobs.db'
+    connector = SQLiteConnector(path)
+    key = connector.put(b'value')
+    connector.close()
+
+    assert path.exists()
+    connector = SQLiteConnector(path)
+    assert connector.get(key) == b'value'
+    connector.close(clear=True)
+    assert not path.exists()
+
+
+def test_creates_parent_directories(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'a' / 'b' / 'blobs.db'
+    with SQLiteConnector(path, clear=True) as connector:
+        assert path.exists()
+        assert connector.database_path == str(path)
+
+
+def test_wal_journal_mode(tmp_path: pathlib.Path) -> None:
+    with SQLiteConnector(tmp_path / 'blobs.db') as connector:
+        conn = connector._connection()
+        (mode,) = conn.execute('PRAGMA journal_mode').fetchone()
+        assert mode == 'wal'
+
+
+def test_bad_blob_chunk_size(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match='chunk size'):
+        SQLiteConnector(tmp_path / 'blobs.db', blob_chunk_size=0)
+
+
+def test_incremental_blob_io(tmp_path: pathlib.Path) -> None:
+    with SQLiteConnector(
+        tmp_path / 'blobs.db',
+        blob_chunk_size=100,
+    ) as connector:
+        small = randbytes(50)
+        large = randbytes(1001)
+        keys = connector.put_batch([small, large])
+        assert connector.get_batch(keys) == [small, large]
+
+        key = connector.put(memoryview(large))
+        assert connector.get(key) == large
+
+
+def test_evict_batch(tmp_path: pathlib.Path) -> None:
+    with SQLiteConnector(tmp_path / 'blobs.db') as connector:
+        keys = connector.put_batch([b'value1', b'value2', b'value3'])
+        connector.evict_batch(keys[:2])
+        assert connector.get_batch(keys) == [None, None, b'value3']
+
+
+def test_put_batch_is_atomic(tmp_path: pathlib.Path) -> None:
+    with SQLiteConnector(tmp_path / 'blobs.db') as connector:
+        # The second object is not bytes-like so the transaction should
+        # be rolled back after the first object was written.
+        objs = [b'value', object()]
+        with pytest.raises(TypeError):
+            connector.put_batch(objs)  # type: ignore[arg-type]
+
+        conn = connector._connection()
+        assert conn.execute('SELECT count(*) FROM blobs').fetchone() == (0,)
+
+
+def test_put_with_ttl(tmp_path: pathlib.Path) -> None:
+    with SQLiteConnector(tmp_path / 'blobs.db') as connector:
+        key = connector.put(b'value', ttl=0.05)
+        keys = connector.put_batch([b'value1', b'value2'], ttl=0.05)
+        other = connector.put(b'value')
+
+        assert connector.exists(key)
+        time.sleep(0.1)
+        assert not connector.exists(key)
+        assert connector.get(key) is None
+        assert connector.get_batch(keys) == [None, None]
+        assert connector.exists(other)
+
+        assert connector.sweep() == 3
+        assert connector.sweep() == 0
+
+
+def test_reconnects_in_new_process(tmp_path: pathlib.Path) -> None:
+    with SQLiteConnector(tmp_path / 'blobs.db') as connector:
+        key = connector.put(b'value')
+        conn = connector._connection()
+
+        with mock.patch('os.getpid', return_value=os.getpid() + 1):
+            assert connector.get(key) == b'value'
+            assert connector._connection() is not conn
+
+
+def _get_in_subprocess(
+    config: dict[str, object],
+    key: SQLiteKey,
+    queue: multiprocessing.Queue[bytes | None],
+) -> None:
+    connector = SQLiteConnector.from_config(config)
+    queue.put(bytes(connector.get(key) or b''))
+    connector.close()
+
+
+def test_concurrent_readers_across_processes(tmp_path: pathlib.Path) -> None:
+    with SQLiteConnector(tmp_path / 'blobs.db') as connector:
+        key = connector.put(b'value')
+
+        ctx = multiprocessing.get_context('spawn')
+        queue: multiprocessing.Queue[bytes | None] = ctx.Queue()
+        processes = [
+            ctx.Process(
+                target=_get_in_subprocess,
+                args=(connector.config(), key, queue),
+            )
+            for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert [queue.get(), queue.get()] == [b'value', b'value']
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import pathlib
+import time
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+
+from proxystore.connectors.file import FileConnector
+from proxystore.connectors.local import LocalConnector
+from proxystore.connectors.multi import MultiConnector
+from proxystore.connectors.tiered import TieredConnector
+
+
+@pytest.fixture
+def tiers(
+    tmp_path: pathlib.Path,
+) -> Generator[tuple[LocalConnector, FileConnector], None, None]:
+    with LocalConnector() as hot, FileConnector(str(tmp_path)) as cold:
+        yield hot, cold
+
+
+def test_not_deferrable(
+    tiers: tuple[LocalConnector, FileConnector],
+) -> None:
+    _, cold = tiers
+    with pytest.raises(TypeError, match='DeferrableConnector'):
+        TieredConnector(MultiConnector({}), cold)
+
+
+def test_bad_interval(tiers: tuple[LocalConnector, FileConnector]) -> None:
+    with pytest.raises(ValueError, match='Interval'):
+        TieredConnector(*tiers, interval=0)
+
+
+def test_put_in_hot_tier(tiers: tuple[LocalConnector, FileConnector]) -> None:
+    hot, cold = tiers
+    connector = TieredConnector(hot, cold, demote_after=None)
+
+    key = connector.put(b'value')
+    assert hot.exists(key.hot_key)
+    assert not cold.exists(key.cold_key)
+    assert connector.hot_bytes == len(b'value')
+
+    keys = connector.put_batch([b'a', b'b'])
+    assert all(hot.exists(key.hot_key) for key in keys)
+    assert connector.hot_bytes == len(b'value') + 2
+
+    connector.evict(key)
+    assert connector.hot_bytes == 2
+
+
+def test_demote_stable_key(
+    tiers: tuple[LocalConnector, FileConnector],
+) -> None:
+    hot, cold = tiers
+    connector = TieredConnector(hot, cold, demote_after=None)
+
+    key = connector.put(b'value')
+    assert connector.demote(key)
+    assert not connector.demote(key)
+    assert not hot.exists(key.hot_key)
+    assert cold.exists(key.cold_key)
+    assert connector.hot_bytes == 0
+
+    assert connector.exists(key)
+    assert connector.get(key) == b'value'
+    assert connector.get_batch([key]) == [b'value']
+
+    connector.evict(key)
+    assert not connector.exists(key)
+    assert connector.get(key) is None
+
+
+def test_demote_evicted_from_hot_tier(
+    tiers: tuple[LocalConnector, FileConnector],
+) -> None:
+    hot, cold = tiers
+    connector = TieredConnector(hot, cold, demote_after=None)
+
+    key = connector.put(b'value')
+    hot.evict(key.hot_key)
+    assert not connector.demote(key)
+    assert not cold.exists(key.cold_key)
+
+
+def test_demote_evicted_during_copy(
+    tiers: tuple[LocalConnector, FileConnector],
+) -> None:
+    hot, cold = tiers
+    connector = TieredConnector(hot, cold, demote_after=None)
+
+    key = connector.put(b'value')
+    set_ = cold.set
+
+    def _set_and_evict(*args, **kwargs) -> None:
+        set_(*args, **kwargs)
+        connector._untrack(key)
+
+    with mock.patch.object(cold, 'set', side_effect=_set_and_evict):
+        assert not connector.demote(key)
+    assert not cold.exists(key.cold_key)
+
+
+def test_flush(tiers: tuple[LocalConnector, FileConnector]) -> None:
+    hot, cold = tiers
+    connector = TieredConnector(hot, cold, demote_after=None)
+
+    keys = connector.put_batch([b'a', b'b', b'c'])
+    assert connector.flush() == len(keys)
+    assert all(cold.exists(key.cold_key) for key in keys)
+    assert all(not hot.exists(key.hot_key) for key in keys)
+    assert connector.get_batch(keys) == [b'a', b'b', b'c']
+
+
+def test_demote_by_age(tiers: tuple[LocalConnector, FileConnector]) -> None:
+    hot, cold = tiers
+    with TieredConnector(
+        hot,
+        cold,
+        demote_after=0.01,
+        interval=0.01,
+    ) as connector:
+        key = connector.put(b'value')
+        for _ in range(100):
+            if cold.exists(key.cold_key):
+                break
+            time.sleep(0.01)
+        else:  # pragma: no cover
+            raise AssertionError('Object was not demoted.')
+        assert connector.get(key) == b'value'
+
+
+def test_demote_by_memory_pressure(
+    tiers: tuple[LocalConnector, FileConnector],
+) -> None:
+    hot, cold = tiers
+    connector = TieredConnector(
+        hot,
+        cold,
+        demote_after=None,
+        max_hot_bytes=10,
+    )
+
+    # Background thread is woken by the put exceeding max_hot_bytes.
+    with mock.patch.object(connector._demoter_wake, 'set'):
+        keys = connector.put_batch([b'x' * 4, b'y' * 4, b'z' * 4])
+    assert connector._demote_ready() == 1
+    assert cold.exists(keys[0].cold_key)
+    assert hot.exists(keys[1].hot_key)
+    assert hot.exists(keys[2].hot_key)
+    assert connector.hot_bytes == 8
+
+    connector.close()
+
+
+def test_promote_on_get(tiers: tuple[LocalConnector, FileConnector]) -> None:
+    hot, cold = tiers
+    connector = TieredConnector(
+        hot,
+        cold,
+        demote_after=None,
+        promote_on_get=True,
+    )
+
+    keys = connector.put_batch([b'a', b'b'])
+    connector.flush()
+
+    assert connector.get(keys[0]) == b'a'
+    assert hot.exists(keys[0].hot_key)
+    assert connector.get_batch(keys) == [b'a', b'b']
+    assert hot.exists(keys[1].hot_key)
+    assert connector.hot_bytes == 2
+
+    # Promoted objects are already in the cold tier so demotion only
+    # needs to remove the hot copy.
+    with mock.patch.object(cold, 'set') as mock_set:
+        assert connector.flush() == len(keys)
+    mock_set.assert_not_called()
+    assert connector.get_batch(keys) == [b'a', b'b']
+
+
+def test_from_config(tiers: tuple[LocalConnector, FileConnector]) -> None:
+    connector = TieredConnector(*tiers, demote_after=5, max_hot_bytes=100)
+    config = connector.config()
+    new_connector = TieredConnector.from_config(config)
+
+    assert isinstance(new_connector.hot, LocalConnector)
+    assert isinstance(new_connector.cold, FileConnector)
+    assert new_connector.demote_after == connector.demote_after
+    assert new_connector.max_hot_bytes == connector.max_hot_bytes
+
+    new_connector.close()
+    connector.close()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.metadata
+import json
 import logging
 import os
 import pathlib
@@ -306,3 +307,64 @@ def test_test_command_unexpected_error(
         assert result.exit_code == 1
         assert len(caplog.records) == 1
         caplog.clear()
+
+
+def test_stats_command(home_dir, endpoint: EndpointConfig) -> None:
+    with mock.patch('proxystore.endpoint.cli.home_dir', return_value=home_dir):
+        endpoint_dir = os.path.join(home_dir, endpoint.name)
+        write_config(endpoint, endpoint_dir)
+
+        runner = click.testing.CliRunner()
+
+        result = runner.invoke(cli, ['stats', endpoint.name])
+        assert result.exit_code == 0
+        stats = json.loads(result.output)
+        assert stats['uuid'] == endpoint.uuid
+
+        # Fallback to TCP when the endpoint is not served on a socket
+        write_config(
+            endpoint.model_copy(update={'socket_path': None}),
+            endpoint_dir,
+        )
+        result = runner.invoke(
+            cli,
+            ['stats', endpoint.name, '--format', 'prometheus'],
+        )
+        assert result.exit_code == 0
+        assert 'proxystore_endpoint_storage_blobs' in result.output
+
+
+def test_stats_command_errors(
+    home_dir,
+    caplog,
+    endpoint: EndpointConfig,
+) -> None:
+    caplog.set_level(logging.ERROR)
+
+    with mock.patch('proxystore.endpoint.cli.home_dir', return_value=home_dir):
+        runner = click.testing.CliRunner()
+
+        result = runner.invoke(cli, ['stats', 'fake-name'])
+        assert result.exit_code == 1
+        assert 'does not exist' in caplog.records[0].message
+        caplog.clear()
+
+        endpoint_dir = os.path.join(home_dir, endpoint.name)
+        write_config(endpoint, endpoint_dir)
+
+        with mock.patch(
+            'proxystore.endpoint.client.metrics',
+            side_effect=requests.exceptions.ConnectionError,
+        ):
+            result = runner.invoke(cli, ['stats', endpoint.name])
+        assert result.exit_code == 1
+        assert 'Unable to connect' in caplog.records[0].message
+        caplog.clear()
+
+        with mock.patch(
+            'proxystore.endpoint.client.metrics',
+            side_effect=requests.exceptions.RequestException,
+        ):
+            result = runner.invoke(cli, ['stats', endpoint.name])
+        assert result.exit_code == 1
+        assert len(caplog.records) == 1
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import io
+import pathlib
+import time
 import uuid
 from unittest import mock
 
@@ -8,6 +11,7 @@ import requests
 
 from proxystore.endpoint import client
 from proxystore.endpoint.config import EndpointConfig
+from proxystore.endpoint.multipart import decode_multipart
 
 
 def test_basic_client_interaction(endpoint: EndpointConfig) -> None:
@@ -24,6 +28,26 @@ def test_basic_client_interaction(endpoint: EndpointConfig) -> None:
     assert client.get(address, key) is None
 
 
+def test_client_metrics(endpoint: EndpointConfig) -> None:
+    address = f'http://{endpoint.host}:{endpoint.port}'
+    client.put(address, str(uuid.uuid4()), b'test')
+
+    stats = client.metrics(address)
+    assert stats['uuid'] == endpoint.uuid
+    assert stats['routes']['/set']['count'] >= 1
+    assert stats['storage']['blobs'] >= 1
+
+
+def test_client_put_with_ttl(endpoint: EndpointConfig) -> None:
+    address = f'http://{endpoint.host}:{endpoint.port}'
+    key = str(uuid.uuid4())
+
+    client.put(address, key, b'test', ttl=0.05)
+    assert client.exists(address, key)
+    time.sleep(0.1)
+    assert not client.exists(address, key)
+
+
 def test_client_interaction_with_session(endpoint: EndpointConfig) -> None:
     address = f'http://{endpoint.host}:{endpoint.port}'
     key = str(uuid.uuid4())
@@ -39,6 +63,121 @@ def test_client_interaction_with_session(endpoint: EndpointConfig) -> None:
         assert client.get(address, key, session=session) is None
 
 
+def test_batch_client_interaction(endpoint: EndpointConfig) -> None:
+    address = f'http://{endpoint.host}:{endpoint.port}'
+    keys = [str(uuid.uuid4()) for _ in range(3)]
+    data = [b'test1', b'test2', b'']
+
+    with requests.Session() as session:
+        client.put_batch(address, keys, data, session=session, ttl=60)
+        assert client.exists_batch(address, keys) == [True, True, True]
+        assert client.get_batch(address, keys, session=session) == data
+
+        endpoints = [uuid.UUID(endpoint.uuid), None, endpoint.uuid]
+        client.evict_batch(address, keys[:2], endpoints[:2])
+        assert client.exists_batch(address, keys, endpoints) == [
+            False,
+            False,
+            True,
+        ]
+        assert client.get_batch(address, keys) == [None, None, b'']
+
+
+def test_unix_socket_client_interaction(endpoint: EndpointConfig) -> None:
+    assert endpoint.socket_path is not None
+    address = client.unix_socket_address(endpoint.socket_path)
+    assert address.startswith(f'{client.UNIX_SOCKET_SCHEME}://')
+    key = str(uuid.uuid4())
+    data = b'test'
+
+    client.put(address, key, data)
+    assert client.exists(address, key)
+    assert client.get(address, key) == data
+
+    with requests.Session() as session:
+        session.mount(
+            f'{client.UNIX_SOCKET_SCHEME}://',
+            client.UnixSocketAdapter(),
+        )
+        assert session.get(f'{address}/', timeout=5).ok
+        assert client.get_batch(address, [key], session=session) == [data]
+        client.evict(address, key, session=session)
+        assert not client.exists(address, key, session=session)
+
+
+def test_unix_socket_connection_error(tmp_path: pathlib.Path) -> None:
+    address = client.unix_socket_address(str(tmp_path / 'missing.sock'))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.exists(address, 'key')
+
+
+def test_batch_length_mismatch() -> None:
+    address = 'http://localhost:8539'
+
+    with pytest.raises(ValueError, match='2 keys but 1 endpoints'):
+        client.get_batch(address, ['a', 'b'], [None])
+
+    with pytest.raises(ValueError, match='2 keys but 1 values'):
+        client.put_batch(address, ['a', 'b'], [b'data'])
+
+
+def test_put_batch_content_length() -> None:
+    address = 'http://localhost:8539'
+    data: list[bytes | bytearray | memoryview] = [
+        b'x' * 100,
+        bytearray(b'y' * 10),
+        memoryview(b'z' * 5),
+    ]
+
+    response = requests.Response()
+    response.status_code = 200
+    with mock.patch('requests.post', return_value=response) as mock_post:
+        client.put_batch(address, ['a', 'b', 'c'], data)
+
+    kwargs = mock_post.call_args.kwargs
+    request = requests.Request(
+        'POST',
+        mock_post.call_args.args[0],
+        headers=kwargs['headers'],
+        data=kwargs['data'],
+    ).prepare()
+    assert 'Transfer-Encoding' not in request.headers
+    body = b''.join(kwargs['data'])
+    assert int(request.headers['Content-Length']) == len(body)
+    assert decode_multipart(body)[1:] == data
+
+
+def _mock_response(data: bytes, headers: dict[str, str]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(data)
+    response.headers.update(headers)
+    return response
+
+
+@pytest.mark.parametrize(
+    'headers',
+    ({}, {'Content-Length': '100'}, {'Content-Encoding': 'identity'}),
+)
+def test_get_response_body(headers: dict[str, str]) -> None:
+    data = b'x' * 100
+    response = _mock_response(data, headers)
+    with mock.patch('requests.get', return_value=response):
+        assert client.get('http://localhost:8539', 'key') == data
+
+
+def test_get_response_body_truncated() -> None:
+    response = _mock_response(b'x' * 50, {'Content-Length': '100'})
+    with (
+        mock.patch('requests.get', return_value=response),
+        pytest.raises(
+            requests.exceptions.RequestException,
+            match='ended after 50 of 100 bytes',
+        ),
+    ):
+        client.get('http://localhost:8539', 'key')
+
+
 def test_errors_raised() -> None:
     address = 'http://localhost:8539'
     key = 'abcd'
@@ -53,9 +192,24 @@ def test_errors_raised() -> None:
         with pytest.raises(requests.exceptions.RequestException):
             client.put(address, key, b'data')
 
+        with pytest.raises(requests.exceptions.RequestException):
+            client.evict_batch(address, [key])
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.exists_batch(address, [key])
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get_batch(address, [key])
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.put_batch(address, [key], [b'data'])
+
     with mock.patch('requests.get', return_value=response):
         with pytest.raises(requests.exceptions.RequestException):
             client.exists(address, key)
 
         with pytest.raises(requests.exceptions.RequestException):
             client.get(address, key)
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.metrics(address)
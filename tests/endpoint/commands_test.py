@@ -102,6 +102,7 @@ def test_configure_endpoint_basic(tmp_path: pathlib.Path, caplog) -> None:
     assert cfg.host is None
     assert cfg.port == _PORT
     assert cfg.relay.address == _SERVER
+    assert cfg.socket_path is None
 
     assert any(
         [
@@ -111,6 +112,21 @@ def test_configure_endpoint_basic(tmp_path: pathlib.Path, caplog) -> None:
     )
 
 
+def test_configure_endpoint_unix_socket(tmp_path: pathlib.Path) -> None:
+    rv = configure_endpoint(
+        name=_NAME,
+        port=_PORT,
+        relay_server=_SERVER,
+        proxystore_dir=str(tmp_path),
+        unix_socket=True,
+    )
+    assert rv == 0
+
+    endpoint_dir = os.path.join(tmp_path, _NAME)
+    cfg = read_config(endpoint_dir)
+    assert cfg.socket_path == os.path.join(endpoint_dir, 'endpoint.sock')
+
+
 def test_configure_endpoint_home_dir(tmp_path: pathlib.Path) -> None:
     with mock.patch(
         'proxystore.endpoint.commands.home_dir',
@@ -106,6 +106,16 @@ def test_validate_name(name: str, valid: bool) -> None:
     assert validate_name(name) == valid
 
 
+def test_config_socket_path_expanded() -> None:
+    config = EndpointConfig(
+        name='name',
+        uuid=str(uuid.uuid4()),
+        port=1234,
+        socket_path='~/endpoint.sock',
+    )
+    assert config.socket_path == os.path.expanduser('~/endpoint.sock')
+
+
 @pytest.mark.parametrize(
     ('bad_cfg', 'valid'),
     (
@@ -141,6 +151,13 @@ def test_validate_config(bad_cfg: Any, valid: bool) -> None:
         ({'address': 'https://'}, False),
         ({'peer_channels': 1}, True),
         ({'peer_channels': 0}, False),
+        ({'max_peer_requests': 1}, True),
+        ({'max_peer_requests': 0}, False),
+        ({'peer_idle_timeout': None}, True),
+        ({'peer_idle_timeout': 60}, True),
+        ({'peer_idle_timeout': 0}, False),
+        ({'warm_peers': [str(uuid.uuid4())]}, True),
+        ({'warm_peers': ['abc']}, False),
     ),
 )
 def test_validate_relay_config(bad_cfg: Any, valid: bool) -> None:
@@ -157,6 +174,15 @@ def test_validate_relay_config(bad_cfg: Any, valid: bool) -> None:
         ({'max_object_size': 0}, False),
         ({'max_object_size': 1}, True),
         ({'max_object_size': -1}, False),
+        ({'max_request_size': 0}, False),
+        ({'max_request_size': None}, True),
+        ({'max_memory_size': 0, 'database_path': 'blobs.db'}, True),
+        ({'max_memory_size': -1, 'database_path': 'blobs.db'}, False),
+        ({'max_memory_size': 100}, False),
+        ({'commit_window': 0.01}, True),
+        ({'commit_window': -1}, False),
+        ({'replica_cache_size': 0}, True),
+        ({'replica_cache_size': -1}, False),
     ),
 )
 def test_validate_storage_config(bad_cfg: Any, valid: bool) -> None:
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
+from collections import deque
 from collections.abc import AsyncGenerator
+from typing import Any
+from unittest import mock
 
 import pytest
 import pytest_asyncio
 
+from proxystore.endpoint.endpoint import _ReplicaCache
 from proxystore.endpoint.endpoint import Endpoint
 from proxystore.endpoint.exceptions import PeeringNotAvailableError
 from proxystore.endpoint.exceptions import PeerRequestError
+from proxystore.endpoint.messages import encode_message
+from proxystore.endpoint.messages import EndpointBatchRequest
 from proxystore.endpoint.messages import EndpointRequest
 from proxystore.p2p.manager import PeerManager
 from proxystore.p2p.relay.client import RelayClient
-from proxystore.serialize import serialize
 from testing.compat import randbytes
 
 
@@ -57,6 +64,9 @@ async def test_set(endpoints: tuple[Endpoint, Endpoint]) -> None:
     data = randbytes(100)
     await endpoint1.set(key, data, endpoint=endpoint2.uuid)
     assert (await endpoint2.get(key)) == data
+    # Data decoded from the peer message is copied rather than stored as a
+    # view into the message buffer.
+    assert isinstance(await endpoint2._storage.get(key), bytes)
 
 
 @pytest.mark.asyncio
@@ -166,7 +176,7 @@ async def test_unsupported_peer_message(
 
     assert endpoint2._peer_manager is not None
     endpoint2._peer_manager._message_queue.put_nowait(
-        (endpoint1.uuid, b'nonsense_message'),
+        (endpoint1.uuid, bytearray(b'nonsense_message')),
     )
     # Make request to endpoint 2 to establish connection
     key = str(uuid.uuid4())
@@ -193,17 +203,17 @@ async def test_unexpected_response(
     assert not (await endpoint1.exists('key', endpoint=endpoint2.uuid))
 
     # Add bad message to queue
-    message = serialize(
+    message = encode_message(
         EndpointRequest(
             kind='request',
             op='evict',
-            uuid='1234',
+            uuid=str(uuid.uuid4()),
             key='key',
         ),
     )
     assert endpoint2._peer_manager is not None
     endpoint2._peer_manager._message_queue.put_nowait(
-        (endpoint1.uuid, message),
+        (endpoint1.uuid, bytearray(b''.join(message))),
     )
 
     # Make request to endpoint 2 to flush queue
@@ -215,3 +225,630 @@ async def test_unexpected_response(
             for record in caplog.records
         ],
     )
+
+
+@pytest.mark.asyncio
+async def test_batch_operations(endpoints: tuple[Endpoint, Endpoint]) -> None:
+    endpoint1, endpoint2 = endpoints
+    keys = [str(uuid.uuid4()) for _ in range(4)]
+    data = [randbytes(100) for _ in keys]
+    targets = [None, endpoint2.uuid, endpoint1.uuid, endpoint2.uuid]
+
+    await endpoint1.set_batch(keys, data, targets)
+    assert await endpoint1.exists_batch(keys) == [True, False, True, False]
+    assert await endpoint2.exists_batch(keys) == [False, True, False, True]
+    assert await endpoint1.get_batch(keys, targets) == data
+    # None is the local endpoint so resolve it to endpoint1 for endpoint2
+    resolved = [endpoint1.uuid, *targets[1:]]
+    assert await endpoint2.get_batch(keys, resolved) == data
+
+    await endpoint2.evict_batch(keys[:2], resolved[:2])
+    assert await endpoint1.exists_batch(keys, targets) == [
+        False,
+        False,
+        True,
+        True,
+    ]
+    assert await endpoint1.get_batch(keys[:2], targets[:2]) == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_batch_grouped_by_peer(
+    endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = endpoints
+    keys = [str(uuid.uuid4()) for _ in range(4)]
+    data = [randbytes(100) for _ in keys]
+    targets = [endpoint2.uuid, None, endpoint2.uuid, endpoint2.uuid]
+
+    with mock.patch.object(
+        endpoint1,
+        '_request_from_peer',
+        wraps=endpoint1._request_from_peer,
+    ) as mock_request:
+        await endpoint1.set_batch(keys, data, targets)
+        assert mock_request.call_count == 1
+        assert await endpoint1.get_batch(keys, targets) == data
+        assert mock_request.call_count == 2
+
+    request = mock_request.call_args.args[1]
+    assert isinstance(request, EndpointBatchRequest)
+    assert request.keys == [keys[0], keys[2], keys[3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_remote_error_propogation(
+    endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = endpoints
+    key = str(uuid.uuid4())
+    with pytest.raises(AssertionError):
+        await endpoint1.set_batch(
+            [key],
+            [None],  # type: ignore[list-item]
+            [endpoint2.uuid],
+        )
+
+
+@pytest_asyncio.fixture()
+async def caching_endpoints(
+    relay_server,
+) -> AsyncGenerator[tuple[Endpoint, Endpoint], None]:
+    relay_client_1 = RelayClient(
+        relay_server.address,
+        client_name='test-caching-endpoint-1',
+    )
+    relay_client_2 = RelayClient(
+        relay_server.address,
+        client_name='test-caching-endpoint-2',
+    )
+    peer_manager_1 = await PeerManager(relay_client_1)
+    peer_manager_2 = await PeerManager(relay_client_2)
+    async with Endpoint(
+        peer_manager=peer_manager_1,
+        replica_cache_size=1000,
+    ) as ep1:
+        async with Endpoint(peer_manager=peer_manager_2) as ep2:
+            yield (ep1, ep2)
+
+
+async def _wait_for_invalidation(endpoint: Endpoint) -> None:
+    assert endpoint._replicas is not None
+    for _ in range(500):  # pragma: no branch
+        if len(endpoint._replicas) == 0:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('Replica was not invalidated.')  # pragma: no cover
+
+
+def test_replica_cache_lru() -> None:
+    endpoint = uuid.uuid4()
+    cache = _ReplicaCache(max_bytes=10)
+
+    cache.put(endpoint, 'key1', b'x' * 4)
+    cache.put(endpoint, 'key2', b'x' * 4)
+    assert cache.get(endpoint, 'key1') == b'x' * 4
+    cache.put(endpoint, 'key3', b'x' * 4)
+    assert cache.size == 8
+    assert cache.get(endpoint, 'key2') is None
+    assert cache.get(uuid.uuid4(), 'key1') is None
+
+    # Blobs larger than the budget are not cached
+    cache.put(endpoint, 'key1', b'x' * 20)
+    assert cache.get(endpoint, 'key1') is None
+    assert len(cache) == 1
+
+    # Views are copied so the cache does not keep the underlying buffer
+    buffer = bytearray(b'x' * 8)
+    cache.put(endpoint, 'key4', memoryview(buffer)[:2])
+    blob = cache.get(endpoint, 'key4')
+    assert isinstance(blob, bytes)
+    assert blob == b'xx'
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+@pytest.mark.asyncio
+async def test_replica_read_through(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    key = str(uuid.uuid4())
+    data = randbytes(100)
+    await endpoint2.set(key, data)
+
+    with mock.patch.object(
+        endpoint1,
+        '_request_from_peer',
+        wraps=endpoint1._request_from_peer,
+    ) as mock_request:
+        assert await endpoint1.get(key, endpoint=endpoint2.uuid) == data
+        assert mock_request.call_count == 1
+        assert await endpoint1.get(key, endpoint=endpoint2.uuid) == data
+        assert await endpoint1.exists(key, endpoint=endpoint2.uuid)
+        assert mock_request.call_count == 1
+
+    # Replicas are only stored in the cache and not in the local storage
+    assert not await endpoint1.exists(key)
+    assert endpoint1._replicas is not None
+    assert isinstance(endpoint1._replicas.get(endpoint2.uuid, key), bytes)
+
+
+@pytest.mark.asyncio
+async def test_replica_invalidated_by_owner(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    key = str(uuid.uuid4())
+    await endpoint2.set(key, b'old')
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'old'
+
+    # Overwriting on the owner invalidates the replica
+    await endpoint2.set(key, b'new')
+    await _wait_for_invalidation(endpoint1)
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'new'
+
+    # Evicting on the owner invalidates the replica
+    await endpoint2.evict(key)
+    await _wait_for_invalidation(endpoint1)
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) is None
+    assert not await endpoint1.exists(key, endpoint=endpoint2.uuid)
+
+
+@pytest.mark.asyncio
+async def test_replica_dropped_on_local_write(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    key = str(uuid.uuid4())
+    await endpoint2.set(key, b'old')
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'old'
+
+    await endpoint1.set(key, b'new', endpoint=endpoint2.uuid)
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'new'
+
+    await endpoint1.evict(key, endpoint=endpoint2.uuid)
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) is None
+
+
+@pytest.mark.asyncio
+async def test_replica_batch(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    keys = [str(uuid.uuid4()) for _ in range(3)]
+    data = [randbytes(100) for _ in keys]
+    targets = [endpoint2.uuid] * len(keys)
+    await endpoint2.set_batch(keys[:2], data[:2])
+
+    with mock.patch.object(
+        endpoint1,
+        '_request_from_peer',
+        wraps=endpoint1._request_from_peer,
+    ) as mock_request:
+        expected = [*data[:2], None]
+        assert await endpoint1.get_batch(keys, targets) == expected
+        assert mock_request.call_count == 1
+
+        # Only the missing key needs to be requested from the peer
+        assert await endpoint1.get_batch(keys, targets) == expected
+        assert await endpoint1.exists_batch(keys, targets) == [
+            True,
+            True,
+            False,
+        ]
+        assert mock_request.call_count == 3
+        request = mock_request.call_args.args[1]
+        assert request.keys == [keys[2]]
+
+        # All keys are replicas so no requests are needed
+        assert await endpoint1.get_batch(keys[:2], targets[:2]) == data[:2]
+        assert mock_request.call_count == 3
+
+    assert endpoint1._replicas is not None
+    for key in keys[:2]:
+        blob = endpoint1._replicas.get(endpoint2.uuid, key)
+        assert isinstance(blob, bytes)
+
+    await endpoint2.evict_batch(keys[:1])
+    await endpoint1.evict_batch(keys[1:2], targets[1:2])
+    await _wait_for_invalidation(endpoint1)
+    assert await endpoint1.get_batch(keys, targets) == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_replica_batch_not_cached_after_write(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    keys = [str(uuid.uuid4()) for _ in range(2)]
+    targets = [endpoint2.uuid] * len(keys)
+    await endpoint2.set_batch(keys, [b'old', b'old'])
+
+    gate = asyncio.Event()
+    request_from_peer = endpoint1._request_from_peer
+
+    async def _gated(*args: Any) -> Any:
+        future = await request_from_peer(*args)
+        if args[1].op == 'get':
+            # Response to the get is delayed until after the write
+            await future
+            await gate.wait()
+        return future
+
+    with mock.patch.object(endpoint1, '_request_from_peer', new=_gated):
+        task = asyncio.create_task(endpoint1.get_batch(keys, targets))
+        await asyncio.sleep(0.01)
+        assert len(endpoint1._batch_reads) == 1
+        await endpoint1.set(keys[0], b'new', endpoint=endpoint2.uuid)
+        # Writes to other keys do not affect the read
+        await endpoint1.set('other', b'new', endpoint=endpoint2.uuid)
+        gate.set()
+        assert await task == [b'old', b'old']
+
+    assert len(endpoint1._batch_reads) == 0
+    assert endpoint1._replicas is not None
+    # The result for the key written during the read is not cached
+    assert endpoint1._replicas.get(endpoint2.uuid, keys[0]) is None
+    assert endpoint1._replicas.get(endpoint2.uuid, keys[1]) == b'old'
+    assert await endpoint1.get(keys[0], endpoint=endpoint2.uuid) == b'new'
+
+
+@pytest.mark.asyncio
+async def test_replica_holders_bounded(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    keys = [str(uuid.uuid4()) for _ in range(3)]
+    for key in keys:
+        await endpoint2.set(key, b'data')
+
+    assert endpoint1._replicas is not None
+    with mock.patch('proxystore.endpoint.endpoint._MAX_REPLICA_HOLDERS', 2):
+        for key in keys[:2]:
+            assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'data'
+        # Fetching again refreshes the first key in the LRU order
+        endpoint1._replicas.evict(endpoint2.uuid, keys[0])
+        assert await endpoint1.get(keys[0], endpoint=endpoint2.uuid) == b'data'
+        assert await endpoint1.get(keys[2], endpoint=endpoint2.uuid) == b'data'
+
+    assert list(endpoint2._replica_holders) == [keys[0], keys[2]]
+    await asyncio.gather(*endpoint2._invalidation_tasks)
+    # The replica of the key no longer tracked was invalidated
+    assert endpoint1._replicas.get(endpoint2.uuid, keys[1]) is None
+    assert endpoint1._replicas.get(endpoint2.uuid, keys[0]) == b'data'
+
+    # Reads by the endpoint itself are not tracked
+    endpoint2._record_replica(endpoint2.uuid, keys[1], b'data')
+    assert keys[1] not in endpoint2._replica_holders
+
+
+@pytest.mark.asyncio
+async def test_replica_holders_dropped_on_expiry(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    key = str(uuid.uuid4())
+    await endpoint2.set(key, b'data', ttl=60)
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'data'
+    assert key in endpoint2._replica_holders
+
+    # Expire the key without going through the endpoint
+    with mock.patch('time.time', return_value=time.time() + 120):
+        assert await endpoint2.get(key) is None
+    assert endpoint1._replicas is not None
+    endpoint1._replicas.evict(endpoint2.uuid, key)
+    assert await endpoint1.get_batch([key], [endpoint2.uuid]) == [None]
+    assert key not in endpoint2._replica_holders
+
+
+@pytest.mark.asyncio
+async def test_replica_invalidation_failure(
+    endpoints: tuple[Endpoint, Endpoint],
+    caplog,
+) -> None:
+    caplog.set_level(logging.WARNING)
+    _, endpoint2 = endpoints
+    key = str(uuid.uuid4())
+    await endpoint2.set(key, b'data')
+    endpoint2._record_replica(uuid.uuid4(), key, b'data')
+
+    with mock.patch.object(
+        endpoint2.peer_manager,
+        'send',
+        side_effect=Exception('send failed'),
+    ):
+        await endpoint2.evict(key)
+        await asyncio.gather(*endpoint2._invalidation_tasks)
+
+    assert any('failed to invalidate' in r.message for r in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_invalidations(relay_server) -> None:
+    relay_client = RelayClient(
+        relay_server.address,
+        client_name='test-close-cancels-invalidations',
+    )
+    peer_manager = await PeerManager(relay_client)
+    endpoint = await Endpoint(peer_manager=peer_manager)
+    endpoint._record_replica(uuid.uuid4(), 'key', b'data')
+
+    async def _hang(*args: Any) -> None:
+        await asyncio.Event().wait()
+
+    with mock.patch.object(endpoint, '_send_invalidations', new=_hang):
+        await endpoint.evict('key')
+        assert len(endpoint._invalidation_tasks) == 1
+        # Let the task start before it is cancelled
+        await asyncio.sleep(0)
+        assert len(endpoint._invalidation_tasks) == 1
+        await endpoint.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_concurrent_requests(
+    endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = endpoints
+    key = str(uuid.uuid4())
+    data = randbytes(100)
+    await endpoint2.set(key, data)
+
+    with mock.patch.object(
+        endpoint1,
+        '_request_from_peer',
+        wraps=endpoint1._request_from_peer,
+    ) as mock_request:
+        results = await asyncio.gather(
+            *(endpoint1.get(key, endpoint=endpoint2.uuid) for _ in range(5)),
+            *(
+                endpoint1.exists(key, endpoint=endpoint2.uuid)
+                for _ in range(5)
+            ),
+        )
+        # One get and one exists request are sent to the peer
+        assert mock_request.call_count == 2
+
+    assert results == [data] * 5 + [True] * 5
+    assert len(endpoint1._inflight) == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_shares_errors(
+    endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = endpoints
+    calls = 0
+
+    async def _fail(*args: Any) -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise PeerRequestError('failed')
+
+    with mock.patch.object(endpoint1, '_request_from_peer', new=_fail):
+        results = await asyncio.gather(
+            *(endpoint1.get('key', endpoint=endpoint2.uuid) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    assert calls == 1
+    assert all(isinstance(r, PeerRequestError) for r in results)
+    assert len(endpoint1._inflight) == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_caller_cancelled(
+    caching_endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = caching_endpoints
+    key = str(uuid.uuid4())
+    await endpoint2.set(key, b'old')
+
+    gate = asyncio.Event()
+    request_from_peer = endpoint1._request_from_peer
+
+    async def _gated(*args: Any) -> Any:
+        if args[1].op == 'get':
+            await gate.wait()
+        return await request_from_peer(*args)
+
+    with mock.patch.object(endpoint1, '_request_from_peer', new=_gated):
+        task1 = asyncio.create_task(
+            endpoint1.get(key, endpoint=endpoint2.uuid),
+        )
+        task2 = asyncio.create_task(
+            endpoint1.get(key, endpoint=endpoint2.uuid),
+        )
+        await asyncio.sleep(0.01)
+        assert len(endpoint1._inflight) == 1
+
+        # Cancelling one caller does not cancel the shared request
+        task1.cancel()
+        # A write issued while the read is in-flight is not joined by
+        # later reads and the stale result is not cached
+        await endpoint1.set(key, b'new', endpoint=endpoint2.uuid)
+        task3 = asyncio.create_task(
+            endpoint1.get(key, endpoint=endpoint2.uuid),
+        )
+        await asyncio.sleep(0.01)
+        assert len(endpoint1._inflight) == 1
+
+        gate.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task1
+        assert await task2 in (b'old', b'new')
+        assert await task3 == b'new'
+
+    assert len(endpoint1._inflight) == 0
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'new'
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_inflight_requests(relay_server) -> None:
+    relay_client = RelayClient(
+        relay_server.address,
+        client_name='test-close-cancels-inflight',
+    )
+    peer_manager = await PeerManager(relay_client)
+    endpoint = await Endpoint(peer_manager=peer_manager)
+
+    async def _hang(*args: Any) -> None:
+        await asyncio.Event().wait()
+
+    with mock.patch.object(endpoint, '_request_from_peer', new=_hang):
+        task = asyncio.create_task(endpoint.get('key', endpoint=uuid.uuid4()))
+        await asyncio.sleep(0)
+        await endpoint.close()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_stats(endpoints: tuple[Endpoint, Endpoint]) -> None:
+    endpoint1, endpoint2 = endpoints
+    key = str(uuid.uuid4())
+    await endpoint1.set(key, b'data', endpoint=endpoint2.uuid)
+    assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'data'
+    await endpoint1.set_batch(
+        ['a', 'b'],
+        [b'x', b'yy'],
+        endpoints=[endpoint2.uuid, endpoint2.uuid],
+    )
+
+    stats = await endpoint1.stats()
+    assert stats['mode'] == 'PEERING'
+    assert stats['relay_connected']
+    assert stats['peer_connections'] == {str(endpoint2.uuid): 'connected'}
+    assert stats['peer_connection_events'] == {
+        'opened': 1,
+        'warmed': 0,
+        'idle_closed': 0,
+    }
+    assert stats['peer_requests_in_flight'] == 0
+    assert stats['peer_requests']['set']['count'] == 1
+    assert stats['peer_requests']['set']['bytes_sent'] == 4
+    assert stats['peer_requests']['get']['bytes_received'] == 4
+    assert stats['peer_requests']['set_batch']['bytes_sent'] == 3
+
+    with pytest.raises(AssertionError):
+        await endpoint1.set(key, None, endpoint=endpoint2.uuid)  # type: ignore
+    stats = await endpoint1.stats()
+    assert stats['peer_requests']['set']['errors'] == 1
+
+
+@pytest.mark.asyncio
+async def test_stats_request_send_failure(relay_server) -> None:
+    relay_client = RelayClient(
+        relay_server.address,
+        client_name='test-stats-send-failure',
+    )
+    peer_manager = await PeerManager(relay_client)
+    async with Endpoint(peer_manager=peer_manager) as endpoint:
+        with mock.patch.object(
+            peer_manager,
+            'send',
+            side_effect=RuntimeError('failed'),
+        ):
+            with pytest.raises(PeerRequestError, match='failed'):
+                await endpoint.get('key', endpoint=uuid.uuid4())
+
+        stats = await endpoint.stats()
+        assert stats['peer_requests_in_flight'] == 0
+        assert stats['peer_requests']['get']['errors'] == 1
+
+
+@pytest.mark.asyncio
+async def test_peer_requests_processed_concurrently(
+    endpoints: tuple[Endpoint, Endpoint],
+) -> None:
+    endpoint1, endpoint2 = endpoints
+    await endpoint2.set('slow', b'data')
+
+    gate = asyncio.Event()
+    get = endpoint2._storage.get
+
+    async def _slow_get(key: str, default: Any = None) -> Any:
+        if key == 'slow':
+            await gate.wait()
+        return await get(key, default)
+
+    with mock.patch.object(endpoint2._storage, 'get', new=_slow_get):
+        slow = asyncio.create_task(
+            endpoint1.get('slow', endpoint=endpoint2.uuid),
+        )
+        # Requests from the same peer are not blocked by the slow request
+        assert not await asyncio.wait_for(
+            endpoint1.exists('fast', endpoint=endpoint2.uuid),
+            timeout=5,
+        )
+        assert not slow.done()
+        gate.set()
+        assert await slow == b'data'
+
+
+@pytest.mark.asyncio
+async def test_peer_requests_round_robin() -> None:
+    endpoint = Endpoint('test', uuid.uuid4(), max_peer_requests=1)
+    peer1, peer2 = uuid.uuid4(), uuid.uuid4()
+    processed: list[tuple[uuid.UUID, str]] = []
+
+    async def _respond(source: uuid.UUID, message: EndpointRequest) -> None:
+        assert len(endpoint._peer_request_tasks) == 1
+        processed.append((source, message.key))
+
+    for source, key in ((peer1, 'a'), (peer1, 'b'), (peer1, 'c')):
+        endpoint._peer_request_queues.setdefault(source, deque()).append(
+            EndpointRequest(kind='request', op='get', uuid='', key=key),
+        )
+    endpoint._peer_request_queues.setdefault(peer2, deque()).append(
+        EndpointRequest(kind='request', op='get', uuid='', key='d'),
+    )
+
+    with mock.patch.object(endpoint, '_respond_to_peer', new=_respond):
+        endpoint._dispatch_peer_requests()
+        while len(endpoint._peer_request_tasks) > 0:
+            await asyncio.sleep(0)
+
+    assert processed == [
+        (peer1, 'a'),
+        (peer2, 'd'),
+        (peer1, 'b'),
+        (peer1, 'c'),
+    ]
+    assert len(endpoint._peer_request_queues) == 0
+    await endpoint.close()
+
+
+def test_max_peer_requests_validation() -> None:
+    with pytest.raises(ValueError, match='max_peer_requests'):
+        Endpoint('test', uuid.uuid4(), max_peer_requests=0)
+
+
+@pytest.mark.asyncio
+async def test_peer_response_send_failure(
+    endpoints: tuple[Endpoint, Endpoint],
+    caplog,
+) -> None:
+    caplog.set_level(logging.ERROR)
+    endpoint1, endpoint2 = endpoints
+    request = EndpointRequest(
+        kind='request',
+        op='exists',
+        uuid=str(uuid.uuid4()),
+        key='k',
+    )
+
+    assert endpoint2._peer_manager is not None
+    with mock.patch.object(
+        endpoint2._peer_manager,
+        'send',
+        side_effect=RuntimeError('closed'),
+    ):
+        await endpoint2._respond_to_peer(endpoint1.uuid, request)
+
+    assert request.kind == 'response'
+    assert any('failed to send exists' in r.message for r in caplog.records)
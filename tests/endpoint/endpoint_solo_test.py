@@ -75,3 +75,47 @@ async def test_exists() -> None:
         assert not (await endpoint.exists('key'))
         await endpoint.set('key', data)
         assert await endpoint.exists('key')
+
+
+@pytest.mark.asyncio
+async def test_batch_operations() -> None:
+    async with Endpoint(name=_NAME, uuid=_UUID) as endpoint:
+        keys = ['key1', 'key2', 'key3']
+        data = [randbytes(100) for _ in keys]
+        # Endpoints are ignored in solo mode
+        endpoints = [None, _UUID, uuid.uuid4()]
+
+        await endpoint.set_batch(keys, data, endpoints)
+        assert await endpoint.exists_batch(keys) == [True, True, True]
+        assert await endpoint.get_batch([*keys, 'missing']) == [*data, None]
+
+        await endpoint.evict_batch(keys[:2], endpoints[:2])
+        assert await endpoint.exists_batch(keys) == [False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_batch_length_mismatch() -> None:
+    async with Endpoint(name=_NAME, uuid=_UUID) as endpoint:
+        with pytest.raises(ValueError, match='2 keys but 1 endpoints'):
+            await endpoint.get_batch(['key1', 'key2'], [None])
+
+        with pytest.raises(ValueError, match='2 keys but 1 values'):
+            await endpoint.set_batch(['key1', 'key2'], [b'data'])
+
+
+@pytest.mark.asyncio
+async def test_stats() -> None:
+    async with Endpoint(name=_NAME, uuid=_UUID) as endpoint:
+        await endpoint.set('key', b'data')
+        stats = await endpoint.stats()
+
+    assert stats['uuid'] == str(_UUID)
+    assert stats['name'] == _NAME
+    assert stats['mode'] == 'SOLO'
+    assert stats['routes'] == {}
+    assert stats['peer_requests'] == {}
+    assert stats['peer_requests_in_flight'] == 0
+    assert stats['storage'] == {'blobs': 1, 'total_bytes': 4}
+    assert stats['relay_connected'] is None
+    assert stats['peer_connections'] == {}
+    assert stats['peer_connection_events'] == {}
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import struct
+import threading
+import uuid
+
+import pytest
+
+from proxystore.endpoint.exceptions import PeerRequestError
+from proxystore.endpoint.messages import decode_message
+from proxystore.endpoint.messages import encode_message
+from proxystore.endpoint.messages import EndpointBatchRequest
+from proxystore.endpoint.messages import EndpointRequest
+from testing.compat import randbytes
+
+
+@pytest.mark.parametrize(
+    'message',
+    (
+        EndpointRequest(
+            kind='request',
+            op='set',
+            uuid=str(uuid.uuid4()),
+            key='key',
+            data=b'data',
+            ttl=1.5,
+        ),
+        EndpointRequest(
+            kind='response',
+            op='exists',
+            uuid=str(uuid.uuid4()),
+            key='key',
+            exists=False,
+        ),
+        EndpointRequest(
+            kind='response',
+            op='get',
+            uuid=str(uuid.uuid4()),
+            key='ключ',
+            data=b'',
+        ),
+        EndpointRequest(
+            kind='request',
+            op='invalidate',
+            uuid=str(uuid.uuid4()),
+            key='key',
+        ),
+        EndpointBatchRequest(
+            kind='response',
+            op='get',
+            uuid=str(uuid.uuid4()),
+            keys=['a', 'b', 'c'],
+            data=[b'a', None, b''],
+        ),
+        EndpointBatchRequest(
+            kind='response',
+            op='exists',
+            uuid=str(uuid.uuid4()),
+            keys=['a', 'b'],
+            exists=[True, False],
+        ),
+        EndpointBatchRequest(
+            kind='request',
+            op='evict',
+            uuid=str(uuid.uuid4()),
+            keys=[],
+        ),
+    ),
+)
+def test_encode_decode_round_trip(
+    message: EndpointRequest | EndpointBatchRequest,
+) -> None:
+    assert decode_message(b''.join(encode_message(message))) == message
+
+
+def test_blob_is_not_pickled() -> None:
+    data = randbytes(10000)
+    message = EndpointRequest(
+        kind='response',
+        op='get',
+        uuid=str(uuid.uuid4()),
+        key='key',
+        data=bytearray(data),
+    )
+    parts = encode_message(message)
+    # The blob is referenced by the encoded message rather than copied
+    assert parts[-1] is message.data
+    encoded = b''.join(parts)
+    assert len(encoded) < len(data) + 64
+    decoded = decode_message(encoded)
+    assert decoded.data == data
+    assert isinstance(decoded.data, memoryview)
+    assert decoded.data.obj is encoded
+
+
+def test_error_round_trip() -> None:
+    message = EndpointRequest(
+        kind='response',
+        op='get',
+        uuid=str(uuid.uuid4()),
+        key='key',
+        error=ValueError('bad value'),
+    )
+    decoded = decode_message(b''.join(encode_message(message)))
+    assert isinstance(decoded.error, ValueError)
+    assert str(decoded.error) == 'bad value'
+
+
+def test_unpicklable_error() -> None:
+    class _UnpicklableError(Exception):
+        def __init__(self) -> None:
+            super().__init__('unpicklable')
+            self.lock = threading.Lock()
+
+    message = EndpointRequest(
+        kind='response',
+        op='get',
+        uuid=str(uuid.uuid4()),
+        key='key',
+        error=_UnpicklableError(),
+    )
+    decoded = decode_message(b''.join(encode_message(message)))
+    assert isinstance(decoded.error, PeerRequestError)
+    assert '_UnpicklableError: unpicklable' in str(decoded.error)
+
+
+def _encode(**kwargs: object) -> bytes:
+    options: dict[str, object] = {
+        'kind': 'request',
+        'op': 'get',
+        'uuid': str(uuid.uuid4()),
+        'key': 'key',
+    }
+    options.update(kwargs)
+    message = EndpointRequest(**options)  # type: ignore[arg-type]
+    return b''.join(encode_message(message))
+
+
+def test_decode_bad_version() -> None:
+    with pytest.raises(ValueError, match='version'):
+        decode_message(b'\x00' + _encode()[1:])
+
+
+def test_decode_truncated() -> None:
+    with pytest.raises(ValueError, match='truncated'):
+        decode_message(b'nonsense')
+    with pytest.raises(ValueError, match='truncated'):
+        decode_message(_encode(data=b'data')[:-1])
+
+
+def test_decode_trailing_bytes() -> None:
+    with pytest.raises(ValueError, match='trailing'):
+        decode_message(_encode() + b'\x00')
+
+
+def test_decode_unknown_kind_or_op() -> None:
+    encoded = bytearray(_encode())
+    encoded[2] = 255
+    with pytest.raises(ValueError, match='Unknown'):
+        decode_message(bytes(encoded))
+
+
+def test_decode_bad_key_count() -> None:
+    encoded = bytearray(_encode())
+    # Key count is the last field of the header.
+    struct.pack_into('!I', encoded, 28, 0)
+    with pytest.raises(ValueError, match='one key'):
+        decode_message(bytes(encoded[:32]))
+
+
+def test_decode_batch_invalidate() -> None:
+    message = EndpointBatchRequest(
+        kind='request',
+        op='invalidate',  # type: ignore[arg-type]
+        uuid=str(uuid.uuid4()),
+        keys=['key'],
+    )
+    with pytest.raises(ValueError, match='invalidate'):
+        decode_message(b''.join(encode_message(message)))
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import Any
+
+from proxystore.endpoint.metrics import EndpointMetrics
+from proxystore.endpoint.metrics import format_prometheus
+from proxystore.endpoint.metrics import LatencyHistogram
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram(buckets=(1.0, 0.1))
+    assert histogram.buckets == (0.1, 1.0)
+
+    for latency in (0.05, 0.1, 0.5, 5):
+        histogram.observe(latency)
+
+    assert histogram.as_dict() == {
+        'count': 4,
+        'sum': 5.65,
+        'buckets': {'0.1': 2, '1.0': 3, '+Inf': 4},
+    }
+
+
+def test_endpoint_metrics() -> None:
+    metrics = EndpointMetrics()
+    metrics.record_route('/get', 0.01, bytes_sent=100)
+    metrics.record_route('/get', 0.02, error=True)
+    metrics.record_peer_request('set', 0.1, bytes_sent=10)
+    metrics.record_peer_request('get', 0.1, bytes_received=20)
+
+    get = metrics.routes['/get'].as_dict()
+    assert get['count'] == 2
+    assert get['errors'] == 1
+    assert get['bytes_sent'] == 100
+    assert get['bytes_received'] == 0
+    assert get['latency']['count'] == 2
+
+    assert metrics.peer_requests['set'].bytes_sent == 10
+    assert metrics.peer_requests['get'].bytes_received == 20
+
+
+def _stats(**kwargs: Any) -> dict[str, Any]:
+    metrics = EndpointMetrics()
+    metrics.record_route('/get', 0.01, bytes_sent=100)
+    metrics.record_peer_request('get_batch', 0.1, error=True)
+    stats = {
+        'routes': {k: v.as_dict() for k, v in metrics.routes.items()},
+        'peer_requests': {
+            k: v.as_dict() for k, v in metrics.peer_requests.items()
+        },
+        'peer_requests_in_flight': 3,
+        'storage': {'blobs': 2, 'total_bytes': 42},
+        'relay_connected': None,
+        'peer_connections': {},
+        'peer_connection_events': {},
+    }
+    stats.update(kwargs)
+    return stats
+
+
+def test_format_prometheus() -> None:
+    text = format_prometheus(_stats())
+    lines = text.splitlines()
+    assert text.endswith('\n')
+
+    assert '# TYPE proxystore_endpoint_requests_total counter' in lines
+    assert 'proxystore_endpoint_requests_total{route="/get"} 1' in lines
+    assert (
+        'proxystore_endpoint_requests_sent_bytes_total{route="/get"} 100'
+        in lines
+    )
+    assert (
+        '# TYPE proxystore_endpoint_requests_duration_seconds histogram'
+        in lines
+    )
+    assert (
+        'proxystore_endpoint_requests_duration_seconds_bucket'
+        '{route="/get",le="+Inf"} 1' in lines
+    )
+    assert (
+        'proxystore_endpoint_peer_requests_errors_total{op="get_batch"} 1'
+        in lines
+    )
+    assert 'proxystore_endpoint_peer_requests_in_flight 3' in lines
+    assert 'proxystore_endpoint_storage_blobs 2' in lines
+    assert 'proxystore_endpoint_storage_bytes 42' in lines
+    # Relay metrics are omitted for endpoints in solo mode
+    assert 'relay_connected' not in text
+
+
+def test_format_prometheus_peers() -> None:
+    stats = _stats(
+        relay_connected=True,
+        peer_connections={'abc': 'connected', 'a"b\\c\n': 'new'},
+        peer_connection_events={'opened': 3, 'idle_closed': 1},
+    )
+    lines = format_prometheus(stats).splitlines()
+
+    assert 'proxystore_endpoint_relay_connected 1' in lines
+    assert (
+        'proxystore_endpoint_peer_connection_state'
+        '{peer="abc",state="connected"} 1' in lines
+    )
+    assert (
+        'proxystore_endpoint_peer_connection_state'
+        '{peer="a\\"b\\\\c\\n",state="new"} 1' in lines
+    )
+    assert (
+        'proxystore_endpoint_peer_connection_events_total{event="opened"} 3'
+        in lines
+    )
+    assert (
+        'proxystore_endpoint_peer_connection_events_total'
+        '{event="idle_closed"} 1' in lines
+    )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from proxystore.endpoint.multipart import decode_multipart
+from proxystore.endpoint.multipart import encode_multipart
+from proxystore.endpoint.multipart import encoded_length
+from testing.compat import randbytes
+
+
+@pytest.mark.parametrize(
+    'parts',
+    (
+        [],
+        [b''],
+        [None],
+        [b'abc', None, b'', randbytes(1000)],
+    ),
+)
+def test_multipart_round_trip(parts: list[bytes | None]) -> None:
+    body = b''.join(encode_multipart(parts, chunk_length=100))
+    assert decode_multipart(body) == parts
+    assert encoded_length(parts) == len(body)
+
+
+def test_multipart_decode_views() -> None:
+    body = bytearray(b''.join(encode_multipart([b'abc', None, b'def'])))
+    parts = decode_multipart(body)
+
+    assert isinstance(parts[0], memoryview)
+    assert parts[1] is None
+    # Parts are views of the body rather than copies
+    body[-1:] = b'x'
+    assert parts[2] == b'dex'
+
+
+def test_multipart_chunked() -> None:
+    data = randbytes(1000)
+    chunks = list(encode_multipart([data], chunk_length=100))
+    # Header plus ten chunks of data
+    assert len(chunks) == 11
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+def test_multipart_truncated() -> None:
+    body = b''.join(encode_multipart([b'abcdef']))
+
+    with pytest.raises(ValueError, match='truncated in header'):
+        decode_multipart(body[:4])
+
+    with pytest.raises(ValueError, match='truncated in part'):
+        decode_multipart(body[:-1])
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import multiprocessing
 import os
 import pathlib
+import socket
+import stat
 import time
 import uuid
 from collections.abc import AsyncGenerator
+from collections.abc import Sequence
+from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock
 
@@ -19,10 +24,15 @@ from globus_sdk.token_storage import TokenValidationError
 from proxystore.endpoint.config import EndpointConfig
 from proxystore.endpoint.config import EndpointStorageConfig
 from proxystore.endpoint.endpoint import Endpoint
+from proxystore.endpoint.multipart import decode_multipart
+from proxystore.endpoint.multipart import encode_multipart
+from proxystore.endpoint.serve import _bind_unix_socket
 from proxystore.endpoint.serve import _get_auth_headers
 from proxystore.endpoint.serve import create_app
 from proxystore.endpoint.serve import MAX_CHUNK_LENGTH
 from proxystore.endpoint.serve import serve
+from proxystore.endpoint.storage import DictStorage
+from proxystore.endpoint.storage import TieredStorage
 from proxystore.utils.data import chunk_bytes
 from testing.compat import randbytes
 from testing.mocked.globus import get_testing_app
@@ -51,6 +61,47 @@ async def test_running(quart_app) -> None:
     assert len((await response.get_json())['uuid']) > 0
 
 
+@pytest.mark.asyncio
+async def test_metrics_request(quart_app) -> None:
+    client = quart_app.test_client()
+    data = randbytes(100)
+    await client.post(
+        '/set',
+        headers={'Content-Type': 'application/octet-stream'},
+        query_string={'key': 'my-key'},
+        data=data,
+    )
+    await client.get('/get', query_string={'key': 'my-key'})
+    missing = await client.get('/get', query_string={'key': 'missing-key'})
+    missing_length = len(await missing.get_data())
+
+    response = await client.get('/metrics', query_string={'format': 'json'})
+    assert response.status_code == 200
+    stats = await response.get_json()
+    assert stats['uuid'] == str(quart_app.endpoint.uuid)
+    assert stats['routes']['/set']['count'] == 1
+    assert stats['routes']['/set']['bytes_received'] == len(data)
+    assert stats['routes']['/get']['count'] == 2
+    assert stats['routes']['/get']['errors'] == 1
+    assert stats['routes']['/get']['bytes_sent'] == len(data) + missing_length
+    assert stats['storage'] == {'blobs': 1, 'total_bytes': len(data)}
+
+    response = await client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain')
+    text = await response.get_data(as_text=True)
+    assert 'proxystore_endpoint_requests_total{route="/set"} 1' in text
+    assert 'proxystore_endpoint_storage_blobs 1' in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_request_bad_format(quart_app) -> None:
+    client = quart_app.test_client()
+    response = await client.get('/metrics', query_string={'format': 'xml'})
+    assert response.status_code == 400
+    assert await response.get_data(as_text=True) == 'unsupported format: xml'
+
+
 @pytest.mark.asyncio
 async def test_set_request(quart_app) -> None:
     client = quart_app.test_client()
@@ -97,6 +148,38 @@ async def test_get_request(quart_app) -> None:
     assert get_response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_set_request_with_ttl(quart_app) -> None:
+    client = quart_app.test_client()
+    set_response = await client.post(
+        '/set',
+        headers={'Content-Type': 'application/octet-stream'},
+        query_string={'key': 'my-key', 'ttl': '0.05'},
+        data=randbytes(100),
+    )
+    assert set_response.status_code == 200
+
+    get_response = await client.get('/get', query_string={'key': 'my-key'})
+    assert get_response.status_code == 200
+
+    await asyncio.sleep(0.1)
+    get_response = await client.get('/get', query_string={'key': 'my-key'})
+    assert get_response.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('ttl', ('abc', '0', '-1'))
+async def test_set_request_bad_ttl(ttl: str, quart_app) -> None:
+    client = quart_app.test_client()
+    set_response = await client.post(
+        '/set',
+        headers={'Content-Type': 'application/octet-stream'},
+        query_string={'key': 'my-key', 'ttl': ttl},
+        data=randbytes(100),
+    )
+    assert set_response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_chunked_data(quart_app) -> None:
     client = quart_app.test_client()
@@ -122,6 +205,56 @@ async def test_chunked_data(quart_app) -> None:
     assert (await get_response.get_data()) == data
 
 
+@pytest.mark.asyncio
+async def test_chunked_data_with_content_length(quart_app) -> None:
+    client = quart_app.test_client()
+    data = randbytes((2 * MAX_CHUNK_LENGTH) + 1)
+
+    async with client.request(
+        '/set',
+        method='POST',
+        headers={
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(len(data)),
+        },
+        query_string={'key': 'my-key'},
+    ) as connection:
+        for chunk in chunk_bytes(data, MAX_CHUNK_LENGTH):
+            await connection.send(chunk)
+        await connection.send_complete()
+    set_response = await connection.as_response()
+    assert set_response.status_code == 200
+
+    get_response = await client.get('/get', query_string={'key': 'my-key'})
+    assert get_response.status_code == 200
+    assert get_response.content_length == len(data)
+    assert (await get_response.get_data()) == data
+
+    get_response = await client.post('/get_batch', json={'keys': ['my-key']})
+    assert decode_multipart(await get_response.get_data()) == [data]
+
+
+@pytest.mark.parametrize('offset', (-1, 1))
+@pytest.mark.asyncio
+async def test_content_length_mismatch(offset: int, quart_app) -> None:
+    client = quart_app.test_client()
+    data = randbytes(100)
+
+    async with client.request(
+        '/set',
+        method='POST',
+        headers={
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': str(len(data) + offset),
+        },
+        query_string={'key': 'my-key'},
+    ) as connection:
+        await connection.send(data)
+        await connection.send_complete()
+    set_response = await connection.as_response()
+    assert set_response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_empty_chunked_data(quart_app) -> None:
     client = quart_app.test_client()
@@ -217,6 +350,32 @@ async def test_payload_too_big() -> None:
             assert set_response.status_code == 413
 
 
+@pytest.mark.asyncio
+async def test_content_length_exceeds_max() -> None:
+    async with Endpoint(
+        name='my-endpoint',
+        uuid=uuid.uuid4(),
+    ) as endpoint:
+        app = create_app(endpoint, max_content_length=1000)
+        async with app.test_app() as quart_app:
+            client = quart_app.test_client()
+            async with client.request(
+                '/set',
+                method='POST',
+                headers={
+                    'Content-Type': 'application/octet-stream',
+                    'Content-Length': str(100_000_000_000),
+                },
+                query_string={'key': 'my-key'},
+            ) as connection:
+                # The body is small but the buffer is sized from the header
+                await connection.send(b'data')
+                await connection.send_complete()
+            set_response = await connection.as_response()
+            assert set_response.status_code == 413
+            assert not await endpoint.exists('my-key')
+
+
 @pytest.mark.asyncio
 async def test_bad_endpoint_uuid(quart_app) -> None:
     client = quart_app.test_client()
@@ -298,6 +457,167 @@ async def test_unknown_endpoint_uuid(quart_app) -> None:
         assert set_response.status_code == 500
 
 
+def _set_batch_body(
+    keys: list[str],
+    data: Sequence[bytes | None],
+    endpoints: list[str | None] | None = None,
+) -> bytes:
+    header = json.dumps({'keys': keys, 'endpoints': endpoints}).encode()
+    return b''.join(encode_multipart([header, *data]))
+
+
+@pytest.mark.asyncio
+async def test_batch_requests(quart_app) -> None:
+    client = quart_app.test_client()
+    keys = ['key1', 'key2']
+    data = [randbytes(100), randbytes(MAX_CHUNK_LENGTH + 1)]
+
+    set_response = await client.post(
+        '/set_batch',
+        headers={'Content-Type': 'application/octet-stream'},
+        query_string={'ttl': 60},
+        data=_set_batch_body(keys, data),
+    )
+    assert set_response.status_code == 200
+
+    body: dict[str, Any] = {'keys': [*keys, 'missing'], 'endpoints': None}
+    exists_response = await client.post('/exists_batch', json=body)
+    assert exists_response.status_code == 200
+    assert (await exists_response.get_json())['exists'] == [True, True, False]
+
+    get_response = await client.post('/get_batch', json=body)
+    assert get_response.status_code == 200
+    body_data = await get_response.get_data()
+    assert decode_multipart(body_data) == [*data, None]
+    assert get_response.content_length == len(body_data)
+
+    endpoint_uuid = str(quart_app.endpoint.uuid)
+    body = {'keys': keys, 'endpoints': [endpoint_uuid, None]}
+    evict_response = await client.post('/evict_batch', json=body)
+    assert evict_response.status_code == 200
+
+    exists_response = await client.post('/exists_batch', json=body)
+    assert (await exists_response.get_json())['exists'] == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_set_batch_request_parts_not_views_of_body() -> None:
+    storage = TieredStorage(DictStorage(), max_memory_bytes=10_000)
+    keys = ['key1', 'key2', 'key3']
+    data = [randbytes(1000) for _ in keys]
+
+    async with Endpoint(
+        name='my-endpoint',
+        uuid=uuid.uuid4(),
+        storage=storage,
+    ) as endpoint:
+        app = create_app(endpoint)
+        async with app.test_app() as test_app:
+            client = test_app.test_client()
+            response = await client.post(
+                '/set_batch',
+                headers={'Content-Type': 'application/octet-stream'},
+                data=_set_batch_body(keys, data),
+            )
+            assert response.status_code == 200
+
+            await endpoint.evict_batch(keys[:2])
+
+            # The remaining blob must own its memory rather than keep the
+            # whole request body alive while only its size is counted.
+            assert storage.occupancy().memory_bytes == len(data[2])
+            blob = await storage.get(keys[2])
+            assert isinstance(blob, bytes)
+            assert blob == data[2]
+
+
+@pytest.mark.parametrize(
+    'body',
+    (
+        {},
+        {'keys': 'key'},
+        {'keys': [1, 2]},
+        {'keys': ['key'], 'endpoints': []},
+        {'keys': ['key'], 'endpoints': ['not-a-uuid']},
+    ),
+)
+@pytest.mark.asyncio
+async def test_batch_requests_bad_body(body: Any, quart_app) -> None:
+    client = quart_app.test_client()
+    for route in ('/evict_batch', '/exists_batch', '/get_batch'):
+        response = await client.post(route, json=body)
+        assert response.status_code == 400
+
+    header = json.dumps(body).encode()
+    response = await client.post(
+        '/set_batch',
+        headers={'Content-Type': 'application/octet-stream'},
+        data=b''.join(encode_multipart([header, b'data'])),
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    ('body', 'query'),
+    (
+        (b'', {}),
+        (b'\x00', {}),
+        (b''.join(encode_multipart([None])), {}),
+        (_set_batch_body(['key1', 'key2'], [b'data']), {}),
+        (_set_batch_body(['key1'], [None]), {}),
+        (_set_batch_body(['key1'], [b'data']), {'ttl': 'abc'}),
+        (_set_batch_body(['key1'], [b'data']), {'ttl': -1}),
+    ),
+)
+@pytest.mark.asyncio
+async def test_set_batch_request_bad_body(
+    body: bytes,
+    query: dict[str, Any],
+    quart_app,
+) -> None:
+    client = quart_app.test_client()
+    response = await client.post(
+        '/set_batch',
+        headers={'Content-Type': 'application/octet-stream'},
+        query_string=query,
+        data=body,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_batch_requests_unknown_endpoint_uuid(quart_app) -> None:
+    client = quart_app.test_client()
+    unknown_uuid = str(uuid.uuid4())
+    body = {'keys': ['my-key'], 'endpoints': [unknown_uuid]}
+
+    with (
+        mock.patch(
+            'proxystore.endpoint.endpoint.Endpoint._is_peer_request',
+            return_value=True,
+        ),
+        mock.patch(
+            'proxystore.endpoint.endpoint.Endpoint.peer_manager',
+            new_callable=mock.PropertyMock,
+        ) as mock_peer_manager_property,
+    ):
+        mock_peer_manager = AsyncMock()
+        mock_peer_manager.send = AsyncMock(side_effect=Exception())
+        mock_peer_manager.close = AsyncMock()
+        mock_peer_manager_property.return_value = mock_peer_manager
+
+        for route in ('/evict_batch', '/exists_batch', '/get_batch'):
+            response = await client.post(route, json=body)
+            assert response.status_code == 500
+
+        response = await client.post(
+            '/set_batch',
+            headers={'Content-Type': 'application/octet-stream'},
+            data=_set_batch_body(['my-key'], [b'data'], [unknown_uuid]),
+        )
+        assert response.status_code == 500
+
+
 @pytest.mark.asyncio
 async def test_missing_key(quart_app) -> None:
     client = quart_app.test_client()
@@ -394,6 +714,72 @@ def test_serve_logging(use_uvloop: bool, tmp_path: pathlib.Path) -> None:
     assert os.path.exists(log_file2)
 
 
+def test_serve_tiered_storage(
+    use_uvloop: bool,
+    tmp_path: pathlib.Path,
+) -> None:
+    config = EndpointConfig(
+        name='name',
+        uuid=str(uuid.uuid4()),
+        host='localhost',
+        port=open_port(),
+        storage=EndpointStorageConfig(
+            database_path=str(tmp_path / 'blobs.db'),
+            max_memory_size=1000,
+        ),
+    )
+    with (
+        mock.patch('uvicorn.Server.serve', AsyncMock()),
+        mock.patch(
+            'proxystore.endpoint.serve.TieredStorage',
+            wraps=TieredStorage,
+        ) as mock_storage,
+    ):
+        serve(config, use_uvloop=use_uvloop)
+    mock_storage.assert_called_once()
+    assert mock_storage.call_args.kwargs['max_memory_bytes'] == 1000
+
+
+def test_serve_unix_socket(
+    use_uvloop: bool,
+    tmp_path: pathlib.Path,
+) -> None:
+    socket_path = tmp_path / 'endpoint.sock'
+    # Socket file left behind by an endpoint that did not exit cleanly
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(socket_path))
+
+    config = EndpointConfig(
+        name='name',
+        uuid=str(uuid.uuid4()),
+        host='localhost',
+        port=open_port(),
+        socket_path=str(socket_path),
+    )
+
+    async def _serve(self: Any, sockets: Sequence[socket.socket]) -> None:
+        assert len(sockets) == 2
+        assert sockets[1].getsockname() == str(socket_path)
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+    with mock.patch('uvicorn.Server.serve', _serve):
+        serve(config, use_uvloop=use_uvloop)
+
+    assert not socket_path.exists()
+
+
+def test_bind_unix_socket_errors(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        _bind_unix_socket(str(tmp_path / 'missing' / 'endpoint.sock'))
+
+    # Files which are not sockets are never removed
+    path = tmp_path / 'endpoint.sock'
+    path.write_text('data')
+    with pytest.raises(OSError, match='in use'):
+        _bind_unix_socket(str(path))
+    assert path.read_text() == 'data'
+
+
 def test_get_auth_headers_none() -> None:
     assert _get_auth_headers(None) == {}
 
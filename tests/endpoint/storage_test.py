@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import pathlib
 from collections.abc import AsyncGenerator
+from unittest import mock
 
+import aiosqlite
 import pytest
 import pytest_asyncio
 
@@ -10,15 +13,20 @@ from proxystore.endpoint.exceptions import ObjectSizeExceededError
 from proxystore.endpoint.storage import DictStorage
 from proxystore.endpoint.storage import SQLiteStorage
 from proxystore.endpoint.storage import Storage
+from proxystore.endpoint.storage import StorageStats
+from proxystore.endpoint.storage import TieredStorage
+from proxystore.endpoint.storage import TieredStorageOccupancy
 
 
-@pytest_asyncio.fixture(params=['dict', 'sql'])
+@pytest_asyncio.fixture(params=['dict', 'sql', 'tiered'])
 async def storage(request) -> AsyncGenerator[Storage, None]:
     s: Storage
     if request.param == 'dict':
         s = DictStorage()
     elif request.param == 'sql':
         s = SQLiteStorage(':memory:')
+    elif request.param == 'tiered':
+        s = TieredStorage(SQLiteStorage(':memory:'), max_memory_bytes=100)
     else:
         raise AssertionError('Unreachable.')
 
@@ -46,6 +54,30 @@ async def test_storage_basics(storage: Storage) -> None:
     assert await storage.get(key, b'123') == b'123'
 
 
+@pytest.mark.asyncio
+async def test_storage_stats(storage: Storage) -> None:
+    assert await storage.stats() == StorageStats(blobs=0, total_bytes=0)
+
+    await storage.set('key1', b'x' * 10)
+    await storage.set('key2', b'x' * 20)
+    await storage.set('key3', b'x' * 30, ttl=0.01)
+    await asyncio.sleep(0.02)
+
+    # Expired blobs are not included even before they are swept
+    assert await storage.stats() == StorageStats(blobs=2, total_bytes=30)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_stats_chunked_blobs() -> None:
+    storage = SQLiteStorage(':memory:', chunk_size=10)
+    await storage.set('small', b'x' * 5)
+    await storage.set('large', b'x' * 25)
+
+    assert await storage.stats() == StorageStats(blobs=2, total_bytes=30)
+
+    await storage.close()
+
+
 @pytest.mark.asyncio
 async def test_sqlite_storage_persists(tmp_path: pathlib.Path) -> None:
     key = 'key'
@@ -76,3 +108,307 @@ async def test_max_object_size_exceeded() -> None:
     sqlite_storage = SQLiteStorage(':memory:', max_object_size=100)
     with pytest.raises(ObjectSizeExceededError):
         await sqlite_storage.set('key', b'x' * 1000)
+
+
+@pytest.mark.asyncio
+async def test_storage_ttl(storage: Storage) -> None:
+    await storage.set('expires', b'data', ttl=0.05)
+    await storage.set('persists', b'data')
+    assert await storage.exists('expires')
+    assert await storage.get('expires') == b'data'
+
+    await asyncio.sleep(0.1)
+    assert not await storage.exists('expires')
+    assert await storage.get('expires') is None
+    assert await storage.exists('persists')
+
+    # Overwriting without a ttl clears the prior expiry
+    await storage.set('expires', b'data', ttl=0.05)
+    await storage.set('expires', b'data')
+    await asyncio.sleep(0.1)
+    assert await storage.exists('expires')
+
+
+@pytest.mark.asyncio
+async def test_storage_sweep() -> None:
+    dict_storage = DictStorage()
+    sqlite_storage = SQLiteStorage(':memory:', sweep_interval=None)
+    for storage in (dict_storage, sqlite_storage):
+        await storage.set('key1', b'data', ttl=0.01)
+        await storage.set('key2', b'data', ttl=0.01)
+        await storage.set('key3', b'data', ttl=100)
+        await storage.set('key4', b'data')
+        await asyncio.sleep(0.05)
+        assert await storage.sweep() == 2
+        assert await storage.sweep() == 0
+        assert await storage.exists('key3')
+        assert await storage.exists('key4')
+        await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_sweeper_task() -> None:
+    storage = SQLiteStorage(':memory:', sweep_interval=0.01)
+    await storage.set('key', b'data', ttl=0.01)
+    await asyncio.sleep(0.1)
+
+    db = await storage.db()
+    async with db.execute('SELECT count(*) FROM blobs') as cursor:
+        assert await cursor.fetchone() == (0,)
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_migrates_expires_column(
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / 'db.db'
+    async with aiosqlite.connect(path) as db:
+        await db.execute(
+            'CREATE TABLE blobs(key TEXT PRIMARY KEY, value BLOB NOT NULL)',
+        )
+        await db.execute(
+            'INSERT INTO blobs (key, value) VALUES (?, ?)',
+            ('key', b'data'),
+        )
+        await db.commit()
+
+    storage = SQLiteStorage(path, chunk_size=2)
+    assert await storage.get('key') == b'data'
+    await storage.set('other', b'data', ttl=100)
+    assert await storage.exists('other')
+    assert await storage.get('other') == b'data'
+    await storage.close()
+
+
+def test_sqlite_storage_bad_args() -> None:
+    with pytest.raises(ValueError, match='Commit window'):
+        SQLiteStorage(commit_window=-1)
+    with pytest.raises(ValueError, match='Chunk size'):
+        SQLiteStorage(chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_wal(tmp_path: pathlib.Path) -> None:
+    storage = SQLiteStorage(tmp_path / 'db.db')
+    db = await storage.db()
+    async with db.execute('PRAGMA journal_mode') as cursor:
+        assert await cursor.fetchone() == ('wal',)
+    await storage.close()
+
+
+async def _count_chunks(storage: SQLiteStorage, key: str) -> int:
+    db = await storage.db()
+    async with db.execute(
+        'SELECT count(*) FROM blob_chunks WHERE key=?',
+        (key,),
+    ) as cursor:
+        result = await cursor.fetchone()
+        assert result is not None
+        return result[0]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_chunked_blobs() -> None:
+    storage = SQLiteStorage(
+        ':memory:',
+        max_object_size=None,
+        chunk_size=10,
+        sweep_interval=None,
+    )
+    data = b'0123456789' * 2 + b'01234'
+
+    await storage.set('key', data)
+    assert await _count_chunks(storage, 'key') == 3
+    assert await storage.exists('key')
+    assert await storage.get('key') == data
+
+    # Overwriting with a small blob removes the chunks
+    await storage.set('key', b'small')
+    assert await _count_chunks(storage, 'key') == 0
+    assert await storage.get('key') == b'small'
+
+    await storage.set('key', data)
+    await storage.evict('key')
+    assert await _count_chunks(storage, 'key') == 0
+    assert await storage.get('key') is None
+
+    await storage.set('key', data, ttl=0.01)
+    await asyncio.sleep(0.02)
+    assert await storage.get('key') is None
+    assert await storage.sweep() == 1
+    assert await _count_chunks(storage, 'key') == 0
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_chunked_concurrent_overwrite() -> None:
+    storage = SQLiteStorage(':memory:', chunk_size=10)
+    first = b'a' * 50
+    second = b'b' * 30
+
+    await storage.set('key', first)
+    results = await asyncio.gather(
+        storage.get('key'),
+        storage.set('key', second),
+        storage.get('key'),
+    )
+    assert results[0] in (first, second)
+    assert results[2] in (first, second)
+    assert await storage.get('key') == second
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_group_commit(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'db.db'
+    storage = SQLiteStorage(path, commit_window=0.05)
+    db = await storage.db()
+
+    with mock.patch.object(db, 'commit', wraps=db.commit) as mock_commit:
+        await asyncio.gather(
+            *(storage.set(f'key{i}', b'data') for i in range(10)),
+            storage.evict('key0'),
+        )
+        assert mock_commit.call_count == 1
+
+        await storage.set('key10', b'data')
+        assert mock_commit.call_count == 2
+
+    # Writes waiting on a group commit are committed on close
+    task = asyncio.create_task(storage.set('key11', b'data'))
+    await asyncio.sleep(0)
+    await storage.close()
+    await task
+
+    storage = SQLiteStorage(path)
+    assert not await storage.exists('key0')
+    for i in range(1, 12):
+        assert await storage.exists(f'key{i}')
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_storage_spills_lru() -> None:
+    cold = DictStorage()
+    storage = TieredStorage(cold, max_memory_bytes=10)
+
+    await storage.set('key1', b'x' * 4)
+    await storage.set('key2', b'x' * 4)
+    # Reading key1 makes key2 the least recently used
+    assert await storage.get('key1') == b'x' * 4
+    await storage.set('key3', b'x' * 4)
+
+    assert storage.occupancy() == TieredStorageOccupancy(
+        memory_bytes=8,
+        memory_blobs=2,
+        max_memory_bytes=10,
+        spilled_blobs=1,
+    )
+    assert await cold.exists('key2')
+    assert not await cold.exists('key1')
+    assert not await cold.exists('key3')
+
+    for key in ('key1', 'key2', 'key3'):
+        assert await storage.exists(key)
+        assert await storage.get(key) == b'x' * 4
+
+    await storage.evict('key2')
+    assert not await cold.exists('key2')
+    assert not await storage.exists('key2')
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_storage_large_blob() -> None:
+    cold = DictStorage()
+    storage = TieredStorage(cold, max_memory_bytes=10)
+
+    await storage.set('key', b'x' * 4)
+    # Blobs larger than the budget are written directly to cold storage
+    await storage.set('key', b'x' * 20)
+    assert storage.occupancy().memory_blobs == 0
+    assert await cold.get('key') == b'x' * 20
+    assert await storage.get('key') == b'x' * 20
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_storage_max_object_size() -> None:
+    storage = TieredStorage(
+        DictStorage(),
+        max_memory_bytes=10,
+        max_object_size=100,
+    )
+    with pytest.raises(ObjectSizeExceededError):
+        await storage.set('key', b'x' * 1000)
+    await storage.close()
+
+
+def test_tiered_storage_bad_budget() -> None:
+    with pytest.raises(ValueError, match='Max memory bytes'):
+        TieredStorage(DictStorage(), max_memory_bytes=-1)
+
+
+@pytest.mark.asyncio
+async def test_tiered_storage_spill_ttl() -> None:
+    cold = DictStorage()
+    storage = TieredStorage(cold, max_memory_bytes=4)
+
+    await storage.set('expires', b'x' * 4, ttl=0.05)
+    await storage.set('expired', b'x' * 4, ttl=0.01)
+    await asyncio.sleep(0.02)
+    # Spilling keeps the remaining ttl and drops already expired blobs
+    await storage.set('other', b'x' * 4)
+    assert await cold.exists('expires')
+    assert not await cold.exists('expired')
+
+    await asyncio.sleep(0.05)
+    assert not await storage.exists('expires')
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_storage_expired_overwrite() -> None:
+    cold = DictStorage()
+    storage = TieredStorage(cold, max_memory_bytes=4)
+
+    await storage.set('key', b'old1')
+    await storage.set('other', b'x' * 4)
+    assert await cold.get('key') == b'old1'
+
+    # Overwrite in the memory tier then let it expire. The stale copy in
+    # the cold storage should not be returned.
+    await storage.evict('other')
+    await storage.set('key', b'new1', ttl=0.01)
+    await asyncio.sleep(0.02)
+    assert await storage.get('key') is None
+    assert not await cold.exists('key')
+
+    await storage.set('key', b'new2', ttl=0.01)
+    await asyncio.sleep(0.02)
+    assert await storage.sweep() == 1
+    assert await storage.sweep() == 0
+    assert not await storage.exists('key')
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_storage_close_persists(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'db.db'
+
+    storage = TieredStorage(SQLiteStorage(path), max_memory_bytes=100)
+    await storage.set('key', b'data')
+    assert storage.occupancy().memory_blobs == 1
+    await storage.close()
+
+    sqlite_storage = SQLiteStorage(path)
+    assert await sqlite_storage.get('key') == b'data'
+    await sqlite_storage.close()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from proxystore.p2p.chunks import Chunk
+from proxystore.p2p.chunks import ChunkAssembler
 from proxystore.p2p.chunks import ChunkDType
 from proxystore.p2p.chunks import chunkify
 from proxystore.p2p.chunks import reconstruct
@@ -38,19 +41,113 @@ def test_chunk_validation() -> None:
         Chunk(0, 2, 1, '')
 
 
+def test_chunkify_references_data() -> None:
+    data = bytearray(randbytes(1000))
+
+    chunks = list(chunkify(data, 300, 1))
+
+    assert [len(chunk.data) for chunk in chunks] == [300, 300, 300, 100]
+    assert all(chunk.data.obj is data for chunk in chunks)
+
+
+def test_chunkify_buffer_sequence() -> None:
+    parts: list[bytes | bytearray] = [
+        b'header',
+        bytearray(randbytes(250)),
+        b'',
+        randbytes(44),
+    ]
+    data = b''.join(parts)
+
+    chunks = list(chunkify(parts, 100, 1))
+
+    assert [len(chunk.data) for chunk in chunks] == [100, 100, 100]
+    assert reconstruct(chunks) == data
+    # Only chunks spanning multiple buffers are copied
+    assert chunks[1].data.obj is parts[1]
+    (empty,) = chunkify([], 100, 1)
+    assert empty.data == b''
+
+
 @pytest.mark.parametrize('dtype', (bytes, str))
 def test_chunk_and_reconstruct(dtype: bytes | str) -> None:
-    data: bytes | str = randbytes(1000) if dtype is bytes else 'x' * 1000
+    # Multibyte characters are split across chunks
+    data: bytes | str = randbytes(1000) if dtype is bytes else 'xß€' * 300
 
     chunks = list(chunkify(data, 100, 1))
+    random.shuffle(chunks)
     new_data = reconstruct(chunks)
 
     assert data == new_data
 
 
+@pytest.mark.parametrize('data', (b'', b'x', ''))
+def test_chunk_and_reconstruct_small(data: bytes | str) -> None:
+    chunks = list(chunkify(data, 100, 1))
+
+    assert len(chunks) == 1
+    assert reconstruct(chunks) == data
+
+
 def test_reconstruct_validation() -> None:
     with pytest.raises(ValueError, match='empty'):
         reconstruct([])
 
     with pytest.raises(ValueError, match='expected'):
         reconstruct([Chunk(0, 0, 1, ''), Chunk(0, 0, 1, '')])
+
+
+@pytest.mark.parametrize('last_first', (True, False))
+def test_chunk_assembler(last_first: bool) -> None:
+    data = randbytes(250)
+    chunks = list(chunkify(data, 100, 1))
+    if last_first:
+        chunks.reverse()
+
+    assembler = ChunkAssembler(3, ChunkDType.BYTES)
+    for chunk in chunks:
+        assert not assembler.complete
+        with pytest.raises(ValueError, match='expected'):
+            assembler.message()
+        assembler.add(Chunk.from_bytes(bytes(chunk)))
+
+    assert assembler.complete
+    message = assembler.message()
+    assert isinstance(message, bytearray)
+    assert message == data
+
+
+def test_chunk_assembler_grows_with_data() -> None:
+    data = randbytes(1000)
+    chunks = list(chunkify(data, 100, 1))
+    assembler = ChunkAssembler(len(chunks), ChunkDType.BYTES)
+
+    assembler.add(chunks[0])
+    # Buffer is not allocated for the whole message up front
+    assert len(assembler._buffer) == 100
+    assembler.add(chunks[-1])
+    assert len(assembler._buffer) == 100
+    assembler.add(chunks[3])
+    assert len(assembler._buffer) == 400
+    for chunk in (*chunks[1:3], *chunks[4:-1]):
+        assembler.add(chunk)
+
+    assert assembler.message() == data
+
+
+def test_chunk_assembler_validation() -> None:
+    assembler = ChunkAssembler(2, ChunkDType.BYTES)
+
+    with pytest.raises(ValueError, match='belong'):
+        assembler.add(Chunk(0, 0, 3, b'abc'))
+    with pytest.raises(ValueError, match='belong'):
+        assembler.add(Chunk(0, 0, 2, 'abc'))
+
+    assembler.add(Chunk(0, 0, 2, b'abc'))
+    with pytest.raises(ValueError, match='expected 3'):
+        assembler.add(Chunk(0, 1, 2, b'abcd'))
+
+    assembler.add(Chunk(0, 1, 2, b'ab'))
+    with pytest.raises(ValueError, match='more than'):
+        assembler.add(Chunk(0, 1, 2, b'ab'))
+    assert assembler.message() == b'abcab'
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from uuid import uuid4
 
 import aiortc
 import pytest
 
-from proxystore.p2p.connection import MAX_CHUNK_SIZE_BYTES
-from proxystore.p2p.connection import MAX_CHUNK_SIZE_STRING
+from proxystore.p2p.chunks import Chunk
+from proxystore.p2p.chunks import CHUNK_HEADER_LENGTH
+from proxystore.p2p.chunks import ChunkDType
+from proxystore.p2p.connection import _negotiate_max_message_size
+from proxystore.p2p.connection import CHANNEL_SEND_WINDOW
+from proxystore.p2p.connection import DEFAULT_MAX_MESSAGE_SIZE
 from proxystore.p2p.connection import PeerConnection
 from proxystore.p2p.exceptions import PeerConnectionError
 from proxystore.p2p.exceptions import PeerConnectionTimeoutError
@@ -38,16 +43,17 @@ async def test_p2p_connection(relay_server) -> None:
 
     assert connection1.state == 'connected'
     assert connection2.state == 'connected'
+    assert connection1.chunk_size == connection2.chunk_size
 
     # Very long string message to test chunking
-    message_str = 'x' * MAX_CHUNK_SIZE_STRING * 3
+    message_str = 'x' * connection1.chunk_size * 3
     await connection1.send(message_str)
     assert await connection2.recv() == message_str
     await connection2.send('hello hello')
     assert await connection1.recv() == 'hello hello'
 
     # Very long bytes message to test chunking
-    message_bytes = b'\x00' * MAX_CHUNK_SIZE_BYTES * 3
+    message_bytes = b'\x00' * connection1.chunk_size * 3
     await connection1.send(message_bytes)
     assert await connection2.recv() == message_bytes
     await connection2.send(b'hello hello')
@@ -85,6 +91,11 @@ async def test_p2p_connection_multichannel(relay_server) -> None:
     assert len(connection1._channels) == 4
     assert len(connection2._channels) == 4
 
+    # Large message striped across channels
+    message = bytes(range(256)) * (connection1.chunk_size // 16)
+    await connection1.send(message)
+    assert await connection2.recv() == message
+
     await client1.close()
     await client2.close()
     await connection1.close()
@@ -245,3 +256,240 @@ async def test_p2p_closed_by_answerer_callback(relay_server) -> None:
 
     await client1.close()
     await client2.close()
+
+
+@pytest.mark.asyncio
+async def test_negotiate_max_message_size(relay_server) -> None:
+    client = RelayClient(relay_server.address)
+    await client.connect()
+    connection = PeerConnection(client)
+    await connection.send_offer(uuid4())
+    description = connection._pc.localDescription
+    attribute = f'a=max-message-size:{DEFAULT_MAX_MESSAGE_SIZE}'
+    assert attribute in description.sdp
+
+    def _replace(value: str) -> aiortc.RTCSessionDescription:
+        return aiortc.RTCSessionDescription(
+            sdp=description.sdp.replace(attribute, value),
+            type=description.type,
+        )
+
+    assert _negotiate_max_message_size(description) == 65536
+    assert (
+        _negotiate_max_message_size(_replace('a=max-message-size:16384'))
+        == 16384
+    )
+    # Zero indicates no limit so the local limit is used
+    assert (
+        _negotiate_max_message_size(_replace('a=max-message-size:0')) == 65536
+    )
+    assert _negotiate_max_message_size(_replace('')) == 65536
+
+    await client.close()
+    await connection.close()
+
+
+class _FakeChannel:
+    def __init__(self, buffered: int) -> None:
+        self.bufferedAmount = buffered
+        self.sent: list[Chunk] = []
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(Chunk.from_bytes(data))
+
+
+@pytest.mark.asyncio
+async def test_next_channel_least_buffered() -> None:
+    connection = PeerConnection(RelayClient('ws://localhost'))
+    channels = [_FakeChannel(100), _FakeChannel(10), _FakeChannel(50)]
+    connection._channels = {
+        str(i): channel  # type: ignore[misc]
+        for i, channel in enumerate(channels)
+    }
+    assert await connection._next_channel() is channels[1]
+
+    for channel in channels:
+        channel.bufferedAmount = CHANNEL_SEND_WINDOW
+    task = asyncio.create_task(connection._next_channel())
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    # Channel drains below its low threshold
+    channels[2].bufferedAmount = CHANNEL_SEND_WINDOW // 2
+    connection._buffer_low.set()
+    assert await asyncio.wait_for(task, timeout=1) is channels[2]
+
+    connection._channels.clear()
+    await connection.close()
+
+
+def _fake_connection(channel: _FakeChannel) -> PeerConnection:
+    connection = PeerConnection(RelayClient('ws://localhost'))
+    connection._channels = {'0': channel}  # type: ignore[dict-item]
+    connection._handshake_success.set_result(True)
+    # Chunks contain ten bytes of data
+    connection._max_message_size = CHUNK_HEADER_LENGTH + 10
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_send_small_message_queued_first() -> None:
+    channel = _FakeChannel(CHANNEL_SEND_WINDOW)
+    connection = _fake_connection(channel)
+
+    large = asyncio.create_task(connection.send(b'x' * 30))
+    await asyncio.sleep(0.01)
+    small = [
+        asyncio.create_task(connection.send(b'small1')),
+        asyncio.create_task(connection.send(b'small2')),
+    ]
+    await asyncio.sleep(0.01)
+    # Small messages still wait on the send window
+    assert len(channel.sent) == 0
+    assert not any(task.done() for task in small)
+
+    channel.bufferedAmount = 0
+    connection._buffer_low.set()
+    await asyncio.wait_for(asyncio.gather(large, *small), timeout=1)
+    assert [bytes(chunk.data) for chunk in channel.sent] == [
+        b'small1',
+        b'small2',
+        *([b'x' * 10] * 3),
+    ]
+    assert connection._outgoing_small == 0
+
+    connection._channels.clear()
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_send_interleaves_large_messages() -> None:
+    channel = _FakeChannel(0)
+    connection = _fake_connection(channel)
+
+    await asyncio.gather(
+        connection.send(b'a' * 30),
+        connection.send(b'b' * 30),
+    )
+
+    assert [bytes(chunk.data[:1]) for chunk in channel.sent] == [
+        b'a',
+        b'b',
+        b'a',
+        b'b',
+        b'a',
+        b'b',
+    ]
+
+    connection._channels.clear()
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_send_cancelled_message_dropped() -> None:
+    channel = _FakeChannel(CHANNEL_SEND_WINDOW)
+    connection = _fake_connection(channel)
+
+    cancelled = asyncio.create_task(connection.send(b'a' * 30))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    channel.bufferedAmount = 0
+    connection._buffer_low.set()
+    await asyncio.wait_for(connection.send(b'b' * 30), timeout=1)
+    assert [bytes(chunk.data) for chunk in channel.sent] == [b'b' * 10] * 3
+
+    connection._channels.clear()
+    await connection.close()
+
+
+class _FillingChannel(_FakeChannel):
+    def send(self, data: bytes) -> None:
+        super().send(data)
+        # The send window is full after each chunk
+        self.bufferedAmount = CHANNEL_SEND_WINDOW
+
+
+@pytest.mark.asyncio
+async def test_send_cancelled_message_aborted(caplog) -> None:
+    caplog.set_level(logging.WARNING)
+
+    class _ClosedChannel(_FakeChannel):
+        def send(self, data: bytes) -> None:
+            raise RuntimeError('closed')
+
+    channel = _FillingChannel(0)
+    connection = _fake_connection(channel)
+    connection._channels['1'] = _ClosedChannel(  # type: ignore[assignment]
+        2 * CHANNEL_SEND_WINDOW,
+    )
+
+    cancelled = asyncio.create_task(connection.send(b'a' * 30))
+    await asyncio.sleep(0.01)
+    assert len(channel.sent) == 1
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    channel.bufferedAmount = 0
+    connection._buffer_low.set()
+    assert connection._outgoing_task is not None
+    await asyncio.wait_for(connection._outgoing_task, timeout=1)
+    assert len(channel.sent) == 2
+    abort = channel.sent[1]
+    assert abort.dtype is ChunkDType.ABORT
+    assert abort.stream_id == channel.sent[0].stream_id
+    assert any('failed to abort' in r.message for r in caplog.records)
+
+    connection._channels.clear()
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_aborted_message() -> None:
+    connection = PeerConnection(RelayClient('ws://localhost'))
+
+    await connection._on_message(bytes(Chunk(1, 0, 3, b'x' * 10)))
+    assert 1 in connection._incoming_chunks
+    await connection._on_message(bytes(Chunk(1, 0, 1, b'', ChunkDType.ABORT)))
+    assert 1 not in connection._incoming_chunks
+    # Aborting an unknown stream is a no-op
+    await connection._on_message(bytes(Chunk(2, 0, 1, b'', ChunkDType.ABORT)))
+
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_send_large_message_error() -> None:
+    class _ClosedChannel(_FakeChannel):
+        def send(self, data: bytes) -> None:
+            raise RuntimeError('closed')
+
+    connection = _fake_connection(_ClosedChannel(0))
+
+    with pytest.raises(RuntimeError, match='closed'):
+        await connection.send(b'x' * 30)
+
+    connection._channels.clear()
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_send() -> None:
+    channel = _FakeChannel(CHANNEL_SEND_WINDOW)
+    connection = _fake_connection(channel)
+
+    task = asyncio.create_task(connection.send(b'x' * 30))
+    cancelled = asyncio.create_task(connection.send(b'y' * 30))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    connection._channels.clear()
+    await connection.close()
+
+    with pytest.raises(PeerConnectionError, match='closed'):
+        await asyncio.wait_for(task, timeout=1)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from typing import Any
+from unittest import mock
 
 import pytest
 
@@ -65,6 +67,9 @@ async def test_p2p_connection(relay_server) -> None:
         await connection2.ready()
         assert connection2.state == 'connected'
 
+        assert manager1.connection_states() == {manager2.uuid: 'connected'}
+        assert manager2.connection_states() == {manager1.uuid: 'connected'}
+
 
 @pytest.mark.asyncio
 async def test_p2p_connection_error_unknown_peer(relay_server) -> None:
@@ -259,3 +264,209 @@ async def test_close_connection(relay_server) -> None:
         source_uuid, message = await manager2.recv()
         assert source_uuid == manager1.uuid
         assert message == 'hello hello again'
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_validation(relay_server) -> None:
+    with pytest.raises(ValueError, match='Idle timeout'):
+        PeerManager(RelayClient(relay_server.address), idle_timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_warm_connections(relay_server) -> None:
+    async with (
+        PeerManager(RelayClient(relay_server.address)) as manager1,
+        PeerManager(RelayClient(relay_server.address)) as manager2,
+        PeerManager(RelayClient(relay_server.address)) as manager3,
+    ):
+        await manager1.warm(
+            [manager2.uuid, manager3.uuid, manager2.uuid, manager1.uuid],
+        )
+        # Peers with existing connections are skipped
+        await manager1.warm([manager2.uuid])
+
+        for peer in (manager2.uuid, manager3.uuid):
+            connection = await manager1.get_connection(peer)
+            await connection.ready()
+
+        assert manager1.connection_states() == {
+            manager2.uuid: 'connected',
+            manager3.uuid: 'connected',
+        }
+        assert manager1.connection_events() == {
+            'opened': 2,
+            'warmed': 2,
+            'idle_closed': 0,
+        }
+        assert manager2.connection_events()['opened'] == 1
+        assert manager2.connection_events()['warmed'] == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_connection_failure(relay_server, caplog) -> None:
+    caplog.set_level(logging.WARNING)
+    async with PeerManager(RelayClient(relay_server.address)) as manager:
+        peer = uuid.uuid4()
+        with mock.patch.object(
+            manager,
+            'get_connection',
+            side_effect=PeerConnectionError('test error'),
+        ):
+            await manager.warm([peer])
+
+        assert manager.connection_events()['warmed'] == 0
+
+    assert any(
+        f'failed to warm connection with {peer}' in record.message
+        and record.levelname == 'WARNING'
+        for record in caplog.records
+    )
+
+
+@pytest.mark.asyncio
+async def test_idle_connections_closed(relay_server) -> None:
+    async with (
+        PeerManager(
+            RelayClient(relay_server.address),
+            idle_timeout=0.2,
+        ) as manager1,
+        PeerManager(RelayClient(relay_server.address)) as manager2,
+    ):
+        await manager1.send(manager2.uuid, 'hello')
+        assert await manager2.recv() == (manager1.uuid, 'hello')
+        assert manager2.uuid in manager1.connection_states()
+
+        for _ in range(100):
+            if len(manager1.connection_states()) == 0:
+                break
+            await asyncio.sleep(0.05)
+
+        assert manager1.connection_states() == {}
+        assert manager1.connection_events()['idle_closed'] == 1
+
+        # A new connection is opened on the next send
+        await manager1.send(manager2.uuid, 'hello again')
+        assert await manager2.recv() == (manager1.uuid, 'hello again')
+        assert manager1.connection_events()['opened'] == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_connections_not_closed_while_active(relay_server) -> None:
+    async with (
+        PeerManager(
+            RelayClient(relay_server.address),
+            idle_timeout=0.2,
+        ) as manager1,
+        PeerManager(RelayClient(relay_server.address)) as manager2,
+    ):
+        await manager1.send(manager2.uuid, 'hello')
+        assert await manager2.recv() == (manager1.uuid, 'hello')
+
+        connection = await manager1.get_connection(manager2.uuid)
+        sending = asyncio.Event()
+        sent = asyncio.Event()
+
+        async def _send(*args: Any, **kwargs: Any) -> None:
+            sending.set()
+            await sent.wait()
+
+        with mock.patch.object(connection, 'send', _send):
+            tasks = [
+                asyncio.create_task(manager1.send(manager2.uuid, 'data'))
+                for _ in range(2)
+            ]
+            await sending.wait()
+            # Longer than the idle timeout but the sends are in progress
+            await asyncio.sleep(0.5)
+            assert manager2.uuid in manager1.connection_states()
+            sent.set()
+            await asyncio.gather(*tasks)
+
+        # Messages received from the peer also keep the connection open
+        for _ in range(10):
+            await manager2.send(manager1.uuid, 'ping')
+            assert await manager1.recv() == (manager2.uuid, 'ping')
+            await asyncio.sleep(0.05)
+        assert manager2.uuid in manager1.connection_states()
+        assert manager1.connection_events()['idle_closed'] == 0
+
+
+def _mock_connection(state: str) -> Any:
+    connection = mock.AsyncMock()
+    connection.state = state
+    return connection
+
+
+async def _wait_for_reaper(manager: PeerManager, count: int) -> None:
+    for _ in range(100):  # pragma: no branch
+        if manager.connection_events()['idle_closed'] >= count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('Idle connection was not closed.')  # pragma: no cover
+
+
+@pytest.mark.asyncio
+async def test_idle_connections_in_handshake_not_closed(relay_server) -> None:
+    async with PeerManager(
+        RelayClient(relay_server.address),
+        idle_timeout=0.05,
+    ) as manager:
+        peers = frozenset({manager.uuid, uuid.uuid4()})
+        connection = _mock_connection('connecting')
+        manager._peers[peers] = connection
+        manager._last_active[peers] = 0
+
+        await asyncio.sleep(0.2)
+        assert peers in manager._peers
+
+        connection.state = 'connected'
+        await _wait_for_reaper(manager, 1)
+        assert peers not in manager._peers
+        connection.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_rechecked_before_close(relay_server) -> None:
+    async with PeerManager(
+        RelayClient(relay_server.address),
+        idle_timeout=0.05,
+    ) as manager:
+        first = frozenset({manager.uuid, uuid.uuid4()})
+        second = frozenset({manager.uuid, uuid.uuid4()})
+
+        async def _close() -> None:
+            # A send starts on the second connection while the first
+            # idle connection is being closed
+            manager._sending[second] = 1
+
+        connection = _mock_connection('connected')
+        connection.close.side_effect = _close
+        manager._peers[first] = connection
+        manager._peers[second] = _mock_connection('connected')
+        manager._last_active[first] = 0
+        manager._last_active[second] = 0
+
+        await _wait_for_reaper(manager, 1)
+        await asyncio.sleep(0.2)
+        assert first not in manager._peers
+        assert second in manager._peers
+        assert manager.connection_events()['idle_closed'] == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_closed_during_send(relay_server) -> None:
+    async with (
+        PeerManager(RelayClient(relay_server.address)) as manager1,
+        PeerManager(RelayClient(relay_server.address)) as manager2,
+    ):
+        peers = (manager1.uuid, manager2.uuid)
+        connection = await manager1.get_connection(manager2.uuid)
+
+        async def _send(*args: Any, **kwargs: Any) -> None:
+            await manager1.close_connection(peers)
+
+        with mock.patch.object(connection, 'send', _send):
+            await manager1.send(manager2.uuid, 'hello')
+
+        assert manager1._last_active == {}
+        assert manager1._sending == {}
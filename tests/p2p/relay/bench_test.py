@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import os
+from collections.abc import Generator
+from typing import Any
+from unittest import mock
+
+import click.testing
+import pytest
+
+from proxystore.p2p.relay.bench import _recv
+from proxystore.p2p.relay.bench import _run
+from proxystore.p2p.relay.bench import BenchmarkResult
+from proxystore.p2p.relay.bench import cli
+from proxystore.p2p.relay.bench import local_relay
+from proxystore.p2p.relay.bench import run_benchmark
+from proxystore.p2p.relay.bench import ServerUsage
+from proxystore.p2p.relay.messages import PeerConnectionRequest
+from proxystore.p2p.relay.messages import RelayResponse
+
+
+def _result(latencies: list[float]) -> BenchmarkResult:
+    return BenchmarkResult(
+        clients=2,
+        sent=len(latencies),
+        forwarded=len(latencies),
+        errors=0,
+        duration=2,
+        latencies=latencies,
+    )
+
+
+def test_benchmark_result() -> None:
+    result = _result([0.001 * i for i in range(1, 101)])
+
+    assert result.forwarded_per_second == 50
+    assert result.latency_percentile(50) == pytest.approx(0.050)
+    assert result.latency_percentile(99) == pytest.approx(0.099)
+    assert result.latency_percentile(0) == pytest.approx(0.001)
+    assert 'server_cpu_percent' not in result.format()
+
+    result.server = ServerUsage(cpu_percent=12.5, max_rss_bytes=int(64e6))
+    formatted = result.format()
+    assert 'latency_p99_ms: 99.000' in formatted
+    assert 'server_cpu_percent: 12.5' in formatted
+    assert 'server_max_rss_mb: 64.0' in formatted
+
+
+def test_benchmark_result_empty() -> None:
+    assert math.isnan(_result([]).latency_percentile(50))
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark(relay_server) -> None:
+    result = await _run(relay_server.address, None, 3, 100, 300, 0.1)
+
+    assert result.clients == 3
+    assert result.sent > 0
+    assert result.forwarded == result.sent
+    assert result.errors == 0
+    assert result.latencies == sorted(result.latencies)
+    assert len(result.latencies) == result.forwarded
+    assert result.server is None
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_slow_clients(relay_server) -> None:
+    result = await run_benchmark(
+        relay_server.address,
+        clients=2,
+        size=100,
+        rate=100,
+        duration=0.1,
+        slow_clients=2,
+        slow_size=1000,
+    )
+
+    # Requests to slow clients are not included in the result
+    assert result.sent > 0
+    assert result.forwarded == result.sent
+    assert len(result.latencies) == result.forwarded
+
+
+@pytest.mark.asyncio
+async def test_run_without_psutil(relay_server) -> None:
+    with (
+        mock.patch('proxystore.p2p.relay.bench._PSUTIL_AVAILABLE', False),
+        mock.patch('proxystore.p2p.relay.bench._UsageMonitor') as monitor,
+    ):
+        result = await _run(relay_server.address, 42, 2, 100, 100, 0.1)
+
+    monitor.assert_not_called()
+    assert result.server is None
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_validation() -> None:
+    with pytest.raises(ValueError, match='two clients'):
+        await run_benchmark(
+            'ws://localhost',
+            clients=1,
+            size=1,
+            rate=1,
+            duration=1,
+        )
+    with pytest.raises(ValueError, match='Rate'):
+        await run_benchmark(
+            'ws://localhost',
+            clients=2,
+            size=1,
+            rate=0,
+            duration=1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_recv_counts_errors() -> None:
+    request = PeerConnectionRequest(
+        source_uuid=mock.MagicMock(),
+        source_name='name',
+        peer_uuid=mock.MagicMock(),
+        description_type='offer',
+        description='0.0:padding',
+    )
+    error = PeerConnectionRequest(**{**request.__dict__, 'error': 'error'})
+    client = mock.MagicMock()
+    client.recv = mock.AsyncMock(
+        side_effect=[RelayResponse(), error, request, asyncio.CancelledError],
+    )
+    counters = mock.MagicMock(forwarded=0, errors=0)
+    latencies: list[float] = []
+
+    with pytest.raises(asyncio.CancelledError):
+        await _recv(client, latencies, counters)
+
+    assert counters.errors == 1
+    assert counters.forwarded == 1
+    assert len(latencies) == 1
+
+
+def test_local_relay_server_usage() -> None:
+    with local_relay() as (address, pid):
+        assert pid != os.getpid()
+        result = asyncio.run(_run(address, pid, 2, 10, 100, 0.1))
+
+    assert result.forwarded > 0
+    assert result.server is not None
+    assert result.server.max_rss_bytes > 0
+
+
+def test_local_relay_timeout() -> None:
+    with mock.patch(
+        'socket.create_connection',
+        side_effect=ConnectionRefusedError,
+    ):
+        with pytest.raises(TimeoutError):
+            with local_relay(timeout=0):
+                pass
+
+
+@contextlib.contextmanager
+def _mock_local_relay(*args: Any) -> Generator[tuple[str, int], None, None]:
+    yield 'ws://localhost:1234', 42
+
+
+@pytest.mark.parametrize('address', (None, 'ws://example.com'))
+def test_cli(address: str | None) -> None:
+    result = _result([0.001])
+    args = ['--clients', '4', '--rate', '10', '--duration', '1']
+    args.extend(['--slow-clients', '1', '--slow-size', '10'])
+    if address is not None:
+        args.extend(['--relay-address', address])
+
+    with (
+        mock.patch(
+            'proxystore.p2p.relay.bench.local_relay',
+            _mock_local_relay,
+        ),
+        mock.patch(
+            'proxystore.p2p.relay.bench._run',
+            mock.AsyncMock(return_value=result),
+        ) as mock_run,
+    ):
+        runner = click.testing.CliRunner()
+        output = runner.invoke(cli, args)
+
+    assert output.exit_code == 0, output.output
+    assert 'forwarded_per_second' in output.output
+    expected = (
+        ('ws://localhost:1234', 42) if address is None else (address, None)
+    )
+    assert mock_run.await_args is not None
+    assert mock_run.await_args.args[:2] == expected
+    assert mock_run.await_args.args[-2:] == (1, 10)
@@ -9,14 +9,20 @@ from unittest.mock import AsyncMock
 
 import pytest
 import websockets
+import websockets.asyncio.server
 
+from proxystore.p2p.relay.authenticate import NullAuthenticator
 from proxystore.p2p.relay.client import RelayClient
 from proxystore.p2p.relay.exceptions import RelayNotConnectedError
 from proxystore.p2p.relay.exceptions import RelayRegistrationError
+from proxystore.p2p.relay.messages import BINARY_SUBPROTOCOL
 from proxystore.p2p.relay.messages import encode_relay_message
 from proxystore.p2p.relay.messages import PeerConnectionRequest
+from proxystore.p2p.relay.messages import RelayMessageDecodeError
 from proxystore.p2p.relay.messages import RelayRegistrationRequest
 from proxystore.p2p.relay.messages import RelayResponse
+from proxystore.p2p.relay.server import RelayServer
+from testing.utils import open_port
 
 # Use 100ms as wait_for/timeout to keep test short
 _WAIT_FOR = 0.1
@@ -48,12 +54,14 @@ async def test_default_ssl_context_no_verify() -> None:
 @pytest.mark.asyncio
 async def test_open_and_close() -> None:
     client = RelayClient('ws://localhost')
+    assert not client.connected
     await client.close()
 
 
 @pytest.mark.asyncio
 async def test_connect_and_ping_server(relay_server) -> None:
     async with RelayClient(relay_server.address) as client:
+        assert client.connected
         pong_waiter = await client.websocket.ping()
         await asyncio.wait_for(pong_waiter, _WAIT_FOR)
 
@@ -61,6 +69,7 @@ async def test_connect_and_ping_server(relay_server) -> None:
 @pytest.mark.asyncio
 async def test_send_recv(relay_server) -> None:
     async with RelayClient(relay_server.address) as client:
+        assert client.websocket.subprotocol == BINARY_SUBPROTOCOL
         message = RelayRegistrationRequest(name=client.name, uuid=client.uuid)
         await client.send(message)
         response = await asyncio.wait_for(client.recv(), _WAIT_FOR)
@@ -68,7 +77,25 @@ async def test_send_recv(relay_server) -> None:
 
 
 @pytest.mark.asyncio
-async def test_recv_wrong_type(relay_server) -> None:
+async def test_send_recv_json_server() -> None:
+    # Relay server which does not support the binary message format
+    relay_server = RelayServer(NullAuthenticator())
+    port = open_port()
+    async with websockets.asyncio.server.serve(
+        relay_server.handler,
+        'localhost',
+        port,
+    ):
+        async with RelayClient(f'ws://localhost:{port}') as client:
+            assert client.websocket.subprotocol is None
+            message = RelayRegistrationRequest(client.name, client.uuid)
+            await client.send(message)
+            response = await asyncio.wait_for(client.recv(), _WAIT_FOR)
+            assert isinstance(response, RelayResponse)
+
+
+@pytest.mark.asyncio
+async def test_recv_bad_binary_message(relay_server) -> None:
     async with RelayClient(relay_server.address) as client:
         with mock.patch.object(
             client.websocket,
@@ -76,22 +103,22 @@ async def test_recv_wrong_type(relay_server) -> None:
             AsyncMock(return_value=b''),
         ):
             with pytest.raises(  # pragma: <3.14 cover
-                AssertionError,
-                match='non-string',
+                RelayMessageDecodeError,
+                match='binary',
             ):
                 await client.recv()
 
 
 @pytest.mark.asyncio
-async def test_connect_received_non_string(relay_server) -> None:
+async def test_connect_received_bad_binary_message(relay_server) -> None:
     async with RelayClient(relay_server.address) as client:
         with mock.patch(
             'websockets.asyncio.client.ClientConnection.recv',
             AsyncMock(return_value=b''),
         ):
             with pytest.raises(
-                AssertionError,
-                match='non-string',
+                RelayRegistrationError,
+                match='Unable to decode response message',
             ):  # pragma: <3.14 cover
                 await client._register(_WAIT_FOR)
 
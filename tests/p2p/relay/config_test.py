@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 import pathlib
 
+import pytest
+
 from proxystore.p2p.relay.config import RelayAuthConfig
 from proxystore.p2p.relay.config import RelayLoggingConfig
 from proxystore.p2p.relay.config import RelayServingConfig
@@ -70,3 +72,9 @@ current_client_limit = 5
     assert config.logging.websockets_level == 'INFO'
     assert config.logging.current_client_interval == 3
     assert config.logging.current_client_limit == 5
+
+
+def test_serving_config_max_queued_messages_validation() -> None:
+    assert RelayServingConfig(max_queued_messages=8).max_queued_messages == 8
+    with pytest.raises(ValueError, match='Max queued messages'):
+        RelayServingConfig(max_queued_messages=0)
@@ -153,3 +153,67 @@ def test_encode_errors() -> None:
         match='Error encoding message',
     ):
         encode_relay_message(message)
+
+
+@pytest.mark.parametrize(
+    'message',
+    (
+        RelayRegistrationRequest(name='host', uuid=uuid.uuid4()),
+        RelayResponse(),
+        RelayResponse(success=False, message='error message', error=True),
+        PeerConnectionRequest(
+            source_uuid=uuid.uuid4(),
+            source_name='host',
+            peer_uuid=uuid.uuid4(),
+            description_type='answer',
+            description='',
+        ),
+        PeerConnectionRequest(
+            source_uuid=uuid.uuid4(),
+            source_name='hôst',
+            peer_uuid=uuid.uuid4(),
+            description_type='offer',
+            description='v=0\r\n' * 100,
+            error='error',
+        ),
+    ),
+)
+def test_encode_decode_binary(message: RelayMessage) -> None:
+    b = encode_relay_message(message, binary=True)
+    assert isinstance(b, bytes)
+    assert decode_relay_message(b) == message
+    # UUIDs are encoded as raw bytes so the binary format is more compact
+    assert len(b) < len(encode_relay_message(message))
+
+
+def test_decode_binary_errors() -> None:
+    message = RelayRegistrationRequest(name='name', uuid=uuid.uuid4())
+    b = encode_relay_message(message, binary=True)
+
+    with pytest.raises(RelayMessageDecodeError, match='truncated'):
+        decode_relay_message(b[:-1])
+    with pytest.raises(RelayMessageDecodeError, match='trailing'):
+        decode_relay_message(b + b'\x00')
+    with pytest.raises(RelayMessageDecodeError, match='version'):
+        decode_relay_message(b'\x00' + b[1:])
+    with pytest.raises(RelayMessageDecodeError, match='kind'):
+        decode_relay_message(b[:1] + b'\xff' + b[2:])
+    with pytest.raises(RelayMessageDecodeError, match='utf-8'):
+        decode_relay_message(b[:-1] + b'\xff')
+
+
+def test_encode_binary_errors() -> None:
+    message = PeerConnectionRequest(
+        source_uuid=uuid.uuid4(),
+        source_name='host',
+        peer_uuid=uuid.uuid4(),
+        description_type='other',  # type: ignore[arg-type]
+        description='',
+    )
+    with pytest.raises(RelayMessageEncodeError, match='Error encoding'):
+        encode_relay_message(message, binary=True)
+
+    message.description_type = 'offer'
+    message.peer_uuid = str(uuid.uuid4())  # type: ignore[assignment]
+    with pytest.raises(RelayMessageEncodeError, match='Error encoding'):
+        encode_relay_message(message, binary=True)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock
 
@@ -15,6 +16,7 @@ from proxystore.p2p.relay.exceptions import BadRequestError
 from proxystore.p2p.relay.exceptions import ForbiddenError
 from proxystore.p2p.relay.exceptions import UnauthorizedError
 from proxystore.p2p.relay.manager import Client
+from proxystore.p2p.relay.messages import BINARY_SUBPROTOCOL
 from proxystore.p2p.relay.messages import decode_relay_message
 from proxystore.p2p.relay.messages import encode_relay_message
 from proxystore.p2p.relay.messages import PeerConnectionRequest
@@ -35,6 +37,18 @@ def get_mock_websocket() -> websockets.asyncio.server.ServerConnection:
         return websocket
 
 
+def _wait_on(event: asyncio.Event) -> Any:
+    async def _wait(*args: Any) -> None:
+        await event.wait()
+
+    return _wait
+
+
+async def _flush(server: RelayServer[Any], client: Client[Any]) -> None:
+    # Wait on the writer task to send the messages queued for the client
+    await server._outbound[client].queue.join()
+
+
 @pytest.mark.asyncio
 async def test_server_send() -> None:
     server = RelayServer(NullAuthenticator())
@@ -47,6 +61,7 @@ async def test_server_send() -> None:
         mock.AsyncMock(),
     ) as mock_send:
         await server.send(client, message)
+        await _flush(server, client)
         mock_send.assert_awaited_once()
 
 
@@ -54,7 +69,7 @@ async def test_server_send() -> None:
 async def test_server_send_encoding_error(caplog) -> None:
     caplog.set_level(logging.ERROR)
     server = RelayServer(NullAuthenticator())
-    client = object()
+    client = Client('name', uuid.uuid4(), NullUser(), get_mock_websocket())
     message = object()
     await server.send(client, message)  # type: ignore[arg-type]
     assert len(caplog.records) == 1
@@ -75,12 +90,160 @@ async def test_server_send_connection_closed(caplog) -> None:
         mock.AsyncMock(side_effect=exception),
     ) as mock_send:
         await server.send(client, message)
+        await _flush(server, client)
         mock_send.assert_awaited_once()
 
     assert len(caplog.records) == 1
     assert 'Connection closed while' in caplog.records[0].message
 
 
+def test_server_max_queued_messages_validation() -> None:
+    with pytest.raises(ValueError, match='at least one'):
+        RelayServer(NullAuthenticator(), max_queued_messages=0)
+
+
+@pytest.mark.asyncio
+async def test_server_send_does_not_wait_on_slow_client() -> None:
+    server = RelayServer(NullAuthenticator())
+    message = RelayRegistrationRequest('name', uuid.uuid4())
+    client = Client('name', uuid.uuid4(), NullUser(), get_mock_websocket())
+    blocked = asyncio.Event()
+
+    with mock.patch.object(
+        client.websocket,
+        'send',
+        mock.AsyncMock(side_effect=_wait_on(blocked)),
+    ) as mock_send:
+        for _ in range(3):
+            await asyncio.wait_for(server.send(client, message), _WAIT_FOR)
+        blocked.set()
+        await _flush(server, client)
+        assert mock_send.await_count == 3
+
+
+@pytest.mark.parametrize('policy', ('drop', 'close'))
+@pytest.mark.asyncio
+async def test_server_send_overflow(policy: Any, caplog) -> None:
+    caplog.set_level(logging.WARNING)
+    server = RelayServer(
+        NullAuthenticator(),
+        max_queued_messages=1,
+        overflow_policy=policy,
+    )
+    message = RelayRegistrationRequest('name', uuid.uuid4())
+    client = Client('name', uuid.uuid4(), NullUser(), get_mock_websocket())
+    blocked = asyncio.Event()
+
+    with (
+        mock.patch.object(
+            client.websocket,
+            'send',
+            mock.AsyncMock(side_effect=_wait_on(blocked)),
+        ) as mock_send,
+        mock.patch.object(server, 'unregister', AsyncMock()) as mock_close,
+    ):
+        # First message is taken by the writer and blocks and the second
+        # message fills the queue
+        await server.send(client, message)
+        await asyncio.sleep(0)
+        await server.send(client, message)
+        await server.send(client, message)
+        # Only one task is started to close a client which overflows
+        await server.send(client, message)
+
+        if policy == 'drop':
+            assert 'Dropping message' in caplog.records[-1].message
+            mock_close.assert_not_called()
+        else:
+            assert 'Closing client' in caplog.records[-1].message
+            assert len(server._closing_tasks) == 1
+            await asyncio.gather(*server._closing_tasks.values())
+            assert len(server._closing_tasks) == 0
+            mock_close.assert_awaited_once_with(
+                client,
+                code=4005,
+                reason=mock.ANY,
+            )
+
+        blocked.set()
+        await _flush(server, client)
+        assert mock_send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_server_unregister_cancels_writer() -> None:
+    server = RelayServer(NullAuthenticator())
+    message = RelayRegistrationRequest('name', uuid.uuid4())
+    client = Client('name', uuid.uuid4(), NullUser(), get_mock_websocket())
+    server.client_manager.add_client(client)
+
+    with (
+        mock.patch.object(client.websocket, 'send', mock.AsyncMock()),
+        mock.patch.object(client.websocket, 'close', mock.AsyncMock()),
+    ):
+        await server.send(client, message)
+        writer = server._outbound[client].writer
+        await server.unregister(client)
+
+    assert client not in server._outbound
+    with pytest.raises(asyncio.CancelledError):
+        await writer
+
+
+@pytest.mark.asyncio
+async def test_server_writer_error_closes_client(caplog) -> None:
+    server = RelayServer(NullAuthenticator())
+    message = RelayRegistrationRequest('name', uuid.uuid4())
+    client1 = Client('name', uuid.uuid4(), NullUser(), get_mock_websocket())
+    client2 = Client('name', uuid.uuid4(), NullUser(), get_mock_websocket())
+    server.client_manager.add_client(client1)
+    server.client_manager.add_client(client2)
+
+    with (
+        mock.patch.object(
+            client1.websocket,
+            'send',
+            AsyncMock(side_effect=RuntimeError('send failed')),
+        ),
+        mock.patch.object(client1.websocket, 'close', AsyncMock()) as close1,
+        mock.patch.object(client2.websocket, 'send', AsyncMock()) as send2,
+    ):
+        await server.send(client1, message)
+        writer = server._outbound[client1].writer
+        await asyncio.wait([writer])
+        assert isinstance(writer.exception(), RuntimeError)
+        assert any(
+            'Writer for client' in record.message for record in caplog.records
+        )
+
+        # Only the client with the failed writer is closed
+        assert len(server._closing_tasks) == 1
+        await asyncio.gather(*server._closing_tasks.values())
+        close1.assert_awaited_once_with(code=1011, reason=mock.ANY)
+        assert server.client_manager.get_client_by_uuid(client1.uuid) is None
+        assert client1 not in server._outbound
+
+        # Client was already unregistered so it is not closed again
+        server._writer_done(client1, writer)
+        assert len(server._closing_tasks) == 0
+
+        await server.send(client2, message)
+        await _flush(server, client2)
+        send2.assert_awaited_once()
+        assert server.client_manager.get_client_by_uuid(client2.uuid)
+
+
+def test_server_select_subprotocol() -> None:
+    websocket = get_mock_websocket()
+    select = RelayServer.select_subprotocol
+    assert select(websocket, []) is None
+    assert select(websocket, ['other']) is None  # type: ignore[list-item]
+    assert (
+        select(websocket, ['other', BINARY_SUBPROTOCOL])  # type: ignore[list-item]
+        == BINARY_SUBPROTOCOL
+    )
+
+
 @pytest.mark.asyncio
 async def test_server_register() -> None:
     server = RelayServer(NullAuthenticator())
@@ -89,10 +252,11 @@ async def test_server_register() -> None:
 
     with mock.patch.object(websocket, 'send', AsyncMock()) as mock_send:
         await server.register(websocket, request)
+        client = server.client_manager.get_client_by_uuid(request.uuid)
+        assert client is not None
+        await _flush(server, client)
         mock_send.assert_awaited_once()
 
-    client = server.client_manager.get_client_by_uuid(request.uuid)
-    assert client is not None
     assert client.name == 'name'
     assert client.uuid == request.uuid
 
@@ -232,6 +396,7 @@ async def test_forward_request_to_peer() -> None:
         mock.AsyncMock(),
     ) as mock_send:
         await server.forward(client, request)
+        await _flush(server, peer)
         mock_send.assert_awaited_once()
 
 
@@ -353,6 +518,47 @@ async def test_handler_register_and_connect(
         assert client_manager.get_client_by_uuid(client_uuid) is None
 
 
+@pytest.mark.asyncio
+async def test_handler_binary_and_json_clients(
+    relay_server: RelayServerInfo,
+) -> None:
+    binary_uuid, json_uuid = uuid.uuid4(), uuid.uuid4()
+    binary_socket = await websockets.asyncio.client.connect(
+        relay_server.address,
+        subprotocols=[BINARY_SUBPROTOCOL],  # type: ignore[list-item]
+    )
+    json_socket = await websockets.asyncio.client.connect(
+        relay_server.address,
+    )
+    assert binary_socket.subprotocol == BINARY_SUBPROTOCOL
+    assert json_socket.subprotocol is None
+
+    for websocket, client_uuid, binary in (
+        (binary_socket, binary_uuid, True),
+        (json_socket, json_uuid, False),
+    ):
+        request = RelayRegistrationRequest('name', client_uuid)
+        await websocket.send(encode_relay_message(request, binary=binary))
+        result = await asyncio.wait_for(websocket.recv(), _WAIT_FOR)
+        assert isinstance(result, bytes if binary else str)
+        assert decode_relay_message(result) == RelayResponse()
+
+    peer_request = PeerConnectionRequest(
+        source_uuid=binary_uuid,
+        source_name='name',
+        peer_uuid=json_uuid,
+        description_type='offer',
+        description='description',
+    )
+    await binary_socket.send(encode_relay_message(peer_request, binary=True))
+    request_str = await asyncio.wait_for(json_socket.recv(), _WAIT_FOR)
+    assert isinstance(request_str, str)
+    assert decode_relay_message(request_str) == peer_request
+
+    await binary_socket.close()
+    await json_socket.close()
+
+
 @pytest.mark.asyncio
 async def test_handler_bad_message_type_closes_socket(
     relay_server: RelayServerInfo,
@@ -365,6 +571,28 @@ async def test_handler_bad_message_type_closes_socket(
     assert websocket.close_reason == 'Unknown message type.'
 
 
+@pytest.mark.asyncio
+async def test_handler_bad_message_unregisters_client(
+    relay_server: RelayServerInfo,
+) -> None:
+    client_uuid = uuid.uuid4()
+    websocket = await websockets.asyncio.client.connect(relay_server.address)
+    request = RelayRegistrationRequest('name', client_uuid)
+    await websocket.send(encode_relay_message(request))
+    await asyncio.wait_for(websocket.recv(), _WAIT_FOR)
+
+    server = relay_server.relay_server
+    client = server.client_manager.get_client_by_uuid(client_uuid)
+    assert client is not None
+    assert client in server._outbound
+
+    await asyncio.wait_for(websocket.send(b'message'), _WAIT_FOR)
+    await asyncio.wait_for(websocket.wait_closed(), _WAIT_FOR)
+    assert websocket.close_code == 4000
+    assert server.client_manager.get_client_by_uuid(client_uuid) is None
+    assert client not in server._outbound
+
+
 @pytest.mark.asyncio
 async def test_handler_unauthorized_error(
     relay_server: RelayServerInfo,
@@ -416,8 +644,10 @@ async def test_handler_forbidden_error(
             )
 
 
+@pytest.mark.parametrize('binary', (True, False))
 @pytest.mark.asyncio
 async def test_handler_bad_request_error(
+    binary: bool,
     relay_server: RelayServerInfo,
 ) -> None:
     with mock.patch.object(
@@ -427,15 +657,16 @@ async def test_handler_bad_request_error(
     ):
         async with websockets.asyncio.client.connect(
             relay_server.address,
+            subprotocols=[BINARY_SUBPROTOCOL] if binary else None,  # type: ignore[list-item]
         ) as websocket:
             request = RelayRegistrationRequest('name', uuid.uuid4())
             await asyncio.wait_for(
-                websocket.send(encode_relay_message(request)),
+                websocket.send(encode_relay_message(request, binary=binary)),
                 _WAIT_FOR,
             )
 
             response_str = await asyncio.wait_for(websocket.recv(), _WAIT_FOR)
-            assert isinstance(response_str, str)
+            assert isinstance(response_str, bytes if binary else str)
             response = decode_relay_message(response_str)
             assert isinstance(response, RelayResponse)
             assert not response.success
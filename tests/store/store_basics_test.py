@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import pathlib
 import threading
+import time
 from typing import Any
 from unittest import mock
 
 import pytest
 
+from proxystore.connectors.file import FileConnector
 from proxystore.connectors.local import LocalConnector
 from proxystore.proxy import Proxy
 from proxystore.serialize import BytesLike
@@ -15,6 +18,7 @@ from proxystore.store import Store
 from proxystore.store.exceptions import StoreExistsError
 from proxystore.store.future import Future
 from proxystore.store.lifetimes import ContextLifetime
+from proxystore.store.utils import get_key
 
 
 def test_negative_cache_size() -> None:
@@ -231,3 +235,27 @@ def test_put_batch_lifetime(store: Store[LocalConnector]) -> None:
 
     for key in keys:
         assert not store.exists(key)
+
+
+def test_put_ttl(tmp_path: pathlib.Path) -> None:
+    with Store('test', FileConnector(str(tmp_path)), cache_size=0) as store:
+        key = store.put('value', ttl=0.05)
+        keys = store.put_batch(['value1', 'value2'], ttl=0.05)
+        proxy = store.proxy('value', ttl=0.05)
+        other = store.put('value')
+
+        assert store.get(key) == 'value'
+        time.sleep(0.1)
+        assert not store.exists(key)
+        assert not any(store.exists(k) for k in keys)
+        assert not store.exists(get_key(proxy))
+        assert store.exists(other)
+
+
+@pytest.mark.parametrize('ttl', (0, -1))
+def test_put_bad_ttl(ttl: float, store: Store[LocalConnector]) -> None:
+    with pytest.raises(ValueError, match='TTL'):
+        store.put('value', ttl=ttl)
+
+    with pytest.raises(ValueError, match='TTL'):
+        store.put_batch(['value'], ttl=ttl)
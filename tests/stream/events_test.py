@@ -4,12 +4,15 @@ from typing import NamedTuple
 
 import pytest
 
+from proxystore.serialize import deserialize
+from proxystore.serialize import serialize
 from proxystore.store.config import ConnectorConfig
 from proxystore.store.config import StoreConfig
 from proxystore.stream.events import bytes_to_event
 from proxystore.stream.events import EndOfStreamEvent
 from proxystore.stream.events import Event
 from proxystore.stream.events import event_to_bytes
+from proxystore.stream.events import event_to_dict
 from proxystore.stream.events import EventBatch
 from proxystore.stream.events import NewObjectEvent
 from proxystore.stream.events import NewObjectKeyEvent
@@ -50,6 +53,52 @@ def test_encode_decode(event: Event) -> None:
     assert event == new_event
 
 
+def test_decode_dict_encoding() -> None:
+    batch = EventBatch(
+        topic='topic',
+        events=[MOCK_NEW_OBJECT, MOCK_NEW_OBJECT_KEY, MOCK_END_OF_STREAM],
+    )
+    assert bytes_to_event(serialize(event_to_dict(batch))) == batch
+
+
+def test_decode_unsupported_version() -> None:
+    message = list(deserialize(event_to_bytes(MOCK_END_OF_STREAM)))
+    message[0] = -1
+    with pytest.raises(ValueError, match='version'):
+        bytes_to_event(serialize(tuple(message)))
+
+
+def test_encode_batch_interns_configs_and_key_types() -> None:
+    other_config = StoreConfig(
+        name='other',
+        connector=ConnectorConfig(kind='test'),
+    )
+    events: list[Event] = [
+        NewObjectKeyEvent.from_key(
+            _TestKey('a', i),
+            evict=False,
+            metadata={'i': i},
+            store_config=config,
+            topic='topic',
+        )
+        for i, config in enumerate(
+            # Equal configs which are different objects are interned once.
+            (MOCK_CONFIG, other_config, MOCK_CONFIG.model_copy()),
+        )
+    ]
+    batch = EventBatch(topic='topic', events=events)
+
+    message = event_to_bytes(batch)
+    _, _, _, configs, key_types, encoded = deserialize(message)
+    assert len(configs) == 2
+    assert key_types == [MOCK_NEW_OBJECT_KEY.key_type]
+    assert [event[-1] for event in encoded] == [0, 1, 0]
+
+    assert bytes_to_event(message) == batch
+    # The encoding should be smaller than the dictionary encoding.
+    assert len(message) < len(serialize(event_to_dict(batch)))
+
+
 def test_new_object_key() -> None:
     key = _TestKey('a', 123)
     event = NewObjectKeyEvent.from_key(
@@ -6,6 +6,7 @@ import pytest
 
 from proxystore.utils.data import bytes_to_readable
 from proxystore.utils.data import chunk_bytes
+from proxystore.utils.data import chunk_memoryview
 from proxystore.utils.data import readable_to_bytes
 
 
@@ -21,6 +22,17 @@ def test_chunk_bytes(data_size: int, chunk_size: int) -> None:
     assert data == result
 
 
+@pytest.mark.parametrize(
+    ('data_size', 'chunk_size'),
+    ((0, 1), (100, 1), (1000, 100), (1000, 128)),
+)
+def test_chunk_memoryview(data_size: int, chunk_size: int) -> None:
+    data = bytearray(os.urandom(data_size))
+    chunks = list(chunk_memoryview(data, chunk_size))
+    assert all(chunk.obj is data for chunk in chunks)
+    assert data == b''.join(chunks)
+
+
 @pytest.mark.parametrize(
     ('value', 'precision', 'expected'),
     (